@@ -25,6 +25,7 @@ import subprocess
 import traceback
 import uuid
 import pprint
+import multiprocessing
 from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from functools import partial
@@ -41,6 +42,7 @@ from argus.backend.util.enums import TestStatus
 
 import sct_ssh
 import sct_scan_issues
+from sdcm import sct_abs_path
 from sdcm.keystore import KeyStore
 from sdcm.localhost import LocalHost
 from sdcm.provision import AzureProvisioner
@@ -48,7 +50,7 @@ from sdcm.provision.provisioner import VmInstance
 from sdcm.remote import LOCALRUNNER
 from sdcm.nemesis import SisyphusMonkey
 from sdcm.results_analyze import PerformanceResultsAnalyzer, BaseResultsAnalyzer
-from sdcm.sct_config import SCTConfiguration
+from sdcm.sct_config import SCTConfiguration, load_default_layers
 from sdcm.sct_provision.common.layout import SCTProvisionLayout, create_sct_configuration
 from sdcm.sct_provision.instances_provider import provision_sct_resources
 from sdcm.sct_runner import AwsSctRunner, GceSctRunner, AzureSctRunner, get_sct_runner, clean_sct_runners, \
@@ -807,12 +809,13 @@ def _run_yaml_test(backend, full_path, env):
     output = []
     error = False
     output.append(f'---- linting: {full_path} -----')
+    start_time = time.perf_counter()
     while os.environ:
         os.environ.popitem()
     for key, value in env.items():
         os.environ[key] = value
     os.environ['SCT_CLUSTER_BACKEND'] = backend
-    os.environ['SCT_CONFIG_FILES'] = full_path
+    os.environ['SCT_CONFIG_FILES'] = os.path.abspath(full_path)
     logging.getLogger().handlers = []
     logging.getLogger().disabled = True
     try:
@@ -822,7 +825,21 @@ def _run_yaml_test(backend, full_path, env):
     except Exception as exc:  # pylint: disable=broad-except  # noqa: BLE001
         output.append(''.join(traceback.format_exception(type(exc), exc, exc.__traceback__)))
         error = True
-    return error, output
+    duration = time.perf_counter() - start_time
+    output.append(f'---- linted in {duration:.2f}s -----')
+    return error, output, duration
+
+
+def _preload_yaml_lint_state(backend):
+    """
+    Load everything that is shared between all linted yamls, before the lint workers are forked
+
+    workers inherit the parsed defaults layers and the options schema, and only need to overlay
+    the yaml under test on top of them
+    """
+    load_default_layers([sct_abs_path('defaults/test_default.yaml'),
+                         *SCTConfiguration.defaults_config_files.get(backend, [])])
+    SCTConfiguration.get_config_option('config_files')
 
 
 @cli.command(help="Test yaml in test-cases directory")
@@ -852,7 +869,10 @@ def lint_yamls(backend, exclude: str, include: str):  # pylint: disable=too-many
             raise ValueError(f'Include filter "{flt}" compiling failed with: {exc}') from exc
 
     original_env = {**os.environ}
-    process_pool = ProcessPoolExecutor(max_workers=5)  # pylint: disable=consider-using-with
+    lint_start_time = time.perf_counter()
+    _preload_yaml_lint_state(backend)
+    process_pool = ProcessPoolExecutor(  # pylint: disable=consider-using-with
+        max_workers=os.cpu_count(), mp_context=multiprocessing.get_context('fork'))
 
     features = []
     for root, _, files in os.walk('./test-cases'):
@@ -862,17 +882,24 @@ def lint_yamls(backend, exclude: str, include: str):  # pylint: disable=too-many
                 continue
             if any((flt.search(file) or flt.search(full_path) for flt in exclude_filters)):
                 continue
-            features.append(process_pool.submit(_run_yaml_test, backend, full_path, original_env))
+            features.append((full_path, process_pool.submit(_run_yaml_test, backend, full_path, original_env)))
 
     failed = False
-    for pp_feature in features:
-        error, pp_output = pp_feature.result()
+    durations = []
+    for full_path, pp_feature in features:
+        error, pp_output, duration = pp_feature.result()
+        durations.append((duration, full_path))
         if error:
             failed = True
             click.secho('\n'.join(pp_output), fg='red')
         else:
             click.secho('\n'.join(pp_output), fg='green')
+    process_pool.shutdown()
     print()
+    click.secho(f"Linted {len(durations)} yaml files in {time.perf_counter() - lint_start_time:.2f}s "
+                f"using {os.cpu_count()} workers, slowest ones:")
+    for duration, full_path in sorted(durations, reverse=True)[:5]:
+        click.secho(f"\t{duration:.2f}s {full_path}")
     sys.exit(1 if failed else 0)
 
 
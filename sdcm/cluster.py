@@ -46,6 +46,7 @@ import packaging.version
 
 import yaml
 import requests
+from cachetools import TTLCache
 from paramiko import SSHException
 from tenacity import RetryError
 from invoke import Result
@@ -86,6 +87,9 @@ from sdcm.utils import properties
 from sdcm.utils.adaptive_timeouts import Operations, adaptive_timeout
 from sdcm.utils.aws_kms import AwsKms
 from sdcm.utils.cql_utils import cql_quote_if_needed
+from sdcm.utils.cfstats_sampler import CfstatsSampler, parse_cfstats_tables
+from sdcm.utils.cql_session_pool import CQLSessionPool
+from sdcm.utils.log_follower import follow_log
 from sdcm.utils.benchmarks import ScyllaClusterBenchmarkManager
 from sdcm.utils.common import (
     S3Storage,
@@ -99,6 +103,8 @@ from sdcm.utils.common import (
     prepare_and_start_saslauthd_service,
     raise_exception_in_thread,
     get_sct_root_path,
+    parse_nodetool_listsnapshots,
+    SnapshotDetails,
 )
 from sdcm.utils.ci_tools import get_test_name
 from sdcm.utils.distro import Distro
@@ -112,6 +118,7 @@ from sdcm.utils.health_checker import check_nodes_status, check_node_status_in_g
 from sdcm.utils.decorators import NoValue, retrying, log_run_info, optional_cached_property
 from sdcm.test_config import TestConfig
 from sdcm.utils.issues_by_keyword.find_known_issue import FindIssuePerBacktrace
+from sdcm.utils.backtrace_decoder import BacktraceDecoder, backtrace_decoding_metrics
 from sdcm.utils.sstable.sstable_utils import SstableUtils
 from sdcm.utils.version_utils import (
     assume_version,
@@ -122,6 +129,8 @@ from sdcm.utils.version_utils import (
 )
 from sdcm.utils.net import get_my_ip
 from sdcm.utils.node import build_node_api_command
+from sdcm.rest.nodetool_rest_client import NodetoolRestClient
+from sdcm.rest.rest_client import ScyllaApiException
 from sdcm.sct_events import Severity
 from sdcm.sct_events.base import LogEvent, add_severity_limit_rules, max_severity
 from sdcm.sct_events.health import ClusterHealthValidatorEvent
@@ -139,7 +148,6 @@ from sdcm.utils.ldap import LDAP_SSH_TUNNEL_LOCAL_PORT, LDAP_BASE_OBJECT, LDAP_P
     LDAP_PORT, DEFAULT_PWD_SUFFIX
 from sdcm.utils.remote_logger import get_system_logging_thread
 from sdcm.utils.scylla_args import ScyllaArgParser
-from sdcm.utils.file import File
 from sdcm.utils import cdc
 from sdcm.utils.raft import get_raft_mode
 from sdcm.coredump import CoredumpExportSystemdThread
@@ -255,6 +263,13 @@ class BaseNode(AutoSshContainerMixin):  # pylint: disable=too-many-instance-attr
 
     SYSTEM_EVENTS_PATTERNS = SYSTEM_ERROR_EVENTS_PATTERNS + INSTANCE_STATUS_EVENTS_PATTERNS
 
+    # answer read-only nodetool queries with Scylla REST API, when it's supported by the node
+    NODETOOL_REST_API = True
+
+    # max number of queued backtraces decoded together, and number of such batches decoded concurrently
+    BACKTRACE_DECODING_BATCH_SIZE = 20
+    BACKTRACE_DECODING_WORKERS = 4
+
     def __init__(self, name, parent_cluster, ssh_login_info=None, base_logdir=None, node_prefix=None, dc_idx=0, rack=0):  # pylint: disable=too-many-arguments,unused-argument
         self.name = name
         self.rack = rack
@@ -1268,6 +1283,25 @@ class BaseNode(AutoSshContainerMixin):  # pylint: disable=too-many-instance-attr
                     stat_dict[stat_line[0]] = stat_line[1].split()[0]
         return stat_dict
 
+    @staticmethod
+    def _parse_cfstats_partitions(cfstats_output) -> dict[str, int]:
+        """
+        Parse "Number of partitions (estimate)" of every table in the output of `nodetool cfstats' of many keyspaces
+
+        :return: {"keyspace.table": partitions}
+        """
+        return {table: partitions if isinstance(partitions := stats.get("Number of partitions (estimate)"), int) else 0
+                for table, stats in parse_cfstats_tables(cfstats_output).items()}
+
+    def get_tables_partitions_estimate(self, keyspaces: Iterable[str]) -> dict[str, int]:
+        """
+        Get estimated number of partitions of all tables of the keyspaces, with a single `nodetool cfstats' call
+        """
+        res = self.run_nodetool(sub_cmd='cfstats', args=" ".join(sorted(keyspaces)), timeout=300,
+                                warning_event_on_exception=(Failure, UnexpectedExit, Libssh2_UnexpectedExit,),
+                                publish_event=False, retry=3)
+        return self._parse_cfstats_partitions(res.stdout)
+
     def _is_storage_virtualized(self):
         return self.is_docker()
 
@@ -1440,9 +1474,6 @@ class BaseNode(AutoSshContainerMixin):  # pylint: disable=too-many-instance-attr
             patterns: Optional[List[Union[str, re.Pattern, LogEvent]]] = None,
             start_from_beginning: bool = False
     ) -> Iterable[str]:
-        stream = File(self.system_log)
-        if not start_from_beginning:
-            stream.move_to_end()
         if not patterns:
             patterns = [p[0] for p in SYSTEM_ERROR_EVENTS_PATTERNS]
         regexps = []
@@ -1453,7 +1484,7 @@ class BaseNode(AutoSshContainerMixin):  # pylint: disable=too-many-instance-attr
                 regexps.append(re.compile(pattern, flags=re.IGNORECASE))
             elif isinstance(pattern, LogEvent):
                 regexps.append(re.compile(pattern.regex, flags=re.IGNORECASE))
-        return stream.read_lines_filtered(*regexps)
+        return follow_log(self.system_log, regexps, start_from_beginning=start_from_beginning)
 
     @contextlib.contextmanager
     def open_system_log(self, on_datetime: Optional[datetime] = None) -> IO[AnyStr]:
@@ -1499,35 +1530,74 @@ class BaseNode(AutoSshContainerMixin):  # pylint: disable=too-many-instance-attr
         self._decoding_backtraces_thread.daemon = True
         self._decoding_backtraces_thread.start()
 
-    def decode_backtrace(self):
-        scylla_debug_file = None
-        while True:
-            event = None
-            obj = None
-            try:
-                obj = self.test_config.DECODING_QUEUE.get(timeout=5)
+    def _get_backtraces_to_decode(self) -> tuple[list[dict], bool]:
+        """Get up to BACKTRACE_DECODING_BATCH_SIZE queued backtraces, and whether the stop marker was received"""
+        decoding_queue = self.test_config.DECODING_QUEUE
+        batch = []
+        try:
+            while len(batch) < self.BACKTRACE_DECODING_BATCH_SIZE:
+                obj = decoding_queue.get_nowait() if batch else decoding_queue.get(timeout=5)
                 if obj is None:
+                    return batch, True
+                batch.append(obj)
+        except queue.Empty:
+            pass
+        return batch, False
+
+    def decode_backtrace(self):
+        decoder = BacktraceDecoder(remoter=self.remoter)
+        metrics = backtrace_decoding_metrics()
+        scylla_debug_files = {}
+        with ThreadPoolExecutor(max_workers=self.BACKTRACE_DECODING_WORKERS,
+                                thread_name_prefix="DecodeBacktrace") as executor:
+            while True:
+                batch, stop = self._get_backtraces_to_decode()
+                if metrics.queue_size_gauge:
+                    with contextlib.suppress(NotImplementedError):  # not implemented on macOS
+                        metrics.queue_size_gauge.set(self.test_config.DECODING_QUEUE.qsize())
+                events_per_debug_file = defaultdict(list)
+                for obj in batch:
+                    events_per_debug_file[obj["debug_file"]].append((obj["node"], obj["event"]))
+                for debug_file, events in events_per_debug_file.items():
+                    try:
+                        if debug_file not in scylla_debug_files:
+                            scylla_debug_files[debug_file] = self.copy_scylla_debug_info(events[0][0], debug_file)
+                    except Exception as details:  # pylint: disable=broad-except  # noqa: BLE001
+                        self.log.error("failed to copy debug file %s: %s", debug_file, details)
+                        self._publish_decoded_backtraces([event for _, event in events])
+                        continue
+                    executor.submit(self._decode_backtraces, decoder,
+                                    scylla_debug_files[debug_file], [event for _, event in events])
+                if stop or (self.termination_event.is_set() and self.test_config.DECODING_QUEUE.empty()):
                     break
-                event = obj["event"]
-                if not scylla_debug_file:
-                    scylla_debug_file = self.copy_scylla_debug_info(obj["node"], obj["debug_file"])
-                output = self.decode_raw_backtrace(scylla_debug_file, " ".join(event.raw_backtrace.split('\n')))
-                event.backtrace = output.stdout
-                the_map = FindIssuePerBacktrace()
+
+    def _decode_backtraces(self, decoder: BacktraceDecoder, scylla_debug_file: str, events: list):
+        metrics = backtrace_decoding_metrics()
+        start_time = time.perf_counter()
+        try:
+            decoded_backtraces = decoder.decode(scylla_debug_file, [event.raw_backtrace for event in events])
+            the_map = FindIssuePerBacktrace()
+            for event, decoded_backtrace in zip(events, decoded_backtraces):
+                event.backtrace = decoded_backtrace
                 if issue_url := the_map.find_issue(backtrace_type=event.type, decoded_backtrace=event.backtrace):
                     event.known_issue = issue_url
                     self.log.debug("Found issue for %s event: %s", event.event_id, event.known_issue)
-            except queue.Empty:
-                pass
-            except Exception as details:  # pylint: disable=broad-except  # noqa: BLE001
-                self.log.error("failed to decode backtrace %s", details)
-            finally:
-                if event:
-                    event.ready_to_publish()
-                    event.publish()
+        except Exception as details:  # pylint: disable=broad-except  # noqa: BLE001
+            self.log.error("failed to decode backtrace %s", details)
+        finally:
+            self._publish_decoded_backtraces(events)
+        decoding_time = time.perf_counter() - start_time
+        self.log.debug("Decoded %d backtrace(s) in %.1fs", len(events), decoding_time)
+        if metrics.decoded_counter:
+            metrics.decoded_counter.inc(len(events))
+        if metrics.decoding_time_counter:
+            metrics.decoding_time_counter.inc(decoding_time)
 
-            if self.termination_event.is_set() and self.test_config.DECODING_QUEUE.empty():
-                break
+    @staticmethod
+    def _publish_decoded_backtraces(events: list):
+        for event in events:
+            event.ready_to_publish()
+            event.publish()
 
     def copy_scylla_debug_info(self, node_name: str, debug_file: str):
         """Copy scylla debug file from db-node to monitor-node
@@ -1562,19 +1632,6 @@ class BaseNode(AutoSshContainerMixin):  # pylint: disable=too-many-instance-attr
         os.remove(transit_scylla_debug_file)
         return final_scylla_debug_file
 
-    def decode_raw_backtrace(self, scylla_debug_file, raw_backtrace):
-        """run decode backtrace on monitor node
-
-        Decode backtrace on monitor node
-        :param scylla_debug_file: file path on db-node
-        :type scylla_debug_file: str
-        :param raw_backtrace: string with backtrace data
-        :type raw_backtrace: str
-        :returns: result of bactrace
-        :rtype: {str}
-        """
-        return self.remoter.run('addr2line -Cpife {0} {1}'.format(scylla_debug_file, raw_backtrace), verbose=True)
-
     def get_scylla_build_id(self) -> Optional[str]:
         for scylla_executable in ("/usr/bin/scylla", "/opt/scylladb/libexec/scylla", ):
             build_id_result = self.remoter.run(f"{scylla_executable} --build-id", ignore_status=True)
@@ -2660,6 +2717,26 @@ class BaseNode(AutoSshContainerMixin):  # pylint: disable=too-many-instance-attr
                 else:
                     raise
 
+    @cached_property
+    def nodetool_rest_client(self) -> NodetoolRestClient:
+        return NodetoolRestClient(node=self)
+
+    def use_nodetool_rest_api(self, query: str) -> bool:
+        return self.NODETOOL_REST_API and query not in self.nodetool_rest_client.unsupported
+
+    def list_snapshots(self) -> defaultdict[str, list[SnapshotDetails]]:
+        """
+        Get snapshots of the node, same as parsed `nodetool listsnapshots'
+        """
+        if self.use_nodetool_rest_api("listsnapshots"):
+            try:
+                return self.nodetool_rest_client.listsnapshots()
+            except ScyllaApiException as exc:
+                self.log.debug("Failed to list snapshots with REST API, using nodetool: %s", exc)
+        result = self.run_nodetool('listsnapshots')
+        self.log.debug(result)
+        return parse_nodetool_listsnapshots(listsnapshots_output=result.stdout)
+
     def node_health_events(self) -> Iterator[ClusterHealthValidatorEvent]:
         nodes_status = self.get_nodes_status()
         peers_details = self.get_peers_info() or {}
@@ -3173,6 +3250,7 @@ class BaseCluster:  # pylint: disable=too-many-instance-attributes,too-many-publ
     """
     Cluster of Node objects.
     """
+    tables_partitions_cache_ttl = 60  # seconds
 
     # pylint: disable=too-many-arguments,too-many-locals,too-many-branches
     def __init__(self, cluster_uuid=None, cluster_prefix='cluster', node_prefix='node', n_nodes=3, params=None,
@@ -3421,6 +3499,7 @@ class BaseCluster:  # pylint: disable=too-many-instance-attributes,too-many-publ
 
     def destroy(self):
         self.log.info('Destroy nodes')
+        self.cql_session_pool.close()
         for node in self.nodes:
             node.destroy()
 
@@ -3440,6 +3519,7 @@ class BaseCluster:  # pylint: disable=too-many-instance-attributes,too-many-publ
             ))
         if node in self.nodes:
             self.nodes.remove(node)
+        self.cql_session_pool.invalidate(node.name)
         node.destroy()
 
     def get_db_auth(self):
@@ -3488,8 +3568,15 @@ class BaseCluster:  # pylint: disable=too-many-instance-attributes,too-many-publ
         ssl_context.load_verify_locations(cafile=truststore)
         return ssl_context
 
+    @cached_property
+    def cql_session_pool(self) -> CQLSessionPool:
+        return CQLSessionPool()
+
     def _create_session(self, node, keyspace, user, password, compression, protocol_version, load_balancing_policy=None, port=None,  # noqa: PLR0913
-                        ssl_context=None, node_ips=None, connect_timeout=None, verbose=True, connection_bundle_file=None):
+                        ssl_context=None, node_ips=None, connect_timeout=None, verbose=True, connection_bundle_file=None,
+                        pool_nodes=None):
+        # connections with explicit credentials or SSL context are used to test them, so they aren't pooled
+        pooled = pool_nodes is not None and user is None and password is None and ssl_context is None
         if not port:
             port = node.CQL_PORT
 
@@ -3517,25 +3604,34 @@ class BaseCluster:  # pylint: disable=too-many-instance-attributes,too-many-publ
         kwargs = dict(contact_points=node_ips, port=port, ssl_context=ssl_context)
         if connection_bundle_file:
             kwargs = dict(scylla_cloud=connection_bundle_file)
-        cluster_driver = ClusterDriver(auth_provider=auth_provider,
-                                       compression=compression,
-                                       protocol_version=protocol_version,
-                                       load_balancing_policy=load_balancing_policy,
-                                       default_retry_policy=FlakyRetryPolicy(),
-                                       connect_timeout=connect_timeout, **kwargs
-                                       )
-        session = cluster_driver.connect()
-
-        # temporarily increase client-side timeout to 1m to determine
-        # if the cluster is simply responding slowly to requests
-        session.default_timeout = 60.0
-
-        if keyspace is not None:
-            session.set_keyspace(keyspace)
-
-        # override driver default consistency level of LOCAL_QUORUM
-        session.default_consistency_level = ConsistencyLevel.ONE
 
+        def connect():
+            cluster_driver = ClusterDriver(auth_provider=auth_provider,
+                                           compression=compression,
+                                           protocol_version=protocol_version,
+                                           load_balancing_policy=load_balancing_policy,
+                                           default_retry_policy=FlakyRetryPolicy(),
+                                           connect_timeout=connect_timeout, **kwargs
+                                           )
+            session = cluster_driver.connect()
+
+            # temporarily increase client-side timeout to 1m to determine
+            # if the cluster is simply responding slowly to requests
+            session.default_timeout = 60.0
+
+            if keyspace is not None:
+                session.set_keyspace(keyspace)
+
+            # override driver default consistency level of LOCAL_QUORUM
+            session.default_consistency_level = ConsistencyLevel.ONE
+            return session, cluster_driver
+
+        if pooled:
+            key = (tuple(sorted(pool_nodes)), tuple(node_ips or ()), str(connection_bundle_file), keyspace, user,
+                   password, compression, protocol_version, port, ssl_context is not None and str(node.ssl_conf_dir))
+            return self.cql_session_pool.session(
+                key=key, connect=connect, nodes=pool_nodes, keyspace=keyspace, verbose=verbose)
+        session, cluster_driver = connect()
         return ScyllaCQLSession(session, cluster_driver, verbose)
 
     def cql_connection(self, node, keyspace=None, user=None,  # pylint: disable=too-many-arguments
@@ -3550,7 +3646,8 @@ class BaseCluster:  # pylint: disable=too-many-instance-attributes,too-many-publ
         return self._create_session(node=node, keyspace=keyspace, user=user, password=password, compression=compression,
                                     protocol_version=protocol_version, load_balancing_policy=wlrr, port=port, ssl_context=ssl_context,
                                     node_ips=node_ips, connect_timeout=connect_timeout, verbose=verbose,
-                                    connection_bundle_file=connection_bundle_file)
+                                    connection_bundle_file=connection_bundle_file,
+                                    pool_nodes=[cluster_node.name for cluster_node in self.nodes])
 
     def cql_connection_exclusive(self, node, keyspace=None, user=None,  # pylint: disable=too-many-arguments,too-many-locals
                                  password=None, compression=True,
@@ -3574,7 +3671,7 @@ class BaseCluster:  # pylint: disable=too-many-instance-attributes,too-many-publ
         return self._create_session(node=node, keyspace=keyspace, user=user, password=password, compression=compression,
                                     protocol_version=protocol_version, load_balancing_policy=wlrr, port=port, ssl_context=ssl_context,
                                     node_ips=node_ips, connect_timeout=connect_timeout, verbose=verbose,
-                                    connection_bundle_file=connection_bundle_file)
+                                    connection_bundle_file=connection_bundle_file, pool_nodes=[node.name])
 
     @retrying(n=8, sleep_time=15, allowed_exceptions=(NoHostAvailable,))
     def cql_connection_patient(self, node, keyspace=None,
@@ -3613,6 +3710,43 @@ class BaseCluster:  # pylint: disable=too-many-instance-attributes,too-many-publ
         self.log.debug("%s replication_factors", set(ks_rf.replication_factors))
         return set(ks_rf.replication_factors) == {1}
 
+    @cached_property
+    def _tables_partitions_cache(self) -> TTLCache:
+        return TTLCache(maxsize=64, ttl=self.tables_partitions_cache_ttl)
+
+    @cached_property
+    def _tables_partitions_lock(self) -> threading.Lock:
+        return threading.Lock()
+
+    def _get_tables_partitions_estimate(self, db_node, cql_session, keyspaces) -> dict[str, int] | None:
+        """
+        Get estimated number of partitions of the tables in the keyspaces, with a single `nodetool cfstats' call.
+
+        The result is cached per node and schema version for `tables_partitions_cache_ttl' seconds, since nemeses
+        ask for it again and again to choose their targets.
+        """
+        if not keyspaces:
+            # `nodetool cfstats' without keyspaces reports all of them, including the system ones
+            return {}
+        try:
+            schema_version = cql_session.execute("SELECT schema_version FROM system.local").one().schema_version
+        except Exception as exc:  # pylint: disable=broad-except  # noqa: BLE001
+            self.log.debug("Failed to get schema version of %s: %s", db_node.name, exc)
+            schema_version = None
+        key = (db_node.name, str(schema_version), tuple(sorted(keyspaces)))
+        with self._tables_partitions_lock:
+            if schema_version is not None and (tables_partitions := self._tables_partitions_cache.get(key)) is not None:
+                return tables_partitions
+        try:
+            tables_partitions = db_node.get_tables_partitions_estimate(keyspaces)
+        except Exception as exc:  # pylint: disable=broad-except  # noqa: BLE001
+            self.log.warning("Failed to get cfstats of %s keyspaces. Error: %s", ", ".join(sorted(keyspaces)), exc)
+            return None
+        if schema_version is not None:
+            with self._tables_partitions_lock:
+                self._tables_partitions_cache[key] = tables_partitions
+        return tables_partitions
+
     def get_non_system_ks_cf_list(self, db_node,  # pylint: disable=too-many-arguments
                                   filter_out_table_with_counter=False, filter_out_mv=False, filter_empty_tables=True,
                                   filter_by_keyspace: list = None,
@@ -3651,7 +3785,7 @@ class BaseCluster:  # pylint: disable=too-many-instance-attributes,too-many-publ
             cql_session.default_timeout = 60.0 * 5
             cql_session.default_consistency_level = ConsistencyLevel.ONE
             execute_result = cql_session.execute_async(cmd)
-            fetcher = PageFetcher(execute_result).request_all(timeout=120)
+            fetcher = PageFetcher(execute_result, prefetch=True).request_all(timeout=120)
             current_rows = fetcher.all_data()
 
             for row in current_rows:
@@ -3673,7 +3807,14 @@ class BaseCluster:  # pylint: disable=too-many-instance-attributes,too-many-publ
                 result.add(table_name)
 
             if is_column_type and filter_empty_tables:
+                tables_partitions = self._get_tables_partitions_estimate(
+                    db_node=db_node, cql_session=cql_session, keyspaces={name.split(".", 1)[0] for name in result})
                 for i, table_name in enumerate(result.copy()):
+                    if tables_partitions is not None:
+                        if not tables_partitions.get(table_name):
+                            result.discard(table_name)
+                        continue
+                    # fallback to cfstats of every table, in case cfstats of all keyspaces have failed
                     has_data = False
                     try:
                         self.log.debug(f"{i}: {table_name}")
@@ -3808,11 +3949,28 @@ class NodeSetupTimeout(Exception):
     pass
 
 
+@dataclass
+class NodeInitTimings:
+    setup_start: float | None = None
+    setup_end: float | None = None
+    startup_start: float | None = None
+    startup_end: float | None = None
+
+    def __str__(self):
+        def duration(start, end):
+            return f"{int(end - start)}s" if start is not None and end is not None else "-"
+        return (f"setup: {duration(self.setup_start, self.setup_end)}, "
+                f"waiting for startup: {duration(self.setup_end, self.startup_start)}, "
+                f"startup: {duration(self.startup_start, self.startup_end)}")
+
+
 def wait_for_init_wrap(method):  # pylint: disable=too-many-statements
     """
     Wraps wait_for_init class method.
-    Run setup of nodes simultaneously and wait for all the setups finished.
-    Raise exception if setup failed or timeout expired.
+    Run setup of nodes simultaneously and start every node as soon as its setup is finished:
+    one after another, in order of the nodes, or concurrently, but not more than
+    `max_parallel_startups_per_rack' nodes of a rack, if the cluster supports parallel startup.
+    Raise exception if setup or startup failed or timeout expired.
     """
     @wraps(method)
     def wrapper(*args, **kwargs):  # pylint: disable=too-many-statements,too-many-locals
@@ -3831,11 +3989,14 @@ def wait_for_init_wrap(method):  # pylint: disable=too-many-statements
         setup_kwargs = {k: v for k, v in kwargs.items()
                         if k not in ["node_list", "check_node_health", "wait_for_db_logs"]}
 
-        setup_queue, setup_results = queue.Queue(), []
-        startup_queue, startup_results = queue.Queue(), []
+        events_queue = queue.Queue()
+        timings = {node: NodeInitTimings() for node in node_list}
+        setup_results, startup_results = [], []
+        started_nodes, starting_per_rack = [], defaultdict(int)
 
         @raise_event_on_failure
-        def node_setup(_node: BaseNode, task_queue: queue.Queue):
+        def node_setup(_node: BaseNode):
+            timings[_node].setup_start = time.perf_counter()
             exception_details = None
             try:
                 cl_inst.node_setup(_node, **setup_kwargs)
@@ -3848,34 +4009,56 @@ def wait_for_init_wrap(method):  # pylint: disable=too-many-statements
             except Exception:  # pylint: disable=broad-except  # noqa: BLE001
                 LOGGER.warning("Failure settings shards for node %s in Argus.", _node)
                 LOGGER.debug("Exception details:\n", exc_info=True)
-            task_queue.put((_node, exception_details))
-            task_queue.task_done()
+            timings[_node].setup_end = time.perf_counter()
+            events_queue.put((setup_results, _node, exception_details))
 
         @raise_event_on_failure
-        def node_startup(_node: BaseNode, task_queue: queue.Queue):
+        def node_startup(_node: BaseNode):
+            timings[_node].startup_start = time.perf_counter()
             exception_details = None
             try:
                 cl_inst.node_startup(_node, **setup_kwargs)
             except Exception as ex:  # pylint: disable=broad-except  # noqa: BLE001
                 exception_details = (str(ex), traceback.format_exc())
-            task_queue.put((_node, exception_details))
-            task_queue.task_done()
+            timings[_node].startup_end = time.perf_counter()
+            events_queue.put((startup_results, _node, exception_details))
+
+        def start_ready_nodes():
+            # `parallel_startup' is decided by the version of the first node of the cluster, so wait for its setup
+            if cl_inst.nodes[0] in timings and cl_inst.nodes[0] not in setup_results:
+                return
+            for node in node_list:
+                if node in started_nodes:
+                    continue
+                rack = (node.dc_idx, node.rack)
+                if cl_inst.parallel_startup:
+                    if node not in setup_results or starting_per_rack[rack] >= cl_inst.max_parallel_startups_per_rack:
+                        continue
+                elif node not in setup_results or len(started_nodes) != len(startup_results):
+                    return  # keep the order of nodes and start them one after another
+                started_nodes.append(node)
+                starting_per_rack[rack] += 1
+                threading.Thread(target=node_startup, args=(node, ), daemon=True).start()
 
-        def verify_node_setup_or_startup(start_time, task_queue: queue.Queue, results: list):
+        def verify_node_setup_or_startup(start_time):
             time_elapsed = time.perf_counter() - start_time
             try:
-                node, setup_exception = task_queue.get(block=True, timeout=5)
+                results, node, setup_exception = events_queue.get(block=True, timeout=5)
                 if setup_exception:
                     raise NodeSetupFailed(
                         node=node, error_msg=setup_exception[0], traceback_str=setup_exception[1])
                 results.append(node)
-                cl_inst.log.info("(%d/%d) nodes ready, node %s. Time elapsed: %d s",
-                                 len(results), len(node_list), str(node), int(time_elapsed))
+                if results is startup_results:
+                    starting_per_rack[(node.dc_idx, node.rack)] -= 1
+                cl_inst.log.info("(%d/%d) nodes %s, node %s. Time elapsed: %d s",
+                                 len(results), len(node_list), "ready" if results is startup_results else "set up",
+                                 str(node), int(time_elapsed))
+                start_ready_nodes()
             except queue.Empty:
                 pass
             if timeout and time_elapsed / 60 > timeout:
-                msg = 'TIMEOUT [%d min]: Waiting for node(-s) setup/startup(%d/%d) expired!' % (
-                    timeout, len(results), len(node_list))
+                msg = 'TIMEOUT [%d min]: Waiting for node(-s) setup(%d/%d)/startup(%d/%d) expired!' % (
+                    timeout, len(setup_results), len(node_list), len(startup_results), len(node_list))
                 cl_inst.log.error(msg)
                 raise NodeSetupTimeout(msg)
 
@@ -3912,21 +4095,13 @@ def wait_for_init_wrap(method):  # pylint: disable=too-many-statements
 
         with critical_node_setup_events():
             start_time = time.perf_counter()
-            # setup in parallel
-            for node in node_list:
-                current_setup_thread = threading.Thread(
-                    target=node_setup, args=(node, setup_queue), daemon=True)
-                current_setup_thread.start()
-            while len(setup_results) != len(node_list):
-                verify_node_setup_or_startup(start_time, setup_queue, setup_results)
-            # startup
+            # setup in parallel, and startup of every node as soon as it's allowed
             for node in node_list:
-                if cl_inst.parallel_startup:
-                    threading.Thread(target=node_startup, args=(node, startup_queue), daemon=True).start()
-                else:
-                    node_startup(node, startup_queue)
+                threading.Thread(target=node_setup, args=(node, ), daemon=True).start()
             while len(startup_results) != len(node_list):
-                verify_node_setup_or_startup(start_time, startup_queue, startup_results)
+                verify_node_setup_or_startup(start_time)
+            for node, node_timings in timings.items():
+                cl_inst.log.debug("Node %s init timings: %s", node, node_timings)
             # Check DB nodes for UN
             if isinstance(cl_inst, BaseScyllaCluster):
                 cl_inst.wait_for_nodes_up_and_normal(
@@ -3954,6 +4129,8 @@ class BaseScyllaCluster:  # pylint: disable=too-many-public-methods, too-many-in
     nodes: List[BaseNode]
     log: logging.Logger
 
+    max_parallel_startups_per_rack = 3  # number of nodes of a rack bootstrapped concurrently, if `parallel_startup'
+
     def __init__(self, *args, **kwargs):
         self.nemesis_termination_event = threading.Event()
         self.nemesis = []
@@ -3961,6 +4138,8 @@ class BaseScyllaCluster:  # pylint: disable=too-many-public-methods, too-many-in
         self.nemesis_count = 0
         self.test_config = TestConfig()
         self._node_cycle = None
+        self._cfstats_samplers: dict[str, CfstatsSampler] = {}
+        self._cfstats_samplers_lock = threading.Lock()
         self.params = kwargs.get('params', {})
         force_gossip = (self.params.get('append_scylla_yaml') or {}).get('force_gossip_topology_changes', False)
         self.parallel_node_operations = False if force_gossip else self.params.get("parallel_node_operations") or False
@@ -4282,10 +4461,36 @@ class BaseScyllaCluster:  # pylint: disable=too-many-public-methods, too-many-in
         """
         if not verification_node:
             verification_node = random.choice(self.nodes)
+        raw_status = None
+        if verification_node.use_nodetool_rest_api("status"):
+            try:
+                raw_status = verification_node.nodetool_rest_client.status()
+            except ScyllaApiException as exc:
+                self.log.debug("Failed to get status with REST API of %s, using nodetool: %s", verification_node, exc)
+        if raw_status is None:
+            res = verification_node.run_nodetool('status', publish_event=False)
+            raw_status = self._parse_nodetool_status(res.stdout)
+
         status = {}
-        res = verification_node.run_nodetool('status', publish_event=False)
+        for dc_name, nodes_info in raw_status.items():
+            status[dc_name] = {}
+            for node_ip, node_info in nodes_info.items():
+                # make sure we use ipv6 long format (some tools remove leading zeros)
+                ip_address = ipaddress.ip_address(node_ip).exploded
+                # NOTE: following replacement is needed for the K8S case where
+                #       registered IP is different than the one used for network connections
+                if verification_node.is_kubernetes():
+                    for node in self.nodes:
+                        if ip_address in node.get_all_ip_addresses() and ip_address != node.ip_address:
+                            ip_address = node.ip_address
+                node_info["load"] = node_info["load"].replace(" ", "")
+                status[dc_name][ip_address] = node_info
+        return status
 
-        data_centers = res.stdout.split("Datacenter: ")
+    @staticmethod
+    def _parse_nodetool_status(nodetool_status_output: str) -> dict[str, dict[str, dict[str, str]]]:
+        status = {}
+        data_centers = nodetool_status_output.split("Datacenter: ")
         # see TestNodetoolStatus test in test_cluster.py
         pattern = re.compile(
             r"(?P<state>\w{2})\s+"
@@ -4307,16 +4512,7 @@ class BaseScyllaCluster:  # pylint: disable=too-many-public-methods, too-many-in
                 if not match:
                     continue
                 node_info = match.groupdict()
-                # make sure we use ipv6 long format (some tools remove leading zeros)
-                node_ip = ipaddress.ip_address(node_info.pop("ip")).exploded
-                # NOTE: following replacement is needed for the K8S case where
-                #       registered IP is different than the one used for network connections
-                if verification_node.is_kubernetes():
-                    for node in self.nodes:
-                        if node_ip in node.get_all_ip_addresses() and node_ip != node.ip_address:
-                            node_ip = node.ip_address
-                node_info["load"] = node_info["load"].replace(" ", "")
-                status[dc_name][node_ip] = node_info
+                status[dc_name][node_info.pop("ip")] = node_info
         return status
 
     @staticmethod
@@ -4437,6 +4633,12 @@ class BaseScyllaCluster:  # pylint: disable=too-many-public-methods, too-many-in
         keyspaces = db_node.run_cqlsh("describe keyspaces").stdout.split()
         return [ks for ks in keyspaces if not ks.startswith("system")]
 
+    def get_cfstats_sampler(self, node: BaseNode) -> CfstatsSampler:
+        with self._cfstats_samplers_lock:
+            if node.name not in self._cfstats_samplers:
+                self._cfstats_samplers[node.name] = CfstatsSampler(node)
+            return self._cfstats_samplers[node.name]
+
     def cfstat_reached_threshold(self, key, threshold, keyspaces=None):
         """
         Find whether a certain cfstat key in all nodes reached a certain value.
@@ -4447,20 +4649,13 @@ class BaseScyllaCluster:  # pylint: disable=too-many-public-methods, too-many-in
                          receive all
         :return: Whether all nodes reached that threshold or not.
         """
-        if not keyspaces:
-            keyspaces = self.get_test_keyspaces()
-
         self.log.debug("Waiting for threshold: %s" % (threshold))
         node = self.nodes[0]
-        node_space = 0
-        # Calculate space on the disk of all test keyspaces on the one node.
+        # Calculate space on the disk of all test keyspaces on the one node, with one cfstats call for all of them.
         # It's decided to check the threshold on one node only
-        for keyspace_name in keyspaces:
-            self.log.debug("Get cfstats on the node %s for %s keyspace" %
-                           (node.name, keyspace_name))
-            node_space += node.get_cfstats(keyspace_name)[key]
+        node_space = self.get_cfstats_sampler(node).sample().total(key, keyspaces)
         self.log.debug("Current cfstats on the node %s for %s keyspaces: %s" %
-                       (node.name, keyspaces, node_space))
+                       (node.name, keyspaces or "test", node_space))
         reached_threshold = True
         if node_space < threshold:
             reached_threshold = False
@@ -4475,7 +4670,9 @@ class BaseScyllaCluster:  # pylint: disable=too-many-public-methods, too-many-in
             if keyspace and not isinstance(keyspace, list):
                 keyspace = [keyspace]
             key = 'Space used (total)'
-            wait.wait_for(func=self.cfstat_reached_threshold, step=10, timeout=600,
+            sampler = self.get_cfstats_sampler(self.nodes[0])
+            wait.wait_for(func=self.cfstat_reached_threshold, timeout=600,
+                          step=partial(sampler.next_poll_interval, key, size, keyspace),
                           text="Waiting until cfstat '%s' reaches value '%s'" % (key, size),
                           key=key, threshold=size, keyspaces=keyspace, throw_exc=False)
 
@@ -5900,9 +6097,8 @@ class BaseMonitorSet:  # pylint: disable=too-many-public-methods,too-many-instan
                                                  test_start_time=test_start_time,
                                                  extra_entities=grafana_extra_dashboards)
         screenshot_files = screenshot_collector.collect(node, self.logdir)
-        for screenshot in screenshot_files:
-            s3_path = "{test_id}/{date}".format(test_id=self.test_config.test_id(), date=date_time)
-            screenshot_links.append(S3Storage().upload_file(screenshot, s3_path))
+        s3_path = "{test_id}/{date}".format(test_id=self.test_config.test_id(), date=date_time)
+        screenshot_links.extend(S3Storage().upload_files(screenshot_files, s3_path))
 
         return screenshot_links
 
@@ -20,12 +20,12 @@ from typing import List, Optional, Dict
 from datetime import datetime
 from functools import cached_property
 from threading import Thread, Event
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from contextlib import contextmanager
 
 from sdcm.log import SDCMAdapter
-from sdcm.remote import NETWORK_EXCEPTIONS
 from sdcm.utils.decorators import timeout
 from sdcm.utils.version_utils import get_systemd_version
 from sdcm.sct_events.system import CoreDumpEvent
@@ -86,13 +86,43 @@ class CoreDumpInfo:
                 setattr(self, attr_name, attr_value)
 
 
+class CoredumpUploader:
+    """
+    Builds commands uploading coredumps from the node to upload.scylladb.com (backed by gs://upload.scylladb.com)
+
+    `source` is either a path on the node or `-` to upload whatever is piped into the command.
+    """
+    upload_host = 'upload.scylladb.com'
+
+    def upload_cmd(self, source: str, object_name: str, rate_limit: Optional[str] = None) -> str:
+        limit_rate = f"--limit-rate {rate_limit} " if rate_limit else ""
+        return (f"curl --request PUT --fail --show-error {limit_rate}--upload-file "
+                f"'{source}' 'https://{self.upload_host}/{object_name}'")
+
+    def download_url(self, object_name: str) -> str:
+        return f'https://storage.cloud.google.com/{self.upload_host}/{object_name}'
+
+    def download_cmd(self, object_name: str) -> str:
+        return f'gsutil cp gs://{self.upload_host}/{object_name} .'
+
+
 class CoredumpThreadBase(Thread):  # pylint: disable=too-many-instance-attributes
     lookup_period = 30
     upload_retry_limit = 3
     max_coredump_thread_exceptions = 10
+    # Cores are read in chunks of this size, each chunk is compressed and uploaded as a separate part,
+    # so a failed upload is resumed from the first part which is not uploaded yet
+    upload_chunk_size_mb = 1024
+    # Total upload bandwidth of the node, shared between cores uploaded in parallel
+    max_parallel_uploads = 2
+    upload_bandwidth_limit_mb = 200
+    compress_cmd = 'pigz --fast --stdout'
+    compressed_extensions = ('.lz4', '.zip', '.gz', '.gzip', '.zst')
 
     def __init__(self, node: 'BaseNode', max_core_upload_limit: int):
         self.node = node
+        self.uploader = CoredumpUploader()
+        self._uploaded_parts: Dict[str, set] = {}
         self.log = SDCMAdapter(node.log, extra={"prefix": self.__class__.__name__})
         self.max_core_upload_limit = max_core_upload_limit
         self.found: List[CoreDumpInfo] = []
@@ -156,26 +186,45 @@ class CoredumpThreadBase(Thread):  # pylint: disable=too-many-instance-attribute
         """
         if not in_progress:
             return
+        to_process = []
         for core_info in in_progress.copy():
             if self.is_limit_reached():
                 in_progress.remove(core_info)
                 continue
-            try:
-                core_info.process_retry += 1
-                if self.upload_retry_limit < core_info.process_retry:
-                    self.log.error(f"Maximum retry uploading is reached for core {str(core_info)}")
-                    in_progress.remove(core_info)
-                    completed.append(core_info)
-                    continue
-                self.update_coredump_info_with_more_information(core_info)
-                result = self.upload_coredump(core_info)
-                completed.append(core_info)
+            if len(uploaded) + len(to_process) >= self.max_core_upload_limit:
+                # Left for the next cycle, in case some of the cores being uploaded now would fail
+                continue
+            core_info.process_retry += 1
+            if self.upload_retry_limit < core_info.process_retry:
+                self.log.error(f"Maximum retry uploading is reached for core {str(core_info)}")
                 in_progress.remove(core_info)
-                if result:
-                    uploaded.append(core_info)
-                    self.publish_event(core_info)
-            except Exception:  # pylint: disable=broad-except  # noqa: BLE001
-                pass
+                completed.append(core_info)
+                continue
+            to_process.append(core_info)
+        if not to_process:
+            return
+        with ThreadPoolExecutor(max_workers=self.max_parallel_uploads,
+                                thread_name_prefix=self.__class__.__name__) as executor:
+            results = list(executor.map(self._process_coredump, to_process))
+        # Results are collected in the original order, to keep reporting independent of the upload timing
+        for core_info, result in zip(to_process, results):
+            if result is None:
+                continue
+            completed.append(core_info)
+            in_progress.remove(core_info)
+            if result:
+                uploaded.append(core_info)
+                self.publish_event(core_info)
+
+    def _process_coredump(self, core_info: CoreDumpInfo) -> Optional[bool]:
+        """
+        Returns None if processing has failed and should be retried
+        """
+        try:
+            self.update_coredump_info_with_more_information(core_info)
+            return self.upload_coredump(core_info)
+        except Exception:  # pylint: disable=broad-except  # noqa: BLE001
+            return None
 
     @abstractmethod
     def get_list_of_cores(self) -> Optional[List[CoreDumpInfo]]:
@@ -202,28 +251,72 @@ class CoredumpThreadBase(Thread):  # pylint: disable=too-many-instance-attribute
             output.append(new_core_info)
         return output
 
-    # @retrying(n=10, sleep_time=20, allowed_exceptions=NETWORK_EXCEPTIONS, message="Retrying on uploading coredump")
+    @property
+    def upload_rate_limit(self) -> Optional[str]:
+        if not self.upload_bandwidth_limit_mb:
+            return None
+        return f'{max(1, self.upload_bandwidth_limit_mb // self.max_parallel_uploads)}M'
+
     def _upload_coredump(self, core_info: CoreDumpInfo):
         coredump = core_info.corefile
-        coredump = self._pack_coredump(coredump)
-        coredump_id = os.path.basename(coredump)[:-3]
-        upload_url = f'upload.scylladb.com/{coredump_id}/{os.path.basename(coredump)}'
-        self.log.info('Uploading coredump %s to %s', coredump, upload_url)
-        self.node.remoter.run("sudo curl --request PUT --fail --show-error --upload-file "
-                              "'%s' 'https://%s'" % (coredump, upload_url))
-        download_url = 'https://storage.cloud.google.com/%s' % upload_url
+        if coredump.endswith(self.compressed_extensions):
+            object_name = f'{os.path.basename(coredump)[:-3]}/{os.path.basename(coredump)}'
+            self.log.info('Uploading coredump %s to %s', coredump, self.uploader.download_url(object_name))
+            self.node.remoter.sudo(self.uploader.upload_cmd(coredump, object_name, self.upload_rate_limit))
+            object_names = [object_name]
+        else:
+            object_names = self._stream_coredump(coredump)
+        download_url = self.uploader.download_url(object_names[0])
         self.log.info("You can download it by %s (available for ScyllaDB employee)", download_url)
-        download_instructions = f'gsutil cp gs://{upload_url} .'
-
-        coredump = Path(coredump)
-        if coredump.suffix == '.zst':
-            download_instructions += f'\nunzstd {coredump.name}'
-        elif coredump.suffix in ('.gzip', '.gz'):
-            download_instructions += f'\ngunzip {coredump.name}'
-        elif coredump.suffix == '.lz4':
-            download_instructions += f'\nunlz4 {coredump.name}'
+
+        compressed_name = Path(object_names[0]).name
+        if len(object_names) == 1:
+            download_instructions = self.uploader.download_cmd(object_names[0])
+        else:
+            compressed_name = Path(compressed_name).stem
+            parts_pattern = f'{Path(object_names[0]).parent}/{compressed_name}.part-*'
+            download_instructions = self.uploader.download_cmd(parts_pattern)
+            download_instructions += f'\ncat {compressed_name}.part-* > {compressed_name}'
+
+        suffix = Path(compressed_name).suffix
+        if suffix == '.zst':
+            download_instructions += f'\nunzstd {compressed_name}'
+        elif suffix in ('.gzip', '.gz'):
+            download_instructions += f'\ngunzip {compressed_name}'
+        elif suffix == '.lz4':
+            download_instructions += f'\nunlz4 {compressed_name}'
         core_info.download_url, core_info.download_instructions = download_url, download_instructions
 
+    def _stream_coredump(self, coredump: str) -> List[str]:
+        """
+        Compress and upload the coredump in chunks, without writing a compressed copy of it on the node
+
+        Every chunk is a complete gzip stream, so concatenated parts are decompressed by gunzip as a single file.
+        Parts uploaded by the previous attempts are not uploaded again.
+        """
+        if not self._is_pigz_installed:
+            self._install_pigz()
+        core_size = int(self.node.remoter.sudo(f'stat -c %s {coredump}', verbose=False).stdout.strip())
+        chunk_size = self.upload_chunk_size_mb * 1024 * 1024
+        parts_count = max(1, -(-core_size // chunk_size))
+        object_name = f'{os.path.basename(coredump)}/{os.path.basename(coredump)}.gz'
+        if parts_count == 1:
+            object_names = [object_name]
+        else:
+            object_names = [f'{object_name}.part-{part:04d}' for part in range(parts_count)]
+        uploaded_parts = self._uploaded_parts.setdefault(object_name, set())
+        self.log.info('Uploading coredump %s to %s in %s part(s)',
+                      coredump, self.uploader.download_url(object_name), parts_count)
+        for part, part_name in enumerate(object_names):
+            if part in uploaded_parts:
+                continue
+            pipeline = (f"dd if='{coredump}' bs=1M skip={part * self.upload_chunk_size_mb} "
+                        f"count={self.upload_chunk_size_mb} status=none | {self.compress_cmd} | "
+                        f"{self.uploader.upload_cmd('-', part_name, self.upload_rate_limit)}")
+            self.node.remoter.sudo(f'bash -o pipefail -c "{pipeline}"')
+            uploaded_parts.add(part)
+        return object_names
+
     @contextmanager
     def hard_link_corefile(self, corefile):  # pylint: disable=unused-argument,no-self-use
         yield
@@ -258,30 +351,13 @@ class CoredumpThreadBase(Thread):  # pylint: disable=too-many-instance-attribute
     def _install_pigz(self):
         if self.node.distro.is_rhel_like:
             self.node.remoter.sudo('yum install -y pigz')
-            self.__dict__['is_pigz_installed'] = True
+            self.__dict__['_is_pigz_installed'] = True
         elif self.node.distro.is_ubuntu or self.node.distro.is_debian:
             self.node.remoter.sudo('apt install -y pigz')
-            self.__dict__['is_pigz_installed'] = True
+            self.__dict__['_is_pigz_installed'] = True
         else:
             raise RuntimeError("Distro is not supported")
 
-    def _pack_coredump(self, coredump: str) -> str:
-        extensions = ['.lz4', '.zip', '.gz', '.gzip', '.zst']
-        for extension in extensions:
-            if coredump.endswith(extension):
-                return coredump
-        if not self._is_pigz_installed:
-            self._install_pigz()
-        try:  # pylint: disable=unreachable
-            if not self.node.remoter.run(f'sudo ls {coredump}.gz', verbose=False, ignore_status=True).ok:
-                self.node.remoter.run(f'sudo pigz --fast --keep {coredump}')
-            coredump += '.gz'
-        except NETWORK_EXCEPTIONS:  # pylint: disable=try-except-raise
-            raise
-        except Exception as ex:  # pylint: disable=broad-except  # noqa: BLE001
-            self.log.warning("Failed to compress coredump '%s': %s", coredump, ex)
-        return coredump
-
     def log_coredump(self, core_info: CoreDumpInfo):
         if not core_info.coredump_info:
             return
@@ -21,7 +21,7 @@ import json
 import urllib.parse
 
 from textwrap import dedent
-from math import sqrt
+from math import sqrt, ceil
 from typing import Optional
 from functools import cached_property
 from collections import defaultdict
@@ -29,7 +29,7 @@ from collections import defaultdict
 import yaml
 import requests
 
-from sdcm.es import ES
+from sdcm.es import ES, ESBulkWriter, get_shared_es_bulk_writer
 from sdcm.test_config import TestConfig
 from sdcm.utils.common import normalize_ipv6_url, get_ami_tags
 from sdcm.utils.git import get_git_commit_id
@@ -201,6 +201,8 @@ def get_cdcreader_cmd_params(cmd):
 
 
 class PrometheusDBStats:
+    REACTOR_UTILIZATION_GROUP = "reactor_utilization"
+
     def __init__(self, host, port=9090, protocol='http', alternator=None):
         self.host = host
         self.port = port
@@ -334,6 +336,46 @@ class PrometheusDBStats:
                                                     [float(runtime[1]) for runtime in item['values']]})
         return res
 
+    def get_scheduler_runtime_query_steps(self, start_time, end_time, max_points=500):
+        """
+        Pick the query step and the irate() window of a range query for the scrape interval of scylla metrics
+
+        The step is the scrape interval, unless it gives more than `max_points` points per series, and the irate()
+        window holds at least 4 scrapes, to get a rate even if some of the scrapes were missed.
+        """
+        scrape_interval = self.scylla_scrape_interval
+        step = max(scrape_interval, ceil((end_time - start_time) / max_points))
+        irate_window = max(30, 4 * scrape_interval)
+        return step, irate_window
+
+    def get_scylla_scheduler_runtime_per_instance(self, start_time, end_time, instances,  # pylint: disable=invalid-name
+                                                  irate_window=None):
+        """
+        Get Scylla CPU scheduler runtime of the service level groups and the reactor utilization of all the instances
+        in one range query
+
+        :return: tuple of {instance: {scheduler group: [runtime values]}} and {instance: avg reactor utilization}
+        """
+        if not instances or not self._check_start_end_time(start_time, end_time):
+            return {}, {}
+        step, default_irate_window = self.get_scheduler_runtime_query_steps(start_time, end_time)
+        irate_window = irate_window or default_irate_window
+        instance_filter = 'instance=~"%s"' % "|".join(instances)
+        # reactor utilization is labeled as a pseudo scheduler group, to be returned by the same query
+        query = 'avg(irate(scylla_scheduler_runtime_ms{group=~"sl:.*", %s}[%ss])) by (group, instance) or ' \
+            'label_replace(avg(scylla_reactor_utilization{%s}) by (instance), "group", "%s", "", "")' % (
+                instance_filter, irate_window, instance_filter, self.REACTOR_UTILIZATION_GROUP)
+        runtime_per_instance = defaultdict(dict)
+        reactor_utilization = {}
+        for item in self.query(query=query, start=start_time, end=end_time, scrap_metrics_step=step):
+            instance, group = item['metric']['instance'], item['metric']['group']
+            values = [float(value[1]) for value in item['values']]
+            if group == self.REACTOR_UTILIZATION_GROUP:
+                reactor_utilization[instance] = sum(values) / len(values) if values else None
+            else:
+                runtime_per_instance[instance][group] = values
+        return runtime_per_instance, reactor_utilization
+
     def get_scylla_scheduler_shares_per_sla(self, start_time, end_time, node_ip):  # pylint: disable=invalid-name
         """
         Get scylla_scheduler_shares from PrometheusDB
@@ -468,31 +510,46 @@ class Stats:
             ElasticsearchEvent(doc_id=self._test_id, error=str(exc)).publish()
             return None
 
-    def create(self) -> None:
+    @cached_property
+    def es_writer(self) -> Optional[ESBulkWriter]:
+        """Background bulk writer of this process, keeps ES latency out of the test threads"""
         if not self.elasticsearch:
+            return None
+        return get_shared_es_bulk_writer(
+            es=self.elasticsearch,
+            journal_path=os.path.join(self.test_config.logdir(), "es_test_stats_journal.jsonl"),
+        )
+
+    def _publish_es_error(self, error: str) -> None:
+        ElasticsearchEvent(doc_id=self._test_id, error=error).publish()
+
+    def create(self) -> None:
+        if not self.es_writer:
             LOGGER.error("Failed to create test stats: ES connection is not created (doc_id=%s)", self._test_id)
             return
         try:
-            self.elasticsearch.create_doc(
+            self.es_writer.create_doc(
                 index=self._test_index,
                 doc_type=self._es_doc_type,
                 doc_id=self._test_id,
                 body=self._stats,
+                on_error=self._publish_es_error,
             )
         except Exception as exc:  # pylint: disable=broad-except
             LOGGER.exception("Failed to create test stats (doc_id=%s)", self._test_id)
             ElasticsearchEvent(doc_id=self._test_id, error=str(exc)).publish()
 
     def update(self, data: dict) -> None:
-        if not self.elasticsearch:
+        if not self.es_writer:
             LOGGER.error("Failed to update test stats: ES connection is not created (doc_id=%s)", self._test_id)
             return
         try:
-            self.elasticsearch.update_doc(
+            self.es_writer.update_doc(
                 index=self._test_index,
                 doc_type=self._es_doc_type,
                 doc_id=self._test_id,
                 body=data,
+                on_error=self._publish_es_error,
             )
         except Exception as exc:  # pylint: disable=broad-except
             LOGGER.exception("Failed to update test stats (doc_id=%s)", self._test_id)
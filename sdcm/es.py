@@ -1,11 +1,22 @@
+import os
+import copy
+import json
+import atexit
 import logging
+import threading
 from functools import cached_property
+from typing import Callable, Optional
 
 import elasticsearch
+from elasticsearch.serializer import JSONSerializer
 
 from sdcm.keystore import KeyStore
 
 LOGGER = logging.getLogger(__name__)
+# the flusher thread of a writer keeps it alive until it's stopped, all of them are stopped at exit
+_ACTIVE_BULK_WRITERS: set["ESBulkWriter"] = set()
+_SHARED_BULK_WRITERS: dict[Optional[str], "ESBulkWriter"] = {}
+_BULK_WRITERS_LOCK = threading.RLock()
 
 
 class ES(elasticsearch.Elasticsearch):
@@ -23,15 +34,24 @@ class ES(elasticsearch.Elasticsearch):
     def _create_index(self, index):
         self.indices.create(index=index, ignore=400)  # pylint: disable=unexpected-keyword-arg
 
+    # reads go through a barrier, so documents queued by an ESBulkWriter of this process are visible to them
+    def search(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        flush_pending_es_writes()
+        return super().search(*args, **kwargs)
+
+    def get(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        flush_pending_es_writes()
+        return super().get(*args, **kwargs)
+
+    def exists(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        flush_pending_es_writes()
+        return super().exists(*args, **kwargs)
+
     def create_doc(self, index, doc_type, doc_id, body):
         """
         Add document in json format
         """
-        LOGGER.info('Create doc')
-        LOGGER.info('INDEX: %s', index)
-        LOGGER.info('DOC_TYPE: %s', doc_type)
-        LOGGER.info('DOC_ID: %s', doc_id)
-        LOGGER.info('BODY: %s', body)
+        LOGGER.debug('Create doc %s in index %s (doc_type=%s)', doc_id, index, doc_type)
         self._create_index(index)
         if self.exists(index=index, doc_type=doc_type, id=doc_id):
             self.update(index=index, doc_type=doc_type, id=doc_id, body={'doc': body})
@@ -68,3 +88,234 @@ class ES(elasticsearch.Elasticsearch):
         """
         if self.get_doc(index, doc_id, doc_type):
             self.delete(index=index, doc_type=doc_type, id=doc_id)
+
+
+def _deep_merge(target: dict, source: dict) -> dict:
+    """Merge `source` into `target` the same way ES applies a partial document update"""
+    for key, value in source.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _deep_merge(target[key], value)
+        else:
+            target[key] = value
+    return target
+
+
+def _merge_pending_doc(docs: dict[tuple, dict], key: tuple, doc: dict) -> None:
+    if existing := docs.get(key):
+        _deep_merge(existing["doc"], doc["doc"])
+        existing["upsert"] |= doc["upsert"]
+        if doc.get("on_error"):
+            existing["on_error"] = doc["on_error"]
+    else:
+        docs[key] = doc
+
+
+class ESBulkWriter:  # pylint: disable=too-many-instance-attributes
+    """
+    Write documents to Elasticsearch in the background, using the `_bulk` API
+
+    Partial updates of the same document are coalesced into a single update action, and sent when `flush_size`
+    documents are pending or every `flush_interval` seconds. Indices are created once per writer.
+    When ES is unreachable, pending documents are spilled to `journal_path` and replayed on the next flush.
+    Other failures are retried by the next flushes, up to `max_send_attempts` times, and then the documents are dropped.
+    Errors are reported to the `on_error` callback given with the document, or to the one of the writer.
+
+    Readers in the same process stay consistent: `ES.search/get/exists` flush all active writers first.
+    """
+
+    def __init__(self, es: Optional[elasticsearch.Elasticsearch] = None,  # pylint: disable=too-many-arguments
+                 flush_size: int = 500, flush_interval: float = 5.0, journal_path: Optional[str] = None,
+                 on_error: Optional[Callable[[str], None]] = None, max_send_attempts: int = 3):
+        self._es = es
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.journal_path = journal_path
+        self._on_error = on_error
+        self.max_send_attempts = max_send_attempts
+        self._failed_send_attempts = 0
+        self._pending: dict[tuple, dict] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.RLock()
+        self._known_indices = set()
+        self._serializer = JSONSerializer()
+        self._wakeup = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=self.__class__.__name__, daemon=True)
+        self._thread.start()
+        with _BULK_WRITERS_LOCK:
+            _ACTIVE_BULK_WRITERS.add(self)
+
+    @property
+    def es(self) -> elasticsearch.Elasticsearch:
+        if self._es is None:
+            self._es = ES()
+        return self._es
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def create_doc(self, index: str, doc_type: Optional[str], doc_id: str, body: dict,  # pylint: disable=too-many-arguments
+                   on_error: Optional[Callable[[str], None]] = None) -> None:
+        """Queue document creation, or an update of it if it already exists (same as `ES.create_doc`)"""
+        self._enqueue(index, doc_type, doc_id, body, upsert=True, on_error=on_error)
+
+    def update_doc(self, index: str, doc_type: Optional[str], doc_id: str, body: dict,  # pylint: disable=too-many-arguments
+                   on_error: Optional[Callable[[str], None]] = None) -> None:
+        """Queue partial update of an existing document (same as `ES.update_doc`)"""
+        self._enqueue(index, doc_type, doc_id, body, upsert=False, on_error=on_error)
+
+    def _enqueue(self, index, doc_type, doc_id, body, upsert, on_error):  # pylint: disable=too-many-arguments
+        body = copy.deepcopy(body)  # callers keep mutating their dicts, take a snapshot of them
+        with self._pending_lock:
+            _merge_pending_doc(self._pending, (index, doc_type, doc_id),
+                               {"doc": body, "upsert": upsert, "on_error": on_error})
+            pending_count = len(self._pending)
+        LOGGER.debug("Queued %s of doc %s in index %s", "upsert" if upsert else "update", doc_id, index)
+        if pending_count >= self.flush_size:
+            self._wakeup.set()
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            self._wakeup.wait(timeout=self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:  # pylint: disable=broad-except  # noqa: BLE001
+                LOGGER.exception("Failed to flush documents to ES")
+
+    def flush(self) -> None:
+        """Send everything pending (including the spilled journal) to ES, spill it to the journal if ES is unreachable"""
+        with self._flush_lock:
+            with self._pending_lock:
+                pending, self._pending = self._pending, {}
+            journal = self._read_journal()
+            if not pending and not journal:
+                return
+            for key, doc in pending.items():
+                _merge_pending_doc(journal, key, doc)
+            try:
+                self._send(journal)
+            except elasticsearch.ConnectionError as exc:
+                if self.journal_path:
+                    LOGGER.warning("ES is unreachable, spilling %d documents to %s: %s",
+                                   len(journal), self.journal_path, exc)
+                    self._write_journal(journal)
+                else:
+                    LOGGER.warning("ES is unreachable, keeping %d documents pending: %s", len(journal), exc)
+                    self._requeue(journal)
+            except Exception as exc:
+                self._failed_send_attempts += 1
+                if self._failed_send_attempts < self.max_send_attempts:
+                    self._requeue(journal)
+                    raise
+                self._failed_send_attempts = 0
+                self._remove_journal()
+                for (_, _, doc_id), doc in journal.items():
+                    self._report_error(doc, f"Failed to write doc {doc_id} to ES, dropping it after "
+                                            f"{self.max_send_attempts} attempts: {exc}")
+            else:
+                self._failed_send_attempts = 0
+                self._remove_journal()
+
+    def _report_error(self, doc: dict, message: str) -> None:
+        LOGGER.error(message)
+        if on_error := doc.get("on_error") or self._on_error:
+            on_error(message)
+
+    def _requeue(self, docs: dict[tuple, dict]) -> None:
+        with self._pending_lock:
+            for key, doc in self._pending.items():
+                _merge_pending_doc(docs, key, doc)
+            self._pending = docs
+
+    def _send(self, docs: dict[tuple, dict]) -> None:
+        for index in {index for index, _, _ in docs} - self._known_indices:
+            self.es.indices.create(index=index, ignore=400)  # pylint: disable=unexpected-keyword-arg
+            self._known_indices.add(index)
+        actions = []
+        for (index, doc_type, doc_id), doc in docs.items():
+            meta = {"_index": index, "_id": doc_id}
+            if doc_type:
+                meta["_type"] = doc_type
+            actions.append({"update": meta})
+            actions.append({"doc": doc["doc"], "doc_as_upsert": doc["upsert"]})
+        response = self.es.bulk(body=actions)  # pylint: disable=no-value-for-parameter
+        if response.get("errors"):
+            # the items of a bulk response are in the order of its actions
+            for item, doc in zip(response["items"], docs.values()):
+                if error := item["update"].get("error"):
+                    self._report_error(doc, f"Failed to write doc {item['update'].get('_id')} to ES: {error}")
+        LOGGER.debug("Sent %d documents to ES in one bulk request", len(docs))
+
+    def _read_journal(self) -> dict[tuple, dict]:
+        docs = {}
+        if not (self.journal_path and os.path.exists(self.journal_path)):
+            return docs
+        with open(self.journal_path, encoding="utf-8") as journal_file:
+            for line in journal_file:
+                entry = json.loads(line)
+                docs[(entry["index"], entry["doc_type"], entry["doc_id"])] = {"doc": entry["doc"],
+                                                                              "upsert": entry["upsert"]}
+        return docs
+
+    def _write_journal(self, docs: dict[tuple, dict]) -> None:
+        with open(self.journal_path, "w", encoding="utf-8") as journal_file:
+            for (index, doc_type, doc_id), doc in docs.items():
+                journal_file.write(self._serializer.dumps(
+                    {"index": index, "doc_type": doc_type, "doc_id": doc_id,
+                     "doc": doc["doc"], "upsert": doc["upsert"]}) + "\n")
+
+    def _remove_journal(self) -> None:
+        if self.journal_path and os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+
+    def stop(self, timeout: float = 60) -> None:
+        """Stop the flusher thread and send everything still pending"""
+        self._stop_event.set()
+        self._wakeup.set()
+        self._thread.join(timeout=timeout)
+        self.flush()
+        with _BULK_WRITERS_LOCK:
+            _ACTIVE_BULK_WRITERS.discard(self)
+
+
+def get_shared_es_bulk_writer(es: Optional[elasticsearch.Elasticsearch] = None,
+                              journal_path: Optional[str] = None) -> ESBulkWriter:
+    """
+    Return the ESBulkWriter of this process which spills to `journal_path`, create it on the first call
+
+    A journal file can be replayed by one writer only, so there is a shared writer per journal path. The writer is
+    shared by different callers, so they pass their `on_error` callbacks with the documents.
+    """
+    with _BULK_WRITERS_LOCK:
+        if (writer := _SHARED_BULK_WRITERS.get(journal_path)) is None or writer not in _ACTIVE_BULK_WRITERS:
+            writer = _SHARED_BULK_WRITERS[journal_path] = ESBulkWriter(es=es, journal_path=journal_path)
+        return writer
+
+
+def flush_pending_es_writes() -> None:
+    """Flush all the active ESBulkWriter instances of this process"""
+    with _BULK_WRITERS_LOCK:
+        writers = list(_ACTIVE_BULK_WRITERS)
+    for writer in writers:
+        # flush() waits for a flush running in the background, so documents being sent aren't missed
+        try:
+            writer.flush()
+        except Exception:  # pylint: disable=broad-except  # noqa: BLE001
+            LOGGER.exception("Failed to flush pending documents to ES")
+
+
+def stop_es_bulk_writers() -> None:
+    """Stop all the active ESBulkWriter instances of this process, sending everything they still have pending"""
+    with _BULK_WRITERS_LOCK:
+        writers = list(_ACTIVE_BULK_WRITERS)
+        _SHARED_BULK_WRITERS.clear()
+    for writer in writers:
+        try:
+            writer.stop()
+        except Exception:  # pylint: disable=broad-except  # noqa: BLE001
+            LOGGER.exception("Failed to flush pending documents to ES")
+
+
+atexit.register(stop_es_bulk_writers)
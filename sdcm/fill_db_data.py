@@ -19,16 +19,20 @@ __author__ = 'Roy Dahan'
 import contextlib
 import logging
 import random
+import threading
 import time
 import re
 
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
 from uuid import UUID
 
 from cassandra import InvalidRequest
 from cassandra.util import sortedset, SortedSet  # pylint: disable=no-name-in-module
 from cassandra import ConsistencyLevel
 from cassandra.protocol import ProtocolException  # pylint: disable=no-name-in-module
+from cassandra.query import SimpleStatement, FETCH_SIZE_UNSET  # pylint: disable=no-name-in-module
 
 from sdcm.tester import ClusterTester
 from sdcm.utils.database_query_utils import fetch_all_rows
@@ -40,6 +44,11 @@ from sdcm.utils.issues import SkipPerIssues
 
 
 LOGGER = logging.getLogger(__name__)
+# statements which affect other items: nodetool commands on all nodes and switching the keyspace of the session
+EXCLUSIVE_STATEMENT_REGEX = re.compile(r"^\s*(#REMOTER_RUN|USE\s)", re.IGNORECASE)
+TABLE_NAME_REGEX = re.compile(
+    r"\b(?:FROM|INTO|UPDATE|TABLE|COLUMNFAMILY|TRUNCATE|ON)\s+(?:IF\s+(?:NOT\s+)?EXISTS\s+)?(\"?[\w.]+\"?)",
+    re.IGNORECASE)
 
 
 class FillDatabaseData(ClusterTester):
@@ -55,6 +64,8 @@ class FillDatabaseData(ClusterTester):
     NEW_SORTING_ORDER_WITH_SECONDARY_INDEXES_ENTERPRISE_MIN_VERSION = "2021.1.dev"
 
     base_ks = "keyspace_fill_db_data"
+    # number of verification items which don't share tables, run concurrently
+    verification_items_concurrency = 16
     # List of dictionaries for all items tables and their data
     all_verification_items = [
         {
@@ -3031,6 +3042,105 @@ class FillDatabaseData(ClusterTester):
             return match.groupdict()["table_name"]
         return None
 
+    @classmethod
+    def get_item_tables(cls, item: dict) -> set[str]:
+        """Names of the tables (and other schema objects) used by the statements of a verification item"""
+        tables = set()
+        for statement in item['create_tables'] + item['truncates'] + item['inserts'] + item['queries'] + \
+                item.get('invalid_queries', []):
+            for name in TABLE_NAME_REGEX.findall(statement):
+                name = name.strip('"').lower()  # noqa: PLW2901
+                if name not in ('table', 'if'):
+                    tables.add(name.removeprefix(f"{cls.base_ks}."))
+        return tables
+
+    @staticmethod
+    def is_exclusive_item(item: dict) -> bool:
+        return any(EXCLUSIVE_STATEMENT_REGEX.match(statement) for statement in item['inserts'] + item['queries'])
+
+    @classmethod
+    def group_verification_items(cls, items: list[tuple[int, str, dict]]) -> list[list[tuple[int, str, dict]]]:
+        """
+        Split items to groups which can run concurrently: items sharing a table end up in the same group,
+        ordered as in `all_verification_items`
+        """
+        groups: list[tuple[set[str], list]] = []
+        for item_info in items:
+            tables, group_items = cls.get_item_tables(item_info[2]), [item_info]
+            for group in [group for group in groups if group[0] & tables]:
+                groups.remove(group)
+                tables |= group[0]
+                group_items.extend(group[1])
+            groups.append((tables, sorted(group_items, key=lambda info: info[0])))
+        return sorted((group_items for _, group_items in groups), key=lambda group_items: group_items[0][0])
+
+    @classmethod
+    def split_verification_items_to_phases(
+            cls, items: list[tuple[int, str, dict]]) -> list[tuple[bool, list[tuple[int, str, dict]]]]:
+        """
+        Split items to phases which run one after another: an exclusive item runs alone, between the phases of
+        the items before and after it, which run concurrently
+        """
+        phases = []
+        for item_info in items:
+            if cls.is_exclusive_item(item_info[2]):
+                phases.append((True, [item_info]))
+            elif phases and not phases[-1][0]:
+                phases[-1][1].append(item_info)
+            else:
+                phases.append((False, [item_info]))
+        return phases
+
+    def _get_items_to_run(self) -> list[tuple[int, str, dict]]:
+        # TODO: fix following condition to make "skip_condition" really skip stuff
+        # when it is True, not False as it is now.
+        # As of now it behaves as "run_condition".
+        items = []
+        for test_num, item in enumerate(self.all_verification_items):
+            if not item['skip'] and ('skip_condition' not in item or eval(str(item['skip_condition']))):
+                items.append((test_num, item.get('name', 'Test #' + str(test_num)), item))
+        return items
+
+    def _run_verification_items(self, run_item: Callable[[str, dict], None], stage: str):
+        """
+        Run `run_item` for the verification items to run, concurrently for the items which don't share tables
+
+        Stop starting new items on the first failure, and raise the failure of the first failed item
+        once the running items have finished.
+        """
+        timings = {}
+        errors = {}
+        stop_event = threading.Event()
+
+        def run_items_group(group_items):
+            for test_num, test_name, item in group_items:
+                if stop_event.is_set():
+                    return
+                start_time = time.perf_counter()
+                try:
+                    run_item(test_name, item)
+                except Exception as exc:  # pylint: disable=broad-except  # noqa: BLE001
+                    errors[test_num] = exc
+                    stop_event.set()
+                    return
+                finally:
+                    timings[test_name] = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.verification_items_concurrency,
+                                thread_name_prefix="FillDatabaseData") as executor:
+            for exclusive, phase_items in self.split_verification_items_to_phases(self._get_items_to_run()):
+                if exclusive:
+                    run_items_group(phase_items)
+                else:
+                    list(executor.map(run_items_group, self.group_verification_items(phase_items)))
+                if errors:
+                    raise errors[min(errors)]
+        slowest = sorted(timings.items(), key=lambda timing: timing[1], reverse=True)[:10]
+        self.log.info("%s for %s verification items took %.1f seconds (%.1f seconds in total of the items), "
+                      "slowest items:\n%s", stage, len(timings), time.perf_counter() - start_time,
+                      sum(timings.values()), "\n".join(f"  {duration:.2f}s {name}" for name, duration in slowest))
+
     def cql_create_simple_tables(self, session, rows):
         """ Create tables for truncate test """
         create_query = "CREATE TABLE IF NOT EXISTS truncate_table%d (my_id int PRIMARY KEY, col1 int, value int) "
@@ -3218,54 +3328,51 @@ class FillDatabaseData(ClusterTester):
 
     def cql_insert_data_to_tables(self, session, default_fetch_size):
         self.log.info('Start to populate data into tables')
-        # pylint: disable=too-many-nested-blocks
-        for test_num, item in enumerate(self.all_verification_items):
-            test_name = item.get('name', 'Test #' + str(test_num))
-            # TODO: fix following condition to make "skip_condition" really skip stuff
-            # when it is True, not False as it is now.
-            # As of now it behaves as "run_condition".
-            if not item['skip'] and ('skip_condition' not in item or eval(str(item['skip_condition']))):
-                if 'disable_paging' in item and item['disable_paging']:
-                    session.default_fetch_size = 0
-                else:
-                    session.default_fetch_size = default_fetch_size
-                for insert in item['inserts']:
-                    with self._execute_and_log(f'Populated data for test "{test_name}" in {{}} seconds'):
-                        try:
-                            if insert.startswith("#REMOTER_RUN"):
-                                for node in self.db_cluster.nodes:
-                                    node.remoter.run(insert.replace('#REMOTER_RUN', ''))
-                            else:
-                                session.execute(insert)
-                        except Exception as ex:
-                            LOGGER.exception("failed to insert: %s", insert)
-                            raise ex
-                    # Add delay on client side for inserts of list to avoid list order issue
-                    # Referencing https://github.com/scylladb/scylla-enterprise/issues/1177#issuecomment-568762357
-                    if 'list<' in item['create_tables'][0]:
-                        time.sleep(1)
-                if item.get("cdc_tables"):
-                    with self._execute_and_log(f'Read CDC logs for test "{test_name}" in {{}} seconds'):
-                        for cdc_table in item["cdc_tables"]:
-                            item["cdc_tables"][cdc_table] = self.get_cdc_log_rows(session, cdc_table)
-
-    def _run_db_queries(self, item, session):
+
+        def populate_item(test_name, item):
+            fetch_size = 0 if item.get('disable_paging') else default_fetch_size
+            for insert in item['inserts']:
+                with self._execute_and_log(f'Populated data for test "{test_name}" in {{}} seconds'):
+                    try:
+                        if insert.startswith("#REMOTER_RUN"):
+                            for node in self.db_cluster.nodes:
+                                node.remoter.run(insert.replace('#REMOTER_RUN', ''))
+                        else:
+                            session.execute(SimpleStatement(insert, fetch_size=fetch_size))
+                    except Exception as ex:
+                        LOGGER.exception("failed to insert: %s", insert)
+                        raise ex
+                # Add delay on client side for inserts of list to avoid list order issue
+                # Referencing https://github.com/scylladb/scylla-enterprise/issues/1177#issuecomment-568762357
+                if 'list<' in item['create_tables'][0]:
+                    time.sleep(1)
+            if item.get("cdc_tables"):
+                with self._execute_and_log(f'Read CDC logs for test "{test_name}" in {{}} seconds'):
+                    for cdc_table in item["cdc_tables"]:
+                        item["cdc_tables"][cdc_table] = self.get_cdc_log_rows(session, cdc_table)
+
+        self._run_verification_items(populate_item, stage="Populating data")
+
+    def _run_db_queries(self, item, session, fetch_size=FETCH_SIZE_UNSET):
+        def execute(query):
+            return session.execute(SimpleStatement(query, fetch_size=fetch_size))
+
         for i in range(len(item['queries'])):
             try:
                 if item['queries'][i].startswith("#SORTED"):
-                    res = session.execute(item['queries'][i].replace('#SORTED', ''))
+                    res = execute(item['queries'][i].replace('#SORTED', ''))
                     self.assertEqual(sorted([list(row) for row in res]), item['results'][i])
                 elif item['queries'][i].startswith("#REMOTER_RUN"):
                     for node in self.db_cluster.nodes:
                         node.remoter.run(item['queries'][i].replace('#REMOTER_RUN', ''))
                 elif item['queries'][i].startswith("#LENGTH"):
-                    res = session.execute(item['queries'][i].replace('#LENGTH', ''))
+                    res = execute(item['queries'][i].replace('#LENGTH', ''))
                     self.assertEqual(len([list(row) for row in res]), item['results'][i])
                 elif item['queries'][i].startswith("#STR"):
-                    res = session.execute(item['queries'][i].replace('#STR', ''))
+                    res = execute(item['queries'][i].replace('#STR', ''))
                     self.assertEqual(str([list(row) for row in res]), item['results'][i])
                 else:
-                    res = session.execute(item['queries'][i])
+                    res = execute(item['queries'][i])
                     self.assertEqual([list(row) for row in res], item['results'][i])
             except Exception as ex:
                 LOGGER.exception(item['queries'][i])
@@ -3295,35 +3402,33 @@ class FillDatabaseData(ClusterTester):
 
     def run_db_queries(self, session, default_fetch_size):
         self.log.info('Start to running queries')
-        # pylint: disable=too-many-branches,too-many-nested-blocks
-        for test_num, item in enumerate(self.all_verification_items):
-            test_name = item.get('name', 'Test #' + str(test_num))
-            # Some queries contains statement of switch keyspace, reset keyspace at the beginning
-            session.set_keyspace(self.base_ks)
-            # TODO: fix following condition to make "skip_condition" really skip stuff
-            # when it is True, not False as it is now.
-            # As of now it behaves as "run_condition".
-            if not item['skip'] and ('skip_condition' not in item or eval(str(item['skip_condition']))):
-                if 'disable_paging' in item and item['disable_paging']:
-                    session.default_fetch_size = 0
-                else:
-                    session.default_fetch_size = default_fetch_size
+
+        def verify_item(test_name, item):
+            fetch_size = 0 if item.get('disable_paging') else default_fetch_size
+            try:
                 with self._execute_and_log(f'Ran queries for test "{test_name}" in {{}} seconds'):
-                    self._run_db_queries(item, session)
-
-                if 'invalid_queries' in item:
-                    with self._execute_and_log(f'Ran invalid queries for test "{test_name}" in {{}} seconds'):
-                        self._run_invalid_queries(item, session)
-
-                if item.get("cdc_tables"):
-                    with self._execute_and_log(f'Read CDC tables for test "{test_name}" in {{}} seconds'):
-                        self._read_cdc_tables(item, session)
-                    # udpate cdc log tables after queries,
-                    # which could change base table content
-                    with self._execute_and_log(f'Update CDC tables for test "{test_name}" in {{}} seconds'):
-                        for cdc_table in item["cdc_tables"]:
-                            item["cdc_tables"][cdc_table] = self.get_cdc_log_rows(session, cdc_table)
-                            LOGGER.debug(item["cdc_tables"][cdc_table])
+                    self._run_db_queries(item, session, fetch_size=fetch_size)
+            finally:
+                # Some queries contains statement of switch keyspace, such items run alone, reset keyspace after them
+                if self.is_exclusive_item(item):
+                    session.set_keyspace(self.base_ks)
+
+            if 'invalid_queries' in item:
+                with self._execute_and_log(f'Ran invalid queries for test "{test_name}" in {{}} seconds'):
+                    self._run_invalid_queries(item, session)
+
+            if item.get("cdc_tables"):
+                with self._execute_and_log(f'Read CDC tables for test "{test_name}" in {{}} seconds'):
+                    self._read_cdc_tables(item, session)
+                # udpate cdc log tables after queries,
+                # which could change base table content
+                with self._execute_and_log(f'Update CDC tables for test "{test_name}" in {{}} seconds'):
+                    for cdc_table in item["cdc_tables"]:
+                        item["cdc_tables"][cdc_table] = self.get_cdc_log_rows(session, cdc_table)
+                        LOGGER.debug(item["cdc_tables"][cdc_table])
+
+        session.set_keyspace(self.base_ks)
+        self._run_verification_items(verify_item, stage="Running queries")
 
     def get_cdc_log_rows(self, session, cdc_log_table):
         return list(session.execute(f"select * from {self.base_ks}.{cdc_log_table}"))
@@ -12,8 +12,13 @@
 # Copyright (c) 2024 ScyllaDB
 
 import base64
+import bisect
+import heapq
 import json
 import logging
+import time
+from array import array
+from functools import cache
 
 from threading import Event, Thread
 
@@ -21,6 +26,7 @@ import kafka
 
 from sdcm.sct_config import SCTConfiguration
 from sdcm.kafka.kafka_config import SctKafkaConfiguration
+from sdcm.prometheus import NemesisMetrics
 from sdcm.utils.common import generate_random_string
 from sdcm.wait import wait_for
 
@@ -28,15 +34,211 @@ from sdcm.wait import wait_for
 LOGGER = logging.getLogger(__name__)
 
 
+class CompactIntSet:
+    """
+    Set of non-negative 64 bit integers
+
+    Integers below `max_bitmap_key` are stored as bits of a bitmap, larger ones in a sorted array of 8 bytes per
+    integer, which new ones are merged into in batches.
+    """
+
+    def __init__(self, max_bitmap_key: int, min_merge_size: int = 65536):
+        self.max_bitmap_key = max_bitmap_key
+        self.min_merge_size = min_merge_size
+        self._bitmap = bytearray()
+        self._bitmap_count = 0
+        self._sorted = array("Q")
+        self._unmerged = set()
+
+    def add(self, number: int):
+        if number >= self.max_bitmap_key:
+            if number not in self:
+                self._unmerged.add(number)
+                if len(self._unmerged) >= max(self.min_merge_size, len(self._sorted) // 8):
+                    self._merge()
+            return
+        byte_index, mask = number >> 3, 1 << (number & 7)
+        if byte_index >= len(self._bitmap):
+            self._bitmap.extend(bytes(max(byte_index + 1 - len(self._bitmap), len(self._bitmap))))
+        if not self._bitmap[byte_index] & mask:
+            self._bitmap[byte_index] |= mask
+            self._bitmap_count += 1
+
+    def _merge(self):
+        self._sorted = array("Q", heapq.merge(self._sorted, sorted(self._unmerged)))
+        self._unmerged = set()
+
+    def __contains__(self, number: int) -> bool:
+        if number >= self.max_bitmap_key:
+            if number in self._unmerged:
+                return True
+            index = bisect.bisect_left(self._sorted, number)
+            return index < len(self._sorted) and self._sorted[index] == number
+        byte_index = number >> 3
+        return byte_index < len(self._bitmap) and bool(self._bitmap[byte_index] & (1 << (number & 7)))
+
+    def __len__(self) -> int:
+        return self._bitmap_count + len(self._sorted) + len(self._unmerged)
+
+    def __iter__(self):
+        for byte_index, byte in enumerate(self._bitmap):
+            if byte:
+                for bit in range(8):
+                    if byte & (1 << bit):
+                        yield (byte_index << 3) + bit
+        yield from self._sorted
+        yield from self._unmerged
+
+
+class DecimalKeyCodec:
+    """Plain decimal keys, without leading zeros to keep "01" and "1" different keys"""
+
+    @staticmethod
+    def decode(key: bytes) -> int | None:
+        if key.isdigit() and len(key) < 20 and (key[:1] != b"0" or len(key) == 1):
+            return int(key)
+        return None
+
+    @staticmethod
+    def encode(number: int) -> str:
+        return str(number)
+
+
+class StressKeyCodec:
+    """
+    Fixed size hexadecimal keys of cassandra-stress, like `KO5P3MOO61'
+
+    The key of a seed is its hex digits, left padded with zeros. The Scylla fork of cassandra-stress writes digits
+    10-15 as `K'-`P' instead of `A'-`F'.
+    """
+    key_size = 10  # default size of the cassandra-stress keys
+
+    def __init__(self, letters: bytes):
+        self._digits = b"0123456789" + letters
+        self._to_hex = bytes.maketrans(letters, b"ABCDEF")
+        self._from_hex = str.maketrans("ABCDEF", letters.decode())
+
+    def decode(self, key: bytes) -> int | None:
+        if len(key) == self.key_size and not key.translate(None, self._digits):
+            return int(key.translate(self._to_hex), 16)
+        return None
+
+    def encode(self, number: int) -> str:
+        return f"{number:0{self.key_size}X}".translate(self._from_hex)
+
+
+class CompactKeySet:
+    """
+    Set of unique keys, which stores keys decodable to integers in compact integer sets and all the others as bytes
+
+    Decimal keys and cassandra-stress keys are decoded, each format into its own set. Keys may be added as `bytes`
+    or `str`, and are iterated as `str`.
+    """
+    max_bitmap_key = 2 ** 30  # up to 128MB per bitmap
+
+    def __init__(self):
+        self._codecs = (DecimalKeyCodec(), StressKeyCodec(letters=b"KLMNOP"), StressKeyCodec(letters=b"ABCDEF"))
+        self._int_sets = [CompactIntSet(max_bitmap_key=self.max_bitmap_key) for _ in self._codecs]
+        self._other_keys = set()
+
+    def _int_key(self, key: bytes) -> tuple[CompactIntSet, int] | None:
+        for codec, int_set in zip(self._codecs, self._int_sets):
+            if (number := codec.decode(key)) is not None:
+                return int_set, number
+        return None
+
+    def add(self, key: bytes | str):
+        key = key.encode() if isinstance(key, str) else key
+        if (int_key := self._int_key(key)) is None:
+            self._other_keys.add(key)
+        else:
+            int_set, number = int_key
+            int_set.add(number)
+
+    def __contains__(self, key: bytes | str) -> bool:
+        key = key.encode() if isinstance(key, str) else key
+        if (int_key := self._int_key(key)) is None:
+            return key in self._other_keys
+        int_set, number = int_key
+        return number in int_set
+
+    def __len__(self) -> int:
+        return sum(len(int_set) for int_set in self._int_sets) + len(self._other_keys)
+
+    def __iter__(self):
+        for codec, int_set in zip(self._codecs, self._int_sets):
+            for number in int_set:
+                yield codec.encode(number)
+        for key in self._other_keys:
+            yield key.decode()
+
+    @property
+    def other_keys_count(self) -> int:
+        """Number of the keys which aren't decoded to integers"""
+        return len(self._other_keys)
+
+
+def extract_cdc_key(value: bytes, key_column: str = "key") -> bytes | None:
+    """
+    Returns the decoded `payload.after.<key_column>` of a CDC message of the scylla-cdc-source-connector
+
+    The key is looked up in the raw message when it's the first field of `after`, as written by the connector,
+    falling back to parsing the whole message otherwise. Returns None for messages without `after` (deletes).
+    """
+    payload_start = value.find(b'"payload":')
+    after_start = value.find(b'"after":{', payload_start) if payload_start != -1 else -1
+    if after_start != -1:
+        key_marker = b'"' + key_column.encode() + b'":"'
+        key_start = value.find(key_marker, after_start)
+        object_end = value.find(b"}", after_start)
+        if key_start != -1 and key_start < object_end:
+            key_start += len(key_marker)
+            key_end = value.find(b'"', key_start)
+            encoded_key = value[key_start:key_end]
+            if b"\\" not in encoded_key:
+                return base64.b64decode(encoded_key)
+    after = (json.loads(value).get('payload') or {}).get('after') or {}
+    if (encoded_key := after.get(key_column)) is None:
+        return None
+    return base64.b64decode(encoded_key)
+
+
+class KafkaCDCReaderMetrics:  # pylint: disable=too-few-public-methods
+    def __init__(self):
+        labels = ['group_id']
+        self.messages_counter = NemesisMetrics.create_counter(
+            'sct_kafka_cdc_reader_messages', 'Number of CDC messages consumed by the Kafka CDC reader', labels)
+        self.messages_rate_gauge = NemesisMetrics.create_gauge(
+            'sct_kafka_cdc_reader_messages_per_second', 'CDC messages consumed per second by the Kafka CDC reader',
+            labels)
+        self.lag_gauge = NemesisMetrics.create_gauge(
+            'sct_kafka_cdc_reader_lag', 'Number of CDC messages produced but not consumed yet by the Kafka CDC reader',
+            labels)
+        self.keys_gauge = NemesisMetrics.create_gauge(
+            'sct_kafka_cdc_reader_unique_keys', 'Number of unique keys read by the Kafka CDC reader', labels)
+
+
+@cache
+def kafka_cdc_reader_metrics() -> KafkaCDCReaderMetrics:
+    return KafkaCDCReaderMetrics()
+
+
 class KafkaCDCReaderThread(Thread):  # pylint: disable=too-many-instance-attributes
     """
     thread that listen on kafka topic, and list all the unique key
     received, so we can validate how many unique key we got
     """
+    poll_timeout_ms = 1000
+    max_poll_records = 50_000
+    metrics_interval = 5  # seconds between updates of the throughput and lag metrics
 
     def __init__(self, tester, params: SCTConfiguration, kafka_addresses: list | None = None,  # pylint: disable=too-many-arguments
                  connector_index: int = 0, group_id: str = None, duration: int | None = None, **kwargs):
-        self.keys = set()
+        self.keys = CompactKeySet()
+        self.messages_count = 0
+        self.messages_per_second = 0.0
+        self.lag = 0
+        self._partitions_lag = {}
         self.termination_event = Event()
         self.params = params
         self.tester = tester
@@ -50,17 +252,21 @@ class KafkaCDCReaderThread(Thread):  # pylint: disable=too-many-instance-attribu
         # TODO: handle setup of multiple tables
         topic = f'{connector_config.config.scylla_name}.{connector_config.config.scylla_table_names}'
         self.wait_for_topic(topic, timeout=60)
-        self.consumer = kafka.KafkaConsumer(
+        self.consumer = self.create_consumer(topic)
+
+        super().__init__(daemon=True)
+
+    def create_consumer(self, topic: str) -> kafka.KafkaConsumer:
+        return kafka.KafkaConsumer(
             topic,
             auto_offset_reset='earliest',
             enable_auto_commit=True,
             auto_commit_interval_ms=1000,
             group_id=self.group_id,
             bootstrap_servers=self.kafka_addresses,
+            max_poll_records=self.max_poll_records,
         )
 
-        super().__init__(daemon=True)
-
     @property
     def kafka_addresses(self):
         if self.params.get('kafka_backend') == 'localstack':
@@ -82,18 +288,48 @@ class KafkaCDCReaderThread(Thread):  # pylint: disable=too-many-instance-attribu
 
         wait_for(check_topic_exists, text=f"waiting for topic={topic}", timeout=timeout)
 
+    def process_records(self, records: dict) -> int:
+        """Add the keys of a batch of polled records, returns the number of the messages in the batch"""
+        messages_count = 0
+        add_key = self.keys.add
+        for partition, consumer_records in records.items():
+            for msg in consumer_records:
+                if (key := extract_cdc_key(msg.value)) is not None:
+                    add_key(key)
+            messages_count += len(consumer_records)
+            if consumer_records and (highwater := self.consumer.highwater(partition)) is not None:
+                self._partitions_lag[partition] = max(0, highwater - consumer_records[-1].offset - 1)
+        self.messages_count += messages_count
+        self.lag = sum(self._partitions_lag.values())
+        return messages_count
+
+    def update_metrics(self, messages_count: int, duration: float):
+        self.messages_per_second = messages_count / duration if duration else 0.0
+        LOGGER.debug("Kafka CDC reader %s: %.1f messages/s, lag: %s messages, %s unique keys",
+                     self.group_id, self.messages_per_second, self.lag, len(self.keys))
+        metrics = kafka_cdc_reader_metrics()
+        try:
+            metrics.messages_counter.labels(self.group_id).inc(messages_count)
+            metrics.messages_rate_gauge.labels(self.group_id).set(self.messages_per_second)
+            metrics.lag_gauge.labels(self.group_id).set(self.lag)
+            metrics.keys_gauge.labels(self.group_id).set(len(self.keys))
+        except Exception as exc:  # pylint: disable=broad-except  # noqa: BLE001
+            LOGGER.debug("Cannot update Kafka CDC reader metrics: %s", exc)
+
     def run(self):
+        interval_start, interval_messages = time.perf_counter(), 0
         while not self.termination_event.is_set():
-            records = self.consumer.poll(timeout_ms=1000)
-            for _, consumer_records in records.items():
-                for msg in consumer_records:
-                    data = json.loads(msg.value).get('payload', {}).get('after', {})
-                    key = base64.b64decode(data.get('key')).decode()
-                    self.keys.add(key)
+            records = self.consumer.poll(timeout_ms=self.poll_timeout_ms, max_records=self.max_poll_records)
+            interval_messages += self.process_records(records)
+
+            if (now := time.perf_counter()) - interval_start >= self.metrics_interval:
+                self.update_metrics(interval_messages, now - interval_start)
+                interval_start, interval_messages = now, 0
 
             if len(self.keys) >= self.read_number_of_key:
                 LOGGER.info("reach `read_number_of_key` stopping reader thread")
                 self.stop()
+        self.update_metrics(interval_messages, time.perf_counter() - interval_start)
 
     def stop(self):
         self.termination_event.set()
@@ -645,10 +645,16 @@ class LogCollector:
         final_archive = self.archive_to_tarfile(self.local_dir)
         if not final_archive:
             return []
-        s3_link = upload_archive_to_s3(final_archive, f"{self.test_id}/{self.current_run}")
         remove_files(self.local_dir)
-        remove_files(final_archive)
-        return [s3_link]
+        return self.upload_archives([final_archive])
+
+    def upload_archives(self, archive_paths: list[str]) -> list[Optional[str]]:
+        """Upload the archives to S3 concurrently and remove them, returns the links in the order of the archives"""
+        archive_paths = [archive_path for archive_path in archive_paths if archive_path]
+        s3_links = upload_archives_to_s3(archive_paths, f"{self.test_id}/{self.current_run}")
+        for archive_path in archive_paths:
+            remove_files(archive_path)
+        return s3_links
 
     def collect_logs_for_inactive_nodes(self, local_search_path=None):
         node_names = {node.name for node in self.nodes}
@@ -983,25 +989,20 @@ class BaseSCTLogCollector(LogCollector):
 
     def create_single_archive_and_upload(self) -> list[str]:
         final_archive = self.archive_to_tarfile(self.local_dir)
-
-        s3_link = upload_archive_to_s3(final_archive, f"{self.test_id}/{self.current_run}")
         remove_files(self.local_dir)
-        remove_files(final_archive)
-        return [s3_link]
+        return self.upload_archives([final_archive])
 
     def create_archive_per_file_and_upload(self) -> list[str]:
-        s3_links = []
+        file_archives = []
         for root, _, files in os.walk(self.local_dir):
             for current_file in files:
                 file_path = os.path.join(root, current_file)
                 LOGGER.info(file_path)
                 file_archive = self.archive_to_tarfile(file_path, add_test_id_to_archive=True)
                 LOGGER.info(file_archive)
-                s3_link = upload_archive_to_s3(file_archive, f"{self.test_id}/{self.current_run}")
-                s3_links.append(s3_link)
+                file_archives.append(file_archive)
                 remove_files(file_path)
-                remove_files(file_archive)
-        return s3_links
+        return self.upload_archives(file_archives)
 
     def create_archive_and_upload(self) -> list[str]:
         if self.is_collect_to_a_single_archive:
@@ -1040,12 +1041,8 @@ class PythonSCTLogCollector(BaseSCTLogCollector):
 
     def create_archive_and_upload(self) -> list[str]:
         file_archives = self.archive_to_tarfile(os.path.join(self.local_dir, "sct.log"), add_test_id_to_archive=True)
-        s3_links = []
-        for file_archive in file_archives:
-            s3_links.append(upload_archive_to_s3(file_archive, f"{self.test_id}/{self.current_run}"))
-            remove_files(file_archive)
         remove_files(self.local_dir)
-        return s3_links
+        return self.upload_archives(file_archives or [])
 
 
 class KubernetesAPIServerLogCollector(BaseSCTLogCollector):
@@ -1211,10 +1208,7 @@ class JepsenLogCollector(LogCollector):
             jepsen_node = self.nodes[0]
             if jepsen_archive := self.archive_log_remotely(jepsen_node, "./jepsen-scylla", "jepsen-data"):
                 self.receive_log(jepsen_node, jepsen_archive, self.local_dir)
-                s3_link.append(upload_archive_to_s3(
-                    archive_path=os.path.join(self.local_dir, os.path.basename(jepsen_archive)),
-                    storing_path=f"{self.test_id}/{self.current_run}",
-                ))
+                s3_link = self.upload_archives([os.path.join(self.local_dir, os.path.basename(jepsen_archive))])
             remove_files(self.local_dir)
         return s3_link
 
@@ -1635,3 +1629,16 @@ def upload_archive_to_s3(archive_path: str, storing_path: str) -> Optional[str]:
         LOGGER.error("File `%s' will not be uploaded", archive_path)
         return None
     return S3Storage().upload_file(file_path=archive_path, dest_dir=storing_path)
+
+
+def upload_archives_to_s3(archive_paths: list[str], storing_path: str) -> list[Optional[str]]:
+    """Upload the archives concurrently, returns the links in the order of the archives"""
+    runner = LocalCmdRunner()
+    archives_to_upload = []
+    for archive_path in archive_paths:
+        if check_archive(runner, archive_path):
+            archives_to_upload.append(archive_path)
+        else:
+            LOGGER.error("File `%s' will not be uploaded", archive_path)
+    s3_links = dict(zip(archives_to_upload, S3Storage().upload_files(archives_to_upload, dest_dir=storing_path)))
+    return [s3_links.get(archive_path) for archive_path in archive_paths]
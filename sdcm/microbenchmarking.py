@@ -22,6 +22,7 @@ import argparse
 import socket
 import tempfile
 from collections import defaultdict
+from functools import lru_cache
 import contextlib
 import warnings
 
@@ -75,6 +76,40 @@ class EmptyResultFolder(Exception):
         return "MBM: {0.message}".format(self)
 
 
+@lru_cache(maxsize=65536)
+def parse_date(date_string, date_format) -> datetime.datetime:
+    """Cached strptime, since all the datasets of a test run share the dates"""
+    return datetime.datetime.strptime(date_string, date_format)
+
+
+class DatasetHistory:
+    """
+    Prior results of a dataset, sorted by the run date once, with the values of each metric extracted once
+    """
+
+    def __init__(self, docs, run_date_pattern):
+        self.docs = sorted(docs, key=lambda doc: parse_date(doc["_source"]["test_run_date"], run_date_pattern))
+        self._metric_values = {}
+
+    def __len__(self):
+        return len(self.docs)
+
+    def metric_values(self, metrica) -> list[float | None]:
+        if metrica not in self._metric_values:
+            values = []
+            for doc in self.docs:
+                metrica_val = doc["_source"]["results"]["stats"].get(metrica, None)
+                values.append(float(metrica_val) if metrica_val else None)
+            self._metric_values[metrica] = values
+        return self._metric_values[metrica]
+
+    def commit_id(self, idx):
+        return self.docs[idx]["_source"]['versions']['scylla-server']['commit_id']
+
+    def commit_date(self, idx):
+        return parse_date(self.docs[idx]["_source"]['versions']['scylla-server']['date'], "%Y%m%d").date()
+
+
 class MicroBenchmarkingResultsAnalyzer(BaseResultsAnalyzer):  # pylint: disable=too-many-instance-attributes
     allowed_stats = ('Current', 'Stats', 'Last, commit, date', 'Diff last [%]', 'Best, commit, date', 'Diff best [%]')
     higher_better = ('frag/s',)
@@ -138,8 +173,7 @@ class MicroBenchmarkingResultsAnalyzer(BaseResultsAnalyzer):  # pylint: disable=
 
         results = []
         for doc in tests_filtered['hits']['hits']:
-            doc_date = datetime.datetime.strptime(
-                doc['_source']['versions']['scylla-server']['run_date_time'], "%Y-%m-%d %H:%M:%S")
+            doc_date = parse_date(doc['_source']['versions']['scylla-server']['run_date_time'], "%Y-%m-%d %H:%M:%S")
             if doc_date > start_date:
                 results.append(doc)
 
@@ -169,128 +203,95 @@ class MicroBenchmarkingResultsAnalyzer(BaseResultsAnalyzer):  # pylint: disable=
         #           },
         # }
 
-        def set_results_for(current_result, metrica):
-            list_of_results_from_db.sort(key=lambda x: datetime.datetime.strptime(x["_source"]["test_run_date"],
-                                                                                  self._run_date_pattern))
-
-            def get_metrica_val(val):
-                metrica_val = val["_source"]["results"]["stats"].get(metrica, None)
-                return float(metrica_val) if metrica_val else None
-
-            def get_commit_id(val):
-                return val["_source"]['versions']['scylla-server']['commit_id']
-
-            def get_commit_date(val):
-                return datetime.datetime.strptime(val["_source"]['versions']['scylla-server']['date'],
-                                                  "%Y%m%d").date()
-
-            def get_best_result_for_metrica():
-                # build new list with results where analyzing metrica is not None
-                # metrica s with result 0, will be included
-
-                list_for_searching = [el for el in list_of_results_from_db if get_metrica_val(el) is not None]
-
-                # if list is empty ( which could be happened for new metric),
-                # then return first element in list, because result will be None
-                if not list_for_searching:
-                    return list_of_results_from_db[0]
-                if metrica in self.higher_better:
-                    return max(list_for_searching, key=get_metrica_val)
-                elif metrica in self.lower_better:
-                    return min(list_for_searching, key=get_metrica_val)
-                else:
-                    return list_of_results_from_db[0]
-
-            def count_diff(cur_val, dif_val):
-                try:
-                    cur_val = float(cur_val) if cur_val else None
-                except ValueError:
-                    cur_val = None
-
-                if not cur_val:
-                    return None
-
-                if dif_val is None:
-                    return None
-
-                ret_dif = ((cur_val - dif_val) / dif_val) * 100 if dif_val > 0 else cur_val * 100
-
-                if metrica in self.higher_better:
-                    ret_dif = -ret_dif
-
-                ret_dif = -ret_dif if ret_dif != 0 else 0
-
-                return ret_dif
+        for test_type, current_result in current_results.items():
+            if not sorted_by_type[test_type]:
+                self.log.warning("No results for '%s' in DB. Skipping", test_type)
+                continue
+            history = DatasetHistory(sorted_by_type[test_type], run_date_pattern=self._run_date_pattern)
+            if len(history) > 1 and history.commit_id(-1) == self.cur_version_info["commit_id"]:
+                last_idx = -2
+            else:  # when current results are on disk but db is not updated
+                last_idx = -1
+            for metrica in self.metrics:
+                self.log.info("Analyzing %s:%s", test_type, metrica)
+                self._set_results_for(report_results[test_type], current_result, metrica, history, last_idx)
+                if metrica in self.submetrics:
+                    report_results[test_type][metrica].update({'Stats': {}})
+                    for submetrica in self.submetrics.get(metrica):
+                        submetrica_cur_val = float(current_result["results"]["stats"][submetrica])
+                        report_results[test_type][metrica]['Stats'].update({submetrica: submetrica_cur_val})
 
-            def get_diffs(cur_val, best_result_val, last_val):
-                # if last result doesn't contain the metric
-                # assign 0 to last value to count formula of changes
+        return report_results
 
-                diff_best = count_diff(cur_val, best_result_val)
-                diff_last = count_diff(cur_val, last_val)
+    def _best_result_index(self, values: list, metrica: str) -> int:
+        """Index of the best result, or the first one if the metric has no values or no better direction"""
+        # metrics with result 0 are included
+        best_idx = None
+        if metrica in self.higher_better:
+            for idx, value in enumerate(values):
+                if value is not None and (best_idx is None or value > values[best_idx]):
+                    best_idx = idx
+        elif metrica in self.lower_better:
+            for idx, value in enumerate(values):
+                if value is not None and (best_idx is None or value < values[best_idx]):
+                    best_idx = idx
+        return 0 if best_idx is None else best_idx
+
+    def _count_diff(self, cur_val, dif_val, metrica):
+        try:
+            cur_val = float(cur_val) if cur_val else None
+        except ValueError:
+            cur_val = None
 
-                return (diff_last, diff_best)
+        if not cur_val:
+            return None
 
-            if len(list_of_results_from_db) > 1 and get_commit_id(list_of_results_from_db[-1]) == self.cur_version_info["commit_id"]:
-                last_idx = -2
-            else:  # when current results are on disk but db is not updated
-                last_idx = -1
+        if dif_val is None:
+            return None
 
-            cur_val = current_result["results"]["stats"].get(metrica, None)
-            if cur_val:
-                cur_val = float(cur_val)
+        ret_dif = ((cur_val - dif_val) / dif_val) * 100 if dif_val > 0 else cur_val * 100
 
-            last_val = get_metrica_val(list_of_results_from_db[last_idx])
-            last_commit = get_commit_id(list_of_results_from_db[last_idx])
-            last_commit_date = get_commit_date(list_of_results_from_db[last_idx])
+        if metrica in self.higher_better:
+            ret_dif = -ret_dif
 
-            best_result = get_best_result_for_metrica()
-            best_result_val = get_metrica_val(best_result)
-            best_result_commit = get_commit_id(best_result)
-            best_commit_date = get_commit_date(best_result)
+        ret_dif = -ret_dif if ret_dif != 0 else 0
 
-            diff_last, diff_best = get_diffs(cur_val, best_result_val, last_val)
+        return ret_dif
 
-            stats = {
-                "Current": cur_val,
-                "Last, commit, date": (last_val, last_commit, last_commit_date),
-                "Best, commit, date": (best_result_val, best_result_commit, best_commit_date),
-                "Diff last [%]": diff_last,  # diff in percents
-                "Diff best [%]": diff_best,
-                "has_regression": False,
-                "has_improvement": False,
+    def _set_results_for(self, dataset_results, current_result, metrica, history, last_idx):  # pylint: disable=too-many-arguments
+        values = history.metric_values(metrica)
+        best_idx = self._best_result_index(values, metrica)
 
-            }
+        cur_val = current_result["results"]["stats"].get(metrica, None)
+        if cur_val:
+            cur_val = float(cur_val)
 
-            if ((diff_last and diff_last < -5) or (diff_best and diff_best < -5)):
-                report_results[test_type]["has_diff"] = True
-                stats["has_regression"] = True
+        last_val = values[last_idx]
+        best_result_val = values[best_idx]
+        diff_last = self._count_diff(cur_val, last_val, metrica)
+        diff_best = self._count_diff(cur_val, best_result_val, metrica)
 
-            if ((diff_last and diff_last > 50) or (diff_best and diff_best > 50)):
-                report_results[test_type]['has_improve'] = True
-                stats['has_improvement'] = True
+        stats = {
+            "Current": cur_val,
+            "Last, commit, date": (last_val, history.commit_id(last_idx), history.commit_date(last_idx)),
+            "Best, commit, date": (best_result_val, history.commit_id(best_idx), history.commit_date(best_idx)),
+            "Diff last [%]": diff_last,  # diff in percents
+            "Diff best [%]": diff_best,
+            "has_regression": False,
+            "has_improvement": False,
 
-            report_results[test_type]["dataset_name"] = current_result['dataset_name']
-            report_results[test_type][metrica] = stats
+        }
 
-        def set_results_for_sub(current_result, metrica):
-            report_results[test_type][metrica].update({'Stats': {}})
-            for submetrica in self.submetrics.get(metrica):
-                submetrica_cur_val = float(current_result["results"]["stats"][submetrica])
-                report_results[test_type][metrica]['Stats'].update({submetrica: submetrica_cur_val})
+        if ((diff_last and diff_last < -5) or (diff_best and diff_best < -5)):
+            dataset_results["has_diff"] = True
+            stats["has_regression"] = True
 
-        for test_type, current_result in current_results.items():
-            list_of_results_from_db = sorted_by_type[test_type]
-            if not list_of_results_from_db:
-                self.log.warning("No results for '%s' in DB. Skipping", test_type)
-                continue
-            for metrica in self.metrics:
-                self.log.info("Analyzing %s:%s", test_type, metrica)
-                set_results_for(current_result, metrica)
-                if metrica in list(self.submetrics.keys()):
-                    set_results_for_sub(current_result, metrica)
+        if ((diff_last and diff_last > 50) or (diff_best and diff_best > 50)):
+            dataset_results['has_improve'] = True
+            stats['has_improvement'] = True
 
-        return report_results
+        dataset_results["dataset_name"] = current_result['dataset_name']
+        dataset_results[metrica] = stats
 
     def send_html_report(self, report_results, html_report_path=None):
 
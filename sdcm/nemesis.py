@@ -99,7 +99,6 @@ from sdcm.utils import cdc
 from sdcm.utils.adaptive_timeouts import adaptive_timeout, Operations
 from sdcm.utils.common import (get_db_tables, generate_random_string,
                                reach_enospc_on_node, clean_enospc_on_node,
-                               parse_nodetool_listsnapshots,
                                update_authenticator, ParallelObject,
                                ParallelObjectResult, sleep_for_percent_of_duration, get_views_of_base_table)
 from sdcm.utils.features import is_tablets_feature_enabled
@@ -3286,16 +3285,14 @@ class Nemesis:  # pylint: disable=too-many-instance-attributes,too-many-public-m
             raise Exception(f"Snapshot name wasn't found in {nodetool_cmd} output:\n{result.stdout}")
 
         snapshot_name = re.findall(r'(\d+)', result.stdout.split("snapshot name")[1])[0]
-        result = self.target_node.run_nodetool('listsnapshots')
-        self.log.debug(result)
-        if snapshot_name in result.stdout:
+        snapshots_content = self.target_node.list_snapshots()
+        if snapshot_name in snapshots_content:
             self.log.info('Snapshot %s created' % snapshot_name)
-            snapshots_content = parse_nodetool_listsnapshots(listsnapshots_output=result.stdout)
             snapshot_content = snapshots_content.get(snapshot_name)
             self._validate_snapshot(nodetool_cmd=nodetool_cmd, snapshot_content=snapshot_content)
             self.log.info('Snapshot %s validated successfully' % snapshot_name)
         else:
-            raise Exception(f"Snapshot {snapshot_name} wasn't found in: \n{result.stdout}")
+            raise Exception(f"Snapshot {snapshot_name} wasn't found in: \n{dict(snapshots_content)}")
 
         self.clear_snapshots()
 
@@ -16,15 +16,17 @@ import json
 import logging
 import re
 import sys
+from array import array
 from pathlib import Path
-from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List
+from typing import Callable, TextIO
 from enum import Enum
 from jinja2 import Environment, FileSystemLoader
 
 
 LOGGER = logging.getLogger(__name__)
+NODE_NAME_RE = re.compile(r"(.*\s)?(.*)(-\d+)")
+CHART_DATA_PLACEHOLDER = "__PT_REPORT_CHART_DATA__"
 
 env = Environment(
     loader=FileSystemLoader(Path(__file__).parent.resolve() / 'templates'),
@@ -41,112 +43,208 @@ class EventGroup(Enum):
     STRESS_EVENTS = ["CassandraStressEvent", "CassandraStressLogEvent"]
 
 
-# pylint: disable=too-many-instance-attributes
-@dataclass
-class Event:
-    event_dict: dict
-    base: str = field(init=False)
-    event_id: str = field(init=False)
-    original_node_name: str = field(init=False)
-    period_type: str = field(init=False)
-    shard: int = field(init=False)
-    nemesis_name: str = field(init=False)
-    alert_name: str = field(init=False)
-    stress_cmd: str = field(init=False)
-    message: str = field(init=False)
-    nodetool_command: str = field(init=False)
-    type: str = field(init=False)
-    table: str = field(init=False)
-    begin_timestamp: float = field(init=False)
-    end_timestamp: float = field(init=False)
-    node_name: str = field(init=False)
-    cluster_name: str = field(init=False)
-    chart_label: str = field(init=False)
-    chart_value: str = field(init=False)
-
-    def __post_init__(self):
-        self.base = self.event_dict["base"]
-        self.event_id = self.event_dict["event_id"]
-        self.original_node_name = self.event_dict.get("node")
-        self.period_type = self.event_dict.get("period_type")
-        self.shard = self.event_dict.get("shard")
-        self.nemesis_name = self.event_dict.get("nemesis_name")
-        self.alert_name = self.event_dict.get("alert_name")
-        self.stress_cmd = self.event_dict.get("stress_cmd")
-        self.message = self.event_dict.get("message")
-        self.nodetool_command = self.event_dict.get("nodetool_command")
-        self.type = self.event_dict["type"]
-        self.table = self.event_dict.get("table")
-        if self.event_dict.get("period_type") in ["begin", "end"]:
-            event_begin_timestamp = self._convert_to_milliseconds(timestamp=self.event_dict.get("begin_timestamp"))
-            event_end_timestamp = self._convert_to_milliseconds(timestamp=self.event_dict.get("end_timestamp"))
-        else:
-            event_begin_timestamp = self._convert_to_milliseconds(timestamp=self.event_dict.get("event_timestamp"))
-            event_end_timestamp = event_begin_timestamp
-        self.begin_timestamp = event_begin_timestamp
-        self.end_timestamp = event_end_timestamp
-        self.node_name, self.cluster_name = self._parse_node_name(name_to_parse=self.event_dict.get("node"))
-        self.chart_label = self._create_chart_label()
-        self.chart_value = self._create_chart_value()
-
-    @staticmethod
-    def _convert_to_milliseconds(timestamp: float | None) -> float | None:
-        return timestamp * 1000 if timestamp else timestamp
-
-    @staticmethod
-    def _parse_node_name(name_to_parse: str | None) -> tuple[str, str] | tuple[None, None]:
-        """
-        The node names may look like this
-        'Node longevity-100gb-4h-master-db-node-6fb3995d-3 [13.49.80.25 | 10.0.1.221] (seed: True)'
-        or this
-        'longevity-100gb-4h-master-db-node-6fb3995d-3'
-        They are split with regex into 3 groups:
-        1) is skipped
-        2) 'longevity-100gb-4h-master-db-node-6fb3995d' becomes the cluster name
-        3) '-3' is used to create new node name like this: 'node-3'
-        """
-        if name_to_parse:
-            if result := re.match(r"(.*\s)?(.*)(-\d+)", name_to_parse):
-                node_name = f"node{result.group(3)}"
-                cluster_name = result.group(2).replace("node", "cluster")
-                return node_name, cluster_name
-        return name_to_parse, None
-
-    def _create_chart_label(self) -> str:
-        """
-        Creates labels for the chart
+def _convert_to_milliseconds(timestamp: float | None) -> float | None:
+    return timestamp * 1000 if timestamp else timestamp
+
+
+def _parse_node_name(name_to_parse: str | None) -> tuple[str, str] | tuple[None, None]:
+    """
+    The node names may look like this
+    'Node longevity-100gb-4h-master-db-node-6fb3995d-3 [13.49.80.25 | 10.0.1.221] (seed: True)'
+    or this
+    'longevity-100gb-4h-master-db-node-6fb3995d-3'
+    They are split with regex into 3 groups:
+    1) is skipped
+    2) 'longevity-100gb-4h-master-db-node-6fb3995d' becomes the cluster name
+    3) '-3' is used to create new node name like this: 'node-3'
+    """
+    if name_to_parse:
+        if result := NODE_NAME_RE.match(name_to_parse):
+            node_name = f"node{result.group(3)}"
+            cluster_name = result.group(2).replace("node", "cluster")
+            return node_name, cluster_name
+    return name_to_parse, None
+
+
+def _create_chart_label(event_dict: dict) -> str:
+    """
+    Creates labels for the chart
+    """
+    if event_dict["base"] in ["RepairEvent", "CompactionEvent"]:
+        label_string = f"{event_dict['base']}, shard: {event_dict['shard']}"
+    elif event_dict["base"] == "DisruptionEvent":
+        label_string = f"{event_dict['base']}, nemesis: {event_dict['nemesis_name']}"
+    elif event_dict["base"] == "PrometheusAlertManagerEvent":
+        label_string = f"node: {event_dict['node']}, alert: {event_dict['alert_name']}"
+    elif event_dict["base"] == "CassandraStressEvent":
+        label_string = f"cmd: {event_dict['stress_cmd']}, node: {event_dict['node']}"
+    elif event_dict["base"] == "CassandraStressLogEvent":
+        label_string = event_dict['node']
+    else:
+        label_string = event_dict['base']
+    return label_string
+
+
+def _create_chart_value(event_dict: dict) -> str:
+    """
+    Creates values for chart's tooltips
+    """
+    if event_dict["base"] == "InfoEvent":
+        label_string = f"message: {event_dict['message']}"
+    elif event_dict["base"] == "NodetoolEvent":
+        label_string = f"nodetool_command: {event_dict['nodetool_command']}"
+    elif event_dict["base"] == "DisruptionEvent":
+        label_string = f"nemesis: {event_dict['nemesis_name']}"
+    elif event_dict["base"] in ["DatabaseLogEvent", "InstanceStatusEvent"]:
+        label_string = f"type: {event_dict['type']}"
+    elif event_dict["base"] == "CompactionEvent":
+        label_string = f"table: {event_dict['table']}"
+    else:
+        label_string = event_dict['base']
+    return label_string
+
+
+def _htmlsafe_json_dumps(obj) -> str:
+    """Same output as jinja's `tojson` filter, for pieces of the chart data written outside the template"""
+    return json.dumps(obj, sort_keys=True).replace("<", "\\u003c").replace(">", "\\u003e") \
+        .replace("&", "\\u0026").replace("'", "\\u0027")
+
+
+class _StringTable:  # pylint: disable=too-few-public-methods
+    """Interns repeated strings (labels, values, sort keys), so the chart rows can keep integer ids only"""
+
+    def __init__(self):
+        self.ids = {}
+        self.values = []
+
+    def intern(self, value) -> int:
+        if (value_id := self.ids.get(value)) is None:
+            value_id = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return value_id
+
+
+class EventGroupAccumulator:  # pylint: disable=too-many-instance-attributes
+    """
+    Columnar storage of the chart rows of one group of events
+
+    Each row is kept as positions in typed arrays (timestamps, interned chart group/label/value ids),
+    and the row numbers are bucketed by the group's sort key, so no per-event objects are kept in memory.
+
+    Continuous events with a 'begin' record only are kept aside until the end of the file, and then get their
+    'end_timestamp' evaluated. If continuous event has both 'begin' and 'end' records, then only 'end' record is used.
+    """
+
+    def __init__(self, name: str, events_names: list, sort_key: Callable[[dict, str], tuple], split_by_node: bool = False):
+        self.name = name
+        self.events_names = set(events_names)
+        self.sort_key = sort_key
+        self.split_by_node = split_by_node
+        self.strings = _StringTable()
+        self.begin_timestamps = array("d")
+        self.end_timestamps = array("d")
+        self.chart_group_ids = array("L")
+        self.label_ids = array("L")
+        self.value_ids = array("L")
+        self.rows_by_sort_key: dict[int, array] = {}
+        self.stats: dict[str, int] = {}
+        self.open_begin_events: dict[str, list] = {}
+        self.unmatched_end_event_ids = set()
+
+    def __len__(self):
+        return len(self.begin_timestamps)
+
+    def add(self, event_dict: dict, begin_timestamp: float | None, end_timestamp: float | None,
+            node_name: str | None) -> None:
+        # Exclude DisruptionEvents with nemesis=RunUniqueSequence from processing
+        if event_dict["base"] == "DisruptionEvent" and event_dict.get("nemesis_name") == "RunUniqueSequence":
+            return
+        period_type = event_dict.get("period_type")
+        event_id = event_dict["event_id"]
+        if not begin_timestamp:
+            LOGGER.warning("Empty begin_timestamp for event name=%s, id=%s", event_dict["base"], event_id)
+        elif not end_timestamp and period_type == 'end':
+            LOGGER.warning("Empty end_timestamp when period_type=end for event name=%s, id=%s", event_dict["base"],
+                           event_id)
+        # Processing of event records with period_type = None or period_type in ["end", "one-time"]
+        elif period_type != "begin":
+            if period_type == "end" and self.open_begin_events.pop(event_id, None) is None:
+                self.unmatched_end_event_ids.add(event_id)
+            self._add_row(event_dict, begin_timestamp, end_timestamp, node_name)
+        # Save the continuous events with period_type = "begin", until their 'end' record is found
+        elif event_id not in self.unmatched_end_event_ids:
+            self.open_begin_events.setdefault(event_id, []).append((event_dict, begin_timestamp, node_name))
+
+    def _add_row(self, event_dict: dict, begin_timestamp: float, end_timestamp: float, node_name: str | None) -> None:
+        row = len(self.begin_timestamps)
+        self.begin_timestamps.append(begin_timestamp)
+        self.end_timestamps.append(end_timestamp)
+        self.chart_group_ids.append(self.strings.intern(node_name if self.split_by_node else self.name))
+        self.label_ids.append(self.strings.intern(_create_chart_label(event_dict)))
+        self.value_ids.append(self.strings.intern(_create_chart_value(event_dict)))
+        sort_key_id = self.strings.intern(self.sort_key(event_dict, node_name))
+        self.rows_by_sort_key.setdefault(sort_key_id, array("L")).append(row)
+        self.stats[event_dict["base"]] = self.stats.get(event_dict["base"], 0) + 1
+
+    def finalize(self, max_end_timestamp: float) -> None:
+        """Evaluate 'end_timestamp' for continuous events that have 'begin' records only"""
+        for begin_events in self.open_begin_events.values():
+            for event_dict, begin_timestamp, node_name in begin_events:
+                if event_dict["base"] in ["ScyllaServerStatusEvent", "JMXServiceEvent"]:
+                    end_timestamp = max_end_timestamp
+                else:
+                    end_timestamp = begin_timestamp
+                self._add_row(event_dict, begin_timestamp, end_timestamp, node_name)
+        self.open_begin_events.clear()
+        self.unmatched_end_event_ids.clear()
+
+    def chart_layout(self) -> dict[int, dict[int, array]]:
         """
-        if self.event_dict["base"] in ["RepairEvent", "CompactionEvent"]:
-            label_string = f"{self.event_dict['base']}, shard: {self.event_dict['shard']}"
-        elif self.event_dict["base"] == "DisruptionEvent":
-            label_string = f"{self.event_dict['base']}, nemesis: {self.event_dict['nemesis_name']}"
-        elif self.event_dict["base"] == "PrometheusAlertManagerEvent":
-            label_string = f"node: {self.event_dict['node']}, alert: {self.event_dict['alert_name']}"
-        elif self.event_dict["base"] == "CassandraStressEvent":
-            label_string = f"cmd: {self.event_dict['stress_cmd']}, node: {self.event_dict['node']}"
-        elif self.event_dict["base"] == "CassandraStressLogEvent":
-            label_string = self.event_dict['node']
-        else:
-            label_string = self.event_dict['base']
-        return label_string
+        Order the rows by the group's sort key
 
-    def _create_chart_value(self) -> str:
+        :return: {chart_group_id: {label_id: <row numbers>}}, all in order of the first appearance after sorting
         """
-        Creates values for chart's tooltips
+        layout = {}
+        for sort_key_id in sorted(self.rows_by_sort_key, key=self.strings.values.__getitem__):
+            for row in self.rows_by_sort_key[sort_key_id]:
+                labels = layout.setdefault(self.chart_group_ids[row], {})
+                labels.setdefault(self.label_ids[row], array("L")).append(row)
+        return layout
+
+    def write_chart_groups(self, file: TextIO, layout: dict[int, dict[int, array]], first_group: bool) -> bool:
         """
-        if self.event_dict["base"] == "InfoEvent":
-            label_string = f"message: {self.event_dict['message']}"
-        elif self.event_dict["base"] == "NodetoolEvent":
-            label_string = f"nodetool_command: {self.event_dict['nodetool_command']}"
-        elif self.event_dict["base"] == "DisruptionEvent":
-            label_string = f"nemesis: {self.event_dict['nemesis_name']}"
-        elif self.event_dict["base"] in ["DatabaseLogEvent", "InstanceStatusEvent"]:
-            label_string = f"type: {self.event_dict['type']}"
-        elif self.event_dict["base"] == "CompactionEvent":
-            label_string = f"table: {self.event_dict['table']}"
-        else:
-            label_string = self.event_dict['base']
-        return label_string
+        Write the chart groups of this accumulator as JSON, in the structure expected by the timelines chart:
+        [
+            {data: [
+                     {data: [
+                                {timeRange: [<date>, <date>],
+                                 val: <val: number (continuous dataScale) or string (ordinal dataScale)>},
+                                (...)
+                            ],
+                      label: "label1name"},
+                     (...)
+                   ],
+             group: "group1name"},
+             (...)
+        ]
+        """
+        strings = self.strings.values
+        for chart_group_id, labels in layout.items():
+            file.write(('' if first_group else ', ') + '{"data": [')
+            first_group = False
+            for label_index, (label_id, rows) in enumerate(labels.items()):
+                file.write((', ' if label_index else '') + '{"data": [')
+                file.write(', '.join(
+                    f'{{"timeRange": [{self.begin_timestamps[row]!r}, {self.end_timestamps[row]!r}], '
+                    f'"val": {_htmlsafe_json_dumps(strings[self.value_ids[row]])}}}'
+                    for row in rows))
+                file.write(f'], "label": {_htmlsafe_json_dumps(strings[label_id])}}}')
+            file.write(f'], "group": {_htmlsafe_json_dumps(strings[chart_group_id])}}}')
+        stat_string = ', '.join([f"{key}={value}" for key, value in self.stats.items()])
+        if layout:
+            LOGGER.info("All %s data have been successfully prepared.", self.name)
+            LOGGER.info("Number of events processed: %s", stat_string)
+        return first_group
 
 
 # pylint: disable=too-many-instance-attributes
@@ -156,192 +254,95 @@ class ParallelTimelinesReportGenerator:
         self.test_id = ""
         self.cluster_name = ""
         self.max_end_timestamp = 0
-        self.events = []
-        self.chart_data = []
+        self.events_count = 0
+        self.groups = [
+            EventGroupAccumulator(
+                name="Scylla node-related events", events_names=EventGroup.NODES_RELATED_EVENTS.value,
+                sort_key=lambda event_dict, node_name: (int(node_name.split("-")[1]), event_dict["base"]),
+                split_by_node=True),
+            EventGroupAccumulator(
+                name="Prometheus events", events_names=EventGroup.PROMETHEUS_EVENTS.value,
+                sort_key=lambda event_dict, _: (event_dict.get("node"), event_dict.get("alert_name"))),
+            EventGroupAccumulator(
+                name="SCT events", events_names=EventGroup.SCT_EVENTS.value,
+                sort_key=lambda event_dict, _: (event_dict["base"], event_dict.get("node"),
+                                                event_dict.get("nemesis_name"))),
+            EventGroupAccumulator(
+                name="Stress events", events_names=EventGroup.STRESS_EVENTS.value,
+                sort_key=lambda event_dict, _: (event_dict["base"], event_dict.get("node"),
+                                                event_dict.get("stress_cmd"))),
+        ]
+        self._group_by_event_name = {
+            event_name: group for group in self.groups for event_name in group.events_names}
         self.template = "pt_report_template.html"
         self.default_report_file_name = "parallel-timelines-report.html"
 
     def read_events_file(self) -> None:
+        """
+        Read the events file in a single pass, routing each event record to its group accumulator
+        """
         if not self.events_file.exists():
             LOGGER.critical("File \"%s\" not found!", self.events_file)
             sys.exit(1)
         LOGGER.info("Starting to read file \"%s\"...", self.events_file)
         with self.events_file.open(encoding="utf-8") as file:
             for line in file:
-                event = Event(event_dict=json.loads(line))
-                if event.end_timestamp and event.end_timestamp > self.max_end_timestamp:
-                    self.max_end_timestamp = event.end_timestamp
-                if not self.cluster_name and event.cluster_name:
-                    self.cluster_name = event.cluster_name
-                # Getting test_id from the line like this "test_id=fe9c9218-367f-47ba-b59f-0d06c0e81c30"
-                if not self.test_id and event.base == "InfoEvent" and "TEST_START" in event.message:
-                    self.test_id = event.message.split("=")[-1]
-                self.events.append(event)
-            LOGGER.info("File \"%s\" has been read successfully. %d rows have been processed.",
-                        self.events_file, len(self.events))
-
-    def prepare_scylla_nodes_event_data(self) -> None:
-        scylla_nodes_events = self._process_raw_data(events_to_process=EventGroup.NODES_RELATED_EVENTS.value)
-        if scylla_nodes_events:
-            LOGGER.info("Preparing Scylla node-related event data...")
-            scylla_nodes_events_sorted = sorted(scylla_nodes_events,
-                                                key=lambda x: (int(x.node_name.split("-")[1]), x.base))
-
-            group_dict = {}
-            stat_dict = {}
-            for event in scylla_nodes_events_sorted:
-                group_dict.setdefault(event.node_name, []).append(event)
-                stat_dict[event.base] = stat_dict.setdefault(event.base, 0) + 1
-
-            for key, value in group_dict.items():
-                self._process_chart_data(event_list=value, group_name=key)
-            stat_string = ', '.join([f"{key}={value}" for key, value in stat_dict.items()])
-            LOGGER.info("All Scylla node-related event data have been successfully prepared")
-            LOGGER.info("Total number of node-related events processed: %s", stat_string)
-
-    def prepare_prometheus_event_data(self) -> None:
-        prometheus_events_data = self._process_raw_data(events_to_process=EventGroup.PROMETHEUS_EVENTS.value)
-        if prometheus_events_data:
-            prometheus_events_data_sorted = sorted(prometheus_events_data, key=lambda x: (x.original_node_name,
-                                                                                          x.alert_name))
-            self._process_chart_data(event_list=prometheus_events_data_sorted, group_name="Prometheus events")
-
-    def prepare_sct_event_data(self) -> None:
-        sct_events_data = self._process_raw_data(events_to_process=EventGroup.SCT_EVENTS.value)
-        if sct_events_data:
-            sct_events_data_sorted = sorted(sct_events_data,
-                                            key=lambda x: (x.base, x.original_node_name, x.nemesis_name))
-            self._process_chart_data(event_list=sct_events_data_sorted, group_name="SCT events")
-
-    def prepare_stress_event_data(self) -> None:
-        stress_events_data = self._process_raw_data(events_to_process=EventGroup.STRESS_EVENTS.value)
-        if stress_events_data:
-            stress_events_data_sorted = sorted(stress_events_data, key=lambda x: (x.base, x.original_node_name,
-                                                                                  x.stress_cmd))
-            self._process_chart_data(event_list=stress_events_data_sorted, group_name="Stress events")
-
-    def _process_chart_data(self, event_list: List[Event], group_name: str) -> None:
-        """
-        The structure of self.chart_data should look like this:
-        [
-            {group: "group1name",
-             data: [
-                     {label: "label1name",
-                      data: [
-                                {timeRange: [<date>, <date>],
-                                 val: <val: number (continuous dataScale) or string (ordinal dataScale)>},
-                                {timeRange: [<date>, <date>],
-                                 val: <val>},
-                                (...)
-                            ]},
-                     {label: "label2name",
-                      data: [...]},
-                     (...)
-                   ]},
-            {group: "group2name",
-             data: [...]},
-             (...)
-        ]
-        Firstly, we create here an appropriate structure of self.chart_data for the given group of events.
-        Then we populate created group structure with events' data by calling append_group_data().
-        """
-        LOGGER.info("Preparing %s data...", group_name)
-        stat_dict = {}
-
-        # Prepare self.chart_data structure. Add new group dictionary.
-        self.chart_data.append({"group": group_name,
-                                "data": []})
-        current_chart_group = self.chart_data[-1]["data"]
-
-        # Fill self.chart_data with data
-        for event in event_list:
-            if event.chart_label not in [item["label"] for item in current_chart_group]:
-                current_chart_group.append({"label": event.chart_label,
-                                            "data": []})
-            self._append_group_data(group_name=group_name,
-                                    event_data=event)
-            stat_dict[event.base] = stat_dict.setdefault(event.base, 0) + 1
-        stat_string = ', '.join([f"{key}={value}" for key, value in stat_dict.items()])
-        LOGGER.info("All %s data have been successfully prepared.", group_name)
-        LOGGER.info("Number of events processed: %s", stat_string)
-
-    def _append_group_data(self, group_name: str, event_data: Event) -> None:
-        group_by_name_list = list(filter(lambda x: x['group'] == group_name, self.chart_data))
-        for data in group_by_name_list[0]["data"]:
-            if event_data.chart_label == data["label"]:
-                data["data"].append({"timeRange": [event_data.begin_timestamp,
-                                                   event_data.end_timestamp],
-                                     "val": event_data.chart_value})
-
-    def _process_raw_data(self, events_to_process: list) -> List[Event]:
-        """
-        Finds continuous events with 'begin' records only and evaluates 'end_timestamp' for them.
-        If continuous event has both 'begin' and 'end' records, then only 'end' record will be processed.
-        """
-        processed_events = []
-        end_event_id_set = set()
-        begin_event_id_set = set()
-        begin_events = []
-        events_string = ', '.join(events_to_process)
-        LOGGER.info("Processing raw data for events: %s.", events_string)
-        selected_events = list(filter(lambda x: x.base in events_to_process, self.events))
-        for event in selected_events:
-            # Exclude DisruptionEvents with nemesis=RunUniqueSequence from processing
-            if event.base == "DisruptionEvent" and event.nemesis_name == "RunUniqueSequence":
-                continue
-            if not event.begin_timestamp:
-                LOGGER.warning("Empty begin_timestamp for event name=%s, id=%s", event.base, event.event_id)
-            elif not event.end_timestamp and event.period_type == 'end':
-                LOGGER.warning("Empty end_timestamp when period_type=end for event name=%s, id=%s", event.base,
-                               event.event_id)
-            # Processing of event records with period_type = None or period_type in ["end", "one-time"]
-            elif event.period_type != "begin":
-                if event.period_type == "end":
-                    end_event_id_set.add(event.event_id)
-                processed_events.append(event)
-            # Save the continuous events with period_type = "begin" and their IDs
-            else:
-                begin_event_id_set.add(event.event_id)
-                begin_events.append(event)
-        # Check if there are event IDs with period_type = "begin" and without period_type = "end"
-        endless_event_id_set = begin_event_id_set.difference(end_event_id_set)
-        if endless_event_id_set:
-            # If endless events exist, evaluate end_timestamp for them
-            endless_events = list(filter(lambda x: x.event_id in endless_event_id_set, begin_events))
-            for event in endless_events:
-                if event.base in ["ScyllaServerStatusEvent", "JMXServiceEvent"]:
-                    event.end_timestamp = self.max_end_timestamp
-                else:
-                    event.end_timestamp = event.begin_timestamp
-                processed_events.append(event)
-        return processed_events
+                self._process_event(json.loads(line))
+        for group in self.groups:
+            group.finalize(max_end_timestamp=self.max_end_timestamp)
+        LOGGER.info("File \"%s\" has been read successfully. %d rows have been processed.",
+                    self.events_file, self.events_count)
+
+    def _process_event(self, event_dict: dict) -> None:
+        self.events_count += 1
+        if event_dict.get("period_type") in ["begin", "end"]:
+            begin_timestamp = _convert_to_milliseconds(timestamp=event_dict.get("begin_timestamp"))
+            end_timestamp = _convert_to_milliseconds(timestamp=event_dict.get("end_timestamp"))
+        else:
+            begin_timestamp = end_timestamp = _convert_to_milliseconds(timestamp=event_dict.get("event_timestamp"))
+        if end_timestamp and end_timestamp > self.max_end_timestamp:
+            self.max_end_timestamp = end_timestamp
+        node_name, cluster_name = _parse_node_name(name_to_parse=event_dict.get("node"))
+        if not self.cluster_name and cluster_name:
+            self.cluster_name = cluster_name
+        # Getting test_id from the line like this "test_id=fe9c9218-367f-47ba-b59f-0d06c0e81c30"
+        if not self.test_id and event_dict["base"] == "InfoEvent" and "TEST_START" in (event_dict.get("message") or ""):
+            self.test_id = event_dict["message"].split("=")[-1]
+        if (group := self._group_by_event_name.get(event_dict["base"])) is not None:
+            group.add(event_dict, begin_timestamp, end_timestamp, node_name)
 
     def create_report_file(self) -> None:
+        """
+        Render the report, streaming the chart data into the template instead of building it in memory
+        """
         if self.cluster_name:
             report_file_name = self.cluster_name.replace("-db-cluster", "") + "-" + self.default_report_file_name
         else:
             report_file_name = self.default_report_file_name
         report_file = self.events_file.parent / report_file_name
         LOGGER.info("Creating report file \"%s\"", report_file)
+        layouts = [(group, group.chart_layout()) for group in self.groups]
         max_line_height = 20
-        label_count = 0
-        for group in self.chart_data:
-            label_count += len(group["data"])
+        label_count = sum(len(labels) for _, layout in layouts for labels in layout.values())
         max_height = max_line_height * label_count + 200
         template = env.get_template(self.template)
-        rendered_template = template.render(chart_data=self.chart_data, max_height=max_height,
+        rendered_template = template.render(chart_data=CHART_DATA_PLACEHOLDER, max_height=max_height,
                                             max_line_height=max_line_height, test_id=self.test_id,
                                             cluster_name=self.cluster_name)
+        template_head, template_tail = rendered_template.split(_htmlsafe_json_dumps(CHART_DATA_PLACEHOLDER), 1)
         with report_file.open("w", encoding="utf-8") as file:
-            file.write(rendered_template)
+            file.write(template_head)
+            file.write("[")
+            first_group = True
+            for group, layout in layouts:
+                LOGGER.info("Preparing %s data...", group.name)
+                first_group = group.write_chart_groups(file=file, layout=layout, first_group=first_group)
+            file.write("]")
+            file.write(template_tail)
         LOGGER.info("Report file has been successfully created")
 
     def generate_full_report(self):
         self.read_events_file()
-        self.prepare_scylla_nodes_event_data()
-        self.prepare_prometheus_event_data()
-        self.prepare_sct_event_data()
-        self.prepare_stress_event_data()
         self.create_report_file()
 
 
@@ -0,0 +1,169 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2024 ScyllaDB
+
+import json
+import shlex
+import logging
+from collections import Counter, defaultdict
+from typing import Any
+
+from sdcm.rest.rest_client import RestClient, ScyllaApiException
+from sdcm.utils.common import SnapshotDetails
+
+LOGGER = logging.getLogger(__name__)
+
+UNSUPPORTED_STATUS_CODES = ("400", "404")
+
+
+def format_load(load: float | None) -> str:
+    """Format size in bytes, like nodetool does"""
+    if load is None:
+        return "?"
+    for unit, size in (("TB", 1024 ** 4), ("GB", 1024 ** 3), ("MB", 1024 ** 2), ("KB", 1024)):
+        if load >= size:
+            return f"{load / size:.2f} {unit}"
+    return f"{int(load)} bytes"
+
+
+class NodetoolRestClient(RestClient):
+    """
+    Answer read-only nodetool queries with Scylla REST API, instead of running nodetool.
+
+    Only `status' and `listsnapshots' are answered, the other nodetool commands are still run by the CLI.
+    All the requests of a query are sent by a single `curl' call on the node, over its existing SSH connection, and
+    the results have the same structure as parsed output of the nodetool command. Queries which aren't supported by
+    the REST API of the node are remembered in `unsupported', to use nodetool for them.
+    """
+    response_marker = "### sct-rest-api: "
+
+    def __init__(self, node, host: str = "localhost:10000", timeout: int = 30):
+        super().__init__(host=host, endpoint="")
+        self._node = node
+        self.timeout = timeout
+        self.unsupported: set[str] = set()
+
+    def get_many(self, query: str, *paths: str, optional_paths: tuple[str, ...] = ()) -> list[Any]:
+        """
+        Get the responses of the paths, failed requests of `optional_paths' get None instead of failing the query
+        """
+        urls = " ".join(shlex.quote(f"{self._base_url}/{path.lstrip('/')}") for path in paths)
+        result = self._node.remoter.run(
+            f"curl -s -H 'Accept: application/json' -w '\\n{self.response_marker}%{{http_code}}\\n' {urls}",
+            timeout=self.timeout, ignore_status=True, verbose=False)
+        if result.failed:
+            raise ScyllaApiException(f"Scylla REST API requests of `{query}' failed: {result.stderr}")
+        responses, body = [], []
+        for line in result.stdout.splitlines():
+            if not line.startswith(self.response_marker):
+                body.append(line)
+                continue
+            status_code = line[len(self.response_marker):]
+            if status_code != "200" and paths[len(responses)] in optional_paths:
+                LOGGER.debug("Scylla REST API request %s of `%s' returned %s: %s",
+                             paths[len(responses)], query, status_code, "\n".join(body))
+                responses.append(None)
+                body = []
+                continue
+            if status_code != "200":
+                if status_code in UNSUPPORTED_STATUS_CODES:
+                    self.unsupported.add(query)
+                raise ScyllaApiException(
+                    f"Scylla REST API request {paths[len(responses)]} of `{query}' returned {status_code}")
+            try:
+                responses.append(json.loads("\n".join(body)))
+            except ValueError as exc:
+                raise ScyllaApiException(f"Scylla REST API request {paths[len(responses)]} of `{query}' returned "
+                                         f"invalid JSON: {exc}") from exc
+            body = []
+        if len(responses) != len(paths):
+            raise ScyllaApiException(f"Got {len(responses)} responses of Scylla REST API to {len(paths)} requests")
+        return responses
+
+    def status(self) -> dict[str, dict[str, dict[str, str]]]:
+        """
+        Same as parsed `nodetool status':
+
+            {"datacenter1": {"10.0.0.1": {"state": "UN", "load": "1.5 GB", "tokens": "256", "owns": "33.3%",
+                                          "host_id": "...", "rack": "rack1"}}}
+
+        Like nodetool, the ownership is "?" when the keyspaces have different replication settings.
+        """
+        *states, load_map, tokens_endpoint, host_ids, ownership = self.get_many(
+            "status",
+            "/gossiper/endpoint/live/", "/gossiper/endpoint/down/", "/storage_service/nodes/joining",
+            "/storage_service/nodes/leaving", "/storage_service/nodes/moving", "/storage_service/load_map",
+            "/storage_service/tokens_endpoint", "/storage_service/host_id", "/storage_service/ownership/null",
+            optional_paths=("/storage_service/ownership/null", ))
+        tokens = Counter(item["value"] for item in tokens_endpoint)
+        host_ids = {item["key"]: item["value"] for item in host_ids}
+        endpoints = sorted(set(tokens) | set(host_ids) | set(states[2]))
+        if not endpoints:
+            return {}
+        locations = self.get_many("status", *(f"/snitch/{location}?host={endpoint}"
+                                              for endpoint in endpoints for location in ("datacenter", "rack")))
+        rows = self._status_rows(
+            endpoints, states=states, loads={item["key"]: item["value"] for item in load_map}, tokens=tokens,
+            host_ids=host_ids, ownership={item["key"]: item["value"] for item in ownership or []})
+        status = defaultdict(dict)
+        for idx, (endpoint, row) in enumerate(zip(endpoints, rows)):
+            row["rack"] = locations[idx * 2 + 1]
+            status[locations[idx * 2]][endpoint] = row
+        return dict(status)
+
+    def _status_rows(self, endpoints: list[str], states: list[list[str]],  # pylint: disable=too-many-arguments
+                     loads: dict[str, float], tokens: Counter, host_ids: dict[str, str],
+                     ownership: dict[str, float]) -> list[dict[str, str]]:
+        """
+        Rows of `nodetool status' of the endpoints, without their racks
+        """
+        live, down, joining, leaving, moving = states
+        return [{
+            "state": self._endpoint_state(endpoint, live=live, down=down,
+                                          joining=joining, leaving=leaving, moving=moving),
+            "load": format_load(loads.get(endpoint)),
+            "tokens": str(tokens.get(endpoint, 0)),
+            "owns": f"{float(ownership[endpoint]) * 100:.1f}%" if endpoint in ownership else "?",
+            "host_id": host_ids.get(endpoint, "?"),
+        } for endpoint in endpoints]
+
+    @staticmethod
+    def _endpoint_state(endpoint: str, live: list[str], down: list[str],  # pylint: disable=too-many-arguments
+                        joining: list[str], leaving: list[str], moving: list[str]) -> str:
+        """
+        State of the endpoint as shown by `nodetool status', e.g. "UN"
+        """
+        if endpoint in live:
+            state = "U"
+        elif endpoint in down:
+            state = "D"
+        else:
+            state = "?"
+        if endpoint in joining:
+            state += "J"
+        elif endpoint in leaving:
+            state += "L"
+        elif endpoint in moving:
+            state += "M"
+        else:
+            state += "N"
+        return state
+
+    def listsnapshots(self) -> defaultdict[str, list[SnapshotDetails]]:
+        """
+        Same as `parse_nodetool_listsnapshots()' of `nodetool listsnapshots' output
+        """
+        snapshots_content = defaultdict(list)
+        for snapshot in self.get_many("listsnapshots", "/storage_service/snapshots")[0]:
+            for table in snapshot["value"]:
+                snapshots_content[snapshot["key"]].append(SnapshotDetails(table["ks"], table["cf"]))
+        return snapshots_content
@@ -14,11 +14,7 @@
 from typing import Literal
 
 from sdcm.cluster import BaseNode
-from sdcm.rest.rest_client import RestClient
-
-
-class ScyllaApiException(Exception):
-    pass
+from sdcm.rest.rest_client import RestClient, ScyllaApiException
 
 
 class RemoteCurlClient(RestClient):
@@ -23,6 +23,10 @@ from requests import Response
 LOGGER = logging.getLogger(__name__)
 
 
+class ScyllaApiException(Exception):
+    pass
+
+
 class RestClient:
     def __init__(self,
                  host: str,
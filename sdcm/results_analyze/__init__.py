@@ -21,6 +21,7 @@ import collections
 import re
 
 from datetime import datetime, timedelta
+from functools import cached_property
 from typing import Any
 from sortedcontainers import SortedDict
 
@@ -35,6 +36,7 @@ from sdcm.utils.common import format_timestamp
 from sdcm.utils.es_queries import QueryFilter, PerformanceFilterYCSB, PerformanceFilterScyllaBench, \
     PerformanceFilterCS, CDCQueryFilterCS, LatencyWithNemesisQueryFilter
 from test_lib.utils import MagicList, get_data_by_path
+from .results_history import ResultsHistory
 from .test import TestResultClass
 
 
@@ -56,6 +58,17 @@ class BaseResultsAnalyzer:  # pylint: disable=too-many-instance-attributes
         self.log = logger if logger else LOGGER
         self._events = events
 
+    @cached_property
+    def _results_history(self):
+        return ResultsHistory(es=self._es)
+
+    def search_prior_results(self, query=None, filter_path=(), **kwargs):
+        """
+        Search the results of the prior tests, through the local cache of the results history
+        """
+        return self._results_history.search(index=self._es_index, query=query, filter_path=filter_path,
+                                            size=self._limit, **kwargs)
+
     def get_all(self):
         """
         Get all the test results in json format
@@ -239,12 +252,7 @@ class LatencyDuringOperationsPerformanceAnalyzer(BaseResultsAnalyzer):
         query = LatencyWithNemesisQueryFilter(test_doc, is_gce, use_wide_query=True, lastyear=True)()
 
         LOGGER.debug("ES QUERY: %s", query)
-        test_results = self._es.search(  # pylint: disable=unexpected-keyword-arg; pylint doesn't understand Elasticsearch code
-            index=self._es_index,
-            doc_type=self._es_doc_type,
-            q=query,
-            filter_path=filter_path,
-            size=self._limit)
+        test_results = self.search_prior_results(query=query, filter_path=filter_path, doc_type=self._es_doc_type)
         if not test_results:
             self.log.warning("No results found for query: %s", query)
             return []
@@ -527,19 +535,13 @@ class SpecifiedStatsPerformanceAnalyzer(BaseResultsAnalyzer):
             stat_path = '.'.join([es_source_path, stat])
             filter_path.append(stat_path)
 
-        tests_filtered = self._es.search(  # pylint: disable=unexpected-keyword-arg; pylint doesn't understand Elasticsearch code
-            index=self._es_index,
-            size=self._limit,
-            filter_path=filter_path,
-        )
+        tests_filtered = self.search_prior_results(filter_path=filter_path)
         self.log.debug("Filtered tests found are: {}".format(tests_filtered))
 
         if not tests_filtered:
             self.log.info('Cannot find tests with the same parameters as {}'.format(test_id))
             return False
         cur_test_version = None
-        tested_params = stats.keys()
-        group_by_version = {}
         # repair_runtime result example:
         # { '_id': '20190303-105120-405065',
         #   '_index': 'performanceregressionrowlevelrepairtest',
@@ -552,62 +554,35 @@ class SpecifiedStatsPerformanceAnalyzer(BaseResultsAnalyzer):
         #                             'repair_runtime': -1,
         #                             'throughput': { }},
         #
-        # # Find the average results for each version per tested param (stats)
         for tag_row in tests_filtered['hits']['hits']:
-            if '_source' not in tag_row:  # non-valid record?
-                self.log.error('Skip non-valid test: %s', tag_row['_id'])
-                continue
-            if not tag_row['_source']['versions'] or 'scylla-server' not in tag_row['_source']['versions']:
-                continue
-            version_info = tag_row['_source']['versions']['scylla-server']
-            version = version_info['version']
-            self.log.debug("version_info={} version={}".format(version_info, version))
-
-            if tag_row['_id'] == test_id:  # save the current test values
-                cur_test_version = version
-                continue
-
-            if not version:
-                continue
+            if tag_row['_id'] == test_id and tag_row.get('_source', {}).get('versions') \
+                    and 'scylla-server' in tag_row['_source']['versions']:
+                cur_test_version = tag_row['_source']['versions']['scylla-server']['version']
+                break
 
+        if not cur_test_version:
+            raise ValueError("Could not retrieve current test details from database")
+        # Find the average results for each version per tested param (stats)
+        for param in stats:
             # group_by_version example:
-            #   { '2.3.0':
-            #       { 'repair_runtime': [12.345, 13.031]},
-            #     '3.1.0': { 'repair_runtime': [5.341]}
+            #   { '2.3.0': {'count': 2, 'avg': 12.688, ...},
+            #     '3.1.0': {'count': 1, 'avg': 5.341, ...}
             #   }
-            if version not in group_by_version:
-                group_by_version[version] = {}
-                for param in tested_params:
-                    if param in tag_row['_source']:
-                        group_by_version[version][param] = [tag_row['_source'][param]]
-            else:
-                for param in tested_params:
-                    if param in tag_row['_source']:
-                        if param not in group_by_version[version]:
-                            group_by_version[version][param] = [tag_row['_source'][param]]
-                        else:
-                            group_by_version[version][param].append(tag_row['_source'][param])
-
+            group_by_version = self._results_history.summarize(
+                index=self._es_index, filter_path=filter_path, size=self._limit, metric_path=param,
+                version_path='versions.scylla-server.version', exclude_ids=[test_id])
             self.log.debug("group_by_version={}".format(group_by_version))
-
-        if not cur_test_version:
-            raise ValueError("Could not retrieve current test details from database")
-        for param in tested_params:
-            if param in group_by_version[cur_test_version]:
+            if cur_test_version in group_by_version:
                 cur_test_param_result = stats[param]
-                list_param_stats = group_by_version[cur_test_version][param]
-                param_avg = sum(list_param_stats) / float(len(list_param_stats))
+                param_avg = group_by_version[cur_test_version]['avg']
                 deviation_limit = param_avg * allowed_deviation
                 self.log.info(
                     "Performance result for: {} is: {}. (average statistics deviation limit is: {}".format(param,
                                                                                                            cur_test_param_result,
                                                                                                            deviation_limit))
                 for version, group in group_by_version.items():
-                    if param in group:
-                        list_param_results = group[param]
-                        version_avg = sum(list_param_results) / float(len(list_param_results))
-                        self.log.info("Performance average of {} results for: {} on version: {} is: {}".format(
-                            len(list_param_results), param, version, version_avg))
+                    self.log.info("Performance average of {} results for: {} on version: {} is: {}".format(
+                        group['count'], param, version, group['avg']))
                 assert float(
                     cur_test_param_result) < deviation_limit, "Current test performance for: {} exceeds allowed deviation ({})".format(
                     param, deviation_limit)
@@ -736,8 +711,7 @@ class PerformanceResultsAnalyzer(BaseResultsAnalyzer):
                        'hits.hits._source.results.stats_total',
                        'hits.hits._source.results.throughput',
                        'hits.hits._source.versions']
-        tests_filtered = self._es.search(index=self._es_index, q=query, filter_path=filter_path,  # pylint: disable=unexpected-keyword-arg
-                                         size=self._limit, request_timeout=30)
+        tests_filtered = self.search_prior_results(query=query, filter_path=filter_path, request_timeout=30)
 
         if not tests_filtered:
             raise ValueError(f'Cannot find tests with the same parameters as {test_id}')
@@ -916,12 +890,7 @@ class PerformanceResultsAnalyzer(BaseResultsAnalyzer):
                        'hits.hits._source.results',
                        'hits.hits._source.versions',
                        'hits.hits._source.test_details']
-        tests_filtered = self._es.search(  # pylint: disable=unexpected-keyword-arg; pylint doesn't understand Elasticsearch code
-            index=self._es_index,
-            q=query,
-            size=self._limit,
-            filter_path=filter_path,
-        )
+        tests_filtered = self.search_prior_results(query=query, filter_path=filter_path)
 
         if not tests_filtered:
             raise ValueError(f'Cannot find tests with the same parameters as {test_id}')
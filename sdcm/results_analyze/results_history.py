@@ -0,0 +1,207 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2024 ScyllaDB
+
+import os
+import re
+import json
+import time
+import logging
+import sqlite3
+import threading
+from typing import Iterable
+
+LOGGER = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS queries (
+    query_id INTEGER PRIMARY KEY,
+    es_index TEXT NOT NULL,
+    query TEXT NOT NULL,
+    filter_path TEXT NOT NULL,
+    synced_start_time REAL,
+    last_used REAL,
+    UNIQUE (es_index, query, filter_path)
+);
+CREATE TABLE IF NOT EXISTS docs (
+    query_id INTEGER NOT NULL,
+    doc_id TEXT NOT NULL,
+    start_time REAL,
+    source TEXT NOT NULL,
+    PRIMARY KEY (query_id, doc_id)
+);
+CREATE INDEX IF NOT EXISTS docs_by_start_time ON docs (query_id, start_time);
+"""
+
+SUMMARY_QUERY = """
+WITH recent_docs AS (
+    SELECT doc_id, start_time, source FROM docs
+    WHERE query_id = :query_id AND (:min_version_date IS NULL
+        OR CAST(json_extract(source, :version_date_path) AS TEXT) > :min_version_date)
+    ORDER BY start_time DESC LIMIT :size
+), values_by_version AS (
+    SELECT json_extract(source, :version_path) AS version, start_time, json_extract(source, :metric_path) AS value
+    FROM recent_docs
+    WHERE doc_id NOT IN (SELECT value FROM json_each(:exclude_ids))
+        AND json_type(source, :metric_path) IN ('integer', 'real')
+), ranked AS (
+    SELECT version, value,
+        ROW_NUMBER() OVER (PARTITION BY version ORDER BY value) AS value_rank,
+        ROW_NUMBER() OVER (PARTITION BY version ORDER BY start_time DESC) AS recency_rank,
+        COUNT(*) OVER (PARTITION BY version) AS count
+    FROM values_by_version
+    WHERE version IS NOT NULL AND version != ''
+)
+SELECT version, count, AVG(value), MIN(value), MAX(value),
+    MAX(CASE WHEN recency_rank = 1 THEN value END),
+    AVG(CASE WHEN value_rank IN ((count + 1) / 2, (count + 2) / 2) THEN value END)
+FROM ranked
+GROUP BY version
+"""
+
+
+# added by the `lastyear' query filters, the date in it changes daily, so it's applied to the cached results instead
+VERSION_DATE_FILTER_RE = re.compile(r"^versions\.scylla-server\.date:\{(\d+) TO \*\}$")
+
+
+def split_version_date_filter(query: str) -> tuple[str, str | None]:
+    """Remove the minimal scylla version date filter from a query, return the rest of it and the date"""
+    parts, min_version_date = [], None
+    for part in query.split(" AND "):
+        if match := VERSION_DATE_FILTER_RE.match(part.strip()):
+            min_version_date = match.group(1)
+        else:
+            parts.append(part)
+    return " AND ".join(parts), min_version_date
+
+
+def json_path(path: str) -> str:
+    """Convert a dotted path in `_source', like `versions.scylla-server.version', to a SQLite JSON path"""
+    return "$._source" + "".join(f'."{part}"' for part in path.split("."))
+
+
+class ResultsHistory:
+    """
+    Local cache of the prior test results, to not pull all of them from Elasticsearch on every regression check.
+
+    The results of every query are kept in SQLite. Following syncs fetch only the tests started since the last synced
+    one (minus `resync_window', to get the final results of the tests which were still running), and if Elasticsearch
+    isn't reachable, the cached results are used. Results of queries which weren't used for `unused_query_ttl' are
+    evicted.
+    """
+    default_path = os.path.join(os.path.expanduser("~"), ".cache", "sct", "results_history.sqlite")
+    resync_window = 3 * 24 * 60 * 60  # 3 days
+    unused_query_ttl = 90 * 24 * 60 * 60  # 90 days
+    start_time_path = "test_details.start_time"
+    version_date_path = "versions.scylla-server.date"
+
+    def __init__(self, es, path: str = None):
+        self._es = es
+        self.path = path or os.environ.get("SCT_RESULTS_HISTORY_PATH", self.default_path)
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.executescript(SCHEMA)
+        self._lock = threading.Lock()
+        self._evict_unused_queries()
+
+    def _evict_unused_queries(self):
+        with self._db:
+            if "last_used" not in {column for _, column, *_ in self._db.execute("PRAGMA table_info(queries)")}:
+                self._db.execute("ALTER TABLE queries ADD COLUMN last_used REAL")
+            unused = [query_id for query_id, in self._db.execute(
+                "SELECT query_id FROM queries WHERE COALESCE(last_used, 0) < ?",
+                (time.time() - self.unused_query_ttl, ))]
+            self._db.executemany("DELETE FROM docs WHERE query_id = ?", [(query_id, ) for query_id in unused])
+            self._db.executemany("DELETE FROM queries WHERE query_id = ?", [(query_id, ) for query_id in unused])
+        if unused:
+            LOGGER.debug("Evicted cached results of %d unused queries", len(unused))
+
+    def _normalize_filter_path(self, filter_path: Iterable[str]) -> list[str]:
+        # the start time is needed to sync the deltas, and the version date to filter the cached results
+        if not filter_path:
+            return []
+        return sorted(set(filter_path) | {f"hits.hits._source.{self.start_time_path}",
+                                          f"hits.hits._source.{self.version_date_path}"})
+
+    def _get_query(self, index: str, query: str, filter_path: list[str]) -> tuple[int, float | None]:
+        key = (index, query, json.dumps(filter_path))
+        with self._db:
+            self._db.execute("INSERT OR IGNORE INTO queries (es_index, query, filter_path) VALUES (?, ?, ?)", key)
+            self._db.execute("UPDATE queries SET last_used = ? WHERE es_index = ? AND query = ? AND filter_path = ?",
+                             (time.time(), *key))
+            return self._db.execute(
+                "SELECT query_id, synced_start_time FROM queries WHERE es_index = ? AND query = ? AND filter_path = ?",
+                key).fetchone()
+
+    def _store(self, query_id: int, hits: list[dict]):
+        rows = []
+        for hit in hits:
+            start_time = (hit.get("_source") or {}).get("test_details", {}).get("start_time")
+            rows.append((query_id, hit["_id"], float(start_time) if start_time else None, json.dumps(hit)))
+        with self._db:
+            self._db.executemany("INSERT OR REPLACE INTO docs VALUES (?, ?, ?, ?)", rows)
+            self._db.execute(
+                "UPDATE queries SET synced_start_time = (SELECT MAX(start_time) FROM docs WHERE query_id = ?) "
+                "WHERE query_id = ?", (query_id, query_id))
+
+    def search(self, index: str, query: str = None, filter_path: Iterable[str] = (), size: int = 1000,
+               **kwargs) -> dict:
+        """
+        Same as `ES.search(index=index, q=query, filter_path=filter_path, size=size)', but returns the `size' most
+        recent tests of the local cache, after syncing it with Elasticsearch
+        """
+        filter_path = self._normalize_filter_path(filter_path)
+        cached_query, min_version_date = split_version_date_filter(query or "")
+        with self._lock:
+            query_id, synced_start_time = self._get_query(index, cached_query, filter_path)
+            sync_query = query
+            if synced_start_time is not None:
+                delta = f"{self.start_time_path}:>={int(synced_start_time - self.resync_window)}"
+                sync_query = f"({query}) AND {delta}" if query else delta
+            if sync_query:
+                kwargs["q"] = sync_query
+            try:
+                result = self._es.search(index=index, filter_path=filter_path, size=size, **kwargs)
+            except Exception as exc:  # pylint: disable=broad-except  # noqa: BLE001
+                if synced_start_time is None:
+                    raise
+                LOGGER.warning("Failed to sync the results history of `%s' index, using the cached results: %s",
+                               index, exc)
+            else:
+                self._store(query_id, (result or {}).get("hits", {}).get("hits", []))
+            hits = [json.loads(source) for source, in self._db.execute(
+                "SELECT source FROM docs WHERE query_id = :query_id AND (:min_version_date IS NULL "
+                "OR CAST(json_extract(source, :version_date_path) AS TEXT) > :min_version_date) "
+                "ORDER BY start_time DESC LIMIT :size",
+                {"query_id": query_id, "min_version_date": min_version_date, "size": size,
+                 "version_date_path": json_path(self.version_date_path)})]
+        return {"hits": {"hits": hits}} if hits else {}
+
+    def summarize(self, index: str, metric_path: str, version_path: str,  # pylint: disable=too-many-arguments
+                  query: str = None, filter_path: Iterable[str] = (), size: int = 1000,
+                  exclude_ids: Iterable[str] = ()) -> dict[str, dict]:
+        """
+        Calculate count, average, min, max, last and median values of a metric per version, over the cached results
+        of a query, which were synced by `search()'
+
+        :return: {version: {"count": ..., "avg": ..., "min": ..., "max": ..., "last": ..., "median": ...}}
+        """
+        filter_path = self._normalize_filter_path(filter_path)
+        cached_query, min_version_date = split_version_date_filter(query or "")
+        with self._lock:
+            query_id, _ = self._get_query(index, cached_query, filter_path)
+            rows = self._db.execute(SUMMARY_QUERY, {
+                "query_id": query_id, "size": size, "min_version_date": min_version_date,
+                "version_date_path": json_path(self.version_date_path), "version_path": json_path(version_path),
+                "metric_path": json_path(metric_path), "exclude_ids": json.dumps(list(exclude_ids))}).fetchall()
+        return {version: dict(zip(("count", "avg", "min", "max", "last", "median"), values))
+                for version, *values in rows}
@@ -3,10 +3,11 @@ from __future__ import annotations
 import datetime
 import logging
 import random
-import tempfile
 import threading
 import time
 import traceback
+from collections import deque
+from functools import cached_property, partial
 from pathlib import Path
 from abc import abstractmethod
 from string import Template
@@ -14,15 +15,16 @@ from typing import Optional, Type, NamedTuple, TYPE_CHECKING
 
 from pytz import utc
 from cassandra import ConsistencyLevel, OperationTimedOut, ReadTimeout
-from cassandra.cluster import ResponseFuture, ResultSet  # pylint: disable=no-name-in-module
+from cassandra.cluster import ResponseFuture, ResultSet, NoHostAvailable  # pylint: disable=no-name-in-module
+from cassandra.metadata import protect_name  # pylint: disable=no-name-in-module
 from cassandra.query import SimpleStatement  # pylint: disable=no-name-in-module
 
-from sdcm.remote import LocalCmdRunner
 from sdcm.sct_events import Severity
 from sdcm.sct_events.database import FullScanEvent, FullPartitionScanReversedOrderEvent, FullPartitionScanEvent, \
     FullScanAggregateEvent
 from sdcm.utils.database_query_utils import get_table_clustering_order, get_partition_keys
-from sdcm.utils.operations_thread import OperationThreadStats, OneOperationStat, OperationThread, ThreadParams
+from sdcm.utils.operations_thread import OperationThreadStats, OneOperationStat, OperationThread, ThreadParams, \
+    SubRangeStat
 from sdcm.db_stats import PrometheusDBStats
 from sdcm.test_config import TestConfig
 from sdcm.utils.decorators import retrying, Retry
@@ -32,7 +34,12 @@ if TYPE_CHECKING:
 
 ERROR_SUBSTRINGS = ("timed out", "unpack requires", "timeout", 'Host has been marked down or removed')
 BYPASS_CACHE_VALUES = [" BYPASS CACHE", ""]
-LOCAL_CMD_RUNNER = LocalCmdRunner()
+MIN_TOKEN = -(2 ** 63)
+MAX_TOKEN = 2 ** 63 - 1
+# a table scan is split to more sub-ranges than queries running concurrently, so a slow sub-range doesn't stall it
+SUB_RANGES_PER_CONCURRENT_QUERY = 4
+# mismatching rows written to the diff file of a failed reversed partition scan validation
+MAX_REPORTED_MISMATCHES = 100
 
 
 class FullScanCommand(NamedTuple):
@@ -43,6 +50,8 @@ class FullScanCommand(NamedTuple):
 class FullScanAggregateCommands(NamedTuple):
     SELECT_ALL = FullScanCommand("SELECT_ALL", Template("SELECT * from $ks_cf$bypass_cache$timeout"))
     AGG_COUNT_ALL = FullScanCommand("AGG_COUNT_ALL", Template("SELECT count(*) FROM $ks_cf$bypass_cache$timeout"))
+    SELECT_TOKEN_RANGE = FullScanCommand("SELECT_TOKEN_RANGE", Template(
+        "SELECT * from $ks_cf WHERE token($pk) >= $start_token AND token($pk) <= $end_token$bypass_cache$timeout"))
 
 
 class FullscanException(Exception):
@@ -50,6 +59,185 @@ class FullscanException(Exception):
     ...
 
 
+def split_token_range(ranges_count: int) -> list[tuple[int, int]]:
+    """Split the whole Murmur3 token ring into `ranges_count` contiguous inclusive sub-ranges"""
+    step = (MAX_TOKEN - MIN_TOKEN) // ranges_count
+    starts = [MIN_TOKEN + step * index for index in range(ranges_count)]
+    return list(zip(starts, [start - 1 for start in starts[1:]] + [MAX_TOKEN]))
+
+
+class PartitionScanComparator:
+    """
+    Validates the output of a reversed partition scan against the normal scan of the same partition, in memory
+
+    The reversed scan runs first and only hashes of its rows are kept. The normal scan is streamed through a ring
+    holding as many rows as the reversed scan returned, since a reversed scan with a LIMIT returns only the last
+    rows of the partition. Hashes are Python's string hashes, so they are comparable within a process only.
+    """
+
+    def __init__(self):
+        self.reversed_hashes = []
+        self.normal_rows = None
+        self.normal_rows_count = 0
+
+    def add_reversed_row(self, row: str):
+        self.reversed_hashes.append(hash(row))
+
+    def add_normal_row(self, row: str):
+        if self.normal_rows is None:
+            self.normal_rows = deque(maxlen=len(self.reversed_hashes))
+        self.normal_rows_count += 1
+        self.normal_rows.append((hash(row), row))
+
+    def find_mismatches(self, limit: int | None = None) -> list[str]:
+        """Returns descriptions of differences between the scans, an empty list if the outputs match"""
+        mismatches = []
+        expected_count = min(self.normal_rows_count, limit) if limit else self.normal_rows_count
+        if expected_count != len(self.reversed_hashes):
+            mismatches.append(f"reversed scan returned {len(self.reversed_hashes)} rows, expected {expected_count} "
+                              f"(the normal scan returned {self.normal_rows_count} rows, limit: {limit or None})")
+        for position, ((normal_hash, normal_row), reversed_hash) in enumerate(
+                zip(reversed(self.normal_rows or ()), self.reversed_hashes)):
+            if normal_hash != reversed_hash:
+                mismatches.append(f"row {position} of the reversed scan differs, expected: {normal_row.rstrip()}")
+        return mismatches
+
+
+class ScanSessionPool:
+    """
+    Keeps an open CQL session per node and user, shared by the scan operations of a thread
+
+    Opening a session discovers the whole cluster metadata, which may take longer than the scan itself.
+    """
+
+    def __init__(self, db_cluster):
+        self.db_cluster = db_cluster
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def get_session(self, node: BaseNode, user: str = None, password: str = None):
+        with self._lock:
+            if (entry := self._sessions.get((node.name, user))) and entry[1].is_shutdown is not True:
+                return entry[1]
+            connection = self.db_cluster.cql_connection_patient(
+                node=node, connect_timeout=300, user=user, password=password)
+            session = connection.__enter__()  # pylint: disable=unnecessary-dunder-call
+            self._sessions[(node.name, user)] = (connection, session)
+            return session
+
+    def discard(self, node: BaseNode, user: str = None):
+        with self._lock:
+            entry = self._sessions.pop((node.name, user), None)
+        if entry:
+            entry[0].__exit__(None, None, None)
+
+    def close(self):
+        with self._lock:
+            entries, self._sessions = list(self._sessions.values()), {}
+        for connection, _ in entries:
+            connection.__exit__(None, None, None)
+
+
+class TokenRangeScan:
+    """
+    Runs queries of token sub-ranges of a table, keeping up to `concurrency` of them in flight
+
+    Every sub-range is read page by page through the driver callbacks. Up to `read_pages` pages (0 is unlimited) are
+    read by the whole scan, no more pages or sub-ranges are requested once the limit is reached.
+    New queries are issued by the thread calling `run()` only, so a query failing inline doesn't start the next one
+    from within its own callback. Sub-ranges not finished within `timeout` seconds are marked as timed out.
+    """
+
+    def __init__(self, session, queries: list[tuple[SubRangeStat, str]], page_size: int, read_pages: int,
+                 concurrency: int, timeout: float, termination_event: threading.Event = None):
+        self.session = session
+        self.page_size = page_size
+        self.read_pages = read_pages
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.termination_event = termination_event or threading.Event()
+        self.sub_ranges = [stat for stat, _ in queries]
+        self._pending = deque(queries)
+        self._in_flight = 0
+        self._pages_read = 0
+        self._finished = set()
+        self._timed_out = False
+        self._condition = threading.Condition()
+
+    def run(self) -> list[SubRangeStat]:
+        deadline = time.perf_counter() + self.timeout
+        while True:
+            with self._condition:
+                to_start = []
+                while self._pending and self._in_flight + len(to_start) < self.concurrency and not self._stopped:
+                    to_start.append(self._pending.popleft())
+                self._in_flight += len(to_start)
+            for stat, query in to_start:
+                self._start_query(stat, query)
+            with self._condition:
+                if not self._in_flight and (not self._pending or self._stopped):
+                    break
+                if (remaining := deadline - time.perf_counter()) <= 0:
+                    self._time_out()
+                    break
+                if self._in_flight >= self.concurrency or not self._pending or self._stopped:
+                    self._condition.wait(timeout=remaining)
+        return self.sub_ranges
+
+    @property
+    def _pages_limit_reached(self) -> bool:
+        return bool(self.read_pages) and self._pages_read >= self.read_pages
+
+    @property
+    def _stopped(self) -> bool:
+        return self.termination_event.is_set() or self._pages_limit_reached
+
+    def _time_out(self):
+        self._timed_out = True
+        for stat in self.sub_ranges:
+            if id(stat) in self._finished or (stat.duration is None and self._stopped):
+                continue
+            self._finished.add(id(stat))
+            stat.exception = repr(OperationTimedOut(f"token sub-range wasn't read within {self.timeout}s"))
+            if stat.duration is not None:
+                stat.duration = time.perf_counter() - stat.duration
+
+    def _start_query(self, stat: SubRangeStat, query: str):
+        stat.duration = time.perf_counter()
+        try:
+            future = self.session.execute_async(SimpleStatement(
+                query, fetch_size=self.page_size, consistency_level=ConsistencyLevel.ONE))
+        except Exception as exc:  # pylint: disable=broad-except  # noqa: BLE001
+            self._handle_error(stat, exc)
+            return
+        future.add_callbacks(callback=partial(self._handle_page, future, stat),
+                             errback=partial(self._handle_error, stat))
+
+    def _handle_page(self, future: ResponseFuture, stat: SubRangeStat, rows):
+        stat.rows_read += len(rows)
+        stat.pages += 1
+        with self._condition:
+            self._pages_read += 1
+            stopped = self._stopped or self._timed_out
+        if future.has_more_pages and not stopped:
+            future.start_fetching_next_page()
+        else:
+            self._finish(stat)
+
+    def _handle_error(self, stat: SubRangeStat, exc: Exception):
+        self._finish(stat, exception=exc)
+
+    def _finish(self, stat: SubRangeStat, exception: Exception = None):
+        with self._condition:
+            self._in_flight -= 1
+            if id(stat) not in self._finished:
+                self._finished.add(id(stat))
+                stat.duration = time.perf_counter() - stat.duration
+                if exception is not None:
+                    stat.exception = repr(exception)
+            self._condition.notify()
+
+
 # pylint: disable=too-many-instance-attributes
 class ScanOperationThread(OperationThread):
     """
@@ -72,6 +260,8 @@ class ScanOperationThread(OperationThread):
 
     def __init__(self, thread_params: ThreadParams, thread_name: str = ""):
         super().__init__(thread_params, thread_name)
+        self.session_pool = ScanSessionPool(db_cluster=thread_params.db_cluster)
+        self.operation_params['session_pool'] = self.session_pool
         full_scan_operation = FullScanOperation(**self.operation_params)
         full_partition_scan_operation = FullPartitionScanOperation(**self.operation_params)
         full_scan_aggregates_operation = FullScanAggregatesOperation(**self.operation_params)
@@ -88,11 +278,18 @@ class ScanOperationThread(OperationThread):
             "aggregate": lambda: full_scan_aggregates_operation
         }
 
+    def run(self):
+        try:
+            super().run()
+        finally:
+            self.session_pool.close()
+
 
 class FullscanOperationBase:
     def __init__(self, generator: random.Random, thread_params: ThreadParams, thread_stats: OperationThreadStats,
                  scan_event: Type[FullScanEvent] | Type[FullPartitionScanEvent]
-                 | Type[FullPartitionScanReversedOrderEvent] | Type[FullScanAggregateEvent]):
+                 | Type[FullPartitionScanReversedOrderEvent] | Type[FullScanAggregateEvent],
+                 session_pool: ScanSessionPool = None):
         """
         Base class for performing fullscan operations.
         """
@@ -104,6 +301,7 @@ class FullscanOperationBase:
         self.log.info("FullscanOperationBase scan_event: %s", self.scan_event)
         self.termination_event = self.fullscan_params.termination_event
         self.generator = generator
+        self.session_pool = session_pool or ScanSessionPool(db_cluster=self.fullscan_params.db_cluster)
         self.db_node = self._get_random_node()
         self.current_operation_stat = None
         self.log.info("FullscanOperationBase init finished")
@@ -142,41 +340,40 @@ class FullscanOperationBase:
                 cmd=cmd
             )
 
-            with self.fullscan_params.db_cluster.cql_connection_patient(
-                    node=self.db_node,
-                    connect_timeout=300,
-                    user=self.fullscan_params.user,
-                    password=self.fullscan_params.user_password) as session:
-                try:
-                    scan_op_event.message = ''
-                    start_time = time.time()
-                    result = self.execute_query(session=session, cmd=cmd, event=scan_op_event)
-                    if result:
-                        self.fetch_result_pages(result=result, read_pages=self.fullscan_stats.read_pages)
-                    if not scan_op_event.message:
-                        scan_op_event.message = f"{type(self).__name__} operation ended successfully"
-                except Exception as exc:  # pylint: disable=broad-except  # noqa: BLE001
-                    self.log.error(traceback.format_exc())
-                    msg = repr(exc)
-                    self.current_operation_stat.exceptions.append(repr(exc))
-                    msg = f"{msg} while running " \
-                          f"Nemesis: {self.db_node.running_nemesis}" if self.db_node.running_nemesis else msg
-                    scan_op_event.message = msg
-
-                    if self.db_node.running_nemesis or any(s in msg.lower() for s in ERROR_SUBSTRINGS):
-                        scan_op_event.severity = Severity.WARNING
-                    else:
-                        scan_op_event.severity = Severity.ERROR
-                finally:
-                    duration = time.time() - start_time
-                    self.fullscan_stats.time_elapsed += duration
-                    self.fullscan_stats.scans_counter += 1
-                    self.current_operation_stat.nemesis_at_end = self.db_node.running_nemesis
-                    self.current_operation_stat.duration = duration
-                    # success is True if there were no exceptions
-                    self.current_operation_stat.success = not bool(self.current_operation_stat.exceptions)
-                    self.update_stats(self.current_operation_stat)
-                    return self.current_operation_stat  # pylint: disable=lost-exception
+            session = self.session_pool.get_session(
+                node=self.db_node, user=self.fullscan_params.user, password=self.fullscan_params.user_password)
+            try:
+                scan_op_event.message = ''
+                start_time = time.time()
+                result = self.execute_query(session=session, cmd=cmd, event=scan_op_event)
+                if result:
+                    self.fetch_result_pages(result=result, read_pages=self.fullscan_stats.read_pages)
+                if not scan_op_event.message:
+                    scan_op_event.message = f"{type(self).__name__} operation ended successfully"
+            except Exception as exc:  # pylint: disable=broad-except  # noqa: BLE001
+                self.log.error(traceback.format_exc())
+                msg = repr(exc)
+                self.current_operation_stat.exceptions.append(repr(exc))
+                if isinstance(exc, NoHostAvailable):
+                    self.session_pool.discard(node=self.db_node, user=self.fullscan_params.user)
+                msg = f"{msg} while running " \
+                      f"Nemesis: {self.db_node.running_nemesis}" if self.db_node.running_nemesis else msg
+                scan_op_event.message = msg
+
+                if self.db_node.running_nemesis or any(s in msg.lower() for s in ERROR_SUBSTRINGS):
+                    scan_op_event.severity = Severity.WARNING
+                else:
+                    scan_op_event.severity = Severity.ERROR
+            finally:
+                duration = time.time() - start_time
+                self.fullscan_stats.time_elapsed += duration
+                self.fullscan_stats.scans_counter += 1
+                self.current_operation_stat.nemesis_at_end = self.db_node.running_nemesis
+                self.current_operation_stat.duration = duration
+                # success is True if there were no exceptions
+                self.current_operation_stat.success = not bool(self.current_operation_stat.exceptions)
+                self.update_stats(self.current_operation_stat)
+                return self.current_operation_stat  # pylint: disable=lost-exception
 
     def update_stats(self, new_stat):
         self.fullscan_stats.stats.append(new_stat)
@@ -188,13 +385,21 @@ class FullscanOperationBase:
         self.log.debug('Will fetch up to %s result pages..', read_pages)
         pages = 0
         while result.has_more_pages and pages <= read_pages:
+            result.fetch_next_page()
             if read_pages > 0:
                 pages += 1
 
 
 class FullScanOperation(FullscanOperationBase):
+    """
+    Run a full scan of a table, split to token sub-ranges which are queried concurrently.
+
+    By default, there is a query in flight per shard of the cluster, so the scan load scales with the cluster size.
+    """
+
     def __init__(self, generator, **kwargs):
         super().__init__(generator, scan_event=FullScanEvent, **kwargs)
+        self.split_by_token_ranges = False
 
     def randomly_form_cql_statement(self) -> str:
         base_query = FullScanAggregateCommands.SELECT_ALL.base_query
@@ -203,6 +408,69 @@ class FullScanOperation(FullscanOperationBase):
                                     bypass_cache=BYPASS_CACHE_VALUES[0])
         return cmd
 
+    @cached_property
+    def scan_concurrency(self) -> int:
+        return self.fullscan_params.scan_concurrency or \
+            sum(node.scylla_shards or 1 for node in self.fullscan_params.db_cluster.nodes)
+
+    @property
+    def scan_timeout(self) -> int:
+        # every concurrent query runs its sub-ranges one after another, each of them limited by the query timeout
+        return self.fullscan_params.full_scan_operation_limit * SUB_RANGES_PER_CONCURRENT_QUERY
+
+    def get_partition_key_columns(self, session) -> list[str]:
+        keyspace, table = self.fullscan_params.ks_cf.split(".", maxsplit=1)
+        try:
+            table_metadata = session.cluster.metadata.keyspaces[keyspace].tables[table]
+        except (AttributeError, KeyError):
+            return []
+        return [protect_name(column.name) for column in table_metadata.partition_key]
+
+    def form_token_range_queries(self, partition_key_columns: list[str]) -> list[tuple[SubRangeStat, str]]:
+        base_query = FullScanAggregateCommands.SELECT_TOKEN_RANGE.base_query
+        queries = []
+        for start_token, end_token in split_token_range(self.scan_concurrency * SUB_RANGES_PER_CONCURRENT_QUERY):
+            queries.append((SubRangeStat(start_token=start_token, end_token=end_token), base_query.substitute(
+                ks_cf=self.fullscan_params.ks_cf,
+                pk=", ".join(partition_key_columns),
+                start_token=start_token,
+                end_token=end_token,
+                timeout=f" USING TIMEOUT {self.fullscan_params.full_scan_operation_limit}s",
+                bypass_cache=BYPASS_CACHE_VALUES[0])))
+        return queries
+
+    def run_scan_operation(self, cmd: str = None) -> OneOperationStat:
+        # only the generated full table scan is split, a given statement is run as is
+        self.split_by_token_ranges = cmd is None
+        try:
+            return super().run_scan_operation(cmd=cmd)
+        finally:
+            self.split_by_token_ranges = False
+
+    def execute_query(
+            self, session, cmd: str,
+            event: Type[FullScanEvent | FullPartitionScanEvent
+                        | FullPartitionScanReversedOrderEvent]) -> ResultSet | None:
+        if not self.split_by_token_ranges or not (pk_columns := self.get_partition_key_columns(session)):
+            return super().execute_query(session=session, cmd=cmd, event=event)
+
+        queries = self.form_token_range_queries(pk_columns)
+        self.log.debug('Will run command %s split to %s token sub-ranges, %s of them concurrently',
+                       cmd, len(queries), self.scan_concurrency)
+        sub_ranges = TokenRangeScan(session=session, queries=queries,
+                                    page_size=self.fullscan_params.page_size,
+                                    read_pages=self.fullscan_stats.read_pages,
+                                    concurrency=self.scan_concurrency,
+                                    timeout=self.scan_timeout,
+                                    termination_event=self.termination_event).run()
+        self.current_operation_stat.sub_ranges = sub_ranges
+        self.current_operation_stat.rows_read = sum(sub_range.rows_read for sub_range in sub_ranges)
+        self.fullscan_stats.number_of_rows_read += self.current_operation_stat.rows_read
+        if errors := [sub_range.exception for sub_range in sub_ranges if sub_range.exception]:
+            raise FullscanException(f"{len(errors)} of {len(sub_ranges)} token sub-ranges failed, "
+                                    f"first error: {errors[0]}")
+        return None
+
 
 class FullPartitionScanOperation(FullscanOperationBase):
     """
@@ -231,19 +499,17 @@ class FullPartitionScanOperation(FullscanOperationBase):
                                                'no_filter': {'count': 0, 'total_scan_duration': 0}}
         self.ck_filter = ''
         self.limit = ''
-        self.reversed_query_output = tempfile.NamedTemporaryFile(mode='w+', delete=False,  # pylint: disable=consider-using-with
-                                                                 encoding='utf-8')
-        self.normal_query_output = tempfile.NamedTemporaryFile(mode='w+', delete=False,  # pylint: disable=consider-using-with
-                                                               encoding='utf-8')
+        self.comparator = PartitionScanComparator()
 
     def get_table_clustering_order(self) -> str:
         node = self._get_random_node()
         try:
-            with self.fullscan_params.db_cluster.cql_connection_patient(node=node, connect_timeout=300) as session:
-                # Using CL ONE. No need for a quorum since querying a constant fixed attribute of a table.
-                session.default_consistency_level = ConsistencyLevel.ONE
-                return get_table_clustering_order(ks_cf=self.fullscan_params.ks_cf,
-                                                  ck_name=self.fullscan_params.ck_name, session=session)
+            session = self.session_pool.get_session(node=node)
+            # Using CL ONE. No need for a quorum since querying a constant fixed attribute of a table.
+            # The session is shared with other scans, so its default consistency level isn't changed.
+            return get_table_clustering_order(ks_cf=self.fullscan_params.ks_cf,
+                                              ck_name=self.fullscan_params.ck_name, session=session,
+                                              consistency_level=ConsistencyLevel.ONE)
         except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
             self.log.error(traceback.format_exc())
             self.log.error('Failed getting table %s clustering order through node %s : %s',
@@ -264,73 +530,72 @@ class FullPartitionScanOperation(FullscanOperationBase):
         """
         db_node = self._get_random_node()
 
-        with self.fullscan_params.db_cluster.cql_connection_patient(
-                node=db_node, connect_timeout=300) as session:
-            ck_random_min_value = self.generator.randint(a=1, b=self.fullscan_params.rows_count)
-            ck_random_max_value = self.generator.randint(a=ck_random_min_value, b=self.fullscan_params.rows_count)
-            self.ck_filter = ck_filter = self.generator.choice(list(self.reversed_query_filter_ck_by.keys()))
-
-            if pks := get_partition_keys(ks_cf=self.fullscan_params.ks_cf, session=session, pk_name=self.fullscan_params.pk_name):
-                partition_key = self.generator.choice(pks)
-                # Form a random query out of all options, like:
-                # select * from scylla_bench.test where pk = 1234 and ck < 4721 and ck > 2549 order by ck desc
-                # limit 3467 bypass cache
-                selected_columns = [self.fullscan_params.pk_name, self.fullscan_params.ck_name]
-                if self.fullscan_params.include_data_column:
-                    selected_columns.append(self.fullscan_params.data_column_name)
-                reversed_query = f'select {",".join(selected_columns)} from {self.fullscan_params.ks_cf}' + \
-                    f' where {self.fullscan_params.pk_name} = {partition_key}'
-                query_suffix = self.limit = ''
-                # Randomly add CK filtering ( less-than / greater-than / both / non-filter )
-
-                # example: rows-count = 20, ck > 10, ck < 15, limit = 3 ==> ck_range = [11..14] = 4
-                # ==> limit < ck_range
-                # reversed query is: select * from scylla_bench.test where pk = 1 and ck > 10
-                # order by ck desc limit 5
-                # normal query should be: select * from scylla_bench.test where pk = 1 and ck > 15 limit 5
-                match ck_filter:
-                    case 'lt_and_gt':
-                        # Example: select * from scylla_bench.test where pk = 1 and ck > 10 and ck < 15 order by ck desc
-                        reversed_query += self.reversed_query_filter_ck_by[ck_filter].format(
-                            self.fullscan_params.ck_name,
-                            ck_random_max_value,
-                            self.fullscan_params.ck_name,
-                            ck_random_min_value
-                        )
-
-                    case 'gt':
-                        # example: rows-count = 20, ck > 10, limit = 5 ==> ck_range = 20 - 10 = 10 ==> limit < ck_range
-                        # reversed query is: select * from scylla_bench.test where pk = 1 and ck > 10
-                        # order by ck desc limit 5
-                        # normal query should be: select * from scylla_bench.test where pk = 1 and ck > 15 limit 5
-                        reversed_query += self.reversed_query_filter_ck_by[ck_filter].format(
-                            self.fullscan_params.ck_name,
-                            ck_random_min_value
-                        )
-
-                    case 'lt':
-                        # example: rows-count = 20, ck < 10, limit = 5 ==> limit < ck_random_min_value (ck_range)
-                        # reversed query is: select * from scylla_bench.test where pk = 1 and ck < 10
-                        # order by ck desc limit 5
-                        # normal query should be: select * from scylla_bench.test where pk = 1 and ck >= 5 limit 5
-                        reversed_query += self.reversed_query_filter_ck_by[ck_filter].format(
-                            self.fullscan_params.ck_name,
-                            ck_random_min_value
-                        )
-
-                query_suffix = f"{query_suffix} {self.generator.choice(BYPASS_CACHE_VALUES)}"
-                normal_query = reversed_query + query_suffix
-                if random.choice([False] + [True]):  # Randomly add a LIMIT
-                    self.limit = random.randint(a=1, b=self.fullscan_params.rows_count)
-                    query_suffix = f' limit {self.limit}' + query_suffix
-                reversed_query += f' order by {self.fullscan_params.ck_name} {self.reversed_order}' + query_suffix
-                self.log.debug('Randomly formed normal query is: %s', normal_query)
-                self.log.debug('[scan: %s, type: %s] Randomly formed reversed query is: %s', self.fullscan_stats.scans_counter,
-                               ck_filter, reversed_query)
-            else:
-                self.log.debug('No partition keys found for table: %s! A reversed query cannot be executed!',
-                               self.fullscan_params.ks_cf)
-                return None
+        session = self.session_pool.get_session(node=db_node)
+        ck_random_min_value = self.generator.randint(a=1, b=self.fullscan_params.rows_count)
+        ck_random_max_value = self.generator.randint(a=ck_random_min_value, b=self.fullscan_params.rows_count)
+        self.ck_filter = ck_filter = self.generator.choice(list(self.reversed_query_filter_ck_by.keys()))
+
+        if pks := get_partition_keys(ks_cf=self.fullscan_params.ks_cf, session=session, pk_name=self.fullscan_params.pk_name):
+            partition_key = self.generator.choice(pks)
+            # Form a random query out of all options, like:
+            # select * from scylla_bench.test where pk = 1234 and ck < 4721 and ck > 2549 order by ck desc
+            # limit 3467 bypass cache
+            selected_columns = [self.fullscan_params.pk_name, self.fullscan_params.ck_name]
+            if self.fullscan_params.include_data_column:
+                selected_columns.append(self.fullscan_params.data_column_name)
+            reversed_query = f'select {",".join(selected_columns)} from {self.fullscan_params.ks_cf}' + \
+                f' where {self.fullscan_params.pk_name} = {partition_key}'
+            query_suffix = self.limit = ''
+            # Randomly add CK filtering ( less-than / greater-than / both / non-filter )
+
+            # example: rows-count = 20, ck > 10, ck < 15, limit = 3 ==> ck_range = [11..14] = 4
+            # ==> limit < ck_range
+            # reversed query is: select * from scylla_bench.test where pk = 1 and ck > 10
+            # order by ck desc limit 5
+            # normal query should be: select * from scylla_bench.test where pk = 1 and ck > 15 limit 5
+            match ck_filter:
+                case 'lt_and_gt':
+                    # Example: select * from scylla_bench.test where pk = 1 and ck > 10 and ck < 15 order by ck desc
+                    reversed_query += self.reversed_query_filter_ck_by[ck_filter].format(
+                        self.fullscan_params.ck_name,
+                        ck_random_max_value,
+                        self.fullscan_params.ck_name,
+                        ck_random_min_value
+                    )
+
+                case 'gt':
+                    # example: rows-count = 20, ck > 10, limit = 5 ==> ck_range = 20 - 10 = 10 ==> limit < ck_range
+                    # reversed query is: select * from scylla_bench.test where pk = 1 and ck > 10
+                    # order by ck desc limit 5
+                    # normal query should be: select * from scylla_bench.test where pk = 1 and ck > 15 limit 5
+                    reversed_query += self.reversed_query_filter_ck_by[ck_filter].format(
+                        self.fullscan_params.ck_name,
+                        ck_random_min_value
+                    )
+
+                case 'lt':
+                    # example: rows-count = 20, ck < 10, limit = 5 ==> limit < ck_random_min_value (ck_range)
+                    # reversed query is: select * from scylla_bench.test where pk = 1 and ck < 10
+                    # order by ck desc limit 5
+                    # normal query should be: select * from scylla_bench.test where pk = 1 and ck >= 5 limit 5
+                    reversed_query += self.reversed_query_filter_ck_by[ck_filter].format(
+                        self.fullscan_params.ck_name,
+                        ck_random_min_value
+                    )
+
+            query_suffix = f"{query_suffix} {self.generator.choice(BYPASS_CACHE_VALUES)}"
+            normal_query = reversed_query + query_suffix
+            if random.choice([False] + [True]):  # Randomly add a LIMIT
+                self.limit = random.randint(a=1, b=self.fullscan_params.rows_count)
+                query_suffix = f' limit {self.limit}' + query_suffix
+            reversed_query += f' order by {self.fullscan_params.ck_name} {self.reversed_order}' + query_suffix
+            self.log.debug('Randomly formed normal query is: %s', normal_query)
+            self.log.debug('[scan: %s, type: %s] Randomly formed reversed query is: %s', self.fullscan_stats.scans_counter,
+                           ck_filter, reversed_query)
+        else:
+            self.log.debug('No partition keys found for table: %s! A reversed query cannot be executed!',
+                           self.fullscan_params.ks_cf)
+            return None
         return normal_query, reversed_query
 
     def fetch_result_pages(self, result: ResponseFuture, read_pages):
@@ -349,62 +614,26 @@ class FullPartitionScanOperation(FullscanOperationBase):
             event: Type[FullScanEvent | FullPartitionScanEvent
                         | FullPartitionScanReversedOrderEvent]) -> ResponseFuture:
         self.log.debug('Will run command "%s"', cmd)
-        session.default_fetch_size = self.fullscan_params.page_size
-        session.default_consistency_level = ConsistencyLevel.ONE
-        return session.execute_async(cmd)
-
-    def reset_output_files(self):
-        self.normal_query_output.close()
-        self.reversed_query_output.close()
-        self.reversed_query_output = tempfile.NamedTemporaryFile(mode='w+', delete=False,  # pylint: disable=consider-using-with
-                                                                 encoding='utf-8')
-        self.normal_query_output = tempfile.NamedTemporaryFile(mode='w+', delete=False,  # pylint: disable=consider-using-with
-                                                               encoding='utf-8')
-
-    def _compare_output_files(self) -> bool:
-        self.normal_query_output.flush()
-        self.reversed_query_output.flush()
-        result = False
-
-        with tempfile.NamedTemporaryFile(mode='w+', delete=True, encoding='utf-8') as reorder_normal_query_output:
-            cmd = f'tac {self.normal_query_output.name}'
-
-            if self.limit:
-                cmd += f' | head -n {self.limit}'
-
-            cmd += f' > {reorder_normal_query_output.name}'
-            LOCAL_CMD_RUNNER.run(cmd=cmd, ignore_status=True)
-            reorder_normal_query_output.flush()
-            LOCAL_CMD_RUNNER.run(cmd=f'cp {reorder_normal_query_output.name} {self.normal_query_output.name}',
-                                 ignore_status=True)
-            self.normal_query_output.flush()
-            file_names = f' {self.normal_query_output.name} {self.reversed_query_output.name}'
-            diff_cmd = f"diff -y --suppress-common-lines {file_names}"
-            self.log.debug("Comparing scan queries output files by: %s", diff_cmd)
-            log_file = Path(TestConfig().logdir()) / 'fullscans' / \
-                f'partition_range_scan_diff_{datetime.datetime.now(tz=utc).strftime("%Y_%m_%d-%I_%M_%S")}.log'
-            log_file.parent.mkdir(parents=True, exist_ok=True)
-            result = LOCAL_CMD_RUNNER.run(cmd=diff_cmd, ignore_status=True, verbose=False, log_file=str(log_file))
-
-        if not result.stderr:
-            if not result.stdout:
-                self.log.debug("Compared output of normal and reversed queries is identical!")
-                result = True
-            else:
-                self.log.warning("Normal and reversed queries output differs: output results in %s", log_file)
-                ls_cmd = f"ls -alh {file_names}"
-                head_cmd = f"head {file_names}"
-                for cmd in [ls_cmd, head_cmd]:
-                    result = LOCAL_CMD_RUNNER.run(cmd=cmd, ignore_status=True)
-                    if result.stdout:
-                        stdout = result.stdout.strip()
-                        self.log.debug("%s command output is: \n%s", cmd, stdout)
-        else:
-            self.log.warning("Comparison of output of normal and reversed queries failed with stderr:\n%s",
-                             result.stderr)
-
-        self.reset_output_files()
-        return result
+        return session.execute_async(SimpleStatement(
+            cmd, fetch_size=self.fullscan_params.page_size, consistency_level=ConsistencyLevel.ONE))
+
+    def _compare_scans_output(self) -> bool:
+        mismatches = self.comparator.find_mismatches(limit=self.limit or None)
+        self.comparator = PartitionScanComparator()
+        if not mismatches:
+            self.log.debug("Compared output of normal and reversed queries is identical!")
+            return True
+
+        log_file = Path(TestConfig().logdir()) / 'fullscans' / \
+            f'partition_range_scan_diff_{datetime.datetime.now(tz=utc).strftime("%Y_%m_%d-%I_%M_%S")}.log'
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        with log_file.open(mode="w", encoding="utf-8") as diff_file:
+            diff_file.write("\n".join(mismatches[:MAX_REPORTED_MISMATCHES]) + "\n")
+            if len(mismatches) > MAX_REPORTED_MISMATCHES:
+                diff_file.write(f"... and {len(mismatches) - MAX_REPORTED_MISMATCHES} more mismatches\n")
+        self.log.warning("Normal and reversed queries output differs (%s mismatches): output results in %s",
+                         len(mismatches), log_file)
+        return False
 
     def run_scan_operation(self, cmd: str = None):  # pylint: disable=too-many-locals
         self.table_clustering_order = self.get_table_clustering_order()
@@ -432,7 +661,7 @@ class FullPartitionScanOperation(FullscanOperationBase):
             self.log.debug('Executing the normal query: %s', normal_query)
             self.scan_event = FullPartitionScanEvent
             regular_op_stat = self.run_scan_event(cmd=normal_query, scan_event=self.scan_event)
-            comparison_result = self._compare_output_files()
+            comparison_result = self._compare_scans_output()
             full_partition_op_stat.nemesis_at_end = self.db_node.running_nemesis
             full_partition_op_stat.exceptions.append(regular_op_stat.exceptions)
             full_partition_op_stat.exceptions.append(reversed_op_stat.exceptions)
@@ -560,13 +789,13 @@ class PagedResultHandler:
         include_data_column = self.scan_operation.fullscan_params.include_data_column
         if self.scan_operation.scan_event == FullPartitionScanEvent:
             for row in rows:
-                self.scan_operation.normal_query_output.write(
+                self.scan_operation.comparator.add_normal_row(
                     self._row_to_string(row=row, include_data_column=include_data_column))
         elif self.scan_operation.scan_event == FullPartitionScanReversedOrderEvent:
             self.scan_operation.fullscan_stats.number_of_rows_read += len(rows)
             if self.scan_operation.fullscan_params.validate_data:
                 for row in rows:
-                    self.scan_operation.reversed_query_output.write(
+                    self.scan_operation.comparator.add_reversed_row(
                         self._row_to_string(row=row, include_data_column=include_data_column))
 
         if self.future.has_more_pages and self.current_read_pages <= self.max_read_pages:
@@ -23,8 +23,10 @@ import logging
 import getpass
 import pathlib
 import tempfile
+import threading
 from copy import deepcopy
-from typing import List, Union, Set
+from functools import cache
+from typing import Collection, List, Union, Set
 
 from distutils.util import strtobool
 import anyconfig
@@ -73,6 +75,53 @@ from sdcm.kafka.kafka_config import SctKafkaConfiguration
 from sdcm.mgmt.common import RestoreParameters, AgentBackupParameters
 
 
+_DEFAULT_LAYERS_CACHE = {}
+_DEFAULT_LAYERS_CACHE_LOCK = threading.Lock()
+
+
+def load_default_layers(config_files: List[str]) -> dict:
+    """
+    Load and merge the given defaults yaml files, reusing the parsed result while none of the files changed
+
+    The cache is keyed by the list of files, and invalidated whenever a modification time of one of them changes,
+    a deep copy is returned, so callers are free to merge into/modify the result.
+    """
+    files_key = tuple(config_files)
+    mtimes = tuple(os.path.getmtime(config_file) for config_file in config_files)
+    with _DEFAULT_LAYERS_CACHE_LOCK:
+        cached_mtimes, layers = _DEFAULT_LAYERS_CACHE.get(files_key, (None, None))
+        if cached_mtimes != mtimes:
+            layers = anyconfig.load(list(config_files))
+            _DEFAULT_LAYERS_CACHE[files_key] = (mtimes, layers)
+    return deepcopy(layers)
+
+
+def clear_default_layers_cache() -> None:
+    with _DEFAULT_LAYERS_CACHE_LOCK:
+        _DEFAULT_LAYERS_CACHE.clear()
+
+
+def index_environment_variables(env_names: Collection[str]) -> dict[str, dict]:
+    """
+    Scan `os.environ` once and group the variables of the given option env names
+
+    i.e. `SCT_STRESS_IMAGE.ycsb=...` is grouped under `SCT_STRESS_IMAGE`, together with `SCT_STRESS_IMAGE` if set
+
+    :return: dict of `{env_name: {"value": <value or None>, "nested": [(nested_key, value), ...]}}`
+    """
+    index = {}
+    for key, value in os.environ.items():
+        env_name, separator, nested_key = key.partition('.')
+        if env_name not in env_names:
+            continue
+        entry = index.setdefault(env_name, {"value": None, "nested": []})
+        if separator:
+            entry["nested"].append((nested_key.split('.')[0], value))
+        else:
+            entry["value"] = value
+    return index
+
+
 def _str(value: str) -> str:
     if isinstance(value, str):
         return value
@@ -1741,7 +1790,7 @@ class SCTConfiguration(dict):
         self.multi_region_params = self.per_provider_multi_region_params.get(str(backend), [])
 
         # 1) load the default backend config files
-        files = anyconfig.load(list(backend_config_files))
+        files = load_default_layers(backend_config_files)
         anyconfig.merge(self, files)
 
         # 2) load the config files
@@ -2063,9 +2112,19 @@ class SCTConfiguration(dict):
     def environment(self) -> dict:
         return self._load_environment_variables()
 
+    @classmethod
+    @cache
+    def _config_options_by_name(cls) -> dict[str, dict]:
+        return {opt['name']: opt for opt in cls.config_options}
+
+    @classmethod
+    @cache
+    def _config_options_by_env(cls) -> dict[str, dict]:
+        return {opt['env']: opt for opt in cls.config_options}
+
     @classmethod
     def get_config_option(cls, name):
-        return [o for o in cls.config_options if o['name'] == name][0]
+        return cls._config_options_by_name()[name]
 
     def get_default_value(self, key, include_backend=False):
 
@@ -2074,27 +2133,28 @@ class SCTConfiguration(dict):
         if backend and include_backend:
             default_config_files += self.defaults_config_files[str(backend)]
 
-        return anyconfig.load(list(default_config_files)).get(key, None)
+        return load_default_layers(default_config_files).get(key, None)
 
     def _load_environment_variables(self):
         environment_vars = {}
+        sct_env_index = index_environment_variables(self._config_options_by_env().keys())
         for opt in self.config_options:
-            if opt['env'] in os.environ:
+            if not (env_entry := sct_env_index.get(opt['env'])):
+                continue
+            if env_entry['value'] is not None:
                 try:
-                    environment_vars[opt['name']] = opt['type'](os.environ[opt['env']])
+                    environment_vars[opt['name']] = opt['type'](env_entry['value'])
                 except Exception as ex:  # pylint: disable=broad-except  # noqa: BLE001
                     raise ValueError(
                         "failed to parse {} from environment variable".format(opt['env'])) from ex
-            nested_keys = [key for key in os.environ if key.startswith(opt['env'] + '.')]
-            if nested_keys:
+            if env_entry['nested']:
                 list_value = []
                 dict_value = {}
-                for key in nested_keys:
-                    nest_key, *_ = key.split('.')[1:]
+                for nest_key, value in env_entry['nested']:
                     if nest_key.isdigit():
-                        list_value.insert(int(nest_key), os.environ.get(key))
+                        list_value.insert(int(nest_key), value)
                     else:
-                        dict_value[nest_key] = os.environ.get(key)
+                        dict_value[nest_key] = value
                 current_value = environment_vars.get(opt['name'])
                 if current_value and isinstance(current_value, dict):
                     current_value.update(dict_value)
@@ -2277,16 +2337,16 @@ class SCTConfiguration(dict):
 
     def _check_unexpected_sct_variables(self):
         # check if there are SCT_* environment variable which aren't documented
-        config_keys = {opt['env'] for opt in self.config_options}
+        config_keys = self._config_options_by_env().keys()
         env_keys = {o.split('.')[0] for o in os.environ if o.startswith('SCT_')}
-        unknown_env_keys = env_keys.difference(config_keys)
+        unknown_env_keys = env_keys - config_keys
         if unknown_env_keys:
             output = ["{}={}".format(key, os.environ.get(key)) for key in unknown_env_keys]
             raise ValueError("Unsupported environment variables were used:\n\t - {}".format("\n\t - ".join(output)))
 
         # check for unsupported configuration
-        config_names = {o['name'] for o in self.config_options}
-        unsupported_option = set(self.keys()).difference(config_names)
+        config_names = self._config_options_by_name().keys()
+        unsupported_option = self.keys() - config_names
 
         if unsupported_option:
             res = "Unsupported config option/s found:\n"
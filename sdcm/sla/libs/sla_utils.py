@@ -4,6 +4,7 @@ import logging
 from sdcm.sct_events import Severity
 from sdcm.sct_events.workload_prioritisation import WorkloadPrioritisationEvent
 from sdcm.utils.adaptive_timeouts import NodeLoadInfoServices
+from sdcm.utils.common import ParallelObject
 from sdcm.utils.decorators import retrying
 from test_lib.sla import Role
 
@@ -159,28 +160,12 @@ class SlaUtils:
 
         result = []
         sl_group_runtime_zero = False
-        # for node_ip in db_cluster.get_node_private_ips():
-        for node in db_cluster.nodes:
-            # If Scylla is not running on the node - do not perform validation
-            if not (node.jmx_up() and node.db_up()):
-                continue
-
-            node_ip = node.private_ip_address
-            # TODO: follow after this issue (prometheus return empty answer despite the data exists),
-            #  if it is reproduced
-            # Query 'scylla_scheduler_runtime_ms' from prometheus. If no data returned, try to increase the step time
-            # and query again
-            for step in ['30s', '45s', '60s', '120s']:
-                LOGGER.debug("Query 'scylla_scheduler_runtime_ms' on the node %s with irate step %s ", node_ip, step)
-                if scheduler_runtime_per_sla := prometheus_stats.get_scylla_scheduler_runtime_ms(
-                        start_time, end_time, node_ip, irate_sample_sec=step):
-                    break
-
-            # Example of scheduler_runtime_per_sla:
-            #   {'10.0.2.177': {'sl:default': [410.5785714285715, 400.36428571428576],
-            #   'sl:sl500_596ca81a': [177.11428571428573, 182.02857142857144]}
-            LOGGER.debug('SERVICE LEVEL GROUP - RUNTIMES: {}'.format(scheduler_runtime_per_sla))
-            if not scheduler_runtime_per_sla:
+        # If Scylla is not running on the node - do not perform validation
+        node_ips = [node.private_ip_address for node in self.get_running_db_nodes(db_cluster)]
+        scheduler_runtime_per_sla, reactor_utilization = self.get_scheduler_runtime_per_node(
+            prometheus_stats=prometheus_stats, start_time=start_time, end_time=end_time, node_ips=node_ips)
+        for node_ip in node_ips:
+            if not scheduler_runtime_per_sla.get(node_ip):
                 # Set this message as WARNING because I found that prometheus return empty answer despite the data
                 # exists (I run this request manually and got data). Prometheus request doesn't fail, it succeeded but
                 # empty, like:
@@ -211,9 +196,7 @@ class SlaUtils:
             if not expected_ratio:
                 node_cpu = None
                 if load_high_enough is None:
-                    node_cpu = prometheus_stats.get_scylla_reactor_utilization(start_time=start_time,
-                                                                               end_time=end_time,
-                                                                               instance=node_ip)
+                    node_cpu = reactor_utilization.get(node_ip)
                 result.append(self.validate_runtime_relatively_to_share(roles_full_info=roles_full_info,
                                                                         node_ip=node_ip,
                                                                         node_cpu=node_cpu,
@@ -234,6 +217,44 @@ class SlaUtils:
                 result.insert(0, "\nProbably the issue https://github.com/scylladb/scylla-enterprise/issues/2572")
             raise SchedulerRuntimeUnexpectedValue("".join(result))
 
+    @staticmethod
+    def get_running_db_nodes(db_cluster) -> list:
+        """Return the nodes Scylla is running on, checking all the nodes concurrently"""
+        if not db_cluster.nodes:
+            return []
+
+        def is_running(node):
+            return node.jmx_up() and node.db_up()
+
+        results = ParallelObject(db_cluster.nodes, timeout=300, num_workers=min(len(db_cluster.nodes), 20),
+                                 disable_logging=True).run(is_running, ignore_exceptions=True)
+        running_nodes = {id(result.obj) for result in results if result.result and not result.exc}
+        return [node for node in db_cluster.nodes if id(node) in running_nodes]
+
+    @staticmethod
+    def get_scheduler_runtime_per_node(prometheus_stats, start_time, end_time, node_ips: list) -> tuple[dict, dict]:
+        """
+        Query 'scylla_scheduler_runtime_ms' and reactor utilization of all the nodes at once
+
+        TODO: follow after this issue (prometheus return empty answer despite the data exists), if it is reproduced.
+        If no data returned for some nodes, query them once again with twice wider irate window.
+        """
+        scheduler_runtime_per_sla, reactor_utilization = prometheus_stats.get_scylla_scheduler_runtime_per_instance(
+            start_time, end_time, instances=node_ips)
+        if missing_node_ips := [node_ip for node_ip in node_ips if not scheduler_runtime_per_sla.get(node_ip)]:
+            _, irate_window = prometheus_stats.get_scheduler_runtime_query_steps(start_time, end_time)
+            LOGGER.debug("Query 'scylla_scheduler_runtime_ms' again for the nodes %s with irate window %ss",
+                         missing_node_ips, irate_window * 2)
+            retry_runtime, retry_utilization = prometheus_stats.get_scylla_scheduler_runtime_per_instance(
+                start_time, end_time, instances=missing_node_ips, irate_window=irate_window * 2)
+            scheduler_runtime_per_sla.update(retry_runtime)
+            reactor_utilization.update(retry_utilization)
+        # Example of scheduler_runtime_per_sla:
+        #   {'10.0.2.177': {'sl:default': [410.5785714285715, 400.36428571428576],
+        #   'sl:sl500_596ca81a': [177.11428571428573, 182.02857142857144]}
+        LOGGER.debug('SERVICE LEVEL GROUP - RUNTIMES: %s', scheduler_runtime_per_sla)
+        return scheduler_runtime_per_sla, reactor_utilization
+
     # pylint: disable=too-many-branches
     @staticmethod
     def validate_runtime_relatively_to_share(roles_full_info: dict, node_ip: str,
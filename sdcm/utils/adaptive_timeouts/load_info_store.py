@@ -11,6 +11,7 @@
 #
 # Copyright (c) 2023 ScyllaDB
 import logging
+import threading
 import time
 import uuid
 from collections import defaultdict
@@ -22,7 +23,7 @@ from typing import Any
 import yaml
 from cachetools import cached, TTLCache
 
-from sdcm.es import ES
+from sdcm.es import ES, get_shared_es_bulk_writer
 from sdcm.remote import RemoteCmdRunner
 from sdcm.test_config import TestConfig
 from sdcm.utils.decorators import retrying
@@ -50,30 +51,105 @@ def convert_to_mb(value) -> int:
     raise ValueError(f"Couldn't parse value {value} to MB")
 
 
-class NodeLoadInfoService:
+class NodeLoadInfoService:  # pylint: disable=too-many-instance-attributes
     """
     Service to get information about node load through running commands on node like getting metrics from localhost:9180/9100,
-    nodetool status, uptime (load), vmstat (disk utilization). Command responses are cached for some time to avoid too much requests.
+    nodetool info, uptime (load). All the facts are fetched by one remote command, keeping only the needed metrics
+    families, and the snapshot is shared by all the callers for some time to avoid too much requests.
     """
+    snapshot_ttl = 60
+    scylla_metrics_families = ("scylla_lsa_free_space", "scylla_scheduler_shares")
+    node_exporter_metrics_families = ("node_load1", "node_load5", "node_load15", "node_boot_time_seconds")
+    section_marker = "### sct-load-info: "
+    # the sections are fetched ignoring errors, so a node which isn't ready yields them empty
+    required_sections = ("scylla_metrics", "nodetool_info", "io_properties")
 
     def __init__(self, remoter: RemoteCmdRunner, name: str, scylla_version: str):
         self.remoter = remoter
         self._name = name
         self._scylla_version = scylla_version
+        self._snapshot = None
+        self._snapshot_time = 0.0
+        self._snapshot_lock = threading.Lock()
+        self._io_properties_cache = None
+        self.last_snapshot_duration = None
+
+    @staticmethod
+    def _metrics_cmd(port, families) -> str:
+        """Get only the given metrics families, to not transfer and parse all the metrics of the node"""
+        return f"curl -s localhost:{port}/metrics | grep -E '^({'|'.join(families)})[{{ ]'"
 
     @cached_property
-    def _io_properties(self):
-        return yaml.safe_load(self.remoter.run('cat /etc/scylla.d/io_properties.yaml', verbose=False).stdout)
+    def _snapshot_cmd(self) -> str:
+        sections = {
+            "scylla_metrics": self._metrics_cmd(9180, self.scylla_metrics_families),
+            "node_exporter_metrics": self._metrics_cmd(9100, self.node_exporter_metrics_families),
+            "nodetool_info": "nodetool info",
+            "io_properties": "cat /etc/scylla.d/io_properties.yaml",
+            "uptime": "uptime",
+        }
+        return "; ".join(f"echo '{self.section_marker}{name}'; {cmd} 2>/dev/null" for name, cmd in sections.items())
+
+    @staticmethod
+    def _parse_metrics(metrics: str) -> dict[str, str]:
+        metrics_dict = {}
+        for line in metrics.splitlines():
+            if line and not line.startswith('#'):
+                try:
+                    key, value = line.rsplit(' ', 1)
+                    metrics_dict[key] = value
+                except ValueError:
+                    LOGGER.debug("Couldn't parse line: %s", line)
+        return metrics_dict
+
+    def _parse_snapshot(self, output: str) -> dict[str, Any]:
+        sections = {}
+        section_lines = None
+        for line in output.splitlines():
+            if line.startswith(self.section_marker):
+                section_lines = sections[line[len(self.section_marker):].strip()] = []
+            elif section_lines is not None:
+                section_lines.append(line)
+        if not sections:
+            raise ValueError(f"Couldn't parse node load info of {self._name}: {output[:200]}")
+        snapshot = {name: "\n".join(lines) for name, lines in sections.items()}
+        for name in ("scylla_metrics", "node_exporter_metrics"):
+            snapshot[name] = self._parse_metrics(snapshot.get(name, ""))
+        if empty_sections := [name for name in self.required_sections if not snapshot.get(name)]:
+            raise ValueError(f"Couldn't get {', '.join(empty_sections)} of {self._name} node load info")
+        return snapshot
+
+    @retrying(n=5, sleep_time=1, allowed_exceptions=(ValueError,))
+    def _fetch_snapshot(self) -> dict[str, Any]:
+        return self._parse_snapshot(self.remoter.run(self._snapshot_cmd, verbose=False, ignore_status=True).stdout)
+
+    def _get_snapshot(self) -> dict[str, Any]:
+        """Return the node facts, concurrent callers wait for one fetch instead of running their own"""
+        with self._snapshot_lock:
+            if self._snapshot is None or time.monotonic() - self._snapshot_time > self.snapshot_ttl:
+                start_time = time.perf_counter()
+                self._snapshot = self._fetch_snapshot()
+                self._snapshot_time = time.monotonic()
+                self.last_snapshot_duration = time.perf_counter() - start_time
+                LOGGER.debug("Node load info of %s is fetched in %.2fs", self._name, self.last_snapshot_duration)
+            return self._snapshot
+
+    @property
+    def _io_properties(self) -> dict:
+        if self._io_properties_cache is None:
+            io_properties = yaml.safe_load(self._get_snapshot()["io_properties"])
+            if not isinstance(io_properties, dict):
+                raise ValueError(f"Couldn't parse io_properties.yaml of {self._name}: {io_properties}")
+            self._io_properties_cache = io_properties
+        return self._io_properties_cache
 
     @cached(cache=TTLCache(maxsize=1024, ttl=300))
     def _cf_stats(self, keyspace):
         pass
 
-    @cached(cache=TTLCache(maxsize=1024, ttl=300))
     def _get_nodetool_info(self):
-        return self.remoter.run('nodetool info', verbose=False).stdout
+        return self._get_snapshot()["nodetool_info"]
 
-    @cached(cache=TTLCache(maxsize=1024, ttl=60))
     def _get_node_load(self) -> tuple[float, float, float]:
         try:
             metrics = self._get_node_exporter_metrics()
@@ -84,7 +160,7 @@ class NodeLoadInfoService:
         except Exception as exc:  # pylint: disable=broad-except  # noqa: BLE001
             LOGGER.debug("Couldn't get node load from prometheus metrics. Error: %s", exc)
             # fallback to uptime
-            load_1, load_5, load_15 = self.remoter.run('uptime').stdout.split("load average: ")[1].split(",")
+            load_1, load_5, load_15 = self._get_snapshot()["uptime"].split("load average: ")[1].split(",")
             return float(load_1), float(load_5), float(load_15)
 
     def get_node_boot_time_seconds(self) -> float:
@@ -93,25 +169,14 @@ class NodeLoadInfoService:
         return mem_available
 
     @retrying(n=5, sleep_time=1, allowed_exceptions=(ValueError,))
-    def _get_metrics(self, port):
-        metrics = self.remoter.run(f'curl -s localhost:{port}/metrics', verbose=False).stdout
-        metrics_dict = {}
-        for line in metrics.splitlines():
-            if line and not line.startswith('#'):
-                try:
-                    key, value = line.rsplit(' ', 1)
-                    metrics_dict[key] = value
-                except ValueError:
-                    LOGGER.debug("Couldn't parse line: %s", line)
-        return metrics_dict
+    def _get_metrics(self, port, families):
+        return self._parse_metrics(self.remoter.run(self._metrics_cmd(port, families), verbose=False).stdout)
 
-    @cached(cache=TTLCache(maxsize=1024, ttl=60))
     def _get_scylla_metrics(self):
-        return self._get_metrics(port=9180)
+        return self._get_snapshot()["scylla_metrics"]
 
-    @cached(cache=TTLCache(maxsize=1024, ttl=60))
     def _get_node_exporter_metrics(self):
-        return self._get_metrics(port=9100)
+        return self._get_snapshot()["node_exporter_metrics"]
 
     @property
     def node_data_size_mb(self) -> int:
@@ -124,7 +189,7 @@ class NodeLoadInfoService:
     def cpu_load_5(self) -> float:
         return self._get_node_load()[1]
 
-    @cached_property
+    @property
     def shards_count(self) -> int:
         return len([key for key in self._get_scylla_metrics() if key.startswith('scylla_lsa_free_space')])
 
@@ -137,7 +202,8 @@ class NodeLoadInfoService:
         output example: {"sl:sl200": [200, 200], "sl:default": [1000, 1000]}
         """
         scheduler_group_shares = defaultdict(list)
-        all_metrics = self._get_metrics(port=9180)
+        # not taken from the snapshot, since it's polled to wait for service level changes
+        all_metrics = self._get_metrics(port=9180, families=("scylla_scheduler_shares",))
         for key, value in all_metrics.items():
             if key.startswith('scylla_scheduler_shares'):
                 try:
@@ -207,6 +273,10 @@ class ESAdaptiveTimeoutStore(AdaptiveTimeoutStore):
     def _es(self):
         return ES()
 
+    @cached_property
+    def _es_writer(self):
+        return get_shared_es_bulk_writer(es=self._es)
+
     # pylint: disable=too-many-arguments
     def store(self, metrics: dict[str, Any], operation: str, duration: float, timeout: float,
               timeout_occurred: bool):
@@ -222,8 +292,7 @@ class ESAdaptiveTimeoutStore(AdaptiveTimeoutStore):
         if not self._es:
             LOGGER.debug("ESAdaptiveTimeoutStore is not initialized, skipping store")
             return
-        # pylint: disable=unexpected-keyword-arg,no-value-for-parameter
-        self._es.create(index=self._index, id=load_id, document=body)
+        self._es_writer.create_doc(index=self._index, doc_type=None, doc_id=load_id, body=body)
 
     def get(self, operation: str | None, timeout_occurred: bool | None = None):
         """Get adaptive timeout info from ES.
@@ -256,10 +325,12 @@ class NodeLoadInfoServices(metaclass=Singleton):  # pylint: disable=too-few-publ
 
     def __init__(self):
         self._services: dict[str, NodeLoadInfoService] = {}
+        self._lock = threading.Lock()
 
     def get(self, node: "BaseNode") -> NodeLoadInfoService:
-        if node not in self._services:
-            self._services[node.name] = NodeLoadInfoService(node.remoter, node.name, node.scylla_version_detailed)
-        if self._services[node.name].remoter != node.remoter:
-            self._services[node.name] = NodeLoadInfoService(node.remoter, node.name, node.scylla_version_detailed)
-        return self._services[node.name]
+        with self._lock:
+            service = self._services.get(node.name)
+            if service is None or service.remoter != node.remoter:
+                service = self._services[node.name] = NodeLoadInfoService(
+                    node.remoter, node.name, node.scylla_version_detailed)
+            return service
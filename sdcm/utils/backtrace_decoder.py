@@ -0,0 +1,96 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2024 ScyllaDB
+
+import re
+import shlex
+import logging
+import threading
+from functools import cache
+
+from sdcm.prometheus import NemesisMetrics
+
+LOGGER = logging.getLogger(__name__)
+
+ADDR2LINE_RECORD_START = re.compile(r"^0x[0-9a-fA-F]+: ")
+
+
+class BacktraceDecodingMetrics:  # pylint: disable=too-few-public-methods
+    def __init__(self):
+        self.queue_size_gauge = NemesisMetrics.create_gauge(
+            'sct_backtrace_decoding_queue_size', 'Number of backtraces waiting to be decoded', [])
+        self.decoded_counter = NemesisMetrics.create_counter(
+            'sct_backtrace_decoding_backtraces', 'Number of decoded backtraces', [])
+        self.decoding_time_counter = NemesisMetrics.create_counter(
+            'sct_backtrace_decoding_seconds', 'Time spent on decoding of backtraces', [])
+
+
+@cache
+def backtrace_decoding_metrics() -> BacktraceDecodingMetrics:
+    return BacktraceDecodingMetrics()
+
+
+class BacktraceDecoder:
+    """
+    Decode raw backtraces with `addr2line' on a node, which has the debug files.
+
+    Backtraces of crash loops and of reactor stalls share most of their addresses, so the decoded addresses are cached
+    per debug file, and the addresses which aren't cached yet, of all the backtraces decoded together, are decoded
+    with a single `addr2line' call.
+    """
+    addr2line_options = "-Cpife"  # `-e' has to be the last one, since the debug file follows it
+    max_addresses_per_call = 2000  # keep the command line short enough
+
+    def __init__(self, remoter):
+        self._remoter = remoter
+        self._decoded: dict[tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+
+    def _addr2line(self, debug_file: str, addresses: list[str], print_addresses: bool = False) -> str:
+        options = f"-a {self.addr2line_options}" if print_addresses else self.addr2line_options
+        addresses = " ".join(shlex.quote(address) for address in addresses)
+        return self._remoter.run(f"addr2line {options} {debug_file} {addresses}", verbose=True).stdout
+
+    def _decode_addresses(self, debug_file: str, addresses: list[str]) -> dict[str, str]:
+        """
+        Decode the addresses with a single `addr2line -a' call, which starts the output of every address with it
+        """
+        records = []
+        for line in self._addr2line(debug_file, addresses, print_addresses=True).splitlines(keepends=True):
+            if match := ADDR2LINE_RECORD_START.match(line):
+                records.append(line[match.end():])
+            elif records:  # ` (inlined by) ...' lines
+                records[-1] += line
+        if len(records) != len(addresses):
+            raise ValueError(f"addr2line has decoded {len(records)} addresses out of {len(addresses)}")
+        return dict(zip(addresses, records))
+
+    def decode(self, debug_file: str, raw_backtraces: list[str]) -> list[str]:
+        """
+        Decode the raw backtraces, with the same output as `addr2line -Cpife <debug_file> <addresses>' has for each
+        """
+        backtraces_addresses = [raw_backtrace.split() for raw_backtrace in raw_backtraces]
+        with self._lock:
+            missing = list(dict.fromkeys(address for addresses in backtraces_addresses for address in addresses
+                                         if (debug_file, address) not in self._decoded))
+        try:
+            for idx in range(0, len(missing), self.max_addresses_per_call):
+                decoded = self._decode_addresses(debug_file, missing[idx:idx + self.max_addresses_per_call])
+                with self._lock:
+                    self._decoded.update(((debug_file, address), record) for address, record in decoded.items())
+        except ValueError as exc:
+            LOGGER.warning("Failed to decode addresses of %d backtraces together, decoding them one by one: %s",
+                           len(raw_backtraces), exc)
+            return [self._addr2line(debug_file, addresses) for addresses in backtraces_addresses]
+        with self._lock:
+            return ["".join(self._decoded[(debug_file, address)] for address in addresses)
+                    for addresses in backtraces_addresses]
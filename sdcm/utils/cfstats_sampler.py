@@ -0,0 +1,138 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2024 ScyllaDB
+
+import time
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterable
+
+from invoke.exceptions import UnexpectedExit, Failure
+
+from sdcm.remote.libssh2_client import UnexpectedExit as Libssh2_UnexpectedExit
+
+LOGGER = logging.getLogger(__name__)
+
+
+def parse_cfstats_tables(cfstats_output: str) -> dict[str, dict[str, int | float | str]]:
+    """
+    Parse stats of every table in the output of `nodetool cfstats' of many keyspaces
+
+    :return: {"keyspace.table": {"Space used (total)": 123456, ...}}
+    """
+    tables = {}
+    keyspace = stats = None
+    for line in cfstats_output.splitlines():
+        name, _, value = line.partition(":")
+        name, value = name.strip(), value.strip()
+        if name == "Keyspace":
+            keyspace, stats = value, None
+        elif name in ("Table", "Table (index)") and keyspace:
+            stats = tables[f"{keyspace}.{value}"] = {}
+        elif stats is not None and name and value:
+            value = value.split()[0]
+            for value_type in (int, float):
+                try:
+                    stats[name] = value_type(value)
+                    break
+                except ValueError:
+                    continue
+            else:
+                stats[name] = value
+    return tables
+
+
+@dataclass
+class CfstatsSample:
+    time: float
+    tables: dict[str, dict[str, int | float | str]]
+
+    @staticmethod
+    def table_matches(table: str, keyspaces: Iterable[str] | None = None) -> bool:
+        if not keyspaces:  # all test keyspaces
+            return not table.startswith("system")
+        return any(table == keyspace or table.startswith(f"{keyspace}.") for keyspace in keyspaces)
+
+    def total(self, key: str, keyspaces: Iterable[str] | None = None) -> int | float:
+        """
+        Sum of cfstats key of all tables of the keyspaces (or of full table names, like `keyspace1.standard1')
+        """
+        return sum(value for table, stats in self.tables.items() if self.table_matches(table, keyspaces)
+                   and isinstance(value := stats.get(key, 0), (int, float)))
+
+
+class CfstatsSampler:
+    """
+    Sample `nodetool cfstats' of all the tables on a node with a single call.
+
+    A sample is shared by all the waiters during `max_age' seconds, and the last samples are kept to estimate how
+    fast the stats grow, so waiters for a threshold can poll rarely, while it's far.
+    """
+
+    def __init__(self, node, max_age: float = 10, history_size: int = 6):
+        self._node = node
+        self.max_age = max_age
+        self._samples: deque[CfstatsSample] = deque(maxlen=history_size)
+        self._lock = threading.Lock()
+
+    def sample(self) -> CfstatsSample:
+        with self._lock:
+            if self._samples and time.monotonic() - self._samples[-1].time < self.max_age:
+                return self._samples[-1]
+            # flush memtables to count all data in `Space used' stats
+            self._node.run_nodetool("flush", ignore_status=True, timeout=300)
+            # Don't need NodetoolEvent when waiting for space_node_threshold before start the nemesis, not publish it
+            result = self._node.run_nodetool(sub_cmd="cfstats", timeout=300, publish_event=False,
+                                             warning_event_on_exception=(Failure, UnexpectedExit,
+                                                                         Libssh2_UnexpectedExit,))
+            self._samples.append(CfstatsSample(time=time.monotonic(), tables=parse_cfstats_tables(result.stdout)))
+            return self._samples[-1]
+
+    def time_to_threshold(self, key: str, threshold: float, keyspaces: Iterable[str] | None = None) -> float | None:
+        """
+        Estimate time until the total of cfstats key reaches the threshold, by its growth rate in the last samples
+
+        :return: number of seconds, or None if it's unknown or doesn't grow
+        """
+        with self._lock:
+            if not self._samples:
+                return None
+            first, last = self._samples[0], self._samples[-1]
+        last_value = last.total(key, keyspaces)
+        if last_value >= threshold:
+            return 0
+        if last.time == first.time:
+            return None
+        rate = (last_value - first.total(key, keyspaces)) / (last.time - first.time)
+        if rate <= 0:
+            return None
+        return (threshold - last_value) / rate
+
+    def next_poll_interval(self, key: str, threshold: float, keyspaces: Iterable[str] | None = None,
+                           min_interval: float = 10, max_interval: float = 60) -> float:
+        """
+        Time to wait before the next check of the threshold: half of the estimated time to reach it
+        """
+        with self._lock:
+            samples = len(self._samples)
+        time_to_threshold = self.time_to_threshold(key, threshold, keyspaces)
+        if samples < 2:
+            interval = min_interval
+        elif time_to_threshold is None:
+            interval = max_interval
+        else:
+            interval = min(max(time_to_threshold / 2, min_interval), max_interval)
+        LOGGER.debug("Estimated time until %s of %s reaches %s: %s s, next check in %s s",
+                     key, keyspaces or "test keyspaces", threshold, time_to_threshold, interval)
+        return interval
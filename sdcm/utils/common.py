@@ -53,6 +53,7 @@ from pathlib import Path
 from collections import OrderedDict
 import requests
 import boto3
+import botocore.exceptions
 from invoke import UnexpectedExit
 from mypy_boto3_s3 import S3Client, S3ServiceResource
 from mypy_boto3_ec2 import EC2Client, EC2ServiceResource
@@ -246,16 +247,28 @@ def verify_scylla_repo_file(content, is_rhel_like=True):
 
 class S3Storage():
     bucket_name = 'cloudius-jenkins-test'
-    enable_multipart_threshold_size = 1024 * 1024 * 1024  # 1GB
-    multipart_chunksize = 50 * 1024 * 1024  # 50 MB
+    multipart_chunksize = 50 * 1024 * 1024  # 50 MB, used until the upload bandwidth is measured
+    min_multipart_chunksize = 8 * 1024 * 1024  # 8 MB
+    max_multipart_chunksize = 512 * 1024 * 1024  # 512 MB
+    max_multipart_parts = 9000  # S3 allows up to 10000 parts
+    chunk_upload_time = 5  # seconds, chunks are sized to be uploaded by one thread in about this time
+    max_concurrency = 16  # threads uploading chunks, shared by all the files uploaded concurrently
+    max_parallel_uploads = 4
     num_download_attempts = 5
-
-    def __init__(self, bucket=None):
+    md5_metadata_key = 'md5'
+    # same grants set_public_access() adds after an upload: full control of the owner and public read
+    upload_acl = 'public-read'
+    # bytes per second per upload thread, measured by the previous uploads of all the instances
+    _upload_bandwidth = None
+    _upload_bandwidth_lock = threading.Lock()
+
+    def __init__(self, bucket=None, endpoint_url=None):
         if bucket:
             self.bucket_name = bucket
-        self._bucket: S3ServiceResource.Bucket = boto3.resource("s3").Bucket(name=self.bucket_name)
+        self._bucket: S3ServiceResource.Bucket = boto3.resource(
+            "s3", endpoint_url=endpoint_url).Bucket(name=self.bucket_name)
+        self._client: S3Client = boto3.client("s3", endpoint_url=endpoint_url)
         self.transfer_config = boto3.s3.transfer.TransferConfig(
-            multipart_threshold=self.enable_multipart_threshold_size,
             multipart_chunksize=self.multipart_chunksize,
             num_download_attempts=self.num_download_attempts)
 
@@ -278,22 +291,89 @@ class S3Storage():
                                                                                       file_name=file_name,
                                                                                       bucket_name=bucket_name)
 
-    def upload_file(self, file_path, dest_dir=''):
+    def upload_file(self, file_path, dest_dir='', max_concurrency=None):
         s3_url = self.generate_url(file_path, dest_dir)
         s3_obj = "{}/{}".format(dest_dir, os.path.basename(file_path))
         try:
             LOGGER.info("Uploading '{file_path}' to {s3_url}".format(file_path=file_path, s3_url=s3_url))
-            self._bucket.upload_file(Filename=file_path,
+            file_size = os.path.getsize(file_path)
+            file_md5 = self.file_md5(file_path)
+            if self.is_uploaded(key=s3_obj, file_size=file_size, file_md5=file_md5):
+                LOGGER.info("Already uploaded to {0}, skipping".format(s3_url))
+                return s3_url
+            transfer_config = self.get_upload_transfer_config(
+                file_size=file_size, max_concurrency=max_concurrency or self.max_concurrency)
+            start_time = time.perf_counter()
+            # the public read access is set by the upload requests themselves
+            self._client.upload_file(Filename=str(file_path),
+                                     Bucket=self.bucket_name,
                                      Key=s3_obj,
-                                     Config=self.transfer_config)
+                                     ExtraArgs={"ACL": self.upload_acl, "Metadata": {self.md5_metadata_key: file_md5}},
+                                     Config=transfer_config)
+            parts = -(-file_size // transfer_config.multipart_chunksize)
+            self.update_upload_bandwidth(file_size=file_size, duration=time.perf_counter() - start_time,
+                                         concurrency=min(transfer_config.max_request_concurrency, parts))
             LOGGER.info("Uploaded to {0}".format(s3_url))
-            LOGGER.info("Set public read access")
-            self.set_public_access(key=s3_obj)
             return s3_url
         except Exception as details:  # pylint: disable=broad-except  # noqa: BLE001
             LOGGER.debug("Unable to upload to S3: %s", details)
             return ""
 
+    def upload_files(self, file_paths: list, dest_dir='') -> list[str]:
+        """Upload the files concurrently, returns the urls in the order of the files ("" for failed uploads)"""
+        if not file_paths:
+            return []
+        parallel_uploads = min(len(file_paths), self.max_parallel_uploads)
+        max_concurrency = max(2, self.max_concurrency // parallel_uploads)
+        with ThreadPoolExecutor(max_workers=parallel_uploads, thread_name_prefix="S3Upload") as executor:
+            return list(executor.map(
+                lambda file_path: self.upload_file(file_path, dest_dir, max_concurrency=max_concurrency), file_paths))
+
+    @staticmethod
+    def file_md5(file_path, block_size=8 * 1024 * 1024) -> str:
+        md5 = hashlib.md5()
+        with open(file_path, "rb") as file:
+            while block := file.read(block_size):
+                md5.update(block)
+        return md5.hexdigest()
+
+    def is_uploaded(self, key, file_size, file_md5) -> bool:
+        """Check if the object exists with the same content, by the md5 in its metadata or its single part ETag"""
+        try:
+            head = self._client.head_object(Bucket=self.bucket_name, Key=key)
+        except botocore.exceptions.ClientError:
+            return False
+        if head["ContentLength"] != file_size:
+            return False
+        return file_md5 in (head.get("Metadata", {}).get(self.md5_metadata_key), head["ETag"].strip('"'))
+
+    def get_upload_transfer_config(self, file_size, max_concurrency) -> boto3.s3.transfer.TransferConfig:
+        """
+        Size the chunks by the upload bandwidth measured on the previous uploads, so each chunk is uploaded in about
+        `chunk_upload_time' seconds, but keep the number of parts under the S3 limit.
+
+        Files smaller than one chunk are uploaded with a single PutObject request.
+        """
+        with self._upload_bandwidth_lock:
+            bandwidth = self._upload_bandwidth
+        chunksize = int(bandwidth * self.chunk_upload_time) if bandwidth else self.multipart_chunksize
+        chunksize = min(max(chunksize, self.min_multipart_chunksize, -(-file_size // self.max_multipart_parts)),
+                        max(self.max_multipart_chunksize, -(-file_size // self.max_multipart_parts)))
+        return boto3.s3.transfer.TransferConfig(
+            multipart_threshold=chunksize,
+            multipart_chunksize=chunksize,
+            max_concurrency=max_concurrency,
+            num_download_attempts=self.num_download_attempts)
+
+    def update_upload_bandwidth(self, file_size, duration, concurrency):
+        # small files don't tell much about the bandwidth
+        if file_size < self.min_multipart_chunksize or duration <= 0:
+            return
+        bandwidth = file_size / duration / concurrency
+        with self._upload_bandwidth_lock:
+            S3Storage._upload_bandwidth = bandwidth if self._upload_bandwidth is None else \
+                (self._upload_bandwidth + bandwidth) / 2
+
     def set_public_access(self, key):
         acl_obj: S3ServiceResource = boto3.resource('s3').ObjectAcl(self.bucket_name, key)
 
@@ -404,6 +484,9 @@ def all_aws_regions(cached=False):
 class ParallelObject:
     """
         Run function in with supplied args in parallel using thread.
+
+        Every run has its own pool of `num_workers' threads, so runs which are left behind by a timeout or
+        by `fail_fast' can't hold threads of other runs.
     """
 
     def __init__(self, objects: Iterable, timeout: int = 6,  # pylint: disable=redefined-outer-name
@@ -419,80 +502,120 @@ class ParallelObject:
                 if function accept list as parameter, the item shuld be list of list item = [[]]
 
         :param timeout: global timeout for running all
-        :param num_workers: num of parallel threads, defaults to None
+        :param num_workers: num of parallel threads, defaults to None (same default as of ThreadPoolExecutor)
         :param disable_logging: disable logging for running disrupt_func, defaults to False
         """
         self.objects = objects
         self.timeout = timeout
-        self.num_workers = num_workers
+        self.num_workers = num_workers or min(32, (os.cpu_count() or 1) + 4)
         self.disable_logging = disable_logging
-        self._thread_pool = ThreadPoolExecutor(max_workers=self.num_workers)  # pylint: disable=consider-using-with
 
-    def run(self, func: Callable, ignore_exceptions=False, unpack_objects: bool = False) -> List[ParallelObjectResult]:
+    @staticmethod
+    def _func_wrap(fun):
+        @wraps(fun)
+        def inner(*args, **kwargs):
+            thread_name = threading.current_thread().name
+            fun_args = args
+            fun_kwargs = kwargs
+            fun_name = fun.__name__
+            LOGGER.debug("[{thread_name}] {fun_name}({fun_args}, {fun_kwargs})".format(thread_name=thread_name,
+                                                                                       fun_name=fun_name,
+                                                                                       fun_args=fun_args,
+                                                                                       fun_kwargs=fun_kwargs))
+            return_val = fun(*args, **kwargs)
+            LOGGER.debug("[{thread_name}] Done.".format(thread_name=thread_name))
+            return return_val
+
+        return inner
+
+    @staticmethod
+    def _timed(func: Callable, durations: list[float | None], idx: int, *args, **kwargs):
+        start_time = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            durations[idx] = time.perf_counter() - start_time
+
+    def _submit(self, thread_pool: ThreadPoolExecutor,  # pylint: disable=too-many-arguments
+                func: Callable, objects: list, durations: list[float | None],
+                unpack_objects: bool) -> dict[concurrent.futures.Future, int]:
+        futures = {}
+        for idx, obj in enumerate(objects):
+            if unpack_objects and isinstance(obj, (list, tuple)):
+                futures[thread_pool.submit(self._timed, func, durations, idx, *obj)] = idx
+            elif unpack_objects and isinstance(obj, dict):
+                futures[thread_pool.submit(self._timed, func, durations, idx, **obj)] = idx
+            else:
+                futures[thread_pool.submit(self._timed, func, durations, idx, obj)] = idx
+        return futures
+
+    def run(self, func: Callable, ignore_exceptions=False,  # pylint: disable=too-many-locals
+            unpack_objects: bool = False, fail_fast: bool = False) -> List[ParallelObjectResult]:
         """Run callable object "disrupt_func" in parallel
 
         Allow to run callable object in parallel.
         if ignore_exceptions is true,  return
         list of FutureResult object instances which contains
-        two attributes:
+        three attributes:
             - result - result of callable object execution
             - exc - exception object, if happened during run
-        if ignore_exceptions is False, then running will
-        terminated on future where happened exception or by timeout
-        what has stepped first.
+            - duration - run time of callable object, None if it wasn't finished
+        if ignore_exceptions is False, then ParallelObjectException
+        is raised if an exception happened in any of the runs or
+        by timeout.
+
+        Results are collected as soon as they are ready, and the timeout is a deadline of the whole run:
+        runs which weren't finished by the deadline get TimeoutError, and runs which weren't started
+        are cancelled.
 
         :param func: Callable object to run in parallel
         :param ignore_exceptions: ignore exception and return result, defaults to False
         :param unpack_objects: set to True when unpacking of objects to the disrupt_func as args or kwargs needed
-        :returns: list of FutureResult object
+        :param fail_fast: stop on the first exception, the rest of runs get CancelledError, and runs which weren't
+                          started are cancelled. Already running ones can't be interrupted, but aren't waited for.
+        :returns: list of FutureResult object, in the same order as objects
         :rtype: {List[FutureResult]}
         """
-
-        def func_wrap(fun):
-            @wraps(fun)
-            def inner(*args, **kwargs):
-                thread_name = threading.current_thread().name
-                fun_args = args
-                fun_kwargs = kwargs
-                fun_name = fun.__name__
-                LOGGER.debug("[{thread_name}] {fun_name}({fun_args}, {fun_kwargs})".format(thread_name=thread_name,
-                                                                                           fun_name=fun_name,
-                                                                                           fun_args=fun_args,
-                                                                                           fun_kwargs=fun_kwargs))
-                return_val = fun(*args, **kwargs)
-                LOGGER.debug("[{thread_name}] Done.".format(thread_name=thread_name))
-                return return_val
-
-            return inner
-
-        results = []
+        objects = list(self.objects)
+        results: list[ParallelObjectResult | None] = [None] * len(objects)
+        durations: list[float | None] = [None] * len(objects)
+        func_name = getattr(func, "__name__", repr(func))
+        start_time = time.perf_counter()
+        deadline = None if self.timeout is None else start_time + self.timeout
 
         if not self.disable_logging:
-            LOGGER.debug("Executing in parallel: '{}' on {}".format(func.__name__, self.objects))
-            func = func_wrap(func)
-
-        futures = []
-
-        for obj in self.objects:
-            if unpack_objects and isinstance(obj, (list, tuple)):
-                futures.append((self._thread_pool.submit(func, *obj), obj))
-            elif unpack_objects and isinstance(obj, dict):
-                futures.append((self._thread_pool.submit(func, **obj), obj))
-            else:
-                futures.append((self._thread_pool.submit(func, obj), obj))
-        time_out = self.timeout
-        for future, target_obj in futures:
-            try:
-                result = future.result(time_out)
-            except FuturesTimeoutError as exception:
-                results.append(ParallelObjectResult(obj=target_obj, exc=exception, result=None))
-                time_out = 0.001  # if there was a timeout on one of the futures there is no need to wait for all
-            except Exception as exception:  # pylint: disable=broad-except  # noqa: BLE001
-                results.append(ParallelObjectResult(obj=target_obj, exc=exception, result=None))
-            else:
-                results.append(ParallelObjectResult(obj=target_obj, exc=None, result=result))
+            LOGGER.debug("Executing in parallel: '{}' on {}".format(func_name, objects))
+            func = self._func_wrap(func)
+
+        thread_pool = ThreadPoolExecutor(  # pylint: disable=consider-using-with
+            max_workers=self.num_workers, thread_name_prefix="ParallelObject")
+        futures = self._submit(thread_pool, func, objects, durations, unpack_objects)
+        failed = False
+        while futures and not (fail_fast and failed):
+            time_out = None if deadline is None else max(deadline - time.perf_counter(), 0)
+            done, _ = concurrent.futures.wait(futures, timeout=time_out, return_when=concurrent.futures.FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                idx = futures.pop(future)
+                try:
+                    results[idx] = ParallelObjectResult(obj=objects[idx], result=future.result(),
+                                                        duration=durations[idx])
+                except Exception as exception:  # pylint: disable=broad-except  # noqa: BLE001
+                    results[idx] = ParallelObjectResult(obj=objects[idx], exc=exception, duration=durations[idx])
+                    failed = True
+
+        # runs which weren't started are cancelled, and the running ones are left behind
+        thread_pool.shutdown(wait=False, cancel_futures=True)
+        # we need to unregister internal function that waits for all threads to finish when interpreter exits
+        atexit.unregister(_python_exit)
+        unfinished_exception = concurrent.futures.CancelledError if fail_fast and failed else FuturesTimeoutError
+        for idx, result in enumerate(results):
+            if result is None:
+                results[idx] = ParallelObjectResult(obj=objects[idx], exc=unfinished_exception())
 
-        self.clean_up(futures)
+        if not self.disable_logging:
+            self.log_durations(func_name, results, time.perf_counter() - start_time)
 
         if ignore_exceptions:
             return results
@@ -502,7 +625,17 @@ class ParallelObject:
             raise ParallelObjectException(results=results)
         return results
 
-    def call_objects(self, ignore_exceptions: bool = False) -> list["ParallelObjectResult"]:
+    @staticmethod
+    def log_durations(func_name: str, results: List[ParallelObjectResult], total_duration: float):
+        finished = sorted((res for res in results if res.duration is not None), key=lambda res: res.duration)
+        if not finished:
+            LOGGER.debug("'%s' hasn't finished on any of %d objects in %.2fs", func_name, len(results), total_duration)
+            return
+        LOGGER.debug("'%s' has finished on %d of %d objects in %.2fs, the fastest took %.2fs (%s), "
+                     "the slowest took %.2fs (%s)", func_name, len(finished), len(results), total_duration,
+                     finished[0].duration, finished[0].obj, finished[-1].duration, finished[-1].obj)
+
+    def call_objects(self, ignore_exceptions: bool = False, fail_fast: bool = False) -> list["ParallelObjectResult"]:
         """
         Use the ParallelObject run() method to call a list of
         callables in parallel. Rather than running a single function
@@ -520,15 +653,7 @@ class ParallelObject:
         This can be useful if we need to tightly synchronise the
         execution of multiple functions.
         """
-        return self.run(lambda x: x(), ignore_exceptions=ignore_exceptions)
-
-    def clean_up(self, futures):
-        # if there are futures that didn't run  we cancel them
-        for future, _ in futures:
-            future.cancel()
-        self._thread_pool.shutdown(wait=False)
-        # we need to unregister internal function that waits for all threads to finish when interpreter exits
-        atexit.unregister(_python_exit)
+        return self.run(lambda x: x(), ignore_exceptions=ignore_exceptions, fail_fast=fail_fast)
 
     @staticmethod
     def run_named_tasks_in_parallel(tasks: dict[str, Callable],
@@ -580,10 +705,11 @@ class ParallelObjectResult:  # pylint: disable=too-few-public-methods
     and exception if it happened during run.
     """
 
-    def __init__(self, obj, result=None, exc=None):
+    def __init__(self, obj, result=None, exc=None, duration=None):
         self.obj = obj
         self.result = result
         self.exc = exc
+        self.duration = duration
 
 
 class ParallelObjectException(Exception):
@@ -1295,10 +1421,13 @@ class FileFollowerThread():
 
 
 class ScyllaCQLSession:
-    def __init__(self, session, cluster, verbose=True):
+    def __init__(self, session, cluster, verbose=True, release: Callable = None):
         self.session = session
         self.cluster = cluster
         self.verbose = verbose
+        # pooled sessions are returned to the pool instead of shutdown
+        self._release = release
+        self._execute_orig = None
 
     def __enter__(self):
         execute_orig = self.session.execute
@@ -1321,12 +1450,18 @@ class ScyllaCQLSession:
             return execute_async_orig(*args, **kwargs)
 
         if self.verbose:
+            self._execute_orig = (execute_orig, execute_async_orig)
             self.session.execute = execute_verbose
             self.session.execute_async = execute_async_verbose
         return self.session
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.cluster.shutdown()
+        if self._release is None:
+            self.cluster.shutdown()
+            return
+        if self._execute_orig:
+            self.session.execute, self.session.execute_async = self._execute_orig
+        self._release(exc_type)
 
 
 def get_free_port(address: str = '', ports_to_try: Iterable[int] = (0,)) -> int:
@@ -2026,21 +2161,35 @@ def rows_to_list(rows):
 class Page:  # pylint: disable=too-few-public-methods
     data = None
 
-    def __init__(self):
-        self.data = []
+    def __init__(self, keep_rows=True, latency=None):
+        self.data = [] if keep_rows else None
+        self.row_count = 0
+        self.latency = latency
 
     def add_row(self, row):
-        self.data.append(row)
+        self.row_count += 1
+        if self.data is not None:
+            self.data.append(row)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.row_count / self.latency if self.latency else 0.0
 
 
 # Copied from dtest
-class PageFetcher:
+class PageFetcher:  # pylint: disable=too-many-instance-attributes
     """
     Requests pages, handles their receipt,
     and provides paged data for testing.
 
     The first page is automatically retrieved, so an initial
     call to request_one is actually getting the *second* page!
+
+    With `prefetch=True' the next page is requested as soon as the previous one arrives, before it's handled, so
+    fetching of the pages overlaps with their processing and all of them get retrieved in the background.
+
+    With `keep_rows=False' only the count of the rows (and their digest if `digest_rows=True') is kept, and the rows
+    can be consumed by `on_page(rows)' callback, which is called from the driver's thread for every non-empty page.
     """
     pages = None
     error = None
@@ -2049,8 +2198,16 @@ class PageFetcher:
     retrieved_pages = None
     retrieved_empty_pages = None
 
-    def __init__(self, future):
+    def __init__(self, future, keep_rows=True, digest_rows=False,  # pylint: disable=too-many-arguments
+                 prefetch=False, on_page: Callable[[list], None] = None):
         self.pages = []
+        self.keep_rows = keep_rows
+        self.prefetch = prefetch
+        self.on_page = on_page
+        self.rows_count = 0
+        self._digest = hashlib.md5() if digest_rows else None
+        self._page_arrived = threading.Condition()
+        self._start_time = self._page_requested_time = self._last_page_time = time.perf_counter()
 
         # the first page is automagically returned (eventually)
         # so we'll count this as a request, but the retrieved count
@@ -2070,22 +2227,40 @@ class PageFetcher:
         # called after the first page is returned
         self.wait(seconds=self.future.timeout)
 
-    def handle_page(self, rows):
-        # occasionally get a final blank page that is useless
-        if rows == []:
-            self.retrieved_empty_pages += 1
-            return
-
-        page = Page()
-        self.pages.append(page)
+    def _missing_pages(self):
+        return self.requested_pages - (self.retrieved_pages + self.retrieved_empty_pages)
 
-        for row in rows:
-            page.add_row(row)
+    def _request_next_page(self):
+        self._page_requested_time = time.perf_counter()
+        self.requested_pages += 1
+        self.future.start_fetching_next_page()
 
-        self.retrieved_pages += 1
+    def handle_page(self, rows):
+        with self._page_arrived:
+            self._last_page_time = time.perf_counter()
+            latency = self._last_page_time - self._page_requested_time
+            # occasionally get a final blank page that is useless
+            if rows == []:
+                self.retrieved_empty_pages += 1
+            else:
+                page = Page(keep_rows=self.keep_rows, latency=latency)
+                for row in rows:
+                    page.add_row(row)
+                    if self._digest is not None:
+                        self._digest.update(repr(row).encode())
+                self.pages.append(page)
+                self.rows_count += page.row_count
+                self.retrieved_pages += 1
+            if self.prefetch and self.future.has_more_pages:
+                self._request_next_page()
+            self._page_arrived.notify_all()
+        if rows and self.on_page:
+            self.on_page(rows)
 
     def handle_error(self, exc):
-        self.error = exc
+        with self._page_arrived:
+            self.error = exc
+            self._page_arrived.notify_all()
         LOGGER.error(self.error)
         raise exc
 
@@ -2095,10 +2270,11 @@ class PageFetcher:
 
         If the future is exhausted, this is a no-op.
         """
-        if self.future.has_more_pages:
-            self.future.start_fetching_next_page()
-            self.requested_pages += 1
-            self.wait(seconds=timeout)
+        with self._page_arrived:
+            # a prefetched page can be on its way already
+            if self._missing_pages() <= 0 and self.future.has_more_pages:
+                self._request_next_page()
+        self.wait(seconds=timeout)
 
         return self
 
@@ -2108,9 +2284,12 @@ class PageFetcher:
 
         If the future is exhausted, this is a no-op.
         """
-        while self.future.has_more_pages:
-            self.future.start_fetching_next_page()
-            self.requested_pages += 1
+        while True:
+            with self._page_arrived:
+                if self._missing_pages() <= 0:
+                    if not self.future.has_more_pages:
+                        break
+                    self._request_next_page()
             self.wait(seconds=timeout)
 
         return self
@@ -2121,7 +2300,7 @@ class PageFetcher:
 
         Requests are made by calling request_one and/or request_all.
 
-        Raises RuntimeError if seconds is exceeded.
+        Raises RuntimeError if seconds is exceeded, or the error of the query if it failed.
         """
 
         def error_message(msg):
@@ -2129,20 +2308,22 @@ class PageFetcher:
                 msg, self.requested_pages, self.retrieved_pages, self.retrieved_empty_pages)
 
         def missing_pages():
-            pages = self.requested_pages - (self.retrieved_pages + self.retrieved_empty_pages)
+            pages = self._missing_pages()
             assert pages >= 0, error_message('Retrieved too many pages')
             return pages
 
-        missing = missing_pages()
-        if missing <= 0:
-            return self
-        expiry = time.time() + seconds * missing
-
-        while time.time() < expiry:
-            if missing_pages() <= 0:
+        with self._page_arrived:
+            missing = missing_pages()
+            if missing <= 0:
                 return self
-            # small wait so we don't need excess cpu to keep checking
-            time.sleep(0.1)
+            expiry = time.time() + seconds * missing
+
+            while (remaining := expiry - time.time()) > 0:
+                if self.error is not None:
+                    raise self.error
+                if missing_pages() <= 0:
+                    return self
+                self._page_arrived.wait(timeout=remaining)
 
         raise RuntimeError(error_message('Requested pages were not delivered before timeout'))
 
@@ -2158,10 +2339,14 @@ class PageFetcher:
         """
         Returns the number of results found at page_num
         """
-        return len(self.pages[page_num - 1].data)
+        return self.pages[page_num - 1].row_count
 
     def num_results_all(self):
-        return [len(page.data) for page in self.pages]
+        return [page.row_count for page in self.pages]
+
+    def _check_rows_kept(self):
+        if not self.keep_rows:
+            raise ValueError("The rows are not kept by the PageFetcher, created with `keep_rows=False'")
 
     def page_data(self, page_num):
         """
@@ -2169,6 +2354,7 @@ class PageFetcher:
 
         The page should have already been requested with request_one and/or request_all.
         """
+        self._check_rows_kept()
         return self.pages[page_num - 1].data
 
     def all_data(self):
@@ -2177,12 +2363,39 @@ class PageFetcher:
 
         The page(s) should have already been requested with request_one and/or request_all.
         """
+        self._check_rows_kept()
         all_pages_combined = []
         for page in self.pages:
             all_pages_combined.extend(page.data[:])
 
         return all_pages_combined
 
+    def digest(self) -> str:
+        """
+        Returns md5 digest of all retrieved rows, in the order they were retrieved.
+        """
+        if self._digest is None:
+            raise ValueError("The rows are not digested by the PageFetcher, created without `digest_rows=True'")
+        return self._digest.hexdigest()
+
+    def stats(self) -> dict:
+        """
+        Returns the throughput of the retrieved pages: count of the pages and rows, the time from the first request to
+        the last retrieved page, rows per second and the pages latency.
+        """
+        with self._page_arrived:
+            latencies = [page.latency for page in self.pages]
+            elapsed = self._last_page_time - self._start_time
+            return {
+                "pages": self.retrieved_pages,
+                "empty_pages": self.retrieved_empty_pages,
+                "rows": self.rows_count,
+                "elapsed": elapsed,
+                "rows_per_second": self.rows_count / elapsed if elapsed else 0.0,
+                "avg_page_latency": sum(latencies) / len(latencies) if latencies else 0.0,
+                "max_page_latency": max(latencies, default=0.0),
+            }
+
     @property  # make property to match python driver api
     def has_more_pages(self):
         """
@@ -2229,6 +2442,9 @@ def clean_enospc_on_node(target_node, sleep_time):
     target_node.wait_db_up()
 
 
+SnapshotDetails = namedtuple("SnapshotDetails", ["keyspace_name", "table_name"])
+
+
 def parse_nodetool_listsnapshots(listsnapshots_output: str) -> defaultdict:
     """
     listsnapshots output:
@@ -2243,7 +2459,6 @@ def parse_nodetool_listsnapshots(listsnapshots_output: str) -> defaultdict:
         Total TrueDiskSpaceUsed: 0 bytes
     """
     snapshots_content = defaultdict(list)
-    SnapshotDetails = namedtuple("SnapshotDetails", ["keyspace_name", "table_name"])
     for line in listsnapshots_output.splitlines():
         if line and not line.startswith('Snapshot') and not line.startswith('Total'):
             line_splitted = line.split()
@@ -0,0 +1,204 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2024 ScyllaDB
+
+import time
+import logging
+import threading
+from functools import cache, partial
+from dataclasses import dataclass, field
+from collections import defaultdict
+from typing import Any, Callable, Hashable, Iterable
+
+from cassandra import OperationTimedOut  # pylint: disable=no-name-in-module
+from cassandra.cluster import NoHostAvailable  # pylint: disable=no-name-in-module
+from cassandra.connection import ConnectionException
+
+from sdcm.prometheus import NemesisMetrics
+from sdcm.utils.common import ScyllaCQLSession
+
+LOGGER = logging.getLogger(__name__)
+
+
+class CQLSessionPoolMetrics:  # pylint: disable=too-few-public-methods
+    def __init__(self):
+        self.requests_counter = NemesisMetrics.create_counter(
+            'sct_cql_session_pool_requests', 'Number of CQL sessions requested from the pool', ['result'])
+        self.connect_time_counter = NemesisMetrics.create_counter(
+            'sct_cql_session_pool_connect_seconds', 'Time spent on connecting new CQL sessions of the pool', [])
+
+
+@cache
+def cql_session_pool_metrics() -> CQLSessionPoolMetrics:
+    return CQLSessionPoolMetrics()
+
+
+@dataclass(eq=False)
+class PooledSession:  # pylint: disable=too-many-instance-attributes
+    key: Hashable
+    session: Any
+    cluster: Any
+    nodes: frozenset[str]
+    keyspace: str | None
+    defaults: dict = field(default_factory=dict)
+    last_used: float = field(default_factory=time.monotonic)
+    last_probed: float = field(default_factory=time.monotonic)
+    invalidated: bool = False
+
+
+class CQLSessionPool:
+    """
+    Pool of driver sessions, to not build a new driver Cluster (with the control connection and the discovery of
+    the schema and token metadata) for every `cql_connection*()' call.
+
+    Sessions are pooled by a key of the connection options. Every session is leased to one user at a time, because
+    the users change its defaults, and the defaults are restored when it's returned. Idle sessions are probed before
+    they are handed out again, and the sessions of nodes, which were changed by topology operations, are invalidated.
+    """
+    probe_query = "SELECT key FROM system.local"
+    restored_attributes = ("default_timeout", "default_consistency_level", "default_serial_consistency_level",
+                           "default_fetch_size", "row_factory")
+    discard_on_errors = (NoHostAvailable, OperationTimedOut, ConnectionException)
+
+    def __init__(self, max_idle_per_key: int = 4, idle_timeout: float = 300,
+                 probe_interval: float = 30, probe_timeout: float = 10):
+        self.max_idle_per_key = max_idle_per_key
+        self.idle_timeout = idle_timeout
+        self.probe_interval = probe_interval
+        self.probe_timeout = probe_timeout
+        self.hits = 0
+        self.misses = 0
+        self.connect_time = 0.0
+        self._idle: dict[Hashable, list[PooledSession]] = defaultdict(list)
+        self._leased: set[PooledSession] = set()
+        self._lock = threading.Lock()
+
+    def session(self, key: Hashable, connect: Callable[[], tuple[Any, Any]], nodes: Iterable[str] = (),
+                keyspace: str | None = None, verbose: bool = True) -> ScyllaCQLSession:
+        """
+        Lease a pooled session, or a new one made by `connect()', which returns the driver (session, cluster).
+
+        The session is returned to the pool on exit from the context of the returned ScyllaCQLSession.
+        """
+        entry = self._acquire(key, connect, frozenset(nodes), keyspace)
+        return ScyllaCQLSession(entry.session, entry.cluster, verbose, release=partial(self._release, entry))
+
+    def _acquire(self, key, connect, nodes, keyspace) -> PooledSession:
+        while True:
+            with self._lock:
+                expired = self._pop_expired()
+                entry = self._idle[key].pop() if self._idle.get(key) else None
+            for expired_entry in expired:
+                self._close(expired_entry)
+            if entry is None:
+                break
+            if self._is_healthy(entry):
+                with self._lock:
+                    self.hits += 1
+                    self._leased.add(entry)
+                self._count_request("hit")
+                return entry
+            self._close(entry)
+
+        start_time = time.perf_counter()
+        session, cluster = connect()
+        connect_time = time.perf_counter() - start_time
+        entry = PooledSession(key=key, session=session, cluster=cluster, nodes=nodes, keyspace=keyspace,
+                              defaults={attr: getattr(session, attr) for attr in self.restored_attributes
+                                        if hasattr(session, attr)})
+        with self._lock:
+            self.misses += 1
+            self.connect_time += connect_time
+            self._leased.add(entry)
+        self._count_request("miss")
+        metrics = cql_session_pool_metrics()
+        if metrics.connect_time_counter:
+            metrics.connect_time_counter.inc(connect_time)
+        return entry
+
+    def _release(self, entry: PooledSession, exc_type=None):
+        for attr, value in entry.defaults.items():
+            setattr(entry.session, attr, value)
+        discard = (entry.invalidated
+                   or (exc_type is not None and issubclass(exc_type, self.discard_on_errors))
+                   or entry.cluster.is_shutdown is True
+                   or entry.session.keyspace != entry.keyspace)  # changed by `USE' statement
+        with self._lock:
+            self._leased.discard(entry)
+            if not discard and len(self._idle[entry.key]) < self.max_idle_per_key:
+                entry.last_used = time.monotonic()
+                self._idle[entry.key].append(entry)
+                return
+        self._close(entry)
+
+    def _is_healthy(self, entry: PooledSession) -> bool:
+        if entry.cluster.is_shutdown is True or entry.session.is_shutdown is True:
+            return False
+        if time.monotonic() - entry.last_probed < self.probe_interval:
+            return True
+        try:
+            entry.session.execute(self.probe_query, timeout=self.probe_timeout)
+        except Exception as exc:  # pylint: disable=broad-except  # noqa: BLE001
+            LOGGER.debug("Pooled CQL session to %s failed the health probe: %s", sorted(entry.nodes), exc)
+            return False
+        entry.last_probed = time.monotonic()
+        return True
+
+    def _pop_expired(self) -> list[PooledSession]:
+        expired = []
+        now = time.monotonic()
+        for key, entries in self._idle.items():
+            expired.extend(entry for entry in entries if now - entry.last_used > self.idle_timeout)
+            self._idle[key] = [entry for entry in entries if now - entry.last_used <= self.idle_timeout]
+        return expired
+
+    @staticmethod
+    def _close(entry: PooledSession):
+        try:
+            entry.cluster.shutdown()
+        except Exception as exc:  # pylint: disable=broad-except  # noqa: BLE001
+            LOGGER.debug("Failed to shutdown pooled CQL session: %s", exc)
+
+    @staticmethod
+    def _count_request(result: str):
+        if (counter := cql_session_pool_metrics().requests_counter) is not None:
+            counter.labels(result).inc()
+
+    def invalidate(self, node_name: str | None = None):
+        """
+        Close the idle sessions to the node (or all of them), and the leased ones when they are returned
+        """
+        with self._lock:
+            closed = []
+            for key, entries in self._idle.items():
+                closed.extend(entry for entry in entries if node_name is None or node_name in entry.nodes)
+                self._idle[key] = [entry for entry in entries if entry not in closed]
+            for entry in self._leased:
+                if node_name is None or node_name in entry.nodes:
+                    entry.invalidated = True
+        if closed:
+            LOGGER.debug("Closing %d pooled CQL session(s) of %s", len(closed), node_name or "all nodes")
+        for entry in closed:
+            self._close(entry)
+
+    def close(self):
+        self.invalidate()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "connect_time": self.connect_time,
+                "idle": sum(len(entries) for entries in self._idle.values()),
+                "leased": len(self._leased),
+            }
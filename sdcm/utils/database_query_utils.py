@@ -21,6 +21,7 @@ import sys
 from typing import List
 
 from cassandra import ConsistencyLevel
+from cassandra.query import SimpleStatement  # pylint: disable=no-name-in-module
 
 from sdcm.sct_events import Severity
 from sdcm.sct_events.system import TestFrameworkEvent
@@ -161,12 +162,14 @@ class PartitionsValidationAttributes:  # pylint: disable=too-few-public-methods,
                                                 f' {partitions_dict_after}')
 
 
-def get_table_clustering_order(ks_cf: str, ck_name: str, session) -> str:
+def get_table_clustering_order(ks_cf: str, ck_name: str, session,
+                               consistency_level: ConsistencyLevel | None = None) -> str:
     """
     Returns a clustering order of a table column.
     :param ck_name:
     :param session:
     :param ks_cf:
+    :param consistency_level: consistency level of the query, the session default if not set
     :return: clustering-order string - ASC/DESC
 
     Example query: SELECT clustering_order from system_schema.columns WHERE keyspace_name = 'scylla_bench'
@@ -175,7 +178,7 @@ def get_table_clustering_order(ks_cf: str, ck_name: str, session) -> str:
     keyspace, table = ks_cf.split('.')
     cmd = f"SELECT clustering_order from system_schema.columns WHERE keyspace_name = '{keyspace}' " \
           f"and table_name = '{table}' and column_name = '{ck_name}'"
-    cql_result = session.execute(cmd)
+    cql_result = session.execute(SimpleStatement(cmd, consistency_level=consistency_level))
     clustering_order = cql_result.current_rows[0].clustering_order
     LOGGER.info('Retrieved a clustering-order of: %s for table %s', clustering_order, ks_cf)
     return clustering_order
@@ -215,8 +218,10 @@ def fetch_all_rows(session, default_fetch_size, statement, retries: int = 4, tim
     @retrying(n=retries, sleep_time=5, message='Fetch all rows', raise_on_exceeded=raise_on_exceeded)
     def _fetch_rows() -> list:
         result = session.execute_async(statement)
-        fetcher = PageFetcher(result).request_all() if not timeout else \
-            PageFetcher(result).request_all(timeout=timeout)
+        fetcher = PageFetcher(result, prefetch=True).request_all() if not timeout else \
+            PageFetcher(result, prefetch=True).request_all(timeout=timeout)
+        if verbose:
+            LOGGER.debug("Fetch stats: %s", fetcher.stats())
         return fetcher.all_data()
 
     current_rows = _fetch_rows()
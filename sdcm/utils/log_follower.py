@@ -0,0 +1,180 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2024 ScyllaDB
+
+import os
+import re
+import logging
+import threading
+import weakref
+from collections import deque
+from functools import cached_property
+from typing import Iterable, Iterator
+
+LOGGER = logging.getLogger(__name__)
+
+# patterns with backreferences can't be combined with others, since numbers of their groups are changed
+NOT_COMBINABLE_PATTERN = re.compile(r"\\[1-9]|\(\?P=")
+INLINE_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.VERBOSE, "x"))
+
+
+def pattern_key(pattern: re.Pattern) -> tuple[str, int]:
+    return pattern.pattern, pattern.flags
+
+
+class LogMatcher:
+    """
+    Match lines against patterns of many followers: a line is matched by a single search of all the patterns
+    combined, and only the lines found by it are matched against every pattern, to find the followers of the line.
+    """
+
+    def __init__(self, patterns: Iterable[re.Pattern]):
+        self.patterns = {pattern_key(pattern): pattern for pattern in patterns}
+
+    @cached_property
+    def combined(self) -> re.Pattern | None:
+        parts = []
+        for pattern in self.patterns.values():
+            if NOT_COMBINABLE_PATTERN.search(pattern.pattern):
+                return None
+            flags = "".join(letter for flag, letter in INLINE_FLAGS if pattern.flags & flag)
+            parts.append(f"(?{flags}:{pattern.pattern})")
+        try:
+            return re.compile("|".join(parts))
+        except re.error as exc:
+            LOGGER.debug("Can't combine log patterns, they are matched one by one: %s", exc)
+            return None
+
+    def match(self, line: str) -> set[tuple[str, int]]:
+        if self.combined is not None and not self.combined.search(line):
+            return set()
+        return {key for key, pattern in self.patterns.items() if pattern.search(line)}
+
+
+class LogFollower:
+    """
+    Lines of a log file, which match any of the patterns, and were appended after the follower was created
+    (or from the beginning of the file.)
+
+    Every iteration yields the lines appended since the previous one, like iteration of an open file does.
+    """
+
+    def __init__(self, hub: "LogFollowerHub", patterns: Iterable[re.Pattern], offset: int):
+        self._hub = hub
+        self.patterns = list(patterns)
+        self.keys = {pattern_key(pattern) for pattern in self.patterns}
+        self.offset = offset  # start of the first line which wasn't read for the follower yet
+        self.lines: deque[str] = deque()
+
+    def __iter__(self) -> Iterator[str]:
+        while True:
+            if not self.lines:
+                if not self._hub.poll(self):
+                    return
+                continue
+            yield self.lines.popleft()
+
+
+class LogFollowerHub:
+    """
+    Read a log file once for all its followers.
+
+    Every follower has its own offset in the file, and lines are read lazily, by bounded blocks, when the follower
+    iterates.  The followers at the same offset share reading and matching: the block is matched against the
+    patterns of all of them in a single pass, and the lines are pushed to the followers which they match.  A follower
+    which has many lines queued doesn't share reads, so it falls behind and reads the rest by itself later, and no
+    line is lost.
+    """
+    block_size = 1024 * 1024
+    max_queued_lines = 10_000
+    max_matchers = 64
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")  # pylint: disable=consider-using-with
+        self.inode = os.fstat(self._file.fileno()).st_ino
+        self._followers: weakref.WeakSet[LogFollower] = weakref.WeakSet()
+        self._matchers: dict[frozenset, LogMatcher] = {}
+        self._lock = threading.Lock()
+        weakref.finalize(self, self._file.close)
+
+    def is_current(self) -> bool:
+        try:
+            return os.stat(self.path).st_ino == self.inode
+        except FileNotFoundError:
+            return False
+
+    def follow(self, patterns: Iterable[re.Pattern], start_from_beginning: bool = False) -> LogFollower:
+        with self._lock:
+            offset = 0 if start_from_beginning else self._file.seek(0, os.SEEK_END)
+            follower = LogFollower(self, patterns, offset=offset)
+            self._followers.add(follower)
+            return follower
+
+    def poll(self, follower: LogFollower) -> bool:
+        """
+        Read the next block of complete lines after the offset of the follower, for it and all the followers at the
+        same offset
+
+        :return: False if there are no complete lines to read
+        """
+        with self._lock:
+            start = follower.offset
+            if not (data := self._read_lines(start)):
+                return False
+            followers = [follower] + [other for other in self._followers if other is not follower
+                                      and other.offset == start and len(other.lines) < self.max_queued_lines]
+            matcher = self._get_matcher(followers)
+            for raw_line in data.splitlines(keepends=True):
+                if matched := matcher.match(line := raw_line.decode(errors="replace")):
+                    for other in followers:
+                        if not other.keys.isdisjoint(matched):
+                            other.lines.append(line)
+            for other in followers:
+                other.offset = start + len(data)
+            return True
+
+    def _read_lines(self, start: int) -> bytes:
+        """
+        Read complete lines from the start, about a block of them, or a single line if it's longer than a block
+        """
+        self._file.seek(start)
+        blocks = []
+        while block := self._file.read(self.block_size):
+            blocks.append(block)
+            if b"\n" in block:
+                break
+        data = b"".join(blocks)
+        return data[:data.rfind(b"\n") + 1]
+
+    def _get_matcher(self, followers: list[LogFollower]) -> LogMatcher:
+        keys = frozenset(key for follower in followers for key in follower.keys)
+        if (matcher := self._matchers.get(keys)) is None:
+            if len(self._matchers) >= self.max_matchers:  # of followers which are gone already
+                self._matchers.clear()
+            matcher = self._matchers[keys] = LogMatcher(
+                pattern for follower in followers for pattern in follower.patterns)
+        return matcher
+
+
+_HUBS: weakref.WeakValueDictionary[str, LogFollowerHub] = weakref.WeakValueDictionary()
+_HUBS_LOCK = threading.Lock()
+
+
+def follow_log(path: str, patterns: Iterable[re.Pattern], start_from_beginning: bool = False) -> LogFollower:
+    """
+    Follow lines of the log file, which match any of the patterns, sharing reading and matching with other followers
+    """
+    with _HUBS_LOCK:
+        if (hub := _HUBS.get(path)) is None or not hub.is_current():  # a new file, e.g. the old one was moved
+            hub = _HUBS[path] = LogFollowerHub(path)
+    return hub.follow(patterns, start_from_beginning=start_from_beginning)
@@ -11,10 +11,45 @@
 #
 # Copyright (c) 2020 ScyllaDB
 
+import os
 import abc
+import logging
+import multiprocessing
 import datetime
 import re
+from concurrent.futures import as_completed
+from concurrent.futures.process import ProcessPoolExecutor
 from pathlib import Path
+from typing import Iterable, Iterator
+
+LOGGER = logging.getLogger(__name__)
+
+BLOCK_SIZE = 16 * 1024 * 1024
+
+
+def read_lines(log_file: Path, ignore_lines: Iterable[str] = (), block_size: int = BLOCK_SIZE) -> Iterator[bytes]:
+    """
+    Read lines of the file by big binary blocks, to not keep all of it in memory, and skip lines which contain any
+    of ignore_lines.  Most of the blocks don't have such lines at all, so the whole block is checked first.
+    """
+    ignore_lines = [line_pattern.encode() for line_pattern in ignore_lines]
+
+    def lines_of(data: bytes) -> list[bytes]:
+        lines = data.splitlines(keepends=True)
+        if any(line_pattern in data for line_pattern in ignore_lines):
+            return [line for line in lines if not any(line_pattern in line for line_pattern in ignore_lines)]
+        return lines
+
+    with log_file.open(mode='rb') as log:
+        remainder = b''
+        while block := log.read(block_size):
+            if (end := block.rfind(b'\n') + 1) == 0:
+                remainder += block
+                continue
+            yield from lines_of(remainder + block[:end])
+            remainder = block[end:]
+        if remainder:
+            yield from lines_of(remainder)
 
 
 class LogTimeConsistencyAnalyzerBase:  # pylint: disable=too-few-public-methods
@@ -60,12 +95,24 @@ class LogTimeConsistencyAnalyzerBase:  # pylint: disable=too-few-public-methods
 
     @classmethod
     def analyze_dir(cls, log_dir: str):
-        pathlist = Path(log_dir).glob(cls.files_pattern)
+        pathlist = sorted(Path(log_dir).glob(cls.files_pattern))
         all_files_data = {}
         total_data = {}
+        results = {}
+        if len(pathlist) > 1:
+            # it's called by a multithreaded process, where a fork could inherit locks held by other threads
+            with ProcessPoolExecutor(max_workers=min(len(pathlist), os.cpu_count() or 1),
+                                     mp_context=multiprocessing.get_context("spawn")) as executor:
+                futures = {executor.submit(cls._analyze_file, log_file): log_file for log_file in pathlist}
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+                    LOGGER.info("Processed %s/%s", futures[future].parent.name, futures[future].name)
+        else:
+            for log_file in pathlist:
+                LOGGER.info("Start processing %s/%s", log_file.parent.name, log_file.name)
+                results[log_file] = cls._analyze_file(log_file)
         for log_file in pathlist:
-            print('Start processing ' + log_file.parent.name + '/' + log_file.name)
-            detailed, counters = cls._analyze_file(log_file)
+            detailed, counters = results[log_file]
             all_files_data[str(log_file)] = detailed
             for key, value in counters.items():
                 total_data[key] = total_data.get(key, 0) + value
@@ -89,21 +136,19 @@ class DbLogTimeConsistencyAnalyzer(LogTimeConsistencyAnalyzerBase):  # pylint: d
         prior_time = datetime.datetime.now().timestamp() - 60 * 60 * 24 * 365
         output = cls._init_timeshift_buckets(list)
         counters = cls._init_timeshift_buckets(int) | {'total': 0}
-        prior_line = ""
-        for line in log_file.open(mode='r').readlines():
-            if cls.ignore_lines:
-                if any(line_pattern in line for line_pattern in cls.ignore_lines):
-                    continue
+        prior_line = b""
+        for line in read_lines(log_file, ignore_lines=cls.ignore_lines or ()):
             try:
-                current_time = datetime.datetime.fromisoformat(line.split()[0]).timestamp()
+                current_time = datetime.datetime.fromisoformat(line.split(maxsplit=1)[0].decode()).timestamp()
             except Exception:  # pylint: disable=broad-except  # noqa: BLE001
                 continue
             current_time_shift = prior_time - current_time
-            if bucket_name := cls._get_timeshift_bucket_name(current_time_shift):
+            if current_time_shift > cls.lower_shift_limit \
+                    and (bucket_name := cls._get_timeshift_bucket_name(current_time_shift)):
                 counters['total'] += 1
                 counters[bucket_name] += 1
                 if counters[bucket_name] < cls.records_limit:
-                    output[bucket_name].append(prior_line + line)
+                    output[bucket_name].append((prior_line + line).decode(errors='replace'))
             prior_time = current_time
             prior_line = line
         cls._append_counters_to_details(counters=counters, output=output)
@@ -112,17 +157,17 @@ class DbLogTimeConsistencyAnalyzer(LogTimeConsistencyAnalyzerBase):  # pylint: d
 
 class SctLogTimeConsistencyAnalyzer(LogTimeConsistencyAnalyzerBase):  # pylint: disable=too-few-public-methods
     files_pattern = '**/sct.log'
+    sct_scylla_log_marker = b'c:sdcm.cluster'
     sct_scylla_log_re = re.compile(
-        r'< t:([0-9-]+ [0-9:]+),[0-9]+[ \t]+f:cluster.py[ \t]+l:[0-9]+[ \t]+c:sdcm.cluster[ \t]+p:[A-Z]+ > ([0-9T:-]+)')
+        rb'< t:([0-9-]+ [0-9:]+),[0-9]+[ \t]+f:cluster.py[ \t]+l:[0-9]+[ \t]+c:sdcm.cluster[ \t]+p:[A-Z]+ > ([0-9T:-]+)')
 
     @classmethod
     def _analyze_file(cls, log_file: Path) -> tuple[dict[str, list[str]], dict[str, int]]:
         output = cls._init_timeshift_buckets(list)
         counters = cls._init_timeshift_buckets(int) | {'total': 0}
-        for line in log_file.open(mode='r').readlines():
-            if cls.ignore_lines:
-                if any(line_pattern in line for line_pattern in cls.ignore_lines):
-                    continue
+        for line in read_lines(log_file, ignore_lines=cls.ignore_lines or ()):
+            if cls.sct_scylla_log_marker not in line:
+                continue
             match = cls.sct_scylla_log_re.search(line)
             if not match:
                 continue
@@ -130,8 +175,8 @@ class SctLogTimeConsistencyAnalyzer(LogTimeConsistencyAnalyzerBase):  # pylint:
             # < t:2021-11-09 14:22:18,447 f:cluster.py      l:1405 c:sdcm.cluster   p:DEBUG > 2021-10-06T18:38:00+00:00
             try:
                 sct_time, event_time = match.groups()
-                sct_time = datetime.datetime.fromisoformat(sct_time).timestamp()
-                event_time = datetime.datetime.fromisoformat(event_time).timestamp()
+                sct_time = datetime.datetime.fromisoformat(sct_time.decode()).timestamp()
+                event_time = datetime.datetime.fromisoformat(event_time.decode()).timestamp()
             except Exception:  # pylint: disable=broad-except  # noqa: BLE001
                 continue
             current_time_shift = sct_time - event_time
@@ -139,6 +184,6 @@ class SctLogTimeConsistencyAnalyzer(LogTimeConsistencyAnalyzerBase):  # pylint:
                 counters['total'] += 1
                 counters[bucket_name] += 1
                 if counters[bucket_name] < cls.records_limit:
-                    output[bucket_name].append(line)
+                    output[bucket_name].append(line.decode(errors='replace'))
         cls._append_counters_to_details(counters=counters, output=output)
         return output, counters
@@ -32,6 +32,8 @@ class ConfigParams:
     rows_count: int = 5000
     full_scan_operation_limit: int = 300  # timeout for SELECT * statement, 5 min by default
     full_scan_aggregates_operation_limit: int = 60*30  # timeout for SELECT count(* statement 30 min by default
+    # number of token sub-ranges of a table scan queried concurrently, 0 means one per shard of the cluster
+    scan_concurrency: int = 0
 
     def __post_init__(self):
         types = get_type_hints(ConfigParams)
@@ -78,10 +80,24 @@ class OperationThreadStats:
         pretty_table = PrettyTable(field_names=[field.name for field in dataclasses.fields(self.stats[0])])
         for stat in self.stats:
             pretty_table.add_row([stat.op_type, stat.duration, "\n".join(stat.exceptions), stat.nemesis_at_start,
-                                  stat.nemesis_at_end, stat.success, stat.cmd])
+                                  stat.nemesis_at_end, stat.success, stat.cmd, stat.rows_read,
+                                  len(stat.sub_ranges) or ""])
         return pretty_table
 
 
+@dataclass
+class SubRangeStat:
+    """
+    Keeps track of stats for a single token sub-range query of an operation.
+    """
+    start_token: int
+    end_token: int
+    duration: float = None
+    rows_read: int = 0
+    pages: int = 0
+    exception: str = None
+
+
 @dataclass
 class OneOperationStat:
     """
@@ -94,6 +110,8 @@ class OneOperationStat:
     nemesis_at_end: str = None
     success: bool = None
     cmd: str = None
+    rows_read: int = None
+    sub_ranges: list[SubRangeStat] = dataclasses.field(default_factory=list)
 
 # pylint: disable=too-many-instance-attributes
 
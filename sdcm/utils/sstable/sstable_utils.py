@@ -1,17 +1,51 @@
+import os
+import re
 import datetime
 import json
 import logging
 import random
+from typing import Iterator
 
 from sdcm.paths import SCYLLA_YAML_PATH
+from sdcm.utils.common import ParallelObject
 from sdcm.utils.version_utils import ComparableScyllaVersion
 from sdcm.exceptions import SstablesNotFound
 
+SCYLLA_METADATA_DECODER = json.JSONDecoder(strict=False)
+SCYLLA_METADATA_SSTABLES_RE = re.compile(r'"sstables"\s*:\s*{')
+WHITESPACE_RE = re.compile(r'\s*')
+
 
 class NonDeletedTombstonesFound(Exception):
     pass
 
 
+def iter_sstables_extension_attributes(dump: str) -> Iterator[tuple[str, set[str]]]:
+    """
+    Yield names of extension attributes of every sstable in the output of `scylla sstable dump-scylla-metadata',
+    decoding metadata of one sstable at a time, and stop at the end of the output, if it's cut by a failure.
+
+    Example of the output: {"sstables":{"/var/.../me-3g9s_1eqc_2z60w2ushgma9j7ypu-big-Data.db":{...,
+                            "extension_attributes":{"scylla_encryption_options":"..."}}}}
+    """
+    if not (match := SCYLLA_METADATA_SSTABLES_RE.search(dump)):
+        return
+    pos = match.end()
+    try:
+        while (pos := WHITESPACE_RE.match(dump, pos).end()) < len(dump) and dump[pos] != "}":
+            sstable, pos = SCYLLA_METADATA_DECODER.raw_decode(dump, pos)
+            pos = WHITESPACE_RE.match(dump, pos).end()
+            if dump[pos:pos + 1] != ":":
+                return
+            metadata, pos = SCYLLA_METADATA_DECODER.raw_decode(dump, WHITESPACE_RE.match(dump, pos + 1).end())
+            yield sstable, set(metadata.get("extension_attributes") or {})
+            pos = WHITESPACE_RE.match(dump, pos).end()
+            if dump[pos:pos + 1] == ",":
+                pos += 1
+    except json.JSONDecodeError:
+        return
+
+
 class SstableUtils:
     """
     Provides table details, related to its sstables and tombstones.
@@ -55,7 +89,10 @@ class SstableUtils:
         self.log.debug('Got %s sstables %s', len(selected_sstables), message)
         return selected_sstables
 
-    def check_that_sstables_are_encrypted(self, sstables=None,  # pylint: disable=too-many-branches
+    sstables_per_dump = 200
+    parallel_dumps = 4
+
+    def check_that_sstables_are_encrypted(self, sstables=None,
                                           expected_bool_value: bool = True) -> list:
 
         if not sstables:
@@ -74,57 +111,16 @@ class SstableUtils:
                 "  --logger-log-level scylla-sstable=debug"
                 f" --keyspace {self.keyspace} --table {self.table} --sstables"
             )
+            sstables_per_dump = self.sstables_per_dump
         else:
             dump_cmd = 'sstabledump'
-        for sstable in sstables:
-            sstables_res = self.db_node.remoter.sudo(
-                f"{dump_cmd} {sstable}",
-                ignore_status=True, verbose=True)
-
-            self.log.debug("sstables_res.stdout: %s", sstables_res.stdout)
-            self.log.debug("sstables_res.stderr: %s", sstables_res.stderr)
-            # NOTE: if we have 'stdout' then the data was successfully read and it means there was no encryption
-            if sstables_res.stdout:
-                self.log.debug("Successfully read the sstable located at '%s'.", sstable)
-                if dump_cmd == 'sstabledump':
-                    sstables_encrypted_mapping[sstable] = False
-                else:
-                    scylla_metadata = json.loads(sstables_res.stdout, strict=False)['sstables']
-                    sstables_encrypted_mapping[sstable] = all('scylla_encryption_options' in metadata.get('extension_attributes', {})
-                                                              for table, metadata in scylla_metadata.items())
-            # NOTE: case when sstable exists and it is encrypted:
-            #       [shard 0:main] seastar - Exiting on unhandled exception: \
-            #       sstables::malformed_sstable_exception (Buffer improperly sized to hold requested data. \
-            #       Got: 2. Expected: 4 in sstable \
-            #       /var/.../me-3g9s_1eqc_2z60w2ushgma9j7ypu-big-Statistics.db)
-            elif "malformed_sstable_exception (Buffer improperly sized to hold requested data" in sstables_res.stderr:
-                sstables_encrypted_mapping[sstable] = True
-            # NOTE: case when sstable was concurrently deleted:
-            #       [shard 0:main] seastar - Exiting on unhandled exception: \
-            #       sstables::malformed_sstable_exception \
-            #       (/var/.../me-3g9s_1941_4web4236cvthbyawsi-big-TOC.txt: file not found)
-            elif (" file not found)" in sstables_res.stderr or "Cannot find file" in sstables_res.stderr
-                    or "No such file or directory" in sstables_res.stderr):
-                self.log.debug("'%s' sstable doesn't exist anymore. Skipping it.", sstable)
-            # NOTE: case when
-            #       Could not load SSTable: /var/.../me-3g9w_104a_01xg12j55gjivrwtt5-big-Data.db: \
-            #       sstables::malformed_sstable_exception (/var/.../me-3g9w_104a_01xg12j55gjivrwtt5-big-Data.db: \
-            #       first and last keys of summary are misordered: \
-            #       first={key: pk{00080000000000000003}, token: -578762209316392770} \
-            #       > last={key: pk{00080000000000000008}, token: -6917704163689751025})
-            elif "first and last keys of summary are misordered" in sstables_res.stderr:
-                self.log.warning(
-                    "'%s' sstable cannot be loaded with 'first and last keys of summary are misordered' error. "
-                    "Not representative. Skipping it.",
-                    sstable)
-            elif "NullPointerException" in sstables_res.stderr or "ArrayIndexOutOfBoundsException" in sstables_res.stderr:
-                # using sstabledump
-                sstables_encrypted_mapping[sstable] = True
-            # NOTE: all other unexpected cases
-            else:
-                self.log.warning(
-                    "Unexpected error reading sstable located at '%s': %s", sstable, sstables_res.stderr)
-                sstables_encrypted_mapping[sstable] = None
+            sstables_per_dump = 1
+        chunks = [sstables[idx:idx + sstables_per_dump] for idx in range(0, len(sstables), sstables_per_dump)]
+        self.log.debug("Check encryption of %s sstables of %s by %s dumps", len(sstables), self.ks_cf, len(chunks))
+        results = ParallelObject(objects=chunks, timeout=None, num_workers=self.parallel_dumps,
+                                 disable_logging=True).run(lambda chunk: self._check_sstables_encryption(dump_cmd, chunk))
+        for result in results:
+            sstables_encrypted_mapping.update(result.result)
 
         # NOTE: we read sstables in a concurrent environment.
         #       So, we can get failures trying to read some of them when it gets deleted concurrently...
@@ -135,6 +131,80 @@ class SstableUtils:
             f" Success part: '{encryption_success_part}'. Expected bool value: '{expected_bool_value}'."
             f" Encryption results: {encryption_results}")
 
+    def _check_sstables_encryption(self, dump_cmd: str, sstables: list[str]) -> dict[str, bool | None]:
+        """
+        Dump metadata of all the sstables by one command, and dump the ones which are missing in its output
+        (e.g. it failed on one of them) one by one, to find out why
+        """
+        sstables_encrypted_mapping = {}
+        if len(sstables) > 1:
+            sstables_res = self.db_node.remoter.sudo(f"{dump_cmd} {' '.join(sstables)}", ignore_status=True,
+                                                     verbose=False)
+            sstables_by_name = {os.path.basename(sstable): sstable for sstable in sstables}
+            for name, extension_attributes in iter_sstables_extension_attributes(sstables_res.stdout):
+                if (sstable := sstables_by_name.get(os.path.basename(name))) is not None:
+                    sstables_encrypted_mapping[sstable] = 'scylla_encryption_options' in extension_attributes
+            if len(sstables_encrypted_mapping) < len(sstables):
+                self.log.debug("Metadata of %s of %s sstables is read, the rest are read one by one. stderr: %s",
+                               len(sstables_encrypted_mapping), len(sstables), sstables_res.stderr)
+        for sstable in sstables:
+            if sstable not in sstables_encrypted_mapping:
+                self._check_sstable_encryption(dump_cmd, sstable, sstables_encrypted_mapping)
+        return sstables_encrypted_mapping
+
+    def _check_sstable_encryption(self, dump_cmd: str, sstable: str,  # pylint: disable=too-many-branches
+                                  sstables_encrypted_mapping: dict[str, bool | None]) -> None:
+        sstables_res = self.db_node.remoter.sudo(f"{dump_cmd} {sstable}", ignore_status=True, verbose=False)
+
+        # NOTE: if we have 'stdout' then the data was successfully read and it means there was no encryption
+        if sstables_res.stdout:
+            if dump_cmd == 'sstabledump':
+                self.log.debug("Successfully read the sstable located at '%s'.", sstable)
+                sstables_encrypted_mapping[sstable] = False
+            elif metadata := list(iter_sstables_extension_attributes(sstables_res.stdout)):
+                self.log.debug("Successfully read the sstable located at '%s'.", sstable)
+                sstables_encrypted_mapping[sstable] = all(
+                    'scylla_encryption_options' in extension_attributes for _, extension_attributes in metadata)
+            else:
+                self.log.warning("Unexpected metadata dump of sstable located at '%s'. stdout: %s stderr: %s",
+                                 sstable, sstables_res.stdout, sstables_res.stderr)
+                sstables_encrypted_mapping[sstable] = None
+            return
+        self.log.debug("Failed to read the sstable located at '%s'. stderr: %s", sstable, sstables_res.stderr)
+        # NOTE: case when sstable exists and it is encrypted:
+        #       [shard 0:main] seastar - Exiting on unhandled exception: \
+        #       sstables::malformed_sstable_exception (Buffer improperly sized to hold requested data. \
+        #       Got: 2. Expected: 4 in sstable \
+        #       /var/.../me-3g9s_1eqc_2z60w2ushgma9j7ypu-big-Statistics.db)
+        if "malformed_sstable_exception (Buffer improperly sized to hold requested data" in sstables_res.stderr:
+            sstables_encrypted_mapping[sstable] = True
+        # NOTE: case when sstable was concurrently deleted:
+        #       [shard 0:main] seastar - Exiting on unhandled exception: \
+        #       sstables::malformed_sstable_exception \
+        #       (/var/.../me-3g9s_1941_4web4236cvthbyawsi-big-TOC.txt: file not found)
+        elif (" file not found)" in sstables_res.stderr or "Cannot find file" in sstables_res.stderr
+                or "No such file or directory" in sstables_res.stderr):
+            self.log.debug("'%s' sstable doesn't exist anymore. Skipping it.", sstable)
+        # NOTE: case when
+        #       Could not load SSTable: /var/.../me-3g9w_104a_01xg12j55gjivrwtt5-big-Data.db: \
+        #       sstables::malformed_sstable_exception (/var/.../me-3g9w_104a_01xg12j55gjivrwtt5-big-Data.db: \
+        #       first and last keys of summary are misordered: \
+        #       first={key: pk{00080000000000000003}, token: -578762209316392770} \
+        #       > last={key: pk{00080000000000000008}, token: -6917704163689751025})
+        elif "first and last keys of summary are misordered" in sstables_res.stderr:
+            self.log.warning(
+                "'%s' sstable cannot be loaded with 'first and last keys of summary are misordered' error. "
+                "Not representative. Skipping it.",
+                sstable)
+        elif "NullPointerException" in sstables_res.stderr or "ArrayIndexOutOfBoundsException" in sstables_res.stderr:
+            # using sstabledump
+            sstables_encrypted_mapping[sstable] = True
+        # NOTE: all other unexpected cases
+        else:
+            self.log.warning(
+                "Unexpected error reading sstable located at '%s': %s", sstable, sstables_res.stderr)
+            sstables_encrypted_mapping[sstable] = None
+
     def count_sstable_tombstones(self, sstable: str) -> int:
         self.db_node.remoter.run(
             f'sudo sstabledump  {sstable} 1>/tmp/sstabledump.json', verbose=False, ignore_status=True)
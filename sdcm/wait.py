@@ -34,7 +34,7 @@ def wait_for(func, step=1, text=None, timeout=None, throw_exc=True, stop_event=N
     Wrapper function to wait with timeout option.
 
     :param func: Function to evaluate.
-    :param step: Time to sleep between attempts in seconds
+    :param step: Time to sleep between attempts in seconds, or a function which returns it before every sleep
     :param text: Text to print while waiting, for debug purposes
     :param timeout: Timeout in seconds
     :param throw_exc: Raise exception if timeout expired, but disrupt_func result is not True
@@ -63,7 +63,7 @@ def wait_for(func, step=1, text=None, timeout=None, throw_exc=True, stop_event=N
         retry = tenacity.Retrying(
             reraise=throw_exc,
             stop=tenacity.stop_any(*stops),
-            wait=tenacity.wait_fixed(step),
+            wait=(lambda retry_state: step()) if callable(step) else tenacity.wait_fixed(step),
             before_sleep=retry_logger,
             retry=(tenacity.retry_if_result(lambda value: not value) | tenacity.retry_if_exception_type())
         )
@@ -97,7 +97,7 @@ def forever_wait_for(func, step=1, text=None, **kwargs):
     timeout, we'll just keep waiting for it.
 
     :param func: Function to evaluate.
-    :param step: Amount of time to sleep before another try.
+    :param step: Amount of time to sleep before another try, or a function which returns it.
     :param text: Text to log, for debugging purposes.
     :param kwargs: Keyword arguments to disrupt_func
     :return: Return value of disrupt_func.
@@ -106,7 +106,7 @@ def forever_wait_for(func, step=1, text=None, **kwargs):
     start_time = time.time()
     while not ok:
         ok = func(**kwargs)
-        time.sleep(step)
+        time.sleep(step() if callable(step) else step)
         time_elapsed = time.time() - start_time
         if text is not None:
             LOGGER.debug('%s (%s s)', text, time_elapsed)
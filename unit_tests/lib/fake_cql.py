@@ -0,0 +1,51 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2024 ScyllaDB
+
+import threading
+
+
+class FakeResponseFuture:
+    """Delivers the pages like cassandra.cluster.ResponseFuture, from a timer thread if `delay' is set"""
+
+    timeout = 5
+
+    def __init__(self, pages, delay=None, error=None):
+        self._pages = list(pages)
+        self._delay = delay
+        self._error = error
+        self._callback = self._errback = None
+        self.fetch_requests = 0
+        self.has_more_pages = False
+
+    def add_callbacks(self, callback, errback):
+        self._callback, self._errback = callback, errback
+        self._deliver()
+
+    def start_fetching_next_page(self):
+        assert self.has_more_pages, "no more pages to fetch"
+        self.fetch_requests += 1
+        self._deliver()
+
+    def _deliver_page(self):
+        if self._error and not self._pages:
+            self._errback(self._error)
+            return
+        rows = self._pages.pop(0)
+        self.has_more_pages = bool(self._pages) or bool(self._error)
+        self._callback(rows)
+
+    def _deliver(self):
+        if self._delay:
+            threading.Timer(self._delay, self._deliver_page).start()
+        else:
+            self._deliver_page()
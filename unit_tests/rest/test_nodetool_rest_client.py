@@ -0,0 +1,174 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2024 ScyllaDB
+
+import json
+import shutil
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+from invoke import Result
+
+from sdcm.remote import LocalCmdRunner
+from sdcm.rest.nodetool_rest_client import NodetoolRestClient, format_load
+from sdcm.rest.rest_client import ScyllaApiException
+from sdcm.utils.common import SnapshotDetails
+
+from unit_tests.test_cluster import DummyScyllaCluster, NodetoolDummyNode
+
+pytestmark = pytest.mark.skipif(not shutil.which("curl"), reason="curl is required")
+
+LOCATIONS = {"10.0.0.1": ("dc1", "rack1"), "10.0.0.2": ("dc1", "rack2"), "10.0.1.1": ("dc2", "rack1")}
+
+API = {
+    "/gossiper/endpoint/live/": ["10.0.0.1", "10.0.1.1"],
+    "/gossiper/endpoint/down/": ["10.0.0.2"],
+    "/storage_service/nodes/joining": [],
+    "/storage_service/nodes/leaving": ["10.0.1.1"],
+    "/storage_service/nodes/moving": [],
+    "/storage_service/load_map": [{"key": "10.0.0.1", "value": 23_307_000_000.0},
+                                  {"key": "10.0.1.1", "value": 1023.0}],
+    "/storage_service/tokens_endpoint": [
+        {"key": str(token), "value": ip} for token, ip in enumerate(["10.0.0.1"] * 3 + ["10.0.0.2"] * 2 + ["10.0.1.1"])],
+    "/storage_service/host_id": [{"key": ip, "value": f"host-id-{ip}"} for ip in LOCATIONS],
+    "/storage_service/ownership/null": [{"key": "10.0.0.1", "value": "0.5"}, {"key": "10.0.0.2", "value": "0.3333"},
+                                        {"key": "10.0.1.1", "value": "0.1667"}],
+    "/storage_service/snapshots": [{"key": "1599414845162", "value": [
+        {"ks": "system_schema", "cf": "keyspaces", "total": 0, "live": 0},
+        {"ks": "keyspace1", "cf": "standard1", "total": 0, "live": 0}]}],
+}
+
+
+class FakeScyllaApiHandler(BaseHTTPRequestHandler):
+    server: "FakeScyllaApiServer"
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        url = urlparse(self.path)
+        self.server.requests.append(url.path)
+        if url.path in self.server.api:
+            body = self.server.api[url.path]
+        elif url.path.startswith("/snitch/"):
+            datacenter, rack = LOCATIONS[parse_qs(url.query)["host"][0]]
+            body = datacenter if url.path == "/snitch/datacenter" else rack
+        else:
+            self.send_response(404)
+            self.end_headers()
+            return
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class FakeScyllaApiServer(ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeScyllaApiHandler)
+        self.api = dict(API)
+        self.requests = []
+
+
+@pytest.fixture(name="fake_api")
+def fixture_fake_api():
+    server = FakeScyllaApiServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class RestDummyNode(NodetoolDummyNode):  # pylint: disable=abstract-method
+    NODETOOL_REST_API = True
+
+    def __init__(self, resp, api_port):
+        super().__init__(resp=resp, myname="node-1")
+        self.remoter = LocalCmdRunner()
+        self.nodetool_calls = 0
+        self.nodetool_rest_client = NodetoolRestClient(node=self, host=f"127.0.0.1:{api_port}")
+
+    def run_nodetool(self, *args, **kwargs):
+        self.nodetool_calls += 1
+        return Result(exited=0, stderr="", stdout=self.resp)
+
+    def is_kubernetes(self):  # pylint: disable=no-self-use
+        return False
+
+
+def test_format_load():
+    assert format_load(23_307_000_000.0) == "21.71 GB"
+    assert format_load(1023) == "1023 bytes"
+    assert format_load(None) == "?"
+
+
+def test_status_with_rest_api(fake_api):
+    node = RestDummyNode(resp="", api_port=fake_api.server_address[1])
+    status = DummyScyllaCluster([node]).get_nodetool_status()
+
+    assert status == {
+        "dc1": {
+            "10.0.0.1": {"state": "UN", "load": "21.71GB", "tokens": "3", "owns": "50.0%",
+                         "host_id": "host-id-10.0.0.1", "rack": "rack1"},
+            "10.0.0.2": {"state": "DN", "load": "?", "tokens": "2", "owns": "33.3%",
+                         "host_id": "host-id-10.0.0.2", "rack": "rack2"},
+        },
+        "dc2": {
+            "10.0.1.1": {"state": "UL", "load": "1023bytes", "tokens": "1", "owns": "16.7%",
+                         "host_id": "host-id-10.0.1.1", "rack": "rack1"},
+        },
+    }
+    assert node.nodetool_calls == 0
+    assert node.list_snapshots() == {"1599414845162": [SnapshotDetails("system_schema", "keyspaces"),
+                                                       SnapshotDetails("keyspace1", "standard1")]}
+
+
+def test_status_without_ownership(fake_api):
+    del fake_api.api["/storage_service/ownership/null"]
+    node = RestDummyNode(resp="", api_port=fake_api.server_address[1])
+    status = DummyScyllaCluster([node]).get_nodetool_status()
+
+    assert {row["owns"] for rows in status.values() for row in rows.values()} == {"?"}
+    assert status["dc1"]["10.0.0.1"]["tokens"] == "3"
+    assert node.nodetool_calls == 0
+    assert not node.nodetool_rest_client.unsupported
+
+
+def test_fallback_to_nodetool(fake_api):
+    del fake_api.api["/storage_service/nodes/moving"]
+    resp = "\n".join(["Datacenter: eastus",
+                      "==================",
+                      "Status=Up/Down",
+                      "|/ State=Normal/Leaving/Joining/Moving",
+                      "--  Address   Load       Tokens       Owns    Host ID                               Rack",
+                      "UN  10.0.59.34    21.71 GB   256          ?       e5bcb094-e4de-43aa-8dc9-b1bf74b3b346  1a"])
+    node = RestDummyNode(resp=resp, api_port=fake_api.server_address[1])
+    cluster = DummyScyllaCluster([node])
+
+    for _ in range(2):
+        assert cluster.get_nodetool_status() == {"eastus": {"10.0.59.34": {
+            "state": "UN", "load": "21.71GB", "tokens": "256", "owns": "?",
+            "host_id": "e5bcb094-e4de-43aa-8dc9-b1bf74b3b346", "rack": "1a"}}}
+    assert node.nodetool_calls == 2
+    assert node.nodetool_rest_client.unsupported == {"status"}
+    assert fake_api.requests.count("/gossiper/endpoint/live/") == 1
+
+    fake_api.shutdown()
+    fake_api.server_close()
+    with pytest.raises(ScyllaApiException):
+        node.nodetool_rest_client.listsnapshots()
+    assert "listsnapshots" not in node.nodetool_rest_client.unsupported
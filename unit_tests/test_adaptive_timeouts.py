@@ -15,13 +15,14 @@ import logging
 import time
 import uuid
 from typing import Any
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 import pytest
 from invoke import Result
 
 from sdcm.remote import RemoteCmdRunnerBase
-from sdcm.utils.adaptive_timeouts.load_info_store import AdaptiveTimeoutStore
+from sdcm.utils.adaptive_timeouts.load_info_store import AdaptiveTimeoutStore, NodeLoadInfoService
 from sdcm.utils.adaptive_timeouts import Operations, adaptive_timeout
 from unit_tests.test_cluster import DummyDbCluster
 
@@ -99,11 +100,14 @@ Counter Cache          : entries 0, size 0 bytes, capacity 0 bytes, 0 hits, 0 re
 Percent Repaired       : 0.0%
 Token                  : (invoke with -T/--tokens to see all 256 tokens)
 """
+    uptime = " 10:00:00 up 1 day,  1:00,  1 user,  load average: 1.20, 2.30, 1.60"
+    load_info_snapshot = "".join(
+        f"{NodeLoadInfoService.section_marker}{name}\n{output}\n" for name, output in (
+            ("scylla_metrics", scylla_metrics), ("node_exporter_metrics", ""), ("nodetool_info", nodetool_info),
+            ("io_properties", io_properties), ("uptime", uptime)))
     fake_remoter.result_map = {
-        r"cat /etc/scylla.d/io_properties.yaml": Result(stdout=io_properties, stderr="", exited=0),
+        rf"echo '{NodeLoadInfoService.section_marker}": Result(stdout=load_info_snapshot, exited=0),
         r"curl -s localhost:9180/metrics": Result(stdout=scylla_metrics, exited=0),
-        r"nodetool info": Result(stdout=nodetool_info, exited=0),
-        r"uptime": Result(stdout=" 10:00:00 up 1 day,  1:00,  1 user,  load average: 1.20, 2.30, 1.60", exited=0),
     }
     return RemoteCmdRunnerBase.create_remoter("test-node-host")
 
@@ -151,3 +155,30 @@ def test_decommission_timeout_is_calculated_and_stored(publish_or_dump, fake_nod
         assert timeout == 7200  # based on data size
     publish_or_dump.assert_not_called()
     assert MemoryAdaptiveTimeoutStore().get(operation=Operations.DECOMMISSION.name, timeout_occurred=False)
+
+
+def test_load_info_is_fetched_once_for_concurrent_operations(fake_node):
+    service = NodeLoadInfoService(fake_node.remoter, fake_node.name, fake_node.scylla_version_detailed)
+    with mock.patch.object(service.remoter, "run", wraps=service.remoter.run) as remoter_run, \
+            ThreadPoolExecutor(max_workers=4) as executor:
+        load_infos = list(executor.map(lambda _: service.as_dict(), range(8)))
+    remoter_run.assert_called_once()
+    assert load_infos[0] == {
+        "node_name": "test-node", "cpu_load_5": 2.3, "shards_count": 3, "read_bandwidth_mb": 1826.058837890625,
+        "write_bandwidth_mb": 110.819091796875, "read_iops": 540317, "write_iops": 300319, "node_data_size_mb": 102400,
+        "scylla_version": "2042.1.12-0.20220620.e23889f17"}
+    assert all(load_info == load_infos[0] for load_info in load_infos)
+    assert service.last_snapshot_duration is not None
+
+
+def test_load_info_of_a_node_not_ready_is_not_cached(fake_node):
+    service = NodeLoadInfoService(fake_node.remoter, fake_node.name, fake_node.scylla_version_detailed)
+    not_ready_output = "".join(f"{NodeLoadInfoService.section_marker}{name}\n" for name in (
+        "scylla_metrics", "node_exporter_metrics", "nodetool_info", "io_properties", "uptime"))
+    with pytest.raises(ValueError, match="scylla_metrics, nodetool_info, io_properties"):
+        service._parse_snapshot(not_ready_output)  # pylint: disable=protected-access
+
+    with mock.patch.object(service, "_get_snapshot", return_value={"io_properties": "just text"}), \
+            pytest.raises(ValueError):
+        service.read_iops  # pylint: disable=pointless-statement
+    assert service.read_iops == 540317
@@ -0,0 +1,78 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2024 ScyllaDB
+
+import shutil
+import subprocess
+
+import pytest
+
+from sdcm.remote import LocalCmdRunner
+from sdcm.utils.backtrace_decoder import BacktraceDecoder
+
+SOURCE = """
+static inline __attribute__((always_inline)) int inner(int x) { return x * 3; }
+__attribute__((noinline)) int outer(int x) { return inner(x) + 1; }
+int main(int argc, char **argv) { return outer(argc); }
+"""
+
+pytestmark = pytest.mark.skipif(not (shutil.which("gcc") and shutil.which("addr2line") and shutil.which("nm")),
+                                reason="gcc and binutils are required to build the debug file")
+
+
+class CountingRunner(LocalCmdRunner):
+    def __init__(self):
+        super().__init__()
+        self.commands = []
+
+    def run(self, cmd, *args, **kwargs):  # pylint: disable=arguments-differ
+        self.commands.append(cmd)
+        return super().run(cmd, *args, **kwargs)
+
+
+@pytest.fixture(name="debug_file")
+def fixture_debug_file(tmp_path):
+    source_file = tmp_path / "backtrace.c"
+    source_file.write_text(SOURCE)
+    debug_file = tmp_path / "backtrace"
+    subprocess.run(["gcc", "-g", "-O2", "-o", str(debug_file), str(source_file)], check=True)
+    return str(debug_file)
+
+
+def get_symbol_address(debug_file, symbol):
+    for line in subprocess.run(["nm", debug_file], check=True, capture_output=True, text=True).stdout.splitlines():
+        if line.endswith(f" {symbol}"):
+            return int(line.split()[0], 16)
+    raise AssertionError(f"{symbol} not found")
+
+
+def test_decode_is_same_as_addr2line_per_backtrace(debug_file):
+    outer, main = get_symbol_address(debug_file, "outer"), get_symbol_address(debug_file, "main")
+    raw_backtraces = [
+        "\n".join(hex(outer + offset) for offset in range(0, 8, 2)),
+        f"{hex(main)}\n{hex(outer)}\n0x0",
+        f"{hex(outer)} {hex(main)}",
+    ]
+    runner = CountingRunner()
+    decoder = BacktraceDecoder(remoter=runner)
+
+    decoded = decoder.decode(debug_file, raw_backtraces)
+
+    assert len(runner.commands) == 1
+    for raw_backtrace, backtrace in zip(raw_backtraces, decoded):
+        expected = LocalCmdRunner().run(f"addr2line -Cpife {debug_file} {' '.join(raw_backtrace.split())}").stdout
+        assert backtrace == expected
+    assert "outer at" in decoded[1]
+
+    # all the addresses are cached already
+    assert decoder.decode(debug_file, raw_backtraces[1:]) == decoded[1:]
+    assert len(runner.commands) == 1
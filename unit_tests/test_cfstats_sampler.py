@@ -0,0 +1,112 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2024 ScyllaDB
+
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from sdcm.utils.cfstats_sampler import CfstatsSampler, parse_cfstats_tables
+
+CFSTATS_OUTPUT = """Total number of tables: 4
+----------------
+Keyspace : keyspace1
+\tRead Count: 0
+\t\tTable: standard1
+\t\tSpace used (live): {space}
+\t\tSpace used (total): {space}
+\t\tSSTable Compression Ratio: 0.5
+\t\tSSTables in each level: [1, 0, 0, 0, 0, 0, 0, 0, 0]
+
+\t\tTable: counter1
+\t\tSpace used (total): 1000
+
+----------------
+Keyspace : ks2
+\t\tTable: table1
+\t\tSpace used (total): 500
+
+----------------
+Keyspace : system
+\t\tTable: local
+\t\tSpace used (total): 100000
+
+----------------
+"""
+
+
+class FakeNode:  # pylint: disable=too-few-public-methods
+    def __init__(self, space_per_sample):
+        self.space = 0
+        self.space_per_sample = space_per_sample
+        self.nodetool_calls = []
+
+    def run_nodetool(self, sub_cmd, **kwargs):  # pylint: disable=unused-argument
+        self.nodetool_calls.append(sub_cmd)
+        if sub_cmd == "cfstats":
+            self.space += self.space_per_sample
+        return SimpleNamespace(stdout=CFSTATS_OUTPUT.format(space=self.space))
+
+
+@pytest.fixture(name="clock")
+def fixture_clock(monkeypatch):
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr("sdcm.utils.cfstats_sampler.time.monotonic", lambda: clock.now)
+    return clock
+
+
+def test_parse_cfstats_tables():
+    tables = parse_cfstats_tables(CFSTATS_OUTPUT.format(space=123))
+    assert list(tables) == ["keyspace1.standard1", "keyspace1.counter1", "ks2.table1", "system.local"]
+    assert tables["keyspace1.standard1"] == {"Space used (live)": 123, "Space used (total)": 123,
+                                             "SSTable Compression Ratio": 0.5, "SSTables in each level": "[1,"}
+
+
+def test_sample_is_shared_and_totals_of_keyspaces(clock):
+    node = FakeNode(space_per_sample=1000)
+    sampler = CfstatsSampler(node, max_age=10)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        samples = list(executor.map(lambda _: sampler.sample(), range(8)))
+    assert all(sample is samples[0] for sample in samples)
+    assert node.nodetool_calls == ["flush", "cfstats"]
+
+    sample = samples[0]
+    assert sample.total("Space used (total)") == 2500
+    assert sample.total("Space used (total)", ["keyspace1"]) == 2000
+    assert sample.total("Space used (total)", ["keyspace1.standard1", "ks2"]) == 1500
+    assert sample.total("Space used (total)", ["system"]) == 100000
+
+    clock.now += 10
+    assert sampler.sample().total("Space used (total)", ["keyspace1.standard1"]) == 2000
+    assert node.nodetool_calls.count("cfstats") == 2
+
+
+def test_time_to_threshold(clock):
+    key = "Space used (total)"
+    sampler = CfstatsSampler(FakeNode(space_per_sample=1000), max_age=10, history_size=3)
+    sampler.sample()
+    assert sampler.time_to_threshold(key, 10000, ["keyspace1.standard1"]) is None
+    assert sampler.next_poll_interval(key, 10000, ["keyspace1.standard1"]) == 10
+
+    for _ in range(3):
+        clock.now += 10
+        sampler.sample()
+    # 1000 bytes per 10 seconds
+    assert sampler.time_to_threshold(key, 10000, ["keyspace1.standard1"]) == pytest.approx(60)
+    assert sampler.next_poll_interval(key, 10000, ["keyspace1.standard1"]) == pytest.approx(30)
+    assert sampler.next_poll_interval(key, 100000, ["keyspace1.standard1"]) == 60
+    assert sampler.time_to_threshold(key, 4000, ["keyspace1.standard1"]) == 0
+    # doesn't grow
+    assert sampler.time_to_threshold(key, 1000, ["ks2"]) is None
+    assert sampler.next_poll_interval(key, 1000, ["ks2"]) == 60
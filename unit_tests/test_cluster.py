@@ -21,6 +21,8 @@ import os.path
 import tempfile
 import unittest
 from datetime import datetime
+from contextlib import nullcontext
+from collections import namedtuple
 from functools import cached_property
 from typing import List
 from weakref import proxy as weakproxy
@@ -42,6 +44,7 @@ from sdcm.utils.distro import Distro
 from unit_tests.dummy_remote import DummyRemote
 from unit_tests.lib.events_utils import EventsUtilsMixin
 from unit_tests.test_utils_common import DummyNode
+from unit_tests.lib.fake_cql import FakeResponseFuture
 
 
 class DummyDbCluster(BaseCluster, BaseScyllaCluster):  # pylint: disable=abstract-method
@@ -429,6 +432,7 @@ class TestBaseMonitorSet(unittest.TestCase):
 
 
 class NodetoolDummyNode(BaseNode):  # pylint: disable=abstract-method
+    NODETOOL_REST_API = False
 
     def __init__(self, resp, myregion=None, myname=None, myrack=None):  # pylint: disable=super-init-not-called
         self.resp = resp
@@ -824,3 +828,82 @@ class TestNodetool(unittest.TestCase):
         min_token, max_token = keyspace_min_max_tokens(node=node, keyspace="")
         assert min_token == -9193109213506951143
         assert max_token == 9202125676696964746
+
+
+CFSTATS_OUTPUT = """Total number of tables: 3
+----------------
+Keyspace : keyspace1
+\tRead Count: 0
+\tWrite Count: 1000
+\t\tTable: standard1
+\t\tSSTable count: 1
+\t\tNumber of partitions (estimate): 1000
+\t\tDropped Mutations: 0
+
+\t\tTable: empty_table
+\t\tSSTable count: 0
+\t\tNumber of partitions (estimate): 0
+
+\t\tTable (index): standard1_idx
+\t\tNumber of partitions (estimate): 12
+
+----------------
+Keyspace : ks2
+\t\tTable: counters
+\t\tNumber of partitions (estimate): 7
+
+----------------
+"""
+
+
+def test_parse_cfstats_partitions():
+    assert BaseNode._parse_cfstats_partitions(CFSTATS_OUTPUT) == {  # pylint: disable=protected-access
+        "keyspace1.standard1": 1000, "keyspace1.empty_table": 0, "keyspace1.standard1_idx": 12, "ks2.counters": 7}
+
+
+def test_get_any_ks_cf_list_checks_empty_tables_in_single_cfstats_call():
+    row = namedtuple("Row", ["keyspace_name", "table_name", "type"])
+    rows = [row("keyspace1", "standard1", "blob"), row("keyspace1", "empty_table", "blob"),
+            row("ks2", "counters", "counter"), row("ks3", "new_table", "int")]
+
+    class Session:  # pylint: disable=too-few-public-methods
+        schema_version = "00703362-03ed-3b41-afcb-ed34c1d1586c"
+
+        def execute(self, query):
+            assert query == "SELECT schema_version FROM system.local"
+            return type("Result", (), {"one": lambda _: self})()
+
+        def execute_async(self, query):  # pylint: disable=no-self-use
+            assert query.startswith("SELECT keyspace_name, table_name, type FROM system_schema.columns")
+            return FakeResponseFuture([rows])
+
+    class Node(NodetoolDummyNode):  # pylint: disable=abstract-method
+        nodetool_calls = []
+
+        def run_nodetool(self, *args, **kwargs):
+            self.nodetool_calls.append(kwargs)
+            return super().run_nodetool(*args, **kwargs)
+
+    session = Session()
+    node = Node(resp=CFSTATS_OUTPUT, myname="node-1")
+    cluster = DummyScyllaCluster([node])
+    cluster.cql_connection_patient = lambda *args, **kwargs: nullcontext(session)
+
+    for _ in range(2):
+        assert sorted(cluster.get_non_system_ks_cf_list(node)) == ["keyspace1.standard1", "ks2.counters"]
+    assert [call["args"] for call in node.nodetool_calls] == ["keyspace1 ks2 ks3"]
+
+    session.schema_version = "c6b7a7b6-18b6-3f2c-9b0a-8b1e3b1d7c0f"
+    cluster.get_non_system_ks_cf_list(node)
+    assert len(node.nodetool_calls) == 2
+
+
+def test_tables_partitions_estimate_of_no_keyspaces_does_not_run_cfstats():
+    class Node(NodetoolDummyNode):  # pylint: disable=abstract-method
+        def run_nodetool(self, *args, **kwargs):
+            raise AssertionError("nodetool shouldn't run without keyspaces")
+
+    node = Node(resp=CFSTATS_OUTPUT, myname="node-1")
+    cluster = DummyScyllaCluster([node])
+    assert cluster._get_tables_partitions_estimate(  # pylint: disable=protected-access
+        db_node=node, cql_session=None, keyspaces=set()) == {}
@@ -12,10 +12,13 @@
 # Copyright (c) 2020 ScyllaDB
 
 import os
+import time
 import logging
 import itertools
 import unittest
 from collections import namedtuple
+from unittest.mock import patch
+
 import pytest
 from sdcm import sct_config
 from sdcm.utils import loader_utils
@@ -998,6 +1001,71 @@ class ConfigurationTests(unittest.TestCase):  # pylint: disable=too-many-public-
         conf = sct_config.SCTConfiguration()
         conf.verify_configuration()
 
+    def test_35_env_index_nested_and_plain_values(self):
+        os.environ['SCT_STRESS_IMAGE'] = '{"ycsb": "scylladb/something_else"}'
+        os.environ['SCT_STRESS_IMAGE.scylla-bench'] = "scylladb/something"
+        os.environ['SCT_STRESS_READ_CMD.0'] = "cassandra_stress"
+        os.environ['NOT_SCT_STRESS_IMAGE'] = "ignored"
+        try:
+            index = sct_config.index_environment_variables(['SCT_STRESS_IMAGE', 'SCT_STRESS_READ_CMD'])
+        finally:
+            del os.environ['NOT_SCT_STRESS_IMAGE']
+
+        self.assertEqual(index['SCT_STRESS_IMAGE']['value'], '{"ycsb": "scylladb/something_else"}')
+        self.assertEqual(index['SCT_STRESS_IMAGE']['nested'], [('scylla-bench', 'scylladb/something')])
+        self.assertEqual(index['SCT_STRESS_READ_CMD'], {'value': None, 'nested': [('0', 'cassandra_stress')]})
+        self.assertNotIn('NOT_SCT_STRESS_IMAGE', index)
+
+    @patch.dict(os.environ, {'SSH_TRANSPORT': 'libssh2'})
+    def test_36_env_without_sct_prefix(self):
+        os.environ['SCT_CLUSTER_BACKEND'] = 'aws'
+        os.environ['SCT_AMI_ID_DB_SCYLLA'] = 'ami-dummy'
+
+        conf = sct_config.SCTConfiguration()
+        self.assertEqual(conf.get('ssh_transport'), 'libssh2')
+
+    def test_37_default_layers_are_parsed_once(self):
+        os.environ['SCT_CLUSTER_BACKEND'] = 'aws'
+        os.environ['SCT_AMI_ID_DB_SCYLLA'] = 'ami-dummy'
+        sct_config.clear_default_layers_cache()
+
+        with patch.object(sct_config.anyconfig, 'load', wraps=sct_config.anyconfig.load) as load_mock:
+            for _ in range(5):
+                conf = sct_config.SCTConfiguration()
+                # callers mutating the config must not leak into the cached defaults
+                conf['stress_image']['ycsb'] = 'mutated'
+            default_stress_image = conf.get_default_value('stress_image')
+
+        defaults_loads = [tuple(call.args[0]) for call in load_mock.call_args_list
+                          if any('test_default.yaml' in path for path in call.args[0])]
+        # one load of the defaults with the backend ones, and one of get_default_value() without them
+        self.assertEqual(len(defaults_loads), 2)
+        self.assertEqual(len(set(defaults_loads)), 2)
+        self.assertNotEqual(default_stress_image['ycsb'], 'mutated')
+
+    def test_38_construction_micro_benchmark(self):
+        os.environ['SCT_CLUSTER_BACKEND'] = 'aws'
+        os.environ['SCT_AMI_ID_DB_SCYLLA'] = 'ami-dummy'
+        iterations = 20
+
+        def construct(clear_cache):
+            start = time.perf_counter()
+            with patch.object(sct_config.anyconfig, 'load', wraps=sct_config.anyconfig.load) as load_mock:
+                for _ in range(iterations):
+                    if clear_cache:
+                        sct_config.clear_default_layers_cache()
+                    sct_config.SCTConfiguration()
+            defaults_loads = [call for call in load_mock.call_args_list
+                              if any('test_default.yaml' in path for path in call.args[0])]
+            return time.perf_counter() - start, len(defaults_loads)
+
+        cold, cold_loads = construct(clear_cache=True)
+        warm, warm_loads = construct(clear_cache=False)
+        logging.warning("SCTConfiguration x%d: cold defaults %.3fs, cached defaults %.3fs (x%.1f faster)",
+                        iterations, cold, warm, cold / warm)
+        self.assertEqual(cold_loads, iterations)
+        self.assertEqual(warm_loads, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,20 @@
 import unittest
 import os
+import re
+import gzip
 import time
+import shutil
+import getpass
 import tempfile
 from abc import abstractmethod
+from pathlib import Path
+from typing import List, Optional
 
 from sdcm.cluster import BaseNode
-from sdcm.coredump import CoredumpExportSystemdThread, CoreDumpInfo, CoredumpExportFileThread, CoredumpThreadBase
+from sdcm.coredump import (CoredumpExportSystemdThread, CoreDumpInfo, CoredumpExportFileThread, CoredumpThreadBase,
+                           CoredumpUploader)
+from sdcm.remote import LOCALRUNNER
+from sdcm.remote.remote_base import Result
 from unit_tests.lib.data_pickle import Pickler
 from unit_tests.lib.mock_remoter import MockRemoter
 
@@ -198,3 +207,96 @@ class CoredumpExportFileTest(CoredumpExportTestBase):
 
     def test_fail_get_list_test(self):
         self._run_coredump_with_fake_remoter('fail_get_list_test')
+
+
+class LocalDirectoryUploader(CoredumpUploader):
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def upload_cmd(self, source: str, object_name: str, rate_limit: Optional[str] = None) -> str:
+        target = os.path.join(self.directory, object_name)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        return f"cat '{source}' > '{target}'"
+
+
+class LocalRemoter:
+    user = getpass.getuser()
+
+    def __init__(self):
+        self.executed = []
+
+    def run(self, cmd: str, verbose: bool = True, **_) -> Result:  # pylint: disable=unused-argument
+        self.executed.append(cmd)
+        return LOCALRUNNER.run(cmd, verbose=False)
+
+    sudo = run
+
+
+class CoredumpUploadTestThread(CoredumpThreadBase):
+    def get_list_of_cores(self) -> Optional[List[CoreDumpInfo]]:
+        return []
+
+    def update_coredump_info_with_more_information(self, core_info: CoreDumpInfo):
+        pass
+
+    def publish_event(self, core_info: CoreDumpInfo):
+        pass
+
+
+class CoredumpStreamingUploadTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.remoter = LocalRemoter()
+        self.coredump_thread = CoredumpUploadTestThread(
+            FakeNode(self.remoter, os.path.join(self.temp_dir, 'logdir')), max_core_upload_limit=5)
+        self.coredump_thread.__dict__['_is_pigz_installed'] = True
+        self.coredump_thread.compress_cmd = 'gzip --fast --stdout'
+        self.coredump_thread.upload_chunk_size_mb = 1
+        self.coredump_thread.uploader = LocalDirectoryUploader(os.path.join(self.temp_dir, 'bucket'))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _create_core(self, name: str, size: int) -> str:
+        corefile = os.path.join(self.temp_dir, name)
+        with open(corefile, 'wb') as core:
+            core.write(os.urandom(size // 2) + bytes(size - size // 2))
+        return corefile
+
+    def _downloaded_core(self, core_info: CoreDumpInfo) -> bytes:
+        object_dir = os.path.join(self.temp_dir, 'bucket', os.path.basename(core_info.corefile))
+        compressed = b''.join(Path(object_dir, name).read_bytes() for name in sorted(os.listdir(object_dir)))
+        return gzip.decompress(compressed)
+
+    def test_cores_are_uploaded_in_parts_without_intermediate_files(self):
+        cores = [CoreDumpInfo(pid=str(pid), node=None, corefile=self._create_core(f'core.{pid}', size))
+                 for pid, size in ((1, 3 * 1024 * 1024 + 100), (2, 1000))]
+        self.coredump_thread.in_progress.extend(cores)
+        self.coredump_thread.process_coredumps()
+
+        self.assertEqual(cores, self.coredump_thread.uploaded)
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ['bucket', 'core.1', 'core.2', 'logdir'])
+        for core_info in cores:
+            self.assertEqual(Path(core_info.corefile).read_bytes(), self._downloaded_core(core_info))
+        self.assertIn('core.1.gz.part-0003', os.listdir(os.path.join(self.temp_dir, 'bucket', 'core.1')))
+        self.assertIn('cat core.1.gz.part-* > core.1.gz\ngunzip core.1.gz', cores[0].download_instructions)
+        self.assertTrue(cores[1].download_instructions.endswith('core.2/core.2.gz .\ngunzip core.2.gz'))
+
+    def test_failed_upload_is_resumed_from_the_failed_part(self):
+        core_info = CoreDumpInfo(pid='1', node=None, corefile=self._create_core('core.1', 3 * 1024 * 1024))
+        uploader = self.coredump_thread.uploader
+        upload_cmd = uploader.upload_cmd
+        uploader.upload_cmd = lambda source, object_name, rate_limit=None: (
+            'false' if object_name.endswith('part-0001') else upload_cmd(source, object_name, rate_limit))
+        self.coredump_thread.in_progress.append(core_info)
+        self.coredump_thread.process_coredumps()
+        self.assertEqual([], self.coredump_thread.uploaded)
+        self.assertEqual('failed to upload core', core_info.download_instructions)
+
+        uploader.upload_cmd = upload_cmd
+        self.remoter.executed.clear()
+        self.coredump_thread.process_coredumps()
+        self.assertEqual([core_info], self.coredump_thread.uploaded)
+        self.assertEqual(Path(core_info.corefile).read_bytes(), self._downloaded_core(core_info))
+        uploads = [cmd for cmd in self.remoter.executed if cmd.startswith('bash')]
+        self.assertEqual(['skip=1 ', 'skip=2 '], [re.search(r'skip=\d+ ', cmd).group() for cmd in uploads])
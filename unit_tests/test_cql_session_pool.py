@@ -0,0 +1,168 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2024 ScyllaDB
+
+import logging
+from unittest.mock import MagicMock, patch
+
+import pytest
+from cassandra.cluster import NoHostAvailable  # pylint: disable=no-name-in-module
+
+from sdcm.cluster import BaseCluster
+from sdcm.utils.cql_session_pool import CQLSessionPool
+
+
+class FakeSession:  # pylint: disable=too-few-public-methods
+    def __init__(self, keyspace=None):
+        self.keyspace = keyspace
+        self.is_shutdown = False
+        self.default_timeout = 60.0
+        self.default_fetch_size = 5000
+        self.probe_error = None
+        self.queries = []
+
+    def execute(self, query, *args, **kwargs):  # pylint: disable=unused-argument
+        if self.probe_error:
+            raise self.probe_error
+        self.queries.append(query)
+
+    def execute_async(self, query, *args, **kwargs):  # pylint: disable=unused-argument
+        self.queries.append(query)
+
+    def set_keyspace(self, keyspace):
+        self.keyspace = keyspace
+
+
+class FakeDriverCluster:  # pylint: disable=too-few-public-methods
+    def __init__(self, *args, **kwargs):  # pylint: disable=unused-argument
+        self.is_shutdown = False
+        self.session = FakeSession()
+
+    def connect(self):
+        return self.session
+
+    def shutdown(self):
+        self.is_shutdown = self.session.is_shutdown = True
+
+
+def connector(connected, keyspace=None):
+    def connect():
+        cluster = FakeDriverCluster()
+        cluster.session.keyspace = keyspace
+        connected.append(cluster)
+        return cluster.session, cluster
+    return connect
+
+
+def test_sessions_are_reused_with_restored_defaults():
+    pool = CQLSessionPool()
+    connected = []
+    with pool.session(key="k", connect=connector(connected), nodes=["node-1"]) as session:
+        session.default_timeout = 300
+        session.execute("SELECT * FROM ks.cf")
+    with pool.session(key="k", connect=connector(connected), nodes=["node-1"]) as same_session:
+        assert same_session is session
+        assert same_session.default_timeout == 60.0
+        # leases are exclusive, so another user of the same key gets a new session
+        with pool.session(key="k", connect=connector(connected), nodes=["node-1"]) as other_session:
+            assert other_session is not session
+    with pool.session(key="other", connect=connector(connected), nodes=["node-1"]):
+        pass
+
+    assert len(connected) == 3
+    assert not any(cluster.is_shutdown for cluster in connected)
+    assert session.queries == ["SELECT * FROM ks.cf"]
+    assert pool.stats() == {"hits": 1, "misses": 3, "connect_time": pytest.approx(pool.connect_time),
+                            "idle": 3, "leased": 0}
+    pool.close()
+    assert all(cluster.is_shutdown for cluster in connected)
+
+
+def test_unhealthy_sessions_are_discarded():
+    pool = CQLSessionPool(probe_interval=0)
+    connected = []
+    with pool.session(key="k", connect=connector(connected)) as session:
+        pass
+    session.probe_error = NoHostAvailable("Unable to connect", {})
+    with pool.session(key="k", connect=connector(connected)) as session:
+        pass
+    assert connected[0].is_shutdown
+    assert session is connected[1].session
+
+    with pool.session(key="k", connect=connector(connected)):
+        with pytest.raises(NoHostAvailable), pool.session(key="k", connect=connector(connected)):
+            raise NoHostAvailable("Unable to connect", {})
+    assert connected[2].is_shutdown
+
+    with pool.session(key="ks", connect=connector(connected, keyspace="ks1"), keyspace="ks1") as session:
+        session.set_keyspace("ks2")
+    assert connected[3].is_shutdown
+    assert pool.stats()["hits"] == 1
+
+
+def test_invalidate_node():
+    pool = CQLSessionPool()
+    connected = []
+    with pool.session(key="node-1", connect=connector(connected), nodes=["node-1"]):
+        pass
+    with pool.session(key="all", connect=connector(connected), nodes=["node-1", "node-2"]):
+        pool.invalidate("node-2")
+        assert not connected[0].is_shutdown
+        assert not connected[1].is_shutdown
+    assert connected[1].is_shutdown
+
+    with pool.session(key="all", connect=connector(connected), nodes=["node-1", "node-2"]):
+        pass
+    pool.invalidate("node-1")
+    assert all(cluster.is_shutdown for cluster in connected)
+    assert pool.stats()["idle"] == 0
+
+
+class Node:  # pylint: disable=too-few-public-methods
+    CQL_PORT = 9042
+    node_type = "db"
+
+    def __init__(self, name, parent_cluster):
+        self.name = name
+        self.cql_address = f"10.0.0.{name[-1]}"
+        self.parent_cluster = parent_cluster
+
+
+class Cluster(BaseCluster):  # pylint: disable=abstract-method
+    def __init__(self):  # pylint: disable=super-init-not-called
+        self.connection_bundle_file = None
+        self.params = {"authenticator_user": "cassandra", "authenticator_password": "cassandra"}
+        self.added_password_suffix = False
+        self.log = logging.getLogger("cluster")
+        self.nodes = [Node("node-1", self), Node("node-2", self)]
+
+
+@patch("sdcm.cluster.ClusterDriver", side_effect=FakeDriverCluster)
+def test_cql_connections_are_pooled(cluster_driver: MagicMock):
+    cluster = Cluster()
+    for _ in range(3):
+        with cluster.cql_connection_patient(cluster.nodes[0]) as session:
+            session.execute("SELECT * FROM system.local")
+    with cluster.cql_connection_exclusive(cluster.nodes[1]):
+        pass
+    with cluster.cql_connection_exclusive(cluster.nodes[1], user="user", password="password"):
+        pass
+    assert cluster_driver.call_count == 3
+    assert cluster_driver.call_args_list[0].kwargs["contact_points"] == ["10.0.0.1", "10.0.0.2"]
+    assert cluster_driver.call_args_list[1].kwargs["contact_points"] == ["10.0.0.2"]
+    assert cluster.cql_session_pool.stats()["hits"] == 2
+    assert session.execute.__name__ == "execute"
+
+    cluster.nodes.pop()
+    with cluster.cql_connection(cluster.nodes[0]):
+        pass
+    assert cluster_driver.call_count == 4
@@ -0,0 +1,217 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2024 ScyllaDB
+
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import elasticsearch
+
+from sdcm.es import ESBulkWriter, _deep_merge, get_shared_es_bulk_writer, stop_es_bulk_writers
+
+
+class FakeESHandler(BaseHTTPRequestHandler):
+    server: "FakeESServer"
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+    def _reply(self, body: dict, status: int = 200):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("X-Elastic-Product", "Elasticsearch")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        if self.path.split("?")[0] == "/":
+            self._reply({"version": {"number": "7.15.0", "build_flavor": "default"},
+                         "tagline": "You Know, for Search"})
+            return
+        self._reply({}, status=404)
+
+    def do_PUT(self):  # pylint: disable=invalid-name
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.created_indices.append(self.path.split("?")[0].strip("/"))
+        self._reply({"acknowledged": True})
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        lines = self.rfile.read(int(self.headers["Content-Length"])).decode().splitlines()
+        self.server.bulk_requests += 1
+        if self.server.fail_bulk:
+            self._reply({"error": "internal failure"}, status=500)
+            return
+        items = []
+        for action_line, doc_line in zip(lines[::2], lines[1::2]):
+            meta = json.loads(action_line)["update"]
+            doc = json.loads(doc_line)
+            key = (meta["_index"], meta["_id"])
+            if key not in self.server.docs and not doc["doc_as_upsert"]:
+                items.append({"update": {"_id": meta["_id"], "status": 404,
+                                         "error": {"type": "document_missing_exception"}}})
+                continue
+            _deep_merge(self.server.docs.setdefault(key, {}), doc["doc"])
+            items.append({"update": {"_id": meta["_id"], "status": 200}})
+        self._reply({"took": 1, "errors": any("error" in item["update"] for item in items), "items": items})
+
+
+class FakeESServer(ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeESHandler)
+        self.docs = {}
+        self.created_indices = []
+        self.bulk_requests = 0
+        self.fail_bulk = False
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+@pytest.fixture(name="fake_es")
+def fixture_fake_es():
+    server = FakeESServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def get_free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_partial_updates_are_coalesced_into_one_bulk_request(fake_es):
+    writer = ESBulkWriter(es=elasticsearch.Elasticsearch(hosts=[fake_es.url]), flush_interval=3600)
+    stats = {"test_details": {"start_time": 1}, "results": {}}
+    writer.create_doc(index="test_index", doc_type="test_stats", doc_id="test-1", body=stats)
+    stats["results"]["op rate"] = 100  # the writer keeps a snapshot, not the live dict
+    writer.update_doc(index="test_index", doc_type="test_stats", doc_id="test-1",
+                      body={"test_details": {"job_name": "job"}})
+    writer.update_doc(index="test_index", doc_type="test_stats", doc_id="test-1", body={"results": stats["results"]})
+    writer.create_doc(index="other_index", doc_type=None, doc_id="test-2", body={"a": 1})
+    writer.stop()
+
+    assert fake_es.bulk_requests == 1
+    assert sorted(fake_es.created_indices) == ["other_index", "test_index"]
+    assert fake_es.docs[("test_index", "test-1")] == {
+        "test_details": {"start_time": 1, "job_name": "job"}, "results": {"op rate": 100}}
+    assert fake_es.docs[("other_index", "test-2")] == {"a": 1}
+
+
+def test_flush_is_triggered_by_size(fake_es):
+    writer = ESBulkWriter(es=elasticsearch.Elasticsearch(hosts=[fake_es.url]), flush_size=2, flush_interval=3600)
+    writer.create_doc(index="test_index", doc_type=None, doc_id="1", body={"a": 1})
+    writer.create_doc(index="test_index", doc_type=None, doc_id="2", body={"a": 2})
+    for _ in range(50):
+        if fake_es.bulk_requests:
+            break
+        threading.Event().wait(0.1)
+    assert len(fake_es.docs) == 2
+    writer.stop()
+
+
+def test_item_errors_are_reported(fake_es):
+    errors = []
+    writer = ESBulkWriter(es=elasticsearch.Elasticsearch(hosts=[fake_es.url]), flush_interval=3600,
+                          on_error=errors.append)
+    writer.update_doc(index="test_index", doc_type=None, doc_id="missing", body={"a": 1})
+    writer.stop()
+    assert len(errors) == 1
+    assert "document_missing_exception" in errors[0]
+
+
+def test_spill_to_journal_and_replay(fake_es, tmp_path):
+    journal_path = tmp_path / "journal.jsonl"
+    unreachable_es = elasticsearch.Elasticsearch(hosts=[f"http://127.0.0.1:{get_free_port()}"], max_retries=0)
+    writer = ESBulkWriter(es=unreachable_es, flush_interval=3600, journal_path=str(journal_path))
+    writer.create_doc(index="test_index", doc_type=None, doc_id="1", body={"a": 1, "nested": {"b": 1}})
+    writer.flush()
+    assert journal_path.exists()
+    assert writer.pending_count == 0
+
+    writer.update_doc(index="test_index", doc_type=None, doc_id="1", body={"nested": {"c": 2}})
+    writer._es = elasticsearch.Elasticsearch(hosts=[fake_es.url])  # pylint: disable=protected-access
+    writer.stop()
+
+    assert not journal_path.exists()
+    assert fake_es.docs == {("test_index", "1"): {"a": 1, "nested": {"b": 1, "c": 2}}}
+
+
+def test_shared_writer_per_journal_path(fake_es, tmp_path):
+    es = elasticsearch.Elasticsearch(hosts=[fake_es.url])
+    writer = get_shared_es_bulk_writer(es=es, journal_path=str(tmp_path / "journal.jsonl"))
+    assert get_shared_es_bulk_writer(es=es, journal_path=str(tmp_path / "journal.jsonl")) is writer
+    assert get_shared_es_bulk_writer(es=es) is not writer
+    stop_es_bulk_writers()
+    assert get_shared_es_bulk_writer(es=es, journal_path=str(tmp_path / "journal.jsonl")) is not writer
+    stop_es_bulk_writers()
+
+
+def test_stop_at_exit_waits_for_a_running_background_flush(fake_es):
+    writer = ESBulkWriter(es=elasticsearch.Elasticsearch(hosts=[fake_es.url]), flush_interval=3600)
+    sending, release = threading.Event(), threading.Event()
+    original_send = writer._send  # pylint: disable=protected-access
+
+    def slow_send(docs):
+        sending.set()
+        release.wait(timeout=10)
+        original_send(docs)
+
+    writer._send = slow_send  # pylint: disable=protected-access
+    writer.create_doc(index="test_index", doc_type=None, doc_id="1", body={"status": "running"})
+    writer._wakeup.set()  # pylint: disable=protected-access
+    assert sending.wait(timeout=10)
+    writer.update_doc(index="test_index", doc_type=None, doc_id="1", body={"status": "passed"})
+    threading.Timer(0.5, release.set).start()
+    stop_es_bulk_writers()
+
+    assert fake_es.docs[("test_index", "1")] == {"status": "passed"}
+    assert writer.pending_count == 0
+
+
+def test_errors_are_reported_to_the_callback_of_the_document(fake_es):
+    writer_errors, first_errors, second_errors = [], [], []
+    writer = ESBulkWriter(es=elasticsearch.Elasticsearch(hosts=[fake_es.url]), flush_interval=3600,
+                          on_error=writer_errors.append)
+    writer.update_doc(index="test_index", doc_type=None, doc_id="first", body={"a": 1}, on_error=first_errors.append)
+    writer.create_doc(index="test_index", doc_type=None, doc_id="ok", body={"a": 1}, on_error=first_errors.append)
+    writer.update_doc(index="test_index", doc_type=None, doc_id="second", body={"a": 1}, on_error=second_errors.append)
+    writer.update_doc(index="test_index", doc_type=None, doc_id="third", body={"a": 1})
+    writer.stop()
+    assert len(first_errors) == 1 and "first" in first_errors[0]
+    assert len(second_errors) == 1 and "second" in second_errors[0]
+    assert len(writer_errors) == 1 and "third" in writer_errors[0]
+
+
+def test_failing_documents_are_dropped_after_max_send_attempts(fake_es):
+    errors = []
+    fake_es.fail_bulk = True
+    writer = ESBulkWriter(es=elasticsearch.Elasticsearch(hosts=[fake_es.url], max_retries=0), flush_interval=3600,
+                          max_send_attempts=2)
+    writer.create_doc(index="test_index", doc_type=None, doc_id="1", body={"a": 1}, on_error=errors.append)
+    with pytest.raises(elasticsearch.TransportError):
+        writer.flush()
+    assert writer.pending_count == 1 and not errors
+    writer.flush()
+    assert writer.pending_count == 0
+    assert len(errors) == 1 and "dropping it after 2 attempts" in errors[0]
+    writer.stop()
+    assert fake_es.bulk_requests == 2
@@ -0,0 +1,53 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2024 ScyllaDB
+
+from sdcm.fill_db_data import FillDatabaseData
+
+
+def get_items():
+    return [(test_num, item.get('name', f'Test #{test_num}'), item)
+            for test_num, item in enumerate(FillDatabaseData.all_verification_items)]
+
+
+def test_item_tables():
+    items = {name.split(":")[0]: item for _, name, item in get_items()}
+    assert FillDatabaseData.get_item_tables(items["no_range_ghost_test"]) == {
+        "no_range_ghost_test", "ks_no_range_ghost_test.users"}
+    assert "static_cf_test" in FillDatabaseData.get_item_tables(items["static_cf_test"])
+
+
+def test_exclusive_items_run_alone_between_phases():
+    items = get_items()
+    phases = FillDatabaseData.split_verification_items_to_phases(items)
+
+    assert [item for _, phase_items in phases for item in phase_items] == items
+    exclusive_names = [phase_items[0][1] for exclusive, phase_items in phases if exclusive]
+    assert "no_range_ghost_test" in exclusive_names
+    for exclusive, phase_items in phases:
+        assert not exclusive or len(phase_items) == 1
+        assert exclusive == FillDatabaseData.is_exclusive_item(phase_items[0][2])
+
+
+def test_groups_do_not_share_tables_and_keep_items_order():
+    items = [item for exclusive, phase_items in FillDatabaseData.split_verification_items_to_phases(get_items())
+             if not exclusive for item in phase_items]
+    groups = FillDatabaseData.group_verification_items(items)
+
+    assert sorted(item for group in groups for item in group) == sorted(items)
+    assert len(groups) > len(items) / 2, "most of the items should be independent"
+    seen_tables = set()
+    for group in groups:
+        assert [test_num for test_num, _, _ in group] == sorted(test_num for test_num, _, _ in group)
+        group_tables = set().union(*(FillDatabaseData.get_item_tables(item) for _, _, item in group))
+        assert not group_tables & seen_tables
+        seen_tables |= group_tables
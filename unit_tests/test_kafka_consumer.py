@@ -0,0 +1,119 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2024 ScyllaDB
+
+import json
+import base64
+from types import SimpleNamespace
+from collections import namedtuple
+
+import pytest
+
+from sdcm.kafka.kafka_consumer import KafkaCDCReaderThread, CompactKeySet, extract_cdc_key
+
+ConsumerRecord = namedtuple("ConsumerRecord", ["offset", "value"])
+
+
+def cdc_message(key: str | None, key_column: str = "key") -> bytes:
+    after = None if key is None else {key_column: base64.b64encode(key.encode()).decode(),
+                                      "C0": {"value": "dmFsdWU="}}
+    return json.dumps({"schema": {"type": "struct", "fields": [{"field": "after"}]},
+                       "payload": {"before": None, "after": after, "op": "c"}}, separators=(",", ":")).encode()
+
+
+class FakeKafkaConsumer:
+    def __init__(self, batches: list[dict], highwater: int):
+        self.batches = batches
+        self.highwater_offset = highwater
+        self.poll_calls = []
+
+    def poll(self, timeout_ms, max_records):
+        self.poll_calls.append((timeout_ms, max_records))
+        return self.batches.pop(0) if self.batches else {}
+
+    def highwater(self, partition):  # pylint: disable=unused-argument
+        return self.highwater_offset
+
+    def close(self):
+        pass
+
+
+class FakeKafkaCDCReaderThread(KafkaCDCReaderThread):
+    def __init__(self, consumer, **kwargs):
+        self.fake_consumer = consumer
+        params = {"kafka_connectors": [SimpleNamespace(config=SimpleNamespace(scylla_name="ks",
+                                                                              scylla_table_names="cf"))]}
+        super().__init__(tester=None, params=params, group_id="test-group", **kwargs)
+
+    def wait_for_topic(self, topic, timeout):
+        pass
+
+    def create_consumer(self, topic):
+        return self.fake_consumer
+
+
+@pytest.mark.parametrize("message", [
+    cdc_message("4c4f4f4d4c"),
+    json.dumps({"payload": {"after": {"C0": {"value": "dmFsdWU="},
+                                      "key": base64.b64encode(b"4c4f4f4d4c").decode()}}}).encode(),
+])
+def test_extract_cdc_key(message):
+    assert extract_cdc_key(message) == b"4c4f4f4d4c"
+
+
+def test_extract_cdc_key_of_delete():
+    assert extract_cdc_key(cdc_message(None)) is None
+
+
+def test_compact_key_set():
+    keys = CompactKeySet()
+    for key in (b"1", b"01", b"1", "1000000", b"OP3L2K", "OP3L2K", str(2 ** 40)):
+        keys.add(key)
+    assert len(keys) == 5
+    assert "1" in keys and b"01" in keys and "OP3L2K" in keys and "2" not in keys
+    assert sorted(keys) == sorted(["1", "01", "1000000", "OP3L2K", str(2 ** 40)])
+
+
+def test_compact_key_set_decodes_cassandra_stress_keys():
+    keys = CompactKeySet()
+    stress_keys = ["KO5P3MOO61", "0000000001", "PPPPPPPPPP", "00LK3N9P0O", "12AB34CD56"]
+    for key in stress_keys * 2:
+        keys.add(extract_cdc_key(cdc_message(key)))
+    assert len(keys) == len(stress_keys)
+    assert keys.other_keys_count == 0
+    assert all(key in keys for key in stress_keys) and "KO5P3MOO62" not in keys
+    assert sorted(keys) == sorted(stress_keys)
+
+
+def test_compact_key_set_merges_large_keys_in_batches():
+    keys = CompactKeySet()
+    keys._int_sets[1].min_merge_size = 10  # pylint: disable=protected-access
+    stress_keys = [f"{seed * 7919:010X}".translate(str.maketrans("ABCDEF", "KLMNOP")) for seed in range(1, 1000)]
+    for key in stress_keys + stress_keys[:100]:
+        keys.add(key)
+    assert len(keys) == 999 and keys.other_keys_count == 0
+    assert sorted(keys) == sorted(stress_keys)
+
+
+def test_reader_deduplicates_keys_and_tracks_lag():
+    partition = ("ks.cf", 0)
+    messages = [cdc_message(str(index % 30)) for index in range(50)] + [cdc_message(None)]
+    records = [ConsumerRecord(offset, value) for offset, value in enumerate(messages)]
+    consumer = FakeKafkaConsumer(batches=[{partition: records[:25]}, {partition: records[25:]}], highwater=60)
+    reader = FakeKafkaCDCReaderThread(consumer=consumer, read_number_of_key=30)
+    reader.run()
+
+    assert len(reader.keys) == 30
+    assert set(reader.keys) == {str(index) for index in range(30)}
+    assert reader.messages_count == 51
+    assert reader.lag == 9
+    assert consumer.poll_calls == [(reader.poll_timeout_ms, reader.max_poll_records)] * 2
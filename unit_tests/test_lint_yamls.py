@@ -0,0 +1,54 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2024 ScyllaDB
+
+import pytest
+from click.testing import CliRunner
+
+from sct import lint_yamls
+
+VALID_CONFIG = """
+test_duration: 5
+n_db_nodes: 1
+n_loaders: 1
+n_monitor_nodes: 0
+user_prefix: 'lint-test'
+scylla_version: '5.4.0'
+"""
+
+
+@pytest.fixture(name="test_cases")
+def fixture_test_cases(tmp_path, monkeypatch):
+    (tmp_path / "test-cases").mkdir()
+    (tmp_path / "test-cases" / "valid.yaml").write_text(VALID_CONFIG)
+    (tmp_path / "test-cases" / "invalid.yaml").write_text(VALID_CONFIG + "no_such_option: 1\n")
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.mark.usefixtures("test_cases")
+def test_lint_yamls_reports_failure():
+    result = CliRunner().invoke(lint_yamls, ["-b", "docker", "-i", "valid,invalid"])
+
+    assert result.exit_code == 1
+    assert "---- linting: ./test-cases/valid.yaml -----" in result.output
+    assert "---- linting: ./test-cases/invalid.yaml -----\nTraceback" in result.output
+    assert "'no_such_option: 1'" in result.output
+    assert "Linted 2 yaml files in" in result.output
+
+
+@pytest.mark.usefixtures("test_cases")
+def test_lint_yamls_passes():
+    result = CliRunner().invoke(lint_yamls, ["-b", "docker", "-i", "valid", "-e", "invalid"])
+
+    assert result.exit_code == 0, result.output
+    assert "Traceback" not in result.output
+    assert "Linted 1 yaml files in" in result.output
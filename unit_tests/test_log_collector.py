@@ -11,11 +11,13 @@
 #
 # Copyright (c) 2022 ScyllaDB
 # pylint: disable=redefined-outer-name
+import os
 import uuid
+from pathlib import Path
 
 import pytest
 
-from sdcm.logcollector import Collector
+from sdcm.logcollector import Collector, BaseSCTLogCollector
 from sdcm.provision import provisioner_factory
 from unit_tests.lib.fake_resources import prepare_fake_region
 
@@ -47,3 +49,26 @@ def test_create_collecting_nodes(test_id, tmp_path_factory):
     assert len(collector.monitor_set) == len(monitor_nodes)
     for collecting_node, v_m in zip(collector.monitor_set, monitor_nodes):
         assert collecting_node.name == v_m.name
+
+
+def test_archives_of_big_sct_logs_are_uploaded_concurrently(test_id, tmp_path, monkeypatch):
+    uploads = []
+
+    def fake_upload_archives_to_s3(archive_paths, storing_path):
+        uploads.append((sorted(os.path.basename(path) for path in archive_paths), storing_path))
+        return [f"https://bucket/{storing_path}/{os.path.basename(path)}" for path in archive_paths]
+
+    monkeypatch.setattr("sdcm.logcollector.upload_archives_to_s3", fake_upload_archives_to_s3)
+    monkeypatch.chdir(tmp_path)
+    collector = BaseSCTLogCollector([], test_id=test_id, storage_dir=str(tmp_path), params={})
+    for name in ("events.log", "debug.log", "junit.xml"):
+        (Path(collector.local_dir) / name).write_text(name)
+
+    s3_links = collector.create_archive_per_file_and_upload()
+
+    assert len(uploads) == 1
+    short_id = test_id.split("-")[0]
+    assert uploads[0] == ([f"debug-{short_id}.log.tar.gz", f"events-{short_id}.log.tar.gz", "junit.xml.tar.gz"],
+                          f"{test_id}/{collector.current_run}")
+    assert len(s3_links) == 3
+    assert not list(tmp_path.glob("*.tar.gz"))
@@ -0,0 +1,131 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2024 ScyllaDB
+
+import re
+from unittest.mock import patch
+
+import pytest
+
+from sdcm.utils.log_follower import LogFollowerHub, LogMatcher, follow_log
+
+
+def patterns(*regexps):
+    return [re.compile(regexp, flags=re.IGNORECASE) for regexp in regexps]
+
+
+@pytest.fixture(name="log_file")
+def fixture_log_file(tmp_path):
+    log_file = tmp_path / "system.log"
+    log_file.write_text("old error 1\nold info\n")
+    return log_file
+
+
+def append(log_file, text):
+    with log_file.open("a") as log:
+        log.write(text)
+
+
+def test_lines_are_read_and_matched_once_for_all_followers(log_file):
+    errors = follow_log(str(log_file), patterns("error"))
+    warnings = follow_log(str(log_file), patterns("warning", "ERROR 2"))
+    same_errors = follow_log(str(log_file), patterns("error"))
+    append(log_file, "error 1\nwarning 1\ninfo 1\nerror 2\n")
+
+    with patch.object(LogMatcher, "match", autospec=True, side_effect=LogMatcher.match) as match:
+        assert list(errors) == ["error 1\n", "error 2\n"]
+        assert list(warnings) == ["warning 1\n", "error 2\n"]
+        assert list(same_errors) == ["error 1\n", "error 2\n"]
+    assert match.call_count == 4
+
+    append(log_file, "error 3\nwarn")
+    assert list(errors) == ["error 3\n"]
+    assert not list(warnings)
+    # the partial line is read when it's complete
+    append(log_file, "ing 2\n")
+    assert list(warnings) == ["warning 2\n"]
+    assert not list(errors)
+
+
+def test_iteration_continues_from_where_it_stopped(log_file):
+    errors = follow_log(str(log_file), patterns("error"))
+    append(log_file, "error 1\nerror 2\nerror 3\n")
+    assert any(errors)
+    assert list(errors) == ["error 2\n", "error 3\n"]
+
+
+def test_late_followers(log_file):
+    errors = follow_log(str(log_file), patterns("error"))
+    append(log_file, "error 1\n")
+    assert list(errors) == ["error 1\n"]
+
+    all_errors = follow_log(str(log_file), patterns("error"), start_from_beginning=True)
+    new_errors = follow_log(str(log_file), patterns("error"))
+    append(log_file, "error 2\n")
+    assert list(all_errors) == ["old error 1\n", "error 1\n", "error 2\n"]
+    assert list(new_errors) == ["error 2\n"]
+    assert list(errors) == ["error 2\n"]
+
+
+def test_new_log_file_at_same_path(log_file):
+    errors = follow_log(str(log_file), patterns("error"))
+    append(log_file, "error 1\n")
+    log_file.rename(log_file.with_suffix(".old"))
+    log_file.write_text("new error 1\n")
+
+    new_errors = follow_log(str(log_file), patterns("error"), start_from_beginning=True)
+    assert list(new_errors) == ["new error 1\n"]
+    assert list(errors) == ["error 1\n"]
+
+
+def test_patterns_which_can_not_be_combined(log_file):
+    assert LogMatcher(patterns("error", r"(\w+) \1")).combined is None
+    assert LogMatcher(patterns("error", "(?i)warning")).combined is None
+
+    repeated = follow_log(str(log_file), patterns(r"(\w+) \1"))
+    errors = follow_log(str(log_file), [re.compile("ERROR")])
+    append(log_file, "error error\nERROR 1\n")
+    assert list(repeated) == ["error error\n"]
+    assert list(errors) == ["ERROR 1\n"]
+
+
+def test_reads_by_bounded_blocks(log_file, monkeypatch):
+    monkeypatch.setattr(LogFollowerHub, "block_size", 16)
+    append(log_file, "".join(f"error {idx}\ninfo {idx}\n" for idx in range(20)) + f"long error {'x' * 40}\n")
+    errors = follow_log(str(log_file), patterns("error"), start_from_beginning=True)
+
+    reads = []
+    read_lines = LogFollowerHub._read_lines  # pylint: disable=protected-access
+
+    def recorded_read_lines(hub, start):
+        reads.append(data := read_lines(hub, start))
+        return data
+
+    monkeypatch.setattr(LogFollowerHub, "_read_lines", recorded_read_lines)
+    assert list(errors) == ["old error 1\n"] + [f"error {idx}\n" for idx in range(20)] + [
+        f"long error {'x' * 40}\n"]
+    # blocks of complete lines, and a line longer than a block as a whole
+    assert all(len(data) <= 16 for data in reads[:-2])
+    assert reads[-2:] == [f"long error {'x' * 40}\n".encode(), b""]
+
+
+def test_lines_of_idle_followers_are_not_dropped(log_file, monkeypatch):
+    monkeypatch.setattr(LogFollowerHub, "block_size", 16)
+    monkeypatch.setattr(LogFollowerHub, "max_queued_lines", 2)
+    errors = follow_log(str(log_file), patterns("error"))
+    idle_errors = follow_log(str(log_file), patterns("error"))
+    lines = [f"error {idx}\n" for idx in range(10)]
+    append(log_file, "".join(lines))
+
+    assert list(errors) == lines
+    assert len(idle_errors.lines) < len(lines)
+    assert list(idle_errors) == lines
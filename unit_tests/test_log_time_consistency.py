@@ -0,0 +1,124 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2024 ScyllaDB
+
+import os
+import time
+import logging
+import datetime
+import resource
+
+from sdcm.utils.log_time_consistency import (
+    DbLogTimeConsistencyAnalyzer,
+    SctLogTimeConsistencyAnalyzer,
+    read_lines,
+)
+
+LOGGER = logging.getLogger(__name__)
+# the first line of a log, which is older than a year, is counted as shifted
+START_TIME = datetime.datetime.now(tz=datetime.timezone.utc).replace(microsecond=0) - datetime.timedelta(days=30)
+
+
+def db_log_line(timestamp: datetime.datetime, message: str = "scylla[1234]:  [shard 0] storage_service - ok") -> str:
+    return f"{timestamp.isoformat()} db-node-1 {message}\n"
+
+
+def write_db_log(log_file, shifts):
+    """
+    Write a log with the line times going back by the shifts (in seconds), between lines going forward
+    """
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    current = START_TIME
+    with log_file.open("w") as log:
+        log.write(db_log_line(current))
+        log.write("not a log line\n")
+        log.write(db_log_line(current - datetime.timedelta(hours=5), "rsyslogd: ignored line"))
+        for shift in shifts:
+            current += datetime.timedelta(seconds=0.25)
+            log.write(db_log_line(current))
+            log.write(db_log_line(current - datetime.timedelta(seconds=shift)))
+            current += datetime.timedelta(hours=4)
+
+
+def test_read_lines(tmp_path):
+    log_file = tmp_path / "messages.log"
+    lines = [f"line {idx} {'x' * (idx % 13)}\n" for idx in range(100)] + ["no new line"]
+    log_file.write_text("".join(lines))
+    assert [line.decode() for line in read_lines(log_file, block_size=7)] == lines
+    assert [line.decode() for line in read_lines(log_file, ignore_lines=["x" * 12, "no new"], block_size=7)] == [
+        line for line in lines if "x" * 12 not in line and "no new" not in line]
+
+
+def test_db_log_time_consistency(tmp_path):
+    write_db_log(tmp_path / "db-node-1" / "messages.log", shifts=[30, 120, 600, 7200, 18000, 0.5])
+    write_db_log(tmp_path / "db-node-2" / "messages.log", shifts=[30, 40])
+    (tmp_path / "loader-node-1").mkdir()
+    (tmp_path / "loader-node-1" / "messages.log").write_text(db_log_line(START_TIME))
+
+    result = DbLogTimeConsistencyAnalyzer.analyze_dir(str(tmp_path))
+
+    assert list(result) == [str(tmp_path / "db-node-1" / "messages.log"),
+                            str(tmp_path / "db-node-2" / "messages.log"), "TOTAL"]
+    assert result["TOTAL"] == {"<1min": 3, "<5min": 1, "<30min": 1, "<3hours": 1, ">3hours": 1, "total": 7}
+    details = result[str(tmp_path / "db-node-1" / "messages.log")]
+    shifted_time = START_TIME + datetime.timedelta(hours=4, seconds=0.5) - datetime.timedelta(seconds=120)
+    assert details["<5min"] == [
+        db_log_line(START_TIME + datetime.timedelta(hours=4, seconds=0.5)) + db_log_line(shifted_time)]
+
+
+def test_sct_log_time_consistency(tmp_path):
+    line = ("< t:2021-11-09 14:22:18,447 f:cluster.py      l:1405 c:sdcm.cluster   p:DEBUG > "
+            "{event_time} db-node-1 scylla: message\n")
+    sct_log = tmp_path / "sct.log"
+    sct_log.write_text("".join([
+        line.format(event_time="2021-11-09T14:22:18+00:00"),
+        line.format(event_time="2021-11-09T14:20:18+00:00"),
+        "< t:2021-11-09 14:22:18,447 f:tester.py      l:1405 c:sdcm.tester   p:DEBUG > 2021-11-09T10:20:18\n",
+    ]))
+
+    result = SctLogTimeConsistencyAnalyzer.analyze_dir(str(tmp_path))
+
+    sct_time = datetime.datetime.fromisoformat("2021-11-09 14:22:18").timestamp()
+    event_time = datetime.datetime.fromisoformat("2021-11-09T14:20:18+00:00").timestamp()
+    bucket = SctLogTimeConsistencyAnalyzer._get_timeshift_bucket_name(sct_time - event_time)  # pylint: disable=protected-access
+    assert result["TOTAL"]["total"] == 1
+    assert result[str(sct_log)][bucket] == [line.format(event_time="2021-11-09T14:20:18+00:00")]
+
+
+def test_db_log_time_consistency_benchmark(tmp_path):
+    """
+    Measure analyze_dir runtime and memory on synthetic logs
+
+    Set LOG_TIME_CONSISTENCY_BENCHMARK_MB=2048 to run it on 2GB of logs
+    """
+    size = int(os.environ.get("LOG_TIME_CONSISTENCY_BENCHMARK_MB", "20")) * 1024 * 1024
+    files_count = 4
+    lines_per_second = 100
+    for file_idx in range(files_count):
+        log_file = tmp_path / f"db-node-{file_idx}" / "messages.log"
+        log_file.parent.mkdir()
+        written = 0
+        timestamp = START_TIME.timestamp()
+        with log_file.open("w") as log:
+            while written < size // files_count:
+                chunk = "".join(db_log_line(datetime.datetime.fromtimestamp(timestamp + idx / lines_per_second,
+                                                                            tz=datetime.timezone.utc))
+                                for idx in range(10000))
+                log.write(chunk)
+                written += len(chunk)
+                timestamp += 10000 / lines_per_second
+
+    start_time = time.perf_counter()
+    result = DbLogTimeConsistencyAnalyzer.analyze_dir(str(tmp_path))
+    LOGGER.warning("analyze_dir of %d MB in %d files: %.2fs, max RSS: %d MB", size // 1024 // 1024, files_count,
+                   time.perf_counter() - start_time, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss // 1024)
+    assert result["TOTAL"]["total"] == 0
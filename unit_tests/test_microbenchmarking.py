@@ -8,6 +8,9 @@ import tempfile
 import json
 import zipfile
 import hashlib
+import random
+import time
+import datetime
 
 from sdcm.microbenchmarking import MicroBenchmarkingResultsAnalyzer, LargeNumberOfDatasetsException, EmptyResultFolder
 
@@ -229,6 +232,53 @@ class TestMBM(unittest.TestCase):  # pylint: disable=too-many-public-methods
 
         self.verify_html_report_correctness(report_results)
 
+    @staticmethod
+    def generate_history(runs_count, datasets_count, seed=0):
+        rand = random.Random(seed)
+        start_date = datetime.datetime(2023, 1, 1)
+        docs, current_results = [], {}
+        for run in range(runs_count):
+            run_date = start_date + datetime.timedelta(hours=run)
+            for dataset in range(datasets_count):
+                stats = {"frag/s": rand.uniform(1000, 2000), "avg aio": rand.choice([0, rand.uniform(1, 10)]),
+                         "mad f/s": 1.0, "max f/s": 2.0, "min f/s": 0.5}
+                docs.append({"_id": f"{run}_{dataset}", "_source": {
+                    "test_group_properties": {"name": "large-partition-skips"},
+                    "test_args": f"{dataset}-32.1",
+                    "test_run_date": run_date.strftime("%Y-%m-%d_%H:%M:%S"),
+                    "results": {"stats": stats},
+                    "versions": {"scylla-server": {"run_date_time": run_date.strftime("%Y-%m-%d %H:%M:%S"),
+                                                   "commit_id": f"commit{run}",
+                                                   "date": run_date.strftime("%Y%m%d"),
+                                                   "version": "5.5.0"}}}})
+                current_results[f"large-partition-skips_{dataset}-32.1"] = {
+                    "results": {"stats": stats}, "dataset_name": "large-partition-skips"}
+        return {"hits": {"hits": docs}}, current_results
+
+    def test_check_regression_benchmark(self):
+        """
+        Measure check_regression runtime on a synthetic history
+
+        Set MBM_BENCHMARK_RUNS=5000 to run it on a multi-year history of a host
+        """
+        runs_count = int(os.environ.get("MBM_BENCHMARK_RUNS", "500"))
+        history, current_results = self.generate_history(runs_count=runs_count, datasets_count=20)
+        self.mbra._get_prior_tests = lambda filter_path, additional_filter='': history  # pylint: disable=protected-access
+        self.mbra.cur_version_info = {"commit_id": f"commit{runs_count - 1}", "version": "5.5.0"}
+
+        start_time = time.perf_counter()
+        report_results = self.mbra.check_regression(current_results)
+        LOGGER.warning("check_regression of %d datasets with %d runs history: %.2fs",
+                       len(current_results), runs_count, time.perf_counter() - start_time)
+
+        dataset_history = [doc["_source"] for doc in history["hits"]["hits"] if doc["_source"]["test_args"] == "0-32.1"]
+        frag_s = report_results["large-partition-skips_0-32.1"]["frag/s"]
+        best = max(dataset_history, key=lambda doc: doc["results"]["stats"]["frag/s"])
+        self.assertEqual(frag_s["Best, commit, date"][:2],
+                         (best["results"]["stats"]["frag/s"], best["versions"]["scylla-server"]["commit_id"]))
+        self.assertEqual(frag_s["Last, commit, date"][1], f"commit{runs_count - 2}")
+        self.assertEqual(frag_s["Stats"], {"mad f/s": 1.0, "max f/s": 2.0, "min f/s": 0.5})
+
     def test_empty_current_result(self):
         result_obj = {}
         report_results = self.mbra.check_regression(result_obj)
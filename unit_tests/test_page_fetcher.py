@@ -0,0 +1,80 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2024 ScyllaDB
+
+import hashlib
+
+import pytest
+
+from sdcm.utils.common import PageFetcher
+from unit_tests.lib.fake_cql import FakeResponseFuture
+
+
+def test_page_counts_and_empty_pages():
+    fetcher = PageFetcher(FakeResponseFuture([[1, 2], [3, 4], [5], []]))
+    assert fetcher.pagecount() == 1
+
+    fetcher.request_one()
+    assert fetcher.pagecount() == 2
+    assert fetcher.page_data(2) == [3, 4]
+
+    fetcher.request_all()
+    assert not fetcher.has_more_pages
+    assert fetcher.pagecount() == 3
+    assert fetcher.retrieved_empty_pages == 1
+    assert fetcher.requested_pages == 4
+    assert fetcher.num_results(3) == 1
+    assert fetcher.num_results_all() == [2, 2, 1]
+    assert fetcher.all_data() == [1, 2, 3, 4, 5]
+    assert fetcher.stats()["rows"] == 5
+
+    fetcher.request_one()
+    assert fetcher.requested_pages == 4
+
+
+def test_prefetch_requests_next_page_before_the_page_is_handled():
+    pages = [[f"row{page}-{row}" for row in range(10)] for page in range(5)]
+    future = FakeResponseFuture(pages, delay=0.01)
+    requested_while_handling = []
+    fetcher = PageFetcher(future, prefetch=True,
+                          on_page=lambda rows: requested_while_handling.append(future.fetch_requests))
+    fetcher.request_all()
+
+    assert future.fetch_requests == 4
+    assert requested_while_handling == [1, 2, 3, 4, 4]
+    assert fetcher.all_data() == [row for page in pages for row in page]
+    stats = fetcher.stats()
+    assert stats["pages"] == 5
+    assert stats["rows"] == 50
+    assert stats["rows_per_second"] > 0
+    assert 0 < stats["avg_page_latency"] <= stats["max_page_latency"]
+
+
+def test_rows_not_kept():
+    pages = [[(1, "a"), (2, "b")], [(3, "c")], []]
+    consumed = []
+    fetcher = PageFetcher(FakeResponseFuture(pages), keep_rows=False, digest_rows=True, on_page=consumed.extend)
+    fetcher.request_all()
+
+    assert consumed == [(1, "a"), (2, "b"), (3, "c")]
+    assert fetcher.pagecount() == 2
+    assert fetcher.num_results_all() == [2, 1]
+    assert all(page.data is None for page in fetcher.pages)
+    assert fetcher.digest() == hashlib.md5(b"(1, 'a')(2, 'b')(3, 'c')").hexdigest()
+    with pytest.raises(ValueError):
+        fetcher.all_data()
+
+
+def test_query_error_is_raised():
+    fetcher = PageFetcher(FakeResponseFuture([[1]], delay=0.01, error=ValueError("read timeout")))
+    with pytest.raises(ValueError, match="read timeout"):
+        fetcher.request_all(timeout=5)
@@ -2,8 +2,10 @@ import unittest
 import time
 import logging
 import random
+import threading
 import concurrent.futures
 
+import pytest
 
 from sdcm.utils.common import ParallelObject, ParallelObjectException
 
@@ -140,3 +142,53 @@ class ParallelObjectTester(unittest.TestCase):
         returned_results = [r.result for r in results]
         expected_results = [r[0][1] for r in self.list_as_arg]
         self.assertListEqual(returned_results, expected_results)
+
+    def test_timeout_is_deadline_of_whole_run(self):
+        start_time = time.time()
+        parallel_object = ParallelObject([0.5, 3, 3, 3], timeout=1, num_workers=1)
+        results = parallel_object.run(dummy_func_return_single, ignore_exceptions=True)
+        self.assertLess(time.time() - start_time, 2)
+        self.assertEqual(results[0].result, 0.5)
+        self.assertAlmostEqual(results[0].duration, 0.5, delta=0.2)
+        self.assertIsInstance(results[1].exc, concurrent.futures.TimeoutError)
+        self.assertIsNone(results[1].duration)
+        # the runs which weren't started by the deadline are not started at all
+        self.assertTrue(all(isinstance(res.exc, concurrent.futures.TimeoutError) for res in results[2:]))
+
+    def test_fail_fast(self):
+        def raise_or_sleep(timeout):
+            time.sleep(abs(timeout))
+            if timeout < 0:
+                raise DummyException()
+            return timeout
+
+        start_time = time.time()
+        with self.assertRaises(ParallelObjectException) as exp:
+            ParallelObject([0.1, 3, -0.5, 3, 3], timeout=10, num_workers=3).run(raise_or_sleep, fail_fast=True)
+        self.assertLess(time.time() - start_time, 2)
+        results = exp.exception.results
+        self.assertEqual([res.obj for res in results], [0.1, 3, -0.5, 3, 3])
+        self.assertEqual(results[0].result, 0.1)
+        self.assertIsInstance(results[2].exc, DummyException)
+        for res in results[1:2] + results[3:]:
+            self.assertIsInstance(res.exc, concurrent.futures.CancelledError)
+
+    def test_runs_left_behind_do_not_block_other_runs(self):
+        release = threading.Event()
+        try:
+            for _ in range(3):
+                results = ParallelObject(range(100), timeout=0.1, num_workers=100).run(
+                    lambda _: release.wait(), ignore_exceptions=True)
+                self.assertTrue(all(isinstance(res.exc, concurrent.futures.TimeoutError) for res in results))
+            results = ParallelObject([0.1] * 10, timeout=2, num_workers=10).run(dummy_func_return_single)
+            self.assertListEqual([res.result for res in results], [0.1] * 10)
+        finally:
+            release.set()
+
+    def test_nested_runs(self):
+        def run_inner(timeout):
+            return sum(res.result for res in ParallelObject([timeout] * 4, timeout=5, num_workers=4).run(
+                dummy_func_return_single))
+
+        results = ParallelObject([0.1] * 8, timeout=10, num_workers=8).run(run_inner)
+        self.assertListEqual([res.result for res in results], [pytest.approx(0.4)] * 8)
@@ -0,0 +1,135 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2024 ScyllaDB
+
+import os
+import re
+import json
+import time
+import random
+import logging
+import tracemalloc
+from pathlib import Path
+
+from sdcm.parallel_timeline_report.generate_pt_report import ParallelTimelinesReportGenerator
+
+LOGGER = logging.getLogger(__name__)
+NODE = "Node longevity-100gb-4h-master-db-node-6fb3995d-{} [13.49.80.25 | 10.0.1.221] (seed: True)"
+
+
+def generate_raw_events(path: Path, events_count: int, seed: int = 0) -> None:  # pylint: disable=too-many-locals
+    """Write a synthetic raw_events.log, with a mix of one-time, begin/end and endless continuous events"""
+    rand = random.Random(seed)
+    timestamp = 1_700_000_000.0
+    open_events = []
+    with path.open("w", encoding="utf-8") as file:
+        file.write(json.dumps({"base": "InfoEvent", "event_id": "info-0", "type": "info", "event_timestamp": timestamp,
+                               "message": "TEST_START test_id=fe9c9218-367f-47ba-b59f-0d06c0e81c30"}) + "\n")
+        for index in range(1, events_count):
+            timestamp += rand.random()
+            node = NODE.format(rand.randint(1, 6))
+            if open_events and rand.random() < 0.3:
+                event = open_events.pop(rand.randrange(len(open_events)))
+                event.update(period_type="end", end_timestamp=timestamp)
+            elif rand.random() < 0.3:
+                event = {"event_id": f"event-{index}", "period_type": "begin", "begin_timestamp": timestamp,
+                         "end_timestamp": None, "node": node, "type": "begin", "shard": rand.randint(0, 7),
+                         **rand.choice([{"base": "RepairEvent"}, {"base": "CompactionEvent", "table": "ks.cf"},
+                                        {"base": "ScyllaServerStatusEvent"},
+                                        {"base": "DisruptionEvent", "nemesis_name": "StopStart"},
+                                        {"base": "CassandraStressEvent", "stress_cmd": "cassandra-stress write"}])}
+                open_events.append(dict(event))
+            else:
+                event = {"event_id": f"event-{index}", "event_timestamp": timestamp, "node": node,
+                         **rand.choice([{"base": "DatabaseLogEvent", "type": "BACKTRACE"},
+                                        {"base": "NodetoolEvent", "type": "info", "nodetool_command": "status"},
+                                        {"base": "PrometheusAlertManagerEvent", "type": "start",
+                                         "alert_name": "InstanceDown"},
+                                        {"base": "NodetoolEvent", "type": "error", "nodetool_command": "a <'cmd'> & more"},
+                                        {"base": "CassandraStressLogEvent", "type": "error"},
+                                        {"base": "TestFrameworkEvent", "type": "error"}])}
+            file.write(json.dumps(event) + "\n")
+
+
+def read_chart_data(report_file: Path) -> list:
+    chart_data = re.search(r"jsonChartData = '(.*)';", report_file.read_text(encoding="utf-8")).group(1)
+    return json.loads(chart_data)
+
+
+def test_report_groups_and_endless_events(tmp_path):
+    events_file = tmp_path / "raw_events.log"
+    events = [
+        {"base": "InfoEvent", "event_id": "1", "type": "info", "event_timestamp": 10.0,
+         "message": "TEST_START test_id=fe9c9218-367f-47ba-b59f-0d06c0e81c30"},
+        {"base": "ScyllaServerStatusEvent", "event_id": "2", "type": "start", "period_type": "begin",
+         "begin_timestamp": 11.0, "node": NODE.format(2)},
+        {"base": "RepairEvent", "event_id": "3", "type": "start", "period_type": "begin", "begin_timestamp": 12.0,
+         "node": NODE.format(1), "shard": 0},
+        {"base": "RepairEvent", "event_id": "3", "type": "finish", "period_type": "end", "begin_timestamp": 12.0,
+         "end_timestamp": 15.0, "node": NODE.format(1), "shard": 0},
+        {"base": "CompactionEvent", "event_id": "4", "type": "start", "period_type": "begin",
+         "begin_timestamp": 13.0, "node": NODE.format(1), "shard": 1, "table": "ks.cf"},
+        {"base": "DisruptionEvent", "event_id": "5", "type": "start", "period_type": "one-time",
+         "event_timestamp": 14.0, "node": NODE.format(1), "nemesis_name": "RunUniqueSequence"},
+        {"base": "PrometheusAlertManagerEvent", "event_id": "6", "type": "start", "event_timestamp": 20.0,
+         "node": "node-1", "alert_name": "InstanceDown"},
+    ]
+    events_file.write_text("".join(json.dumps(event) + "\n" for event in events), encoding="utf-8")
+
+    generator = ParallelTimelinesReportGenerator(events_file=events_file)
+    generator.generate_full_report()
+
+    assert generator.test_id == "fe9c9218-367f-47ba-b59f-0d06c0e81c30"
+    assert generator.cluster_name == "longevity-100gb-4h-master-db-cluster-6fb3995d"
+    report_file = tmp_path / "longevity-100gb-4h-master-6fb3995d-parallel-timelines-report.html"
+    assert read_chart_data(report_file) == [
+        {"group": "node-1", "data": [
+            {"label": "CompactionEvent, shard: 1", "data": [{"timeRange": [13000.0, 13000.0], "val": "table: ks.cf"}]},
+            {"label": "RepairEvent, shard: 0", "data": [{"timeRange": [12000.0, 15000.0], "val": "RepairEvent"}]},
+        ]},
+        {"group": "node-2", "data": [
+            {"label": "ScyllaServerStatusEvent",
+             "data": [{"timeRange": [11000.0, 20000.0], "val": "ScyllaServerStatusEvent"}]},
+        ]},
+        {"group": "Prometheus events", "data": [
+            {"label": "node: node-1, alert: InstanceDown",
+             "data": [{"timeRange": [20000.0, 20000.0], "val": "PrometheusAlertManagerEvent"}]},
+        ]},
+        {"group": "SCT events", "data": [
+            {"label": "InfoEvent", "data": [
+                {"timeRange": [10000.0, 10000.0],
+                 "val": "message: TEST_START test_id=fe9c9218-367f-47ba-b59f-0d06c0e81c30"}]},
+        ]},
+    ]
+
+
+def test_report_generation_benchmark(tmp_path):
+    """
+    Measure runtime and peak memory of the report generation on a synthetic events file
+
+    Set PT_REPORT_BENCHMARK_EVENTS=5000000 to run it on the size of a multi-day longevity raw_events.log
+    """
+    events_count = int(os.environ.get("PT_REPORT_BENCHMARK_EVENTS", "20000"))
+    events_file = tmp_path / "raw_events.log"
+    generate_raw_events(events_file, events_count)
+
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    ParallelTimelinesReportGenerator(events_file=events_file).generate_full_report()
+    duration = time.perf_counter() - start_time
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    LOGGER.warning("Parallel timelines report of %d events (%.1f MB): %.2fs, peak memory %.1f MB",
+                   events_count, events_file.stat().st_size / 2 ** 20, duration, peak_memory / 2 ** 20)
+    report_file = next(tmp_path.glob("*parallel-timelines-report.html"))
+    assert sum(len(label["data"]) for group in read_chart_data(report_file) for label in group["data"])
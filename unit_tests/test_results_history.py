@@ -0,0 +1,113 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2024 ScyllaDB
+
+import re
+
+import pytest
+from elasticsearch.exceptions import ConnectionError as ESConnectionError
+
+from sdcm.results_analyze.results_history import ResultsHistory
+
+DAY = 24 * 60 * 60
+
+
+def make_doc(doc_id: str, start_time: int, version: str, runtime: float | None) -> dict:
+    source = {"test_details": {"start_time": start_time}, "versions": {"scylla-server": {"version": version}}}
+    if runtime is not None:
+        source["repair_runtime"] = runtime
+    return {"_id": doc_id, "_source": source}
+
+
+class FakeES:
+    def __init__(self, docs: list[dict]):
+        self.docs = docs
+        self.queries = []
+        self.online = True
+
+    def search(self, index, filter_path, size, q=None):  # pylint: disable=unused-argument
+        if not self.online:
+            raise ESConnectionError("N/A", "Elasticsearch is down", None)
+        self.queries.append(q)
+        min_start_time = int(match.group(1)) if q and (match := re.search(r"start_time:>=(\d+)", q)) else 0
+        hits = [doc for doc in self.docs if doc["_source"]["test_details"]["start_time"] >= min_start_time]
+        return {"hits": {"hits": hits[:size]}} if hits else {}
+
+
+@pytest.fixture(name="history")
+def fixture_history(tmp_path):
+    docs = [make_doc("1", 10 * DAY, "5.4.0", 10.0), make_doc("2", 11 * DAY, "5.4.0", 30.0),
+            make_doc("3", 12 * DAY, "5.4.0", 20.0), make_doc("4", 13 * DAY, "6.0.0", 5.0),
+            make_doc("5", 14 * DAY, "", 1.0), make_doc("6", 15 * DAY, "6.0.0", None)]
+    return ResultsHistory(es=FakeES(docs), path=str(tmp_path / "results_history.sqlite"))
+
+
+def test_search_syncs_deltas_and_works_offline(history):
+    es = history._es  # pylint: disable=protected-access
+    first = history.search(index="test_index", query="test_details.test_name:repair", filter_path=["hits.hits._id"])
+    assert [hit["_id"] for hit in first["hits"]["hits"]] == ["6", "5", "4", "3", "2", "1"]
+
+    es.docs.append(make_doc("7", 16 * DAY, "6.0.0", 6.0))
+    es.docs[0]["_source"]["repair_runtime"] = 100.0  # docs older than the resync window aren't fetched again
+    second = history.search(index="test_index", query="test_details.test_name:repair", filter_path=["hits.hits._id"])
+    assert es.queries[-1] == f"(test_details.test_name:repair) AND test_details.start_time:>={15 * DAY - 3 * DAY}"
+    assert [hit["_id"] for hit in second["hits"]["hits"]] == ["7", "6", "5", "4", "3", "2", "1"]
+    assert second["hits"]["hits"][-1]["_source"]["repair_runtime"] == 10.0
+
+    es.online = False
+    assert history.search(index="test_index", query="test_details.test_name:repair",
+                          filter_path=["hits.hits._id"]) == second
+    with pytest.raises(ESConnectionError):
+        history.search(index="test_index", query="other_query")
+
+
+def test_summarize_per_version(history):
+    history.search(index="test_index")
+    summary = history.summarize(index="test_index", metric_path="repair_runtime",
+                                version_path="versions.scylla-server.version", exclude_ids=["4"])
+    assert summary == {"5.4.0": {"count": 3, "avg": 20.0, "min": 10.0, "max": 30.0, "last": 20.0, "median": 20.0}}
+
+    summary = history.summarize(index="test_index", metric_path="repair_runtime",
+                                version_path="versions.scylla-server.version")
+    assert summary == {"5.4.0": {"count": 3, "avg": 20.0, "min": 10.0, "max": 30.0, "last": 20.0, "median": 20.0},
+                       "6.0.0": {"count": 1, "avg": 5.0, "min": 5.0, "max": 5.0, "last": 5.0, "median": 5.0}}
+
+
+def test_version_date_filter_is_applied_to_the_cached_results(history):
+    es = history._es  # pylint: disable=protected-access
+    for doc, date in zip(es.docs, ("20230101", "20230601", "20240101", "20240601", "20240701", "20240801")):
+        doc["_source"]["versions"]["scylla-server"]["date"] = date
+    history.search(index="test_index", query="test_details.test_name:repair AND "
+                   "versions.scylla-server.date:{20230601 TO *}", filter_path=["hits.hits._id"])
+    es.online = False
+    next_day = history.search(index="test_index", query="test_details.test_name:repair AND "
+                              "versions.scylla-server.date:{20240101 TO *}", filter_path=["hits.hits._id"])
+    assert [hit["_id"] for hit in next_day["hits"]["hits"]] == ["6", "5", "4"]
+    summary = history.summarize(index="test_index", metric_path="repair_runtime",
+                                version_path="versions.scylla-server.version",
+                                query="test_details.test_name:repair AND versions.scylla-server.date:{20240101 TO *}",
+                                filter_path=["hits.hits._id"])
+    assert summary == {"6.0.0": {"count": 1, "avg": 5.0, "min": 5.0, "max": 5.0, "last": 5.0, "median": 5.0}}
+
+
+def test_unused_queries_are_evicted(history, monkeypatch):
+    history.search(index="test_index", query="test_details.test_name:repair")
+    history.search(index="test_index", query="test_details.test_name:other")
+    monkeypatch.setattr("time.time", lambda: 10**10)
+    history.search(index="test_index", query="test_details.test_name:repair")
+    history._db.close()  # pylint: disable=protected-access
+
+    reopened = ResultsHistory(es=history._es, path=history.path)  # pylint: disable=protected-access
+    queries = [query for query, in reopened._db.execute("SELECT query FROM queries")]  # pylint: disable=protected-access
+    assert queries == ["test_details.test_name:repair"]
+    assert reopened._db.execute(  # pylint: disable=protected-access
+        "SELECT COUNT(DISTINCT query_id) FROM docs").fetchone() == (1, )
@@ -0,0 +1,204 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2024 ScyllaDB
+
+import os
+import time
+import uuid
+import hashlib
+import logging
+import threading
+from urllib.parse import urlparse, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from sdcm.utils.common import S3Storage
+
+LOGGER = logging.getLogger(__name__)
+BUCKET = "test-bucket"
+
+
+class FakeS3Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "FakeS3Server"
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+    def _reply(self, status: int = 200, body: bytes = b"", headers: dict | None = None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _parse_path(self):
+        url = urlparse(self.path)
+        return url.path.lstrip("/").split("/", 1)[1], parse_qs(url.query, keep_blank_values=True)
+
+    def _read_body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def do_HEAD(self):  # pylint: disable=invalid-name
+        key, _ = self._parse_path()
+        if (obj := self.server.objects.get(key)) is None:
+            self._reply(404)
+            return
+        self.send_response(200)
+        self.send_header("ETag", f'"{obj["etag"]}"')
+        self.send_header("Content-Length", str(len(obj["body"])))
+        for name, value in obj["metadata"].items():
+            self.send_header(f"x-amz-meta-{name}", value)
+        self.end_headers()
+
+    def do_PUT(self):  # pylint: disable=invalid-name
+        key, query = self._parse_path()
+        body = self._read_body()
+        etag = hashlib.md5(body).hexdigest()
+        with self.server.lock:
+            self.server.requests.append(("PUT", key, "partNumber" in query))
+            if "partNumber" in query:
+                self.server.uploads[query["uploadId"][0]]["parts"][int(query["partNumber"][0])] = body
+            else:
+                self.server.objects[key] = {"body": body, "etag": etag, "acl": self.headers.get("x-amz-acl"),
+                                            "metadata": self._metadata()}
+        self._reply(headers={"ETag": f'"{etag}"'})
+
+    def _metadata(self) -> dict:
+        return {name[len("x-amz-meta-"):]: value for name, value in self.headers.items()
+                if name.lower().startswith("x-amz-meta-")}
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        key, query = self._parse_path()
+        self._read_body()
+        with self.server.lock:
+            if "uploads" in query:
+                upload_id = uuid.uuid4().hex
+                self.server.requests.append(("CreateMultipartUpload", key, False))
+                self.server.uploads[upload_id] = {"parts": {}, "acl": self.headers.get("x-amz-acl"),
+                                                  "metadata": self._metadata()}
+                body = (f"<InitiateMultipartUploadResult><Bucket>{BUCKET}</Bucket><Key>{key}</Key>"
+                        f"<UploadId>{upload_id}</UploadId></InitiateMultipartUploadResult>")
+            else:
+                upload = self.server.uploads.pop(query["uploadId"][0])
+                self.server.requests.append(("CompleteMultipartUpload", key, False))
+                parts = [upload["parts"][number] for number in sorted(upload["parts"])]
+                etag = hashlib.md5(b"".join(hashlib.md5(part).digest() for part in parts)).hexdigest()
+                etag = f"{etag}-{len(parts)}"
+                self.server.objects[key] = {"body": b"".join(parts), "etag": etag, "acl": upload["acl"],
+                                            "metadata": upload["metadata"]}
+                body = f'<CompleteMultipartUploadResult><ETag>"{etag}"</ETag></CompleteMultipartUploadResult>'
+        self._reply(body=body.encode())
+
+
+class FakeS3Server(ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeS3Handler)
+        self.lock = threading.Lock()
+        self.objects = {}
+        self.uploads = {}
+        self.requests = []
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+@pytest.fixture(name="fake_s3")
+def fixture_fake_s3(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "test")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "test")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    server = FakeS3Server()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def fixture_reset_upload_bandwidth(monkeypatch):
+    monkeypatch.setattr(S3Storage, "_upload_bandwidth", None)
+
+
+def create_files(path, count: int, size: int) -> list[str]:
+    files = []
+    for index in range(count):
+        file_path = path / f"archive-{index}.tar.gz"
+        file_path.write_bytes(os.urandom(size))
+        files.append(str(file_path))
+    return files
+
+
+def test_upload_files_sets_acl_and_skips_uploaded(fake_s3, tmp_path):
+    storage = S3Storage(bucket=BUCKET, endpoint_url=fake_s3.url)
+    storage.min_multipart_chunksize = storage.multipart_chunksize = 5 * 1024 * 1024
+    small_file, big_file = create_files(tmp_path, count=2, size=1024)
+    with open(big_file, "wb") as file:
+        file.write(os.urandom(12 * 1024 * 1024))
+
+    links = storage.upload_files([small_file, big_file], dest_dir="test-id")
+    assert links == [f"https://{BUCKET}.s3.amazonaws.com/test-id/{os.path.basename(path)}"
+                     for path in (small_file, big_file)]
+    for path in (small_file, big_file):
+        obj = fake_s3.objects[f"test-id/{os.path.basename(path)}"]
+        with open(path, "rb") as file:
+            assert obj["body"] == file.read()
+        assert obj["acl"] == "public-read"
+    assert fake_s3.objects[f"test-id/{os.path.basename(big_file)}"]["etag"].endswith("-3")
+
+    requests_count = len(fake_s3.requests)
+    assert storage.upload_files([small_file, big_file], dest_dir="test-id") == links
+    assert len(fake_s3.requests) == requests_count
+
+    with open(small_file, "wb") as file:
+        file.write(b"changed")
+    storage.upload_file(small_file, dest_dir="test-id")
+    assert fake_s3.objects[f"test-id/{os.path.basename(small_file)}"]["body"] == b"changed"
+
+
+def test_upload_bandwidth_is_shared_between_instances(fake_s3, tmp_path, monkeypatch):
+    monkeypatch.setattr(S3Storage, "min_multipart_chunksize", 1024 * 1024)
+    big_file, = create_files(tmp_path, count=1, size=2 * 1024 * 1024)
+    assert S3Storage(bucket=BUCKET, endpoint_url=fake_s3.url).upload_file(big_file, dest_dir="test-id")
+
+    storage = S3Storage(bucket=BUCKET, endpoint_url=fake_s3.url)
+    assert storage._upload_bandwidth  # pylint: disable=protected-access
+    assert storage.get_upload_transfer_config(file_size=10 * 2 ** 30, max_concurrency=4).multipart_chunksize != \
+        S3Storage.multipart_chunksize
+
+
+def test_upload_throughput_benchmark(fake_s3, tmp_path):
+    """
+    Compare uploading the files one by one with uploading them concurrently
+
+    Set S3_UPLOAD_BENCHMARK_FILE_SIZE_MB=1024 to run it on the size of real log archives
+    """
+    file_size = int(os.environ.get("S3_UPLOAD_BENCHMARK_FILE_SIZE_MB", "8")) * 1024 * 1024
+    files = create_files(tmp_path, count=4, size=file_size)
+
+    start_time = time.perf_counter()
+    for file_path in files:
+        assert S3Storage(bucket=BUCKET, endpoint_url=fake_s3.url).upload_file(file_path, dest_dir="serial")
+    serial_duration = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    assert all(S3Storage(bucket=BUCKET, endpoint_url=fake_s3.url).upload_files(files, dest_dir="concurrent"))
+    concurrent_duration = time.perf_counter() - start_time
+
+    total_mb = len(files) * file_size / 2 ** 20
+    LOGGER.warning("Uploaded %d files (%.1f MB): one by one %.1f MB/s, concurrently %.1f MB/s",
+                   len(files), total_mb, total_mb / serial_duration, total_mb / concurrent_duration)
@@ -8,17 +8,22 @@ test_scan_negative_exception - getting operation_timed_out in scan execution (wi
 """
 from pathlib import Path
 import os
+import threading
 from threading import Event
+from types import SimpleNamespace
 from importlib import reload
 from unittest.mock import MagicMock, patch
 import pytest
 from cassandra import OperationTimedOut, ReadTimeout
+from cassandra.cluster import NoHostAvailable  # pylint: disable=no-name-in-module
 
 # from sdcm.utils.operations_thread import ThreadParams
 from unit_tests.test_cluster import DummyDbCluster, DummyNode
 from sdcm.utils.decorators import retrying, Retry
 import sdcm.scan_operation_thread
-from sdcm.scan_operation_thread import ScanOperationThread, ThreadParams, PrometheusDBStats
+from sdcm.scan_operation_thread import ScanOperationThread, ThreadParams, PrometheusDBStats, split_token_range, \
+    PartitionScanComparator, TokenRangeScan
+from sdcm.utils.operations_thread import SubRangeStat
 
 
 def mock_retrying_decorator(*args, **kwargs):  # pylint: disable=unused-argument
@@ -280,3 +285,161 @@ def test_scan_negative_exception(mode, severity, running_nemesis, execute_mock,
     all_events = get_event_log_file(events)
     assert "Severity.NORMAL" in all_events[0] and "period_type=begin" in all_events[0]
     assert f"Severity.{severity}" in all_events[1] and "period_type=end" in all_events[1]
+
+
+def test_split_token_range_covers_whole_ring():
+    sub_ranges = split_token_range(7)
+    assert len(sub_ranges) == 7
+    assert sub_ranges[0][0] == -(2 ** 63) and sub_ranges[-1][1] == 2 ** 63 - 1
+    assert all(end + 1 == next_start for (_, end), (next_start, _) in zip(sub_ranges, sub_ranges[1:]))
+
+
+class FakeRangeFuture:
+    def __init__(self, session, query):
+        self.session = session
+        self.query = query
+        self.pages_left = session.pages_per_range
+        self._callback = None
+
+    @property
+    def has_more_pages(self):
+        return self.pages_left > 0
+
+    def _deliver(self):
+        self.pages_left -= 1
+        if not self.has_more_pages:
+            with self.session.lock:
+                self.session.in_flight -= 1
+        self._callback([MagicMock()] * self.session.rows_per_page)
+
+    def add_callbacks(self, callback, errback):  # pylint: disable=unused-argument
+        self._callback = callback
+        threading.Timer(0.01, self._deliver).start()
+
+    def start_fetching_next_page(self):
+        threading.Timer(0.01, self._deliver).start()
+
+
+class FakeRangeSession:
+    is_shutdown = False
+
+    def __init__(self, pages_per_range=2, rows_per_page=3):
+        self.pages_per_range = pages_per_range
+        self.rows_per_page = rows_per_page
+        self.cluster = SimpleNamespace(metadata=SimpleNamespace(keyspaces={"a": SimpleNamespace(
+            tables={"b": SimpleNamespace(partition_key=[SimpleNamespace(name="pk")])})}))
+        self.lock = threading.Lock()
+        self.in_flight = self.max_in_flight = 0
+        self.queries = []
+
+    def execute_async(self, statement):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.queries.append(statement.query_string)
+        return FakeRangeFuture(self, statement.query_string)
+
+
+class FakeConnection:
+    def __init__(self, session):
+        self.session = session
+        self.opened = self.closed = 0
+
+    def __enter__(self):
+        self.opened += 1
+        return self.session
+
+    def __exit__(self, *args):
+        self.closed += 1
+
+
+def test_table_scan_is_split_to_concurrent_token_ranges(events, node):  # pylint: disable=redefined-outer-name
+    session = FakeRangeSession()
+    connection = FakeConnection(session)
+    db_cluster = DBCluster(connection, [node], {})
+    node.parent_cluster = db_cluster
+    node.running_nemesis = None
+    params = ThreadParams(db_cluster=db_cluster, ks_cf='a.b', mode='table', scan_concurrency=3, **DEFAULT_PARAMS)
+    scan_thread = ScanOperationThread(params)
+    with events.wait_for_n_events(events.get_events_logger(), count=4, timeout=10):
+        scan_thread._run_next_operation()  # pylint: disable=protected-access
+        scan_thread._run_next_operation()  # pylint: disable=protected-access
+
+    assert connection.opened == 1, "the session should be reused by the following scans"
+    assert session.max_in_flight == 3
+    assert len(session.queries) == 2 * 3 * 4
+    assert session.queries[0] == (f"SELECT * from a.b WHERE token(pk) >= {-2 ** 63} AND token(pk) <= "
+                                  f"{-2 ** 63 + (2 ** 64 - 1) // 12 - 1} BYPASS CACHE USING TIMEOUT 300s")
+    for stat in scan_thread.thread_stats.stats:
+        assert stat.success
+        assert len(stat.sub_ranges) == 12
+        assert all(sub_range.pages == 2 and sub_range.rows_read == 6 for sub_range in stat.sub_ranges)
+        assert stat.rows_read == 72
+        assert stat.duration >= max(sub_range.duration for sub_range in stat.sub_ranges)
+    scan_thread.session_pool.close()
+    assert connection.closed == 1
+
+
+@pytest.mark.parametrize(("normal_rows", "reversed_rows", "limit", "mismatches_count"), [
+    [["1 1\n", "1 2\n", "1 3\n"], ["1 3\n", "1 2\n", "1 1\n"], None, 0],
+    [["1 1\n", "1 2\n", "1 3\n"], ["1 3\n", "1 2\n"], 2, 0],
+    [["1 1\n", "1 2\n"], ["1 2\n", "1 1\n"], 5, 0],
+    [[], [], None, 0],
+    [["1 1\n", "1 2\n", "1 3\n"], ["1 3\n", "1 1\n", "1 2\n"], None, 2],
+    [["1 1\n", "1 2\n", "1 3\n"], ["1 3\n", "1 2\n"], None, 1],
+    [["1 1\n", "1 2\n", "1 3\n"], ["1 2\n", "1 1\n"], 2, 2],
+])
+def test_partition_scan_comparator(normal_rows, reversed_rows, limit, mismatches_count):
+    comparator = PartitionScanComparator()
+    for row in reversed_rows:
+        comparator.add_reversed_row(row)
+    for row in normal_rows:
+        comparator.add_normal_row(row)
+    assert len(comparator.find_mismatches(limit=limit)) == mismatches_count
+    if normal_rows:
+        assert len(comparator.normal_rows) <= len(reversed_rows)
+
+
+class FailingRangeSession(FakeRangeSession):
+    def execute_async(self, statement):
+        raise NoHostAvailable("Unable to complete the operation against any hosts", {})
+
+
+class InlineErrorSession(FakeRangeSession):
+    def execute_async(self, statement):
+        future = MagicMock()
+        future.add_callbacks.side_effect = lambda callback, errback: errback(ReadTimeout("inline failure"))
+        return future
+
+
+@pytest.mark.parametrize("session_class", [FailingRangeSession, InlineErrorSession])
+def test_token_range_scan_failing_inline_does_not_recurse(session_class):
+    queries = [(SubRangeStat(start_token=start, end_token=end), "SELECT") for start, end in split_token_range(5000)]
+    sub_ranges = TokenRangeScan(session=session_class(), queries=queries, page_size=10, read_pages=0,
+                                concurrency=4, timeout=10).run()
+    assert len(sub_ranges) == 5000
+    assert all(sub_range.exception for sub_range in sub_ranges)
+
+
+def test_token_range_scan_marks_unfinished_sub_ranges_as_timed_out():
+    class HangingSession(FakeRangeSession):
+        def execute_async(self, statement):
+            return MagicMock()
+
+    queries = [(SubRangeStat(start_token=start, end_token=end), "SELECT") for start, end in split_token_range(6)]
+    sub_ranges = TokenRangeScan(session=HangingSession(), queries=queries, page_size=10, read_pages=0,
+                                concurrency=2, timeout=0.1).run()
+    assert all("OperationTimedOut" in sub_range.exception for sub_range in sub_ranges)
+    assert sum(sub_range.duration is not None for sub_range in sub_ranges) == 2
+
+
+def test_token_range_scan_read_pages_limits_the_whole_scan():
+    session = FakeRangeSession(pages_per_range=5)
+    queries = [(SubRangeStat(start_token=start, end_token=end), f"SELECT {index}")
+               for index, (start, end) in enumerate(split_token_range(12))]
+    sub_ranges = TokenRangeScan(session=session, queries=queries, page_size=10, read_pages=7,
+                                concurrency=3, timeout=10).run()
+    # the pages of the queries in flight when the limit is reached are still delivered
+    assert 7 <= sum(sub_range.pages for sub_range in sub_ranges) < 7 + 3
+    assert len(session.queries) < 12
+    assert not any(sub_range.exception for sub_range in sub_ranges)
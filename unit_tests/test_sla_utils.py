@@ -75,6 +75,9 @@ class FakeServiceLevel(ServiceLevel):
 
 
 class FakePrometheus:
+    def __init__(self):
+        self.queries = []
+
     @staticmethod
     # pylint: disable=unused-argument
     def get_scylla_scheduler_runtime_ms(start_time, end_time, node_ip, irate_sample_sec='60s'):
@@ -87,6 +90,17 @@ class FakePrometheus:
     def get_scylla_reactor_utilization(self, start_time, end_time, instance):
         return 100
 
+    @staticmethod
+    def get_scheduler_runtime_query_steps(start_time, end_time):  # pylint: disable=unused-argument
+        return 20, 80
+
+    def get_scylla_scheduler_runtime_per_instance(self, start_time, end_time, instances, irate_window=None):
+        self.queries.append((tuple(instances), irate_window))
+        runtime = self.get_scylla_scheduler_runtime_ms(start_time, end_time, node_ip=None)
+        return ({instance: runtime[instance] for instance in instances if instance in runtime},
+                {instance: self.get_scylla_reactor_utilization(start_time, end_time, instance)
+                 for instance in instances})
+
 
 # pylint: disable=too-few-public-methods
 class FakeSession:
@@ -120,6 +134,19 @@ class TestSlaUtilsTest(unittest.TestCase, SlaUtils):
                                            'unexpectedly. CPU%: 100. Runtime per service level group:\n  sl:sl50_abc '
                                            '(shares 50): 479.57\n  sl:sl200_abc (shares 200): 179.57')
 
+    def test_scheduler_runtime_of_all_nodes_is_queried_at_once(self):
+        class MissingNodePrometheus(FakePrometheus):
+            def get_scylla_scheduler_runtime_ms(self, start_time, end_time, node_ip, irate_sample_sec='60s'):
+                return {'127.0.0.2': {'sl:default': [400.0]}}
+
+        prometheus_stats = MissingNodePrometheus()
+        runtime, reactor_utilization = self.get_scheduler_runtime_per_node(
+            prometheus_stats=prometheus_stats, start_time=0, end_time=600, node_ips=['127.0.0.1', '127.0.0.2'])
+
+        assert prometheus_stats.queries == [(('127.0.0.1', '127.0.0.2'), None), (('127.0.0.1',), 160)]
+        assert runtime == {'127.0.0.2': {'sl:default': [400.0]}}
+        assert reactor_utilization == {'127.0.0.1': 100, '127.0.0.2': 100}
+
     @staticmethod
     def create_sla_auth(session, shares: int, index: str) -> Role:
         role = FakeRole(session=session, name=STRESS_ROLE_NAME_TEMPLATE % (shares or '', index),
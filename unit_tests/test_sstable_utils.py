@@ -0,0 +1,105 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2024 ScyllaDB
+
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from sdcm.utils.sstable.sstable_utils import SstableUtils, iter_sstables_extension_attributes
+
+DATA_DIR = "/var/lib/scylla/data/keyspace1/standard1-1234"
+ENCRYPTED = {"scylla_encryption_options": "{'cipher_algorithm': 'AES/ECB/PKCS5Padding'}"}
+
+
+def sstable_path(idx):
+    return f"{DATA_DIR}/me-3g9s_{idx:04d}_2z60w2ushgma9j7ypu-big-Data.db"
+
+
+def metadata_dump(sstables):
+    return json.dumps({"sstables": {sstable: {"sharding": [{"left": 1, "right": 2}], "features": {"mask": 0},
+                                              "extension_attributes": ENCRYPTED if sstable in encrypted else {}}
+                                    for sstable in sstables}})
+
+
+encrypted = {sstable_path(idx) for idx in range(0, 10, 2)}
+
+
+class FakeRemoter:  # pylint: disable=too-few-public-methods
+    """
+    Dumps metadata of the sstables till the first one which was deleted
+    """
+
+    def __init__(self, deleted):
+        self.deleted = deleted
+        self.commands = []
+        self.lock = threading.Lock()
+
+    def sudo(self, cmd, **kwargs):  # pylint: disable=unused-argument
+        with self.lock:
+            self.commands.append(cmd)
+        sstables = cmd.split("--sstables ")[1].split()
+        for idx, sstable in enumerate(sstables):
+            if sstable in self.deleted:
+                dump = metadata_dump(sstables[:idx])[:-2] if idx else ""
+                return SimpleNamespace(stdout=dump, stderr=(
+                    "scylla-sstable - Exiting on unhandled exception: sstables::malformed_sstable_exception "
+                    f"({sstable.replace('Data.db', 'TOC.txt')}: file not found)"))
+        return SimpleNamespace(stdout=metadata_dump(sstables), stderr="")
+
+
+def sstable_utils(remoter):
+    node = SimpleNamespace(parent_cluster=None, scylla_version="2024.1.0", remoter=remoter,
+                           add_install_prefix=lambda path: path)
+    return SstableUtils(db_node=node, ks_cf="keyspace1.standard1")
+
+
+def test_iter_sstables_extension_attributes():
+    dump = metadata_dump([sstable_path(0), sstable_path(1)])
+    assert list(iter_sstables_extension_attributes(dump)) == [
+        (sstable_path(0), {"scylla_encryption_options"}), (sstable_path(1), set())]
+    # the output is cut by a failure
+    assert list(iter_sstables_extension_attributes(dump[:dump.index(sstable_path(1)) + 50])) == [
+        (sstable_path(0), {"scylla_encryption_options"})]
+    assert not list(iter_sstables_extension_attributes(""))
+
+
+def test_check_that_sstables_are_encrypted_in_batches(monkeypatch):
+    monkeypatch.setattr(SstableUtils, "sstables_per_dump", 4)
+    remoter = FakeRemoter(deleted={sstable_path(5)})
+
+    with pytest.raises(AssertionError, match="Sstables encryption check failed"):
+        sstable_utils(remoter).check_that_sstables_are_encrypted(sstables=[sstable_path(idx) for idx in range(10)])
+
+    # 3 dumps, and the sstables of the failed one, which are missing in its output, are dumped one by one
+    assert len(remoter.commands) == 6
+    assert sorted(cmd.split()[-1] for cmd in remoter.commands if len(cmd.split("--sstables ")[1].split()) == 1) == [
+        sstable_path(5), sstable_path(6), sstable_path(7)]
+
+    remoter = FakeRemoter(deleted={sstable_path(5)})
+    sstable_utils(remoter).check_that_sstables_are_encrypted(sstables=sorted(encrypted | {sstable_path(5)}))
+    assert len(remoter.commands) == 3
+
+
+@pytest.mark.parametrize("stdout", ["WARNING: something went wrong\n", metadata_dump([sstable_path(0)])[:-40]])
+def test_unparsable_metadata_dump_is_not_encrypted(stdout):
+    remoter = SimpleNamespace(sudo=lambda cmd, **kwargs: SimpleNamespace(stdout=stdout, stderr=""))
+    utils = sstable_utils(remoter)
+
+    with pytest.raises(AssertionError, match="Sstables encryption check failed"):
+        utils.check_that_sstables_are_encrypted(sstables=[sstable_path(0)])
+    mapping = {}
+    utils._check_sstable_encryption("scylla sstable dump-scylla-metadata --sstables",  # pylint: disable=protected-access
+                                    sstable_path(0), mapping)
+    assert mapping == {sstable_path(0): None}
@@ -71,6 +71,18 @@ class TestSdcmWait(unittest.TestCase):
                                callback, timeout=2, throw_exc=True, step=0.5, arg1=1, arg2=3)
         self.assertEqual(len(calls), 5)
 
+    def test_03_step_function(self):
+        calls = []
+        steps = iter([0.1, 0.2, 0.4, 0.8])
+
+        def callback():
+            calls.append(time.perf_counter())
+            return False
+
+        wait_for(callback, timeout=1, step=lambda: next(steps), throw_exc=False)
+        self.assertEqual(len(calls), 5)
+        self.assertAlmostEqual(calls[3] - calls[2], 0.4, delta=0.1)
+
     def test_03_return_value(self):
         calls = []
 
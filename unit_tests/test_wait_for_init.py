@@ -0,0 +1,116 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2024 ScyllaDB
+
+import time
+import logging
+import threading
+
+import pytest
+
+from sdcm.cluster import NodeSetupFailed, wait_for_init_wrap
+
+
+class FakeNode:  # pylint: disable=too-few-public-methods
+    def __init__(self, name, setup_time, startup_time, rack=0, dc_idx=0):
+        self.name = name
+        self.setup_time = setup_time
+        self.startup_time = startup_time
+        self.rack = rack
+        self.dc_idx = dc_idx
+        self.datacenter = f"dc{dc_idx}"
+        self.node_rack = f"rack{rack}"
+        self.setup_end = None
+        self.startup_start = None
+        self.startup_end = None
+
+    def update_shards_in_argus(self):
+        pass
+
+    def update_rack_info_in_argus(self, datacenter, rack):
+        pass
+
+    def __str__(self):
+        return self.name
+
+
+class FakeCluster:  # pylint: disable=too-few-public-methods
+    def __init__(self, nodes, parallel_startup=False, max_parallel_startups_per_rack=3, failed_node=None):
+        self.nodes = nodes
+        self.parallel_startup = parallel_startup
+        self.max_parallel_startups_per_rack = max_parallel_startups_per_rack
+        self.failed_node = failed_node
+        self.log = logging.getLogger("fake-cluster")
+        self.max_starting_per_rack = 0
+        self._starting_per_rack = {}
+        self._lock = threading.Lock()
+
+    def node_setup(self, node, **kwargs):  # pylint: disable=unused-argument
+        time.sleep(node.setup_time)
+        if node is self.failed_node:
+            raise ValueError("setup failed")
+        node.setup_end = time.perf_counter()
+
+    def node_startup(self, node, **kwargs):  # pylint: disable=unused-argument
+        node.startup_start = time.perf_counter()
+        with self._lock:
+            self._starting_per_rack[node.rack] = self._starting_per_rack.get(node.rack, 0) + 1
+            self.max_starting_per_rack = max(self.max_starting_per_rack, self._starting_per_rack[node.rack])
+        time.sleep(node.startup_time)
+        with self._lock:
+            self._starting_per_rack[node.rack] -= 1
+        node.startup_end = time.perf_counter()
+
+    @wait_for_init_wrap
+    def wait_for_init(self, node_list=None, timeout=None, **kwargs):
+        pass
+
+
+def test_sequential_startup_starts_nodes_right_after_their_setup():
+    nodes = [FakeNode("node-1", 0.1, 0.3), FakeNode("node-2", 0.5, 0.3), FakeNode("node-3", 0.2, 0.3)]
+    cluster = FakeCluster(nodes)
+
+    start_time = time.perf_counter()
+    cluster.wait_for_init(critical_node_setup_events=[])
+    elapsed = time.perf_counter() - start_time
+
+    for node in nodes:
+        assert node.startup_start >= node.setup_end
+    # one after another, in order of the nodes
+    for prev_node, node in zip(nodes, nodes[1:]):
+        assert node.startup_start >= prev_node.startup_end
+    # startup of the first node is overlapped with setup of the others: 0.1 + 0.3 + 0.3 + 0.3 < 0.5 + 3 * 0.3
+    assert nodes[0].startup_start < nodes[1].setup_end
+    assert elapsed < 1.3
+
+
+def test_parallel_startup_is_limited_per_rack():
+    nodes = [FakeNode(f"node-{idx}", 0.1 * (idx % 3), 0.3, rack=idx % 2) for idx in range(8)]
+    cluster = FakeCluster(nodes, parallel_startup=True, max_parallel_startups_per_rack=2)
+
+    start_time = time.perf_counter()
+    cluster.wait_for_init(critical_node_setup_events=[])
+    elapsed = time.perf_counter() - start_time
+
+    for node in nodes:
+        assert node.startup_start >= node.setup_end
+    assert cluster.max_starting_per_rack == 2
+    # 4 nodes per rack, 2 at a time: 0.2 + 2 * 0.3 at most, much less than 0.2 + 8 * 0.3 of the sequential startup
+    assert elapsed < 1.2
+
+
+def test_setup_failure():
+    nodes = [FakeNode("node-1", 0.1, 0.1), FakeNode("node-2", 0.2, 0.1)]
+    cluster = FakeCluster(nodes, failed_node=nodes[1])
+
+    with pytest.raises(NodeSetupFailed, match="setup failed"):
+        cluster.wait_for_init(critical_node_setup_events=[])